@@ -4,9 +4,13 @@ This ensures the bluetooth_sig submodule containing Bluetooth SIG data files
 is initialized and available when building distributions, allowing pip installs
 from git or PyPI to work without manual submodule initialization.
 
+Once the data is available the hook also precompiles the company identifier
+name table, which the runtime loads instead of parsing the YAML.
+
 Per Hatchling documentation: https://hatch.pypa.io/latest/plugins/build-hook/custom/
 """
 
+import importlib.util
 import subprocess
 import sys
 from pathlib import Path
@@ -24,6 +28,11 @@ class SubmoduleBuildHook(BuildHookInterface):
             version: The version of the project being built
             build_data: Build configuration data
         """
+        self._initialize_submodule()
+        self._compile_company_table(build_data)
+
+    def _initialize_submodule(self) -> None:
+        """Initialize the bluetooth_sig data submodule if it is empty."""
         submodule_path = Path(self.root) / "bluetooth_sig"
 
         # Check if submodule is already populated
@@ -54,3 +63,27 @@ class SubmoduleBuildHook(BuildHookInterface):
         except subprocess.CalledProcessError as e:
             self.app.display_error(f"Failed to initialize submodule: {e.stderr}")
             sys.exit(1)
+
+    def _compile_company_table(self, build_data: dict[str, any]) -> None:
+        """Precompile company_identifiers.yaml and include it in the build.
+
+        Args:
+            build_data: Build configuration data
+        """
+        root = Path(self.root)
+        yaml_path = root / "bluetooth_sig" / "assigned_numbers" / "company_identifiers" / "company_identifiers.yaml"
+        package_dir = root / "src" / "bluetooth_sig" / "registry" / "company_identifiers"
+        if not yaml_path.exists():
+            self.app.display_warning("company_identifiers.yaml not found - company table not precompiled")
+            return
+
+        # Load the module by path: importing the package would need all runtime dependencies
+        spec = importlib.util.spec_from_file_location("_company_table", package_dir / "company_table.py")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        output_path = package_dir / module.COMPANY_TABLE_FILENAME
+        table = module.compile_company_table(yaml_path, output_path)
+        # The table is git-ignored, so it must be force-included
+        build_data["force_include"][str(output_path)] = f"bluetooth_sig/registry/company_identifiers/{output_path.name}"
+        self.app.display_info(f"Precompiled company table with {len(table)} entries")
@@ -26,19 +26,37 @@ def extract_summary(benchmark_data: dict[str, Any]) -> dict[str, Any]:
         "timestamp": timestamp,
         "commit": benchmark_data.get("commit_info", {}).get("id", "unknown")[:8],
         "results": {},
+        "memory_regressions": [],
     }
 
     for bench in benchmarks:
         name = bench.get("name", "unknown")
         stats = bench.get("stats", {})
+        extra_info = bench.get("extra_info", {})
 
         # Store only essential statistics (mean, max, stddev) in microseconds
-        summary["results"][name] = {
+        result = {
             "mean": round(stats.get("mean", 0) * 1_000_000, 2),  # Convert to µs
             "max": round(stats.get("max", 0) * 1_000_000, 2),  # Convert to µs
             "stddev": round(stats.get("stddev", 0) * 1_000_000, 2),  # Convert to µs
         }
 
+        # Corpus benchmarks record how many packets one round processes
+        packets = extra_info.get("packets")
+        if packets and stats.get("mean"):
+            result["packets_per_sec"] = round(packets / stats["mean"], 1)
+
+        # Memory benchmarks record retained bytes and their regression threshold
+        if "bytes" in extra_info:
+            result["bytes"] = extra_info["bytes"]
+            threshold = extra_info.get("threshold_bytes")
+            if threshold is not None:
+                result["threshold_bytes"] = threshold
+                if extra_info["bytes"] > threshold:
+                    summary["memory_regressions"].append(name)
+
+        summary["results"][name] = result
+
     return summary
 
 
@@ -73,6 +91,9 @@ def update_history(current_json_path: Path, history_json_path: Path) -> None:
     print(f"✅ Updated benchmark history: {len(history)} entries")
     print(f"   Latest: {summary['timestamp'][:19]} (commit {summary['commit']})")
     print(f"   Oldest: {history[0]['timestamp'][:19]} (commit {history[0]['commit']})")
+    for name in summary["memory_regressions"]:
+        result = summary["results"][name]
+        print(f"⚠️  Memory regression: {name} uses {result['bytes']} bytes (threshold {result['threshold_bytes']})")
 
 
 def main() -> None:
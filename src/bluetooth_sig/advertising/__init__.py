@@ -6,6 +6,10 @@ Two-layer architecture:
 - AdvertisingServiceResolver: Map service UUIDs → GATT service classes
 - SIGCharacteristicInterpreter: Built-in interpreter for SIG characteristic service data
 - EAD: Encrypted advertising data support (Core Spec 1.23)
+- CompiledScanFilter: ScanFilter evaluated on raw AD bytes before parsing
+- AdvertisementChangeTracker: Per-device change detection for advertisement streams
+- AuxChainReassembler: Reassembles extended advertisements chained across AUX PDUs
+- PeriodicAdvertisingTracker: Follows periodic advertising trains, parsing only changed data
 
 State Management:
     Interpreters do NOT manage state. The caller (connection manager, device tracker)
@@ -19,12 +23,14 @@ Error Handling:
 
 from __future__ import annotations
 
+from bluetooth_sig.advertising.aux_reassembler import AuxChainReassembler, ReassemblyStats
 from bluetooth_sig.advertising.base import (
     AdvertisingData,
     DataSource,
     InterpreterInfo,
     PayloadInterpreter,
 )
+from bluetooth_sig.advertising.change_detection import AdvertisementChanges, AdvertisementChangeTracker
 from bluetooth_sig.advertising.ead_decryptor import (
     EADDecryptor,
     build_ead_nonce,
@@ -46,12 +52,18 @@ from bluetooth_sig.advertising.exceptions import (
     UnsupportedVersionError,
 )
 from bluetooth_sig.advertising.pdu_parser import AdvertisingPDUParser
+from bluetooth_sig.advertising.periodic_tracker import (
+    PeriodicAdvertisingTracker,
+    PeriodicAdvertisingTrain,
+    PeriodicTrainStats,
+)
 from bluetooth_sig.advertising.registry import (
     PayloadContext,
     PayloadInterpreterRegistry,
     get_payload_interpreter_registry,
     parse_advertising_payloads,
 )
+from bluetooth_sig.advertising.scan_prefilter import CompiledScanFilter
 from bluetooth_sig.advertising.service_data_parser import ServiceDataParser
 from bluetooth_sig.advertising.service_resolver import (
     AdvertisingServiceResolver,
@@ -66,16 +78,22 @@ from bluetooth_sig.advertising.state import (
     EncryptionState,
     PacketState,
 )
+from bluetooth_sig.advertising.synthesizer import AdvertisementSynthesizer
 from bluetooth_sig.types.address import bytes_to_mac_address, mac_address_to_bytes
 from bluetooth_sig.types.company import CompanyIdentifier, ManufacturerData
 
 __all__ = [
+    "AdvertisementChangeTracker",
+    "AdvertisementChanges",
+    "AdvertisementSynthesizer",
     "AdvertisingData",
     "AdvertisingError",
     "AdvertisingPDUParser",
     "AdvertisingParseError",
     "AdvertisingServiceResolver",
+    "AuxChainReassembler",
     "CompanyIdentifier",
+    "CompiledScanFilter",
     "DataSource",
     "DecryptionFailedError",
     "DeviceAdvertisingState",
@@ -92,6 +110,10 @@ __all__ = [
     "PayloadContext",
     "PayloadInterpreter",
     "PayloadInterpreterRegistry",
+    "PeriodicAdvertisingTracker",
+    "PeriodicAdvertisingTrain",
+    "PeriodicTrainStats",
+    "ReassemblyStats",
     "ReplayDetectedError",
     "ResolvedService",
     "SIGCharacteristicData",
@@ -0,0 +1,274 @@
+"""Reassembly of extended advertisements chained across AUX PDUs.
+
+An extended advertisement (Core Spec Vol 6, Part B, 2.3.4) starts with an
+ADV_EXT_IND on a primary channel whose AuxPtr points at an AUX_ADV_IND; the
+advertising data continues in AUX_CHAIN_IND PDUs, each pointing at the
+next, until a PDU without AuxPtr ends the chain. :class:`AuxChainReassembler`
+accepts those PDUs in arrival order and returns one
+:class:`~bluetooth_sig.types.advertising.result.AdvertisingData` per
+completed chain.
+
+Chains are keyed by advertiser address and Advertising Set ID (SID); the
+Data ID (DID) identifies one version of the set's data. AUX_CHAIN_IND PDUs
+omit AdvA, so they are matched by their ADI unless the caller supplies the
+address. Memory is bounded by the number of pending chains, the data size per
+chain and the number of remembered DIDs; incomplete chains time out.
+
+With duplicate suppression enabled, a chain repeating the DID last completed
+for its set is dropped after reading only the PDU header, so re-broadcasts of
+unchanged data never reach AD structure parsing.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+import msgspec
+
+from bluetooth_sig.advertising.pdu_parser import AdvertisingPDUParser
+from bluetooth_sig.types.advertising.ad_structures import ExtendedAdvertisingData
+from bluetooth_sig.types.advertising.pdu import BLEAdvertisingPDU
+from bluetooth_sig.types.advertising.result import AdvertisingData
+
+# Maximum advertising data length of a chained extended advertisement (Core Spec Vol 4, Part E, 7.8.54)
+MAX_CHAINED_DATA_LENGTH = 1650
+
+_ChainKey = tuple[str, int]
+
+
+class ReassemblyStats(msgspec.Struct, kw_only=True):
+    """Counters describing what an :class:`AuxChainReassembler` has seen.
+
+    Attributes:
+        completed: Chains reassembled and returned
+        duplicates: PDUs dropped because their set's DID was already delivered
+        timed_out: Incomplete chains dropped after the timeout
+        evicted: Incomplete chains dropped to stay within ``max_pending``
+        superseded: Incomplete chains dropped because the set started a new DID
+        oversized: Chains dropped for exceeding the maximum data length
+        orphaned: Continuation PDUs that matched no pending chain
+        invalid: PDUs that were not well-formed extended PDUs with an ADI
+
+    """
+
+    completed: int = 0
+    duplicates: int = 0
+    timed_out: int = 0
+    evicted: int = 0
+    superseded: int = 0
+    oversized: int = 0
+    orphaned: int = 0
+    invalid: int = 0
+
+
+class _PendingChain:
+    """Fragments received so far for one advertising set."""
+
+    __slots__ = ("data", "did", "first_raw", "fragments", "sid", "updated")
+
+    def __init__(self, sid: int, did: int, first_raw: bytes, now: float) -> None:
+        self.sid = sid
+        self.did = did
+        self.first_raw = first_raw
+        self.fragments: list[BLEAdvertisingPDU] = []
+        self.data = bytearray()
+        self.updated = now
+
+
+class AuxChainReassembler:  # pylint: disable=too-many-instance-attributes
+    """Stateful reassembler for extended advertisements split across AUX PDUs.
+
+    Example::
+        >>> reassembler = AuxChainReassembler(timeout=1.0)
+        >>> for pdu in received_pdus:  # ADV_EXT_IND, AUX_ADV_IND, AUX_CHAIN_IND...
+        ...     advertisement = reassembler.feed(pdu, rssi=-60)
+        ...     if advertisement is not None:
+        ...         print(advertisement.ad_structures.core.local_name)
+
+    Attributes:
+        timeout: Seconds an incomplete chain may go without a new fragment
+        max_pending: Maximum number of incomplete chains held at once
+        max_data_length: Maximum reassembled advertising data length
+        deduplicate: Whether chains repeating a delivered DID are dropped
+        stats: Running counters
+
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        parser: AdvertisingPDUParser | None = None,
+        *,
+        timeout: float = 1.0,
+        max_pending: int = 64,
+        max_data_length: int = MAX_CHAINED_DATA_LENGTH,
+        max_tracked_sets: int = 1024,
+        deduplicate: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise the reassembler.
+
+        Args:
+            parser: Parser for PDU headers and the reassembled AD structures
+            timeout: Seconds an incomplete chain may go without a new fragment
+            max_pending: Maximum number of incomplete chains held at once
+            max_data_length: Maximum reassembled advertising data length
+            max_tracked_sets: Maximum number of (address, SID) pairs whose last
+                DID is remembered for duplicate suppression
+            deduplicate: Drop chains repeating the last delivered DID of their set
+            clock: Time source used when :meth:`feed` gets no timestamp
+
+        Raises:
+            ValueError: If a limit is not positive
+
+        """
+        if timeout <= 0 or max_pending <= 0 or max_data_length <= 0 or max_tracked_sets <= 0:
+            raise ValueError("Reassembly limits must be positive")
+        self._parser = parser or AdvertisingPDUParser()
+        self.timeout = timeout
+        self.max_pending = max_pending
+        self.max_data_length = max_data_length
+        self.deduplicate = deduplicate
+        self._max_tracked_sets = max_tracked_sets
+        self._clock = clock
+        # Ordered by last update, so expiry and eviction only look at the front
+        self._pending: OrderedDict[_ChainKey, _PendingChain] = OrderedDict()
+        self._delivered: OrderedDict[_ChainKey, int] = OrderedDict()
+        self.stats = ReassemblyStats()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of incomplete chains currently held."""
+        return len(self._pending)
+
+    def feed(
+        self,
+        pdu: bytes,
+        address: str | None = None,
+        *,
+        rssi: int | None = None,
+        timestamp: float | None = None,
+    ) -> AdvertisingData | None:
+        """Add one received extended advertising PDU.
+
+        Args:
+            pdu: Raw PDU bytes (header, length, extended header, AdvData)
+            address: Advertiser address if known from the receive context;
+                needed to key AUX_CHAIN_IND PDUs when several sets share an ADI
+            rssi: Signal strength of this PDU, reported with a completed chain
+            timestamp: Receive time in seconds (defaults to the clock)
+
+        Returns:
+            The reassembled advertisement if this PDU completed a chain, else None
+
+        """
+        now = self._clock() if timestamp is None else timestamp
+        self.expire(now)
+
+        parsed = self._parser.parse_extended_pdu(pdu)
+        header = parsed.extended_header if parsed is not None else None
+        adi = header.advertising_data_info if header is not None else None
+        if parsed is None or header is None or adi is None:
+            self.stats.invalid += 1
+            return None
+        sid, did = adi.advertising_set_id, adi.advertising_data_id
+        advertiser = header.extended_advertiser_address or address
+
+        key, chain = self._find_chain(advertiser, sid, did)
+        if chain is not None and chain.did != did:
+            # The set moved on to new data before the old chain completed
+            del self._pending[key]
+            self.stats.superseded += 1
+            chain = None
+        if chain is None:
+            if advertiser is None:
+                self.stats.orphaned += 1
+                return None
+            key = (advertiser, sid)
+            if self.deduplicate and self._delivered.get(key) == did:
+                self.stats.duplicates += 1
+                return None
+            chain = self._start_chain(key, sid, did, pdu, now)
+
+        chain.fragments.append(parsed)
+        chain.data += parsed.payload
+        if len(chain.data) > self.max_data_length:
+            del self._pending[key]
+            self.stats.oversized += 1
+            return None
+        if header.auxiliary_pointer is not None:
+            chain.updated = now
+            self._pending.move_to_end(key)
+            return None
+
+        del self._pending[key]
+        return self._complete(key, chain, rssi)
+
+    def expire(self, now: float | None = None) -> int:
+        """Drop incomplete chains that have timed out.
+
+        Args:
+            now: Current time in seconds (defaults to the clock)
+
+        Returns:
+            Number of chains dropped
+
+        """
+        deadline = (self._clock() if now is None else now) - self.timeout
+        pending = self._pending
+        expired = 0
+        while pending:
+            key, chain = next(iter(pending.items()))
+            if chain.updated > deadline:
+                break
+            del pending[key]
+            expired += 1
+        self.stats.timed_out += expired
+        return expired
+
+    def reset(self) -> None:
+        """Drop all pending chains and forget delivered DIDs."""
+        self._pending.clear()
+        self._delivered.clear()
+
+    def _find_chain(self, advertiser: str | None, sid: int, did: int) -> tuple[_ChainKey, _PendingChain | None]:
+        """Find the pending chain a PDU belongs to."""
+        if advertiser is not None:
+            key = (advertiser, sid)
+            return key, self._pending.get(key)
+        # AUX_CHAIN_IND without AdvA: accept only an unambiguous ADI match
+        matches = [key for key, chain in self._pending.items() if chain.sid == sid and chain.did == did]
+        if len(matches) == 1:
+            return matches[0], self._pending[matches[0]]
+        return ("", sid), None
+
+    def _start_chain(self, key: _ChainKey, sid: int, did: int, first_raw: bytes, now: float) -> _PendingChain:
+        """Register a new pending chain, evicting the stalest one if full."""
+        pending = self._pending
+        while len(pending) >= self.max_pending:
+            pending.popitem(last=False)
+            self.stats.evicted += 1
+        chain = _PendingChain(sid, did, first_raw, now)
+        pending[key] = chain
+        return chain
+
+    def _complete(self, key: _ChainKey, chain: _PendingChain, rssi: int | None) -> AdvertisingData:
+        """Record the delivered DID and build the reassembled advertisement."""
+        delivered = self._delivered
+        delivered[key] = chain.did
+        delivered.move_to_end(key)
+        if len(delivered) > self._max_tracked_sets:
+            delivered.popitem(last=False)
+        self.stats.completed += 1
+
+        data = bytes(chain.data)
+        return AdvertisingData(
+            raw_data=chain.first_raw,
+            ad_structures=self._parser.parse_ad_structures(data),
+            extended=ExtendedAdvertisingData(extended_payload=data, auxiliary_packets=chain.fragments[1:]),
+            rssi=rssi,
+        )
+
+
+__all__ = ["MAX_CHAINED_DATA_LENGTH", "AuxChainReassembler", "ReassemblyStats"]
@@ -0,0 +1,198 @@
+"""Change detection for per-device advertisement streams.
+
+Sensors re-advertise the same payload many times per second, so consumers
+that only care about new readings would otherwise diff every
+``AdvertisementData`` themselves. :class:`AdvertisementChangeTracker` keeps,
+for one device, the last raw payload of each AD element (manufacturer data
+per company ID, service data per UUID, local name) and the last reported
+value of each interpreted field, and reports only what changed:
+
+* an advertisement whose elements are byte-identical to the previous ones
+  produces no changes and is never interpreted;
+* otherwise interpreted fields are compared with the values last reported.
+  Numeric fields may have a minimum-change threshold; it is measured from
+  the last *reported* value, so slow drift is still reported once it adds up.
+  When there is an interpreted value but only its raw payload changed (say,
+  a rolling packet counter the interpreter drops), nothing is reported.
+
+Elements missing from an advertisement are not treated as removed, since
+devices commonly alternate payloads (advertising data and scan response).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+from collections.abc import Callable, Mapping
+from typing import Any, TypeGuard
+
+import msgspec
+
+from bluetooth_sig.types.advertising.result import AdvertisementData
+from bluetooth_sig.types.company import ManufacturerData
+from bluetooth_sig.types.uuid import BluetoothUUID
+
+# Field name used when the interpreted value is a scalar rather than a record
+SCALAR_FIELD = "value"
+
+
+class AdvertisementChanges(msgspec.Struct, kw_only=True, frozen=True):
+    """Parts of an advertisement that changed since the device's previous one.
+
+    Attributes:
+        manufacturer_data: New or changed manufacturer data, keyed by company ID
+        service_data: New or changed service data, keyed by service UUID
+        local_name: The local name if it changed, else None
+        values: Interpreted fields that changed (beyond their threshold), by name
+
+    """
+
+    manufacturer_data: dict[int, ManufacturerData] = msgspec.field(default_factory=dict)
+    service_data: dict[BluetoothUUID, bytes] = msgspec.field(default_factory=dict)
+    local_name: str | None = None
+    values: dict[str, Any] = msgspec.field(default_factory=dict)
+
+
+def _value_fields(value: object) -> dict[str, object]:
+    """Flatten an interpreted value into named fields (one level deep)."""
+    if value is None:
+        return {}
+    if isinstance(value, msgspec.Struct):
+        return msgspec.structs.asdict(value)
+    if isinstance(value, Mapping):
+        return {str(key): item for key, item in value.items()}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    return {SCALAR_FIELD: value}
+
+
+def _is_number(value: object) -> TypeGuard[float]:
+    """Check for a plain numeric value (not bool or an enum member)."""
+    return isinstance(value, (int, float)) and not isinstance(value, (bool, enum.Enum))
+
+
+class AdvertisementChangeTracker:
+    """Tracks one device's advertisements and reports only what changed.
+
+    Example::
+        >>> tracker = AdvertisementChangeTracker({"temperature": 0.5})
+        >>> changes = tracker.observe(ad, lambda: {"temperature": 21.0, "humidity": 40})
+        >>> changes.values
+        {'temperature': 21.0, 'humidity': 40}
+        >>> tracker.observe(ad) is None  # Identical payload: nothing to report
+        True
+
+    Attributes:
+        thresholds: Minimum change per numeric field name before it is reported
+        default_threshold: Threshold for numeric fields not in ``thresholds``
+            (``0`` reports any change)
+
+    """
+
+    __slots__ = (
+        "_local_name",
+        "_manufacturer_payloads",
+        "_reported_values",
+        "_service_payloads",
+        "default_threshold",
+        "thresholds",
+    )
+
+    def __init__(self, thresholds: Mapping[str, float] | None = None, *, default_threshold: float = 0.0) -> None:
+        """Initialise an empty tracker.
+
+        Args:
+            thresholds: Minimum change per numeric field name
+            default_threshold: Minimum change for other numeric fields
+
+        Raises:
+            ValueError: If any threshold is negative
+
+        """
+        self.thresholds = dict(thresholds or {})
+        if default_threshold < 0 or any(threshold < 0 for threshold in self.thresholds.values()):
+            raise ValueError("Change thresholds must not be negative")
+        self.default_threshold = default_threshold
+        self._manufacturer_payloads: dict[int, bytes] = {}
+        self._service_payloads: dict[BluetoothUUID, bytes] = {}
+        self._local_name: str | None = None
+        self._reported_values: dict[str, object] = {}
+
+    def observe(
+        self,
+        advertisement: AdvertisementData,
+        interpret: Callable[[], object] | None = None,
+    ) -> AdvertisementChanges | None:
+        """Record an advertisement and return what changed.
+
+        Args:
+            advertisement: The device's latest advertisement
+            interpret: Produces the interpreted value; only called when an AD
+                element changed. Defaults to ``advertisement.interpreted_data``.
+
+        Returns:
+            The changes, or None if no element changed or, when there is an
+            interpreted value, only payloads changed and none of its fields did
+
+        """
+        core = advertisement.ad_structures.core
+        known_manufacturer = self._manufacturer_payloads
+        manufacturer_data = {
+            company_id: data
+            for company_id, data in core.manufacturer_data.items()
+            if known_manufacturer.get(company_id) != data.payload
+        }
+        known_service = self._service_payloads
+        service_data = {
+            uuid: payload for uuid, payload in core.service_data.items() if known_service.get(uuid) != payload
+        }
+        local_name = core.local_name if core.local_name and core.local_name != self._local_name else None
+        if not (manufacturer_data or service_data or local_name is not None):
+            return None
+
+        for company_id, data in manufacturer_data.items():
+            known_manufacturer[company_id] = data.payload
+        known_service.update(service_data)
+        if local_name is not None:
+            self._local_name = local_name
+        interpreted = interpret() if interpret is not None else advertisement.interpreted_data
+        values = self._changed_values(interpreted)
+        # With an interpretation, a payload change that moves no field (e.g. a rolling counter) is noise
+        if interpreted is not None and not values and local_name is None:
+            return None
+
+        return AdvertisementChanges(
+            manufacturer_data=manufacturer_data,
+            service_data=service_data,
+            local_name=local_name,
+            values=values,
+        )
+
+    def reset(self) -> None:
+        """Forget all recorded payloads and values, so everything is reported again."""
+        self._manufacturer_payloads.clear()
+        self._service_payloads.clear()
+        self._local_name = None
+        self._reported_values.clear()
+
+    def _changed_values(self, interpreted: object) -> dict[str, object]:
+        """Return the fields that changed and record them as reported."""
+        reported = self._reported_values
+        changed: dict[str, object] = {}
+        for name, value in _value_fields(interpreted).items():
+            if name in reported and not self._differs(name, reported[name], value):
+                continue
+            reported[name] = value
+            changed[name] = value
+        return changed
+
+    def _differs(self, name: str, previous: object, current: object) -> bool:
+        """Check whether a field moved enough to be reported."""
+        if _is_number(previous) and _is_number(current):
+            threshold = self.thresholds.get(name, self.default_threshold)
+            if threshold > 0:
+                return abs(current - previous) >= threshold
+        return bool(previous != current)
+
+
+__all__ = ["SCALAR_FIELD", "AdvertisementChangeTracker", "AdvertisementChanges"]
@@ -105,6 +105,10 @@ class AdvertisingPDUParser:  # pylint: disable=too-few-public-methods
     - Flags, local name, appearance, TX power
     - Extended advertising fields (BLE 5.0+)
 
+    Each call parses a single PDU. Extended advertisements split across
+    AUX_ADV_IND/AUX_CHAIN_IND PDUs are reassembled by
+    :class:`~bluetooth_sig.advertising.aux_reassembler.AuxChainReassembler`.
+
     For vendor-specific interpretation (e.g., BTHome sensor values),
     use AdvertisingDataInterpreter subclasses.
     """
@@ -154,7 +158,7 @@ class AdvertisingPDUParser:  # pylint: disable=too-few-public-methods
         if len(raw_data) < PDULayout.MIN_EXTENDED_PDU:
             return self._parse_legacy_advertising(raw_data)
 
-        pdu = self._parse_extended_pdu(raw_data)
+        pdu = self.parse_extended_pdu(raw_data)
 
         if not pdu:
             return self._parse_legacy_advertising(raw_data)
@@ -162,24 +166,17 @@ class AdvertisingPDUParser:  # pylint: disable=too-few-public-methods
         parsed_data = AdvertisingDataStructures()
 
         if pdu.payload:
-            parsed_data = self._parse_ad_structures(pdu.payload)
-
-        auxiliary_packets: list[BLEAdvertisingPDU] = []
-        if pdu.extended_header and pdu.extended_header.auxiliary_pointer:
-            aux_packets = self._parse_auxiliary_packets(pdu.extended_header.auxiliary_pointer)
-            auxiliary_packets.extend(aux_packets)
+            parsed_data = self.parse_ad_structures(pdu.payload)
 
+        # Fragments behind an AuxPtr arrive as separate PDUs; AuxChainReassembler stitches them
         return AdvertisingData(
             raw_data=raw_data,
             ad_structures=parsed_data,
-            extended=ExtendedAdvertisingData(
-                extended_payload=pdu.payload,
-                auxiliary_packets=auxiliary_packets,
-            ),
+            extended=ExtendedAdvertisingData(extended_payload=pdu.payload),
         )
 
-    def _parse_extended_pdu(self, data: bytes) -> BLEAdvertisingPDU | None:
-        """Parse extended PDU header and payload.
+    def parse_extended_pdu(self, data: bytes) -> BLEAdvertisingPDU | None:
+        """Parse extended PDU header and payload, leaving the AD structures raw.
 
         Args:
             data: Raw PDU data
@@ -439,26 +436,6 @@ class AdvertisingPDUParser:  # pylint: disable=too-few-public-methods
             additional_controller_advertising_data=additional_controller_advertising_data,
         )
 
-    def _parse_auxiliary_packets(self, aux_ptr: AuxiliaryPointer) -> list[BLEAdvertisingPDU]:
-        """Parse auxiliary packets referenced by auxiliary pointer.
-
-        Args:
-            aux_ptr: Parsed AuxiliaryPointer struct
-
-        Returns:
-            List of auxiliary packets (currently returns empty list)
-
-        Note:
-            This is a placeholder. Full implementation would require
-            receiving raw PDU data from the auxiliary channel specified
-            in the AuxiliaryPointer (channel_index, aux_offset, aux_phy).
-        """
-        # Auxiliary packets are received over the air on a different channel
-        # at a later time. This cannot be parsed from a single PDU capture.
-        # The AuxiliaryPointer tells us where to listen, not the data itself.
-        _ = aux_ptr  # Acknowledge the parameter for future implementation
-        return []
-
     def _parse_legacy_advertising(self, raw_data: bytes) -> AdvertisingData:
         """Parse legacy advertising data.
 
@@ -469,7 +446,7 @@ class AdvertisingPDUParser:  # pylint: disable=too-few-public-methods
             Parsed AdvertisingData
 
         """
-        parsed_data = self._parse_ad_structures(raw_data)
+        parsed_data = self.parse_ad_structures(raw_data)
         return AdvertisingData(
             raw_data=raw_data,
             ad_structures=parsed_data,
@@ -551,7 +528,7 @@ class AdvertisingPDUParser:  # pylint: disable=too-few-public-methods
 
         """
         mfr_data = ManufacturerData.from_bytes(ad_data)
-        parsed.core.manufacturer_data[mfr_data.company.id] = mfr_data
+        parsed.core.manufacturer_data[mfr_data.company_id] = mfr_data
 
     def _handle_core_ad_types(self, ad_type: int, ad_data: bytes, parsed: AdvertisingDataStructures) -> bool:
         """Handle core advertising data types (service UUIDs, names, etc).
@@ -744,7 +721,7 @@ class AdvertisingPDUParser:  # pylint: disable=too-few-public-methods
             return False
         return True
 
-    def _parse_ad_structures(self, data: bytes) -> AdvertisingDataStructures:
+    def parse_ad_structures(self, data: bytes) -> AdvertisingDataStructures:
         """Parse advertising data structures from raw bytes.
 
         Args:
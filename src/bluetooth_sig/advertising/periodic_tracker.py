@@ -0,0 +1,387 @@
+"""Following periodic advertising trains.
+
+A periodic advertiser announces its train through the SyncInfo field of an
+AUX_ADV_IND; a scanner that synchronises to it then receives one AUX_SYNC_IND
+per periodic event, optionally continued in AUX_CHAIN_IND PDUs (Core Spec
+Vol 6, Part B, 4.4.2.12). LE Audio broadcast sources and many sensor networks
+repeat the same periodic data for long stretches, so
+:class:`PeriodicAdvertisingTracker` only parses an event's AD structures when
+its data changed:
+
+* if the PDU carries an ADI whose DID matches the last parsed event, the
+  event (including any chain fragments) is dropped after reading the header;
+* otherwise, the reassembled payload is compared with the last one before
+  parsing.
+
+PDUs received through a sync carry no advertiser address, so the caller
+identifies the train by the (address, SID) pair it synchronised to, as a
+controller does with a sync handle. Missed events are counted from the
+periodic event counter when the receive path provides it, otherwise from
+receive timestamps and the advertising interval.
+"""
+
+from __future__ import annotations
+
+import msgspec
+
+from bluetooth_sig.advertising.aux_reassembler import MAX_CHAINED_DATA_LENGTH
+from bluetooth_sig.advertising.pdu_parser import AdvertisingPDUParser
+from bluetooth_sig.types.advertising.ad_structures import ExtendedAdvertisingData
+from bluetooth_sig.types.advertising.extended import SyncInfo
+from bluetooth_sig.types.advertising.pdu import BLEAdvertisingPDU
+from bluetooth_sig.types.advertising.result import AdvertisingData
+
+# SyncInfo interval unit (Core Spec Vol 6, Part B, 2.3.4.6)
+PERIODIC_INTERVAL_UNIT = 0.00125
+_EVENT_COUNTER_MASK = 0xFFFF
+# Counter steps beyond this are treated as stale (out-of-order) rather than a gap
+_MAX_COUNTER_GAP = 0x8000
+
+
+class PeriodicTrainStats(msgspec.Struct, kw_only=True):
+    """Counters for one periodic advertising train.
+
+    Attributes:
+        events: Periodic events received
+        missed_events: Events inferred to have been missed
+        updates: Events whose data changed and were parsed
+        duplicates: Events skipped because their data was unchanged
+        incomplete: Events whose chain was cut short or exceeded the size limit
+        invalid: PDUs that were not well-formed extended PDUs
+
+    """
+
+    events: int = 0
+    missed_events: int = 0
+    updates: int = 0
+    duplicates: int = 0
+    incomplete: int = 0
+    invalid: int = 0
+
+    @property
+    def duplicate_ratio(self) -> float:
+        """Fraction of received events that repeated the previous data."""
+        return self.duplicates / self.events if self.events else 0.0
+
+    @property
+    def missed_ratio(self) -> float:
+        """Fraction of periodic events that were not received."""
+        total = self.events + self.missed_events
+        return self.missed_events / total if total else 0.0
+
+
+class PeriodicAdvertisingTrain:  # pylint: disable=too-many-instance-attributes
+    """State of one followed periodic advertising train.
+
+    Attributes:
+        address: Advertiser address the train was synchronised from
+        sid: Advertising Set ID
+        interval: Periodic advertising interval in seconds, if known
+        latest: Most recently parsed periodic advertisement
+        stats: Per-train counters
+
+    """
+
+    __slots__ = (
+        "_chain",
+        "_did",
+        "_event_counter",
+        "_event_time",
+        "_first_raw",
+        "_fragments",
+        "_payload",
+        "_skipping",
+        "address",
+        "interval",
+        "latest",
+        "sid",
+        "stats",
+    )
+
+    def __init__(self, address: str, sid: int, interval: float | None = None) -> None:
+        """Initialise an empty train.
+
+        Args:
+            address: Advertiser address
+            sid: Advertising Set ID
+            interval: Periodic advertising interval in seconds, if known
+
+        """
+        self.address = address
+        self.sid = sid
+        self.interval = interval
+        self.latest: AdvertisingData | None = None
+        self.stats = PeriodicTrainStats()
+        self._event_counter: int | None = None
+        self._event_time: float | None = None
+        self._did: int | None = None
+        self._payload: bytes | None = None
+        # Data of the event in progress; None when no event is being reassembled
+        self._chain: bytearray | None = None
+        self._first_raw = b""
+        self._fragments: list[BLEAdvertisingPDU] = []
+        # Set while the rest of a duplicate or oversized event is being dropped
+        self._skipping = False
+
+    @property
+    def last_event_counter(self) -> int | None:
+        """Periodic event counter of the last event received, if provided."""
+        return self._event_counter
+
+    def apply_sync_info(self, sync_info: SyncInfo) -> None:
+        """Take the interval and first event counter from the train's SyncInfo."""
+        self.interval = sync_info.interval * PERIODIC_INTERVAL_UNIT or None
+        if self._event_counter is None:
+            # The first event received is expected to carry sync_counter
+            self._event_counter = (sync_info.sync_counter - 1) & _EVENT_COUNTER_MASK
+
+    def accept(  # pylint: disable=too-many-arguments
+        self,
+        raw: bytes,
+        pdu: BLEAdvertisingPDU,
+        *,
+        event_counter: int | None,
+        timestamp: float | None,
+        max_data_length: int,
+    ) -> bytes | None:
+        """Add a parsed PDU to the train.
+
+        Args:
+            raw: Raw PDU bytes
+            pdu: The PDU with its header parsed
+            event_counter: Periodic event counter of the event, if known
+            timestamp: Receive time in seconds, if known
+            max_data_length: Maximum periodic data length per event
+
+        Returns:
+            The event's data if this PDU completed an event whose data changed,
+            else None
+
+        """
+        header = pdu.extended_header
+        more = header is not None and header.auxiliary_pointer is not None
+        if self._starts_event(event_counter, timestamp):
+            if self._chain is not None:
+                self.stats.incomplete += 1
+            self._chain = None
+            self._skipping = False
+            if not self._open_event(event_counter, timestamp):
+                # Stale PDU from an earlier event
+                return None
+            adi = header.advertising_data_info if header is not None else None
+            did = adi.advertising_data_id if adi is not None else None
+            if did is not None and did == self._did and self._payload is not None:
+                self.stats.duplicates += 1
+                self._skipping = more
+                return None
+            self._did = did
+            self._chain = bytearray()
+            self._first_raw = raw
+            self._fragments = []
+
+        chain = self._chain
+        if chain is None:
+            self._skipping = more
+            return None
+        chain += pdu.payload
+        self._fragments.append(pdu)
+        if len(chain) > max_data_length:
+            self.stats.incomplete += 1
+            self._chain = None
+            self._did = None
+            self._skipping = more
+            return None
+        if more:
+            return None
+
+        self._chain = None
+        data = bytes(chain)
+        if data == self._payload:
+            self.stats.duplicates += 1
+            return None
+        self._payload = data
+        self.stats.updates += 1
+        return data
+
+    def record(self, data: bytes, parser: AdvertisingPDUParser) -> AdvertisingData:
+        """Parse the data of a completed event and store it as :attr:`latest`."""
+        self.latest = AdvertisingData(
+            raw_data=self._first_raw,
+            ad_structures=parser.parse_ad_structures(data),
+            extended=ExtendedAdvertisingData(periodic_advertising_data=data, auxiliary_packets=self._fragments[1:]),
+        )
+        return self.latest
+
+    def _starts_event(self, event_counter: int | None, timestamp: float | None) -> bool:
+        """Check whether a PDU opens a new periodic event rather than continuing one."""
+        if self._chain is None and not self._skipping:
+            return True
+        if event_counter is not None:
+            return event_counter != self._event_counter
+        if timestamp is not None and self._event_time is not None and self.interval:
+            # Chain PDUs follow within the event; the next event is a whole interval later
+            return timestamp - self._event_time >= self.interval / 2
+        return False
+
+    def _open_event(self, event_counter: int | None, timestamp: float | None) -> bool:
+        """Count a new event and any events missed since the previous one.
+
+        Returns:
+            False if the event counter shows the PDU is older than the last event
+
+        """
+        stats = self.stats
+        if event_counter is not None and self._event_counter is not None:
+            gap = (event_counter - self._event_counter) & _EVENT_COUNTER_MASK
+            if gap == 0 or gap >= _MAX_COUNTER_GAP:
+                return False
+            stats.missed_events += gap - 1
+        elif timestamp is not None and self._event_time is not None and self.interval:
+            stats.missed_events += max(0, round((timestamp - self._event_time) / self.interval) - 1)
+        if event_counter is not None:
+            self._event_counter = event_counter
+        if timestamp is not None:
+            self._event_time = timestamp
+        stats.events += 1
+        return True
+
+
+class PeriodicAdvertisingTracker:
+    """Follows periodic advertising trains and parses only changed data.
+
+    Example::
+        >>> tracker = PeriodicAdvertisingTracker()
+        >>> train = tracker.synchronize_from_pdu(aux_adv_ind)  # AUX_ADV_IND with SyncInfo
+        >>> for counter, pdu in received_sync_pdus:
+        ...     advertisement = tracker.feed(train.address, train.sid, pdu, event_counter=counter)
+        ...     if advertisement is not None:
+        ...         handle(advertisement.ad_structures)
+        >>> train.stats.duplicate_ratio
+        0.9
+
+    Attributes:
+        max_data_length: Maximum periodic data length per event
+
+    """
+
+    def __init__(
+        self,
+        parser: AdvertisingPDUParser | None = None,
+        *,
+        max_data_length: int = MAX_CHAINED_DATA_LENGTH,
+    ) -> None:
+        """Initialise the tracker.
+
+        Args:
+            parser: Parser for PDU headers and periodic AD structures
+            max_data_length: Maximum periodic data length per event
+
+        """
+        self._parser = parser or AdvertisingPDUParser()
+        self.max_data_length = max_data_length
+        self._trains: dict[tuple[str, int], PeriodicAdvertisingTrain] = {}
+
+    @property
+    def trains(self) -> list[PeriodicAdvertisingTrain]:
+        """Trains currently followed."""
+        return list(self._trains.values())
+
+    def get_train(self, address: str, sid: int) -> PeriodicAdvertisingTrain | None:
+        """Return the train for (*address*, *sid*), if followed."""
+        return self._trains.get((address, sid))
+
+    def synchronize(self, address: str, sid: int, sync_info: SyncInfo | None = None) -> PeriodicAdvertisingTrain:
+        """Start following a train, or refresh its timing if already followed.
+
+        Args:
+            address: Advertiser address
+            sid: Advertising Set ID
+            sync_info: SyncInfo announcing the train, for its interval and
+                first event counter
+
+        Returns:
+            The followed train
+
+        """
+        train = self._trains.get((address, sid))
+        if train is None:
+            train = self._trains[(address, sid)] = PeriodicAdvertisingTrain(address, sid)
+        if sync_info is not None:
+            train.apply_sync_info(sync_info)
+        return train
+
+    def synchronize_from_pdu(self, pdu: bytes, address: str | None = None) -> PeriodicAdvertisingTrain | None:
+        """Start following the train announced by an extended advertising PDU.
+
+        Args:
+            pdu: Raw AUX_ADV_IND PDU carrying SyncInfo and ADI
+            address: Advertiser address, if the PDU does not carry AdvA
+
+        Returns:
+            The followed train, or None if the PDU announces no periodic train
+
+        """
+        parsed = self._parser.parse_extended_pdu(pdu)
+        header = parsed.extended_header if parsed is not None else None
+        if header is None or header.sync_info is None or header.advertising_data_info is None:
+            return None
+        advertiser = header.extended_advertiser_address or address
+        if advertiser is None:
+            return None
+        return self.synchronize(advertiser, header.advertising_data_info.advertising_set_id, header.sync_info)
+
+    def terminate(self, address: str, sid: int) -> PeriodicAdvertisingTrain | None:
+        """Stop following a train, for example after sync loss.
+
+        Returns:
+            The train that was followed, or None
+
+        """
+        return self._trains.pop((address, sid), None)
+
+    def feed(  # pylint: disable=too-many-arguments
+        self,
+        address: str,
+        sid: int,
+        pdu: bytes,
+        *,
+        event_counter: int | None = None,
+        timestamp: float | None = None,
+    ) -> AdvertisingData | None:
+        """Add one AUX_SYNC_IND or AUX_CHAIN_IND received on a train.
+
+        Trains not yet synchronised are followed from their first PDU.
+
+        Args:
+            address: Advertiser address of the train
+            sid: Advertising Set ID of the train
+            pdu: Raw PDU bytes (header, length, extended header, AdvData)
+            event_counter: Periodic event counter of the event, if known
+            timestamp: Receive time in seconds, if known
+
+        Returns:
+            The parsed periodic advertisement if this PDU completed an event
+            with changed data, else None
+
+        """
+        train = self._trains.get((address, sid)) or self.synchronize(address, sid)
+        parsed = self._parser.parse_extended_pdu(pdu)
+        if parsed is None:
+            train.stats.invalid += 1
+            return None
+        data = train.accept(
+            pdu,
+            parsed,
+            event_counter=event_counter,
+            timestamp=timestamp,
+            max_data_length=self.max_data_length,
+        )
+        return train.record(data, self._parser) if data is not None else None
+
+
+__all__ = [
+    "PERIODIC_INTERVAL_UNIT",
+    "PeriodicAdvertisingTracker",
+    "PeriodicAdvertisingTrain",
+    "PeriodicTrainStats",
+]
@@ -0,0 +1,218 @@
+"""Scan filters compiled to run on raw advertising payloads.
+
+:class:`~bluetooth_sig.types.device_types.ScanFilter` is evaluated against a
+:class:`~bluetooth_sig.types.device_types.ScannedDevice`, i.e. after the
+advertisement has been fully parsed. In crowded environments most of what a
+scanner hears is rejected, so :class:`CompiledScanFilter` decides from the raw
+AD bytes instead: it walks the length-type headers and only looks at the
+structures the filter cares about, without building
+``AdvertisingDataStructures``.
+
+The compiled filter decides exactly as ``ScanFilter.matches`` would for a
+device parsed from the same AD bytes. A device's name and service UUIDs may
+arrive in its scan response rather than its advertising data, so pass both
+(``scan_response``) once the response has been received. Names the operating
+system supplies from its own cache are not in the AD bytes and cannot be
+seen, so filtering by name on platforms that report such names must use
+``ScanFilter.matches``. ``filter_func`` cannot run on raw bytes, so accepted
+payloads still go through ``ScanFilter.matches`` when one is set.
+"""
+
+from __future__ import annotations
+
+from bluetooth_sig.gatt.constants import SIZE_UINT16, SIZE_UINT32, SIZE_UUID128
+from bluetooth_sig.types.ad_types_constants import ADType
+from bluetooth_sig.types.device_types import ScanFilter
+from bluetooth_sig.types.uuid import BluetoothUUID
+
+# Lower 96 bits of the Bluetooth base UUID; 16/32-bit UUIDs occupy the top 32 bits
+_BASE_UUID_SHIFT = 96
+_BASE_UUID_LOW = int(BluetoothUUID.SIG_BASE_SUFFIX, 16)
+_BASE_UUID_LOW_MASK = (1 << _BASE_UUID_SHIFT) - 1
+_UINT16_MAX = 0xFFFF
+
+# Plain ints: the scan loop compares against these per structure
+_UUID16_LIST_TYPES = frozenset({int(ADType.INCOMPLETE_16BIT_SERVICE_UUIDS), int(ADType.COMPLETE_16BIT_SERVICE_UUIDS)})
+_UUID32_LIST_TYPES = frozenset({int(ADType.INCOMPLETE_32BIT_SERVICE_UUIDS), int(ADType.COMPLETE_32BIT_SERVICE_UUIDS)})
+_UUID128_LIST_TYPES = frozenset(
+    {int(ADType.INCOMPLETE_128BIT_SERVICE_UUIDS), int(ADType.COMPLETE_128BIT_SERVICE_UUIDS)}
+)
+_NAME_TYPES = frozenset({int(ADType.SHORTENED_LOCAL_NAME), int(ADType.COMPLETE_LOCAL_NAME)})
+_SERVICE_DATA_16BIT = int(ADType.SERVICE_DATA_16BIT)
+_SERVICE_DATA_32BIT = int(ADType.SERVICE_DATA_32BIT)
+_SERVICE_DATA_128BIT = int(ADType.SERVICE_DATA_128BIT)
+_MANUFACTURER_DATA = int(ADType.MANUFACTURER_SPECIFIC_DATA)
+
+
+def _decode_name(data: bytes) -> str:
+    """Decode a local name the way ``AdvertisingPDUParser`` does."""
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data.hex()
+
+
+class CompiledScanFilter:  # pylint: disable=too-many-instance-attributes
+    """A :class:`ScanFilter` precompiled for matching raw AD payloads.
+
+    Filter UUIDs are held as integers (16/32-bit short values for base-UUID
+    UUIDs plus full 128-bit values), addresses as an upper-cased set and names
+    as lower-cased substrings, so nothing is normalised per advertisement.
+
+    Example::
+        >>> compiled = CompiledScanFilter(ScanFilter(service_uuids=["180d"], rssi_threshold=-70))
+        >>> compiled.accepts(bytes([0x03, 0x03, 0x0D, 0x18]), rssi=-60)
+        True
+        >>> compiled.accepts(bytes([0x03, 0x03, 0x0F, 0x18]), rssi=-60)
+        False
+
+    Attributes:
+        scan_filter: The filter this was compiled from
+        needs_post_filter: Whether accepted payloads still need ``scan_filter.matches``
+            (only when a ``filter_func`` is set)
+
+    """
+
+    __slots__ = (
+        "_addresses",
+        "_company_ids",
+        "_inspects_payload",
+        "_match_company",
+        "_match_name",
+        "_match_uuid",
+        "_names",
+        "_rssi_threshold",
+        "_uuid16",
+        "_uuid32",
+        "_uuid128",
+        "needs_post_filter",
+        "scan_filter",
+    )
+
+    def __init__(self, scan_filter: ScanFilter) -> None:
+        """Compile *scan_filter*.
+
+        Args:
+            scan_filter: Filter to compile
+
+        Raises:
+            ValueError: If a service UUID in the filter is invalid
+
+        """
+        self.scan_filter = scan_filter
+        self.needs_post_filter = scan_filter.filter_func is not None
+        self._rssi_threshold = scan_filter.rssi_threshold
+        self._addresses: frozenset[str] | None = (
+            frozenset(address.upper() for address in scan_filter.addresses)
+            if scan_filter.addresses is not None
+            else None
+        )
+        self._match_name = scan_filter.names is not None
+        self._names = tuple(name.lower() for name in scan_filter.names or ())
+        self._match_company = scan_filter.manufacturer_ids is not None
+        self._company_ids = frozenset(scan_filter.manufacturer_ids or ())
+
+        # Full 128-bit values, plus short forms of base UUIDs for 16/32-bit structures
+        self._match_uuid = scan_filter.service_uuids is not None
+        self._uuid128 = frozenset(BluetoothUUID(uuid).int_value for uuid in scan_filter.service_uuids or ())
+        self._uuid32 = frozenset(
+            value >> _BASE_UUID_SHIFT for value in self._uuid128 if value & _BASE_UUID_LOW_MASK == _BASE_UUID_LOW
+        )
+        self._uuid16 = frozenset(value for value in self._uuid32 if value <= _UINT16_MAX)
+
+        self._inspects_payload = self._match_uuid or self._match_company or self._match_name
+
+    def accepts(
+        self,
+        payload: bytes,
+        address: str | None = None,
+        rssi: int | None = None,
+        *,
+        scan_response: bytes = b"",
+    ) -> bool:
+        """Check whether an advertisement may match the filter.
+
+        Args:
+            payload: Raw AD structures of the advertising data
+            address: Advertiser address, required when the filter lists addresses
+            rssi: Received signal strength, required when the filter has a threshold
+            scan_response: Raw AD structures of the scan response, if received;
+                a criterion is met by a structure in either payload
+
+        Returns:
+            ``False`` if the advertisement certainly does not match; ``True``
+            otherwise (see :attr:`needs_post_filter`)
+
+        """
+        threshold = self._rssi_threshold
+        if threshold is not None and (rssi is None or rssi < threshold):
+            return False
+        addresses = self._addresses
+        if addresses is not None and (address is None or address.upper() not in addresses):
+            return False
+        if not self._inspects_payload:
+            return True
+        if scan_response:
+            return self._scan_payload(payload, scan_response)
+        return self._scan_payload(payload)
+
+    def _scan_payload(self, *payloads: bytes) -> bool:  # pylint: disable=too-many-branches
+        """Walk the AD structures of each payload and check the payload-level criteria."""
+        uuid_pending = self._match_uuid
+        company_pending = self._match_company
+        name_pending = self._match_name
+
+        for payload in payloads:
+            end = len(payload)
+            i = 0
+            # Same framing rules as AdvertisingPDUParser.parse_ad_structures
+            while i + 1 < end:
+                length = payload[i]
+                if length == 0 or i + length + 1 > end:
+                    break
+                ad_type = payload[i + 1]
+                start = i + 2
+                stop = i + length + 1
+                i = stop
+
+                if uuid_pending and self._has_service_uuid(ad_type, payload, start, stop):
+                    uuid_pending = False
+                elif (
+                    company_pending
+                    and ad_type == _MANUFACTURER_DATA
+                    and stop - start >= SIZE_UINT16
+                    and (payload[start] | payload[start + 1] << 8) in self._company_ids
+                ):
+                    company_pending = False
+                elif name_pending and ad_type in _NAME_TYPES:
+                    local_name = _decode_name(bytes(payload[start:stop])).lower()
+                    if any(name in local_name for name in self._names):
+                        name_pending = False
+                else:
+                    continue
+                if not (uuid_pending or company_pending or name_pending):
+                    return True
+        return False
+
+    def _has_service_uuid(self, ad_type: int, payload: bytes, start: int, stop: int) -> bool:
+        """Check one AD structure for a filtered service UUID (lists and service data)."""
+        if ad_type in _UUID16_LIST_TYPES:
+            uuid16 = self._uuid16
+            return any(payload[j] | payload[j + 1] << 8 in uuid16 for j in range(start, stop - 1, 2))
+        if ad_type == _SERVICE_DATA_16BIT:
+            return stop - start >= SIZE_UINT16 and (payload[start] | payload[start + 1] << 8) in self._uuid16
+        if ad_type in _UUID32_LIST_TYPES:
+            uuid32 = self._uuid32
+            return any(int.from_bytes(payload[j : j + 4], "little") in uuid32 for j in range(start, stop - 3, 4))
+        if ad_type == _SERVICE_DATA_32BIT:
+            return stop - start >= SIZE_UINT32 and int.from_bytes(payload[start : start + 4], "little") in self._uuid32
+        # 128-bit UUIDs are read in the byte order AdvertisingPDUParser uses, so both agree
+        if ad_type in _UUID128_LIST_TYPES:
+            uuid128 = self._uuid128
+            return any(int.from_bytes(payload[j : j + 16], "big") in uuid128 for j in range(start, stop - 15, 16))
+        if ad_type == _SERVICE_DATA_128BIT:
+            return stop - start >= SIZE_UUID128 and int.from_bytes(payload[start : start + 16], "big") in self._uuid128
+        return False
+
+
+__all__ = ["CompiledScanFilter"]
@@ -0,0 +1,211 @@
+"""Seeded synthesis of random, spec-valid advertising payloads.
+
+:class:`AdvertisementSynthesizer` emits legacy (≤31 byte) and extended
+(≤254 byte) AD payloads mixing flags, local names, 16/128-bit service UUID
+lists, service data, manufacturer data, TX power and appearance. Output is
+deterministic for a given seed, which makes it suitable for load and fuzz
+testing scanners and for the benchmark suite.
+
+Every payload starts with a Flags structure, is a well-formed sequence of
+Length-Type-Data structures within its size limit, and contains each
+singleton AD type (names, TX power, appearance) at most once.
+"""
+
+from __future__ import annotations
+
+import random
+import string
+from collections.abc import Callable, Iterator
+
+from bluetooth_sig.types.ad_types_constants import ADType
+from bluetooth_sig.types.advertising.builder import (
+    EXTENDED_ADVERTISING_MAX_SIZE,
+    LEGACY_ADVERTISING_MAX_SIZE,
+    MutableAdvertisementBuilder,
+)
+from bluetooth_sig.types.advertising.flags import BLEAdvertisingFlags
+
+# Common SIG service UUIDs (Battery, Heart Rate, Device Information, Health
+# Thermometer, Environmental Sensing, CSC, Cycling Power, Fitness Machine)
+# plus member UUIDs widely seen in service data (BTHome, Xiaomi, Google).
+SERVICE_UUIDS_16BIT: tuple[int, ...] = (
+    0x180F,
+    0x180D,
+    0x180A,
+    0x1809,
+    0x181A,
+    0x1816,
+    0x1818,
+    0x1826,
+    0xFCD2,
+    0xFE95,
+    0xFEAA,
+)
+# Apple, Microsoft, Samsung, Google, Nordic Semiconductor, Ruuvi Innovations
+COMPANY_IDS: tuple[int, ...] = (0x004C, 0x0006, 0x0075, 0x00E0, 0x0059, 0x0499)
+# Generic, phone, computer, watch, heart rate sensor, thermometer, cycling sensor
+APPEARANCES: tuple[int, ...] = (0x0000, 0x0040, 0x0080, 0x00C0, 0x0340, 0x0300, 0x0480)
+FLAG_VALUES: tuple[int, ...] = (
+    int(BLEAdvertisingFlags.LE_GENERAL_DISCOVERABLE_MODE | BLEAdvertisingFlags.BR_EDR_NOT_SUPPORTED),
+    int(BLEAdvertisingFlags.LE_LIMITED_DISCOVERABLE_MODE | BLEAdvertisingFlags.BR_EDR_NOT_SUPPORTED),
+    int(BLEAdvertisingFlags.BR_EDR_NOT_SUPPORTED),
+    int(BLEAdvertisingFlags.LE_GENERAL_DISCOVERABLE_MODE),
+)
+
+_NAME_ALPHABET = string.ascii_letters + string.digits + "-_ "
+_FLAGS_SIZE = 3
+_HEADER_SIZE = 2
+# Longest random payload per service/manufacturer data structure
+_MAX_RANDOM_PAYLOAD = 24
+# Chance of leaving out each optional field
+_SKIP_PROBABILITY = 0.3
+
+
+class AdvertisementSynthesizer:
+    """Deterministic generator of randomized, spec-valid advertising payloads.
+
+    Example::
+        >>> synthesizer = AdvertisementSynthesizer(seed=1)
+        >>> payloads = list(synthesizer.stream(1000))
+        >>> all(len(p) <= 254 for p in payloads)
+        True
+
+    Attributes:
+        seed: Seed the generator was created with
+        extended_ratio: Fraction of payloads generated in extended (254-byte) mode
+
+    """
+
+    __slots__ = ("_extended", "_field_writers", "_legacy", "_rng", "extended_ratio", "seed")
+
+    def __init__(self, seed: int | None = 0, *, extended_ratio: float = 0.2) -> None:
+        """Initialise the synthesizer.
+
+        Args:
+            seed: Random seed (``None`` for a non-deterministic stream)
+            extended_ratio: Fraction of payloads generated as extended advertising
+
+        Raises:
+            ValueError: If *extended_ratio* is outside ``[0, 1]``
+
+        """
+        if not 0.0 <= extended_ratio <= 1.0:
+            raise ValueError(f"extended_ratio must be within [0, 1], got {extended_ratio}")
+        self.seed = seed
+        self.extended_ratio = extended_ratio
+        self._rng = random.Random(seed)
+        self._legacy = MutableAdvertisementBuilder(LEGACY_ADVERTISING_MAX_SIZE)
+        self._extended = MutableAdvertisementBuilder(EXTENDED_ADVERTISING_MAX_SIZE)
+        # (writer, repeatable) pairs; each writer adds one structure fitting in `space` bytes or returns False
+        self._field_writers: tuple[tuple[Callable[[MutableAdvertisementBuilder, int], bool], bool], ...] = (
+            (self._write_name, False),
+            (self._write_tx_power, False),
+            (self._write_appearance, False),
+            (self._write_uuid16_list, False),
+            (self._write_uuid128_list, False),
+            (self._write_service_data, True),
+            (self._write_manufacturer_data, True),
+        )
+
+    def generate(self, *, extended: bool | None = None) -> bytes:
+        """Generate one advertising payload.
+
+        Args:
+            extended: Force legacy (``False``) or extended (``True``) mode;
+                ``None`` picks randomly according to :attr:`extended_ratio`
+
+        Returns:
+            Encoded AD structures
+
+        """
+        rng = self._rng
+        if extended is None:
+            extended = rng.random() < self.extended_ratio
+        builder = (self._extended if extended else self._legacy).reset()
+        builder.add_flags(rng.choice(FLAG_VALUES))
+
+        writers = list(self._field_writers)
+        rng.shuffle(writers)
+        # Extended payloads keep adding repeatable structures up to a random fill target.
+        target = rng.randint(_FLAGS_SIZE, builder.max_payload_size) if extended else builder.max_payload_size
+        while writers and len(builder) < target:
+            index = rng.randrange(len(writers))
+            writer, repeatable = writers[index]
+            space = min(builder.remaining_space(), target - len(builder) + _HEADER_SIZE) - _HEADER_SIZE
+            # A writer is dropped when skipped, when nothing fits, or once used unless repeatable
+            if rng.random() < _SKIP_PROBABILITY or not writer(builder, space) or not (repeatable and extended):
+                del writers[index]
+        return builder.build()
+
+    def stream(self, count: int | None = None, *, extended: bool | None = None) -> Iterator[bytes]:
+        """Yield payloads lazily.
+
+        Args:
+            count: Number of payloads (``None`` for an endless stream)
+            extended: Mode for every payload, as for :meth:`generate`
+
+        Yields:
+            Encoded advertising payloads
+
+        """
+        generate = self.generate
+        if count is None:
+            while True:
+                yield generate(extended=extended)
+        for _ in range(count):
+            yield generate(extended=extended)
+
+    def _random_payload(self, space: int) -> bytes:
+        return self._rng.randbytes(self._rng.randint(0, min(space, _MAX_RANDOM_PAYLOAD)))
+
+    def _write_name(self, builder: MutableAdvertisementBuilder, space: int) -> bool:
+        if space < 1:
+            return False
+        rng = self._rng
+        name = "".join(rng.choices(_NAME_ALPHABET, k=rng.randint(1, min(space, 20))))
+        if rng.random() < 0.5:  # noqa: PLR2004  # Complete vs shortened
+            builder.add_complete_local_name(name)
+        else:
+            builder.add_shortened_local_name(name)
+        return True
+
+    def _write_tx_power(self, builder: MutableAdvertisementBuilder, space: int) -> bool:
+        if space < 1:
+            return False
+        builder.add_tx_power(self._rng.randint(-40, 20))
+        return True
+
+    def _write_appearance(self, builder: MutableAdvertisementBuilder, space: int) -> bool:
+        if space < 2:  # noqa: PLR2004  # uint16 appearance
+            return False
+        builder.add_appearance(self._rng.choice(APPEARANCES))
+        return True
+
+    def _write_uuid16_list(self, builder: MutableAdvertisementBuilder, space: int) -> bool:
+        if space < 2:  # noqa: PLR2004  # One 16-bit UUID
+            return False
+        rng = self._rng
+        uuids = rng.sample(SERVICE_UUIDS_16BIT, rng.randint(1, min(space // 2, 4)))
+        data = b"".join(uuid.to_bytes(2, "little") for uuid in uuids)
+        complete = rng.random() < 0.7  # noqa: PLR2004  # Mostly complete lists
+        ad_type = ADType.COMPLETE_16BIT_SERVICE_UUIDS if complete else ADType.INCOMPLETE_16BIT_SERVICE_UUIDS
+        builder.add_raw_structure(ad_type, data)
+        return True
+
+    def _write_uuid128_list(self, builder: MutableAdvertisementBuilder, space: int) -> bool:
+        if space < 16:  # noqa: PLR2004  # One 128-bit UUID
+            return False
+        builder.add_raw_structure(ADType.COMPLETE_128BIT_SERVICE_UUIDS, self._rng.randbytes(16))
+        return True
+
+    def _write_service_data(self, builder: MutableAdvertisementBuilder, space: int) -> bool:
+        if space < 2:  # noqa: PLR2004  # 16-bit service UUID
+            return False
+        builder.add_service_data(self._rng.choice(SERVICE_UUIDS_16BIT), self._random_payload(space - 2))
+        return True
+
+    def _write_manufacturer_data(self, builder: MutableAdvertisementBuilder, space: int) -> bool:
+        if space < 2:  # noqa: PLR2004  # Company identifier
+            return False
+        builder.add_manufacturer_data(self._rng.choice(COMPANY_IDS), self._random_payload(space - 2))
+        return True
@@ -1,17 +1,20 @@
 """Characteristic parsing with dependency-aware batch support.
 
 Provides single and batch characteristic parsing, including topological
-dependency ordering for multi-characteristic reads. Stateless.
+dependency ordering for multi-characteristic reads. Stateless apart from a
+bounded memo of dependency orders.
 """
 
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping
-from graphlib import TopologicalSorter
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+from graphlib import CycleError, TopologicalSorter
 from typing import Any, TypeVar, overload
 
 from ..gatt.characteristics.base import BaseCharacteristic
+from ..gatt.characteristics.pipeline import ParseResult
 from ..gatt.characteristics.registry import CharacteristicRegistry
 from ..gatt.exceptions import (
     CharacteristicParseError,
@@ -19,12 +22,74 @@ from ..gatt.exceptions import (
     SpecialValueDetectedError,
 )
 from ..types import CharacteristicContext
+from ..types.parse_outcome import ParseErrorCode, ParseOutcome
 from ..types.uuid import BluetoothUUID
 
 T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
+# Batch dependency graph: (uuid, in-batch dependencies) pairs in input order.
+DependencyGraph = tuple[tuple[str, tuple[str, ...]], ...]
+
+
+class LayeredMapping(Mapping[str, Any]):
+    """Read-only view of an overlay mapping layered over a base mapping.
+
+    Used as ``other_characteristics`` during batch parsing: the overlay is
+    the live results dict of the batch and the base is the caller's context,
+    so no per-characteristic copy or merge is needed. Overlay keys win.
+    """
+
+    __slots__ = ("_base", "_overlay")
+
+    def __init__(self, overlay: Mapping[str, Any], base: Mapping[str, Any]) -> None:
+        """Initialise the view.
+
+        Args:
+            overlay: Mapping consulted first (may keep growing)
+            base: Fallback mapping
+
+        """
+        self._overlay = overlay
+        self._base = base
+
+    def __getitem__(self, key: str) -> Any:  # noqa: ANN401  # Parsed values are untyped
+        """Return the overlay value for *key*, else the base value."""
+        overlay = self._overlay
+        if key in overlay:
+            return overlay[key]
+        return self._base[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Whether *key* is in either layer."""
+        return key in self._overlay or key in self._base
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate overlay keys, then base keys not shadowed by the overlay."""
+        overlay = self._overlay
+        yield from overlay
+        yield from (key for key in self._base if key not in overlay)
+
+    def __len__(self) -> int:
+        """Number of distinct keys across both layers."""
+        overlay = self._overlay
+        return len(overlay) + sum(1 for key in self._base if key not in overlay)
+
+
+@lru_cache(maxsize=256)
+def _topological_order(graph: DependencyGraph) -> tuple[str, ...]:
+    """Topologically sort a batch dependency graph (memoised per graph).
+
+    Raises:
+        CycleError: If the graph has a cycle (failures are not cached)
+
+    """
+    sorter: TopologicalSorter[str] = TopologicalSorter()
+    for uuid, deps in graph:
+        sorter.add(uuid, *deps)
+    return tuple(sorter.static_order())
+
 
 class CharacteristicParser:
     """Stateless parser for single and batch characteristic data.
@@ -93,25 +158,83 @@ class CharacteristicParser:
 
         if characteristic:
             logger.debug("Found parser for UUID=%s: %s", char, type(characteristic).__name__)
-            try:
-                value = characteristic.parse_value(raw_data, ctx)
-                logger.debug("Successfully parsed %s: %s", characteristic.name, value)
-            except SpecialValueDetectedError as e:
-                logger.debug("Special value detected for %s: %s", characteristic.name, e.special_value.meaning)
-                raise
-            except CharacteristicParseError as e:
-                logger.warning("Parse failed for %s: %s", characteristic.name, e)
-                raise
-            else:
-                return value
+            return self._parse_with(characteristic, raw_data, ctx)
+
+        logger.info("No parser available for UUID=%s", char)
+        raise CharacteristicParseError(
+            message=f"No parser available for characteristic UUID: {char}",
+            name="Unknown",
+            uuid=BluetoothUUID(char),
+            raw_data=bytes(raw_data),
+        )
+
+    @staticmethod
+    def _parse_with(
+        characteristic: BaseCharacteristic[Any],
+        raw_data: bytes | bytearray,
+        ctx: CharacteristicContext | None,
+    ) -> Any:  # noqa: ANN401  # Runtime UUID dispatch cannot be type-safe
+        """Parse with an already-resolved characteristic instance, logging the outcome."""
+        try:
+            value = characteristic.parse_value(raw_data, ctx)
+            logger.debug("Successfully parsed %s: %s", characteristic.name, value)
+        except SpecialValueDetectedError as e:
+            logger.debug("Special value detected for %s: %s", characteristic.name, e.special_value.meaning)
+            raise
+        except CharacteristicParseError as e:
+            logger.warning("Parse failed for %s: %s", characteristic.name, e)
+            raise
         else:
-            logger.info("No parser available for UUID=%s", char)
-            raise CharacteristicParseError(
-                message=f"No parser available for characteristic UUID: {char}",
-                name="Unknown",
-                uuid=BluetoothUUID(char),
-                raw_data=bytes(raw_data),
+            return value
+
+    @overload
+    def try_parse_characteristic(
+        self,
+        char: type[BaseCharacteristic[T]],
+        raw_data: bytes | bytearray,
+        ctx: CharacteristicContext | None = ...,
+    ) -> ParseResult[T]: ...
+
+    @overload
+    def try_parse_characteristic(
+        self,
+        char: str,
+        raw_data: bytes | bytearray,
+        ctx: CharacteristicContext | None = ...,
+    ) -> ParseResult[Any]: ...
+
+    def try_parse_characteristic(
+        self,
+        char: str | type[BaseCharacteristic[T]],
+        raw_data: bytes | bytearray,
+        ctx: CharacteristicContext | None = None,
+    ) -> ParseResult[T] | ParseResult[Any]:
+        """Parse a characteristic's raw data without raising.
+
+        Args:
+            char: Characteristic class (type-safe) or UUID string (not type-safe).
+            raw_data: Raw bytes from the characteristic (bytes or bytearray)
+            ctx: Optional CharacteristicContext providing device-level info
+
+        Returns:
+            Tagged ParseResult; unknown UUIDs yield an ``ERROR`` result with
+            ``UNKNOWN_CHARACTERISTIC``.
+
+        """
+        if isinstance(char, type) and issubclass(char, BaseCharacteristic):
+            return char().try_parse_value(raw_data, ctx)
+
+        characteristic = CharacteristicRegistry.get_characteristic(char)
+        if characteristic is None:
+            return ParseResult(
+                ParseOutcome.ERROR,
+                "Unknown",
+                BluetoothUUID(char),
+                raw_data,
+                error_code=ParseErrorCode.UNKNOWN_CHARACTERISTIC,
+                cause=LookupError(f"No parser available for characteristic UUID: {char}"),
             )
+        return characteristic.try_parse_value(raw_data, ctx)
 
     def parse_characteristics(
         self,
@@ -151,6 +274,8 @@ class CharacteristicParser:
         base_context = ctx
 
         results: dict[str, Any] = {}
+        # One context for the whole batch; it sees ``results`` as they grow.
+        parse_context = self._build_parse_context(base_context, results)
         for uuid_str in sorted_uuids:
             raw_data = char_data[uuid_str]
             characteristic = uuid_to_characteristic.get(uuid_str)
@@ -172,9 +297,10 @@ class CharacteristicParser:
                 base_context,
             )
 
-            parse_context = self._build_parse_context(base_context, results)
-
-            value = self.parse_characteristic(uuid_str, raw_data, ctx=parse_context)
+            if characteristic is None:
+                value = self.parse_characteristic(uuid_str, raw_data, ctx=parse_context)
+            else:
+                value = self._parse_with(characteristic, raw_data, parse_context)
             results[uuid_str] = value
 
         logger.debug("Batch parsing complete: %d results", len(results))
@@ -213,18 +339,26 @@ class CharacteristicParser:
         uuid_to_required_deps: Mapping[str, list[str]],
         uuid_to_optional_deps: Mapping[str, list[str]],
     ) -> list[str]:
-        """Topologically sort characteristics based on declared dependencies."""
+        """Topologically sort characteristics based on declared dependencies.
+
+        Orders are memoised per dependency graph, so repeated batches over the
+        same characteristics skip the sort entirely.
+        """
+        graph: DependencyGraph = tuple(
+            (
+                uuid,
+                tuple(
+                    dep
+                    for dep in uuid_to_required_deps.get(uuid, []) + uuid_to_optional_deps.get(uuid, [])
+                    if dep in characteristic_data
+                ),
+            )
+            for uuid in characteristic_data
+        )
         try:
-            sorter: TopologicalSorter[str] = TopologicalSorter()
-            for uuid in characteristic_data:
-                all_deps = uuid_to_required_deps.get(uuid, []) + uuid_to_optional_deps.get(uuid, [])
-                batch_deps = [dep for dep in all_deps if dep in characteristic_data]
-                sorter.add(uuid, *batch_deps)
-
-            sorted_sequence = sorter.static_order()
-            sorted_uuids = list(sorted_sequence)
+            sorted_uuids = list(_topological_order(graph))
             logger.debug("Dependency-sorted parsing order: %s", sorted_uuids)
-        except Exception as exc:  # pylint: disable=broad-exception-caught
+        except CycleError as exc:
             logger.warning("Dependency sorting failed: %s. Using original order.", exc)
             return list(characteristic_data.keys())
         else:
@@ -287,10 +421,17 @@ class CharacteristicParser:
         base_context: CharacteristicContext | None,
         results: Mapping[str, Any],
     ) -> CharacteristicContext:
-        """Construct the context passed to per-characteristic parsers."""
+        """Construct the context shared by every characteristic of a batch.
+
+        ``other_characteristics`` is a live view of *results* (layered over the
+        base context's values when present), so it is built once per batch.
+        """
         if base_context is not None:
-            other_characteristics = dict(base_context.other_characteristics or {})
-            other_characteristics.update(results)
+            other_characteristics: Mapping[str, Any] = (
+                LayeredMapping(results, base_context.other_characteristics)
+                if base_context.other_characteristics
+                else results
+            )
             return CharacteristicContext(
                 device_info=base_context.device_info,
                 advertisement=base_context.advertisement,
@@ -0,0 +1,100 @@
+"""Process-pool characteristic parsing backed by a shared registry snapshot.
+
+The parent writes one registry snapshot file; every worker memory-maps it in
+its initializer, so workers neither re-read nor re-parse the SIG YAML files.
+The snapshot and the worker pool are created on first use and reused by later
+calls until :meth:`ProcessPoolParser.close`.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from ..utils.registry_snapshot import attach_registry_snapshot, write_registry_snapshot
+from .parser import CharacteristicParser
+
+# Payloads are small; batch them so per-task IPC overhead stays negligible.
+DEFAULT_CHUNKSIZE = 256
+
+_SNAPSHOT_FILENAME = "registry.snapshot"
+
+
+def _parse_payload(payload: tuple[str, bytes]) -> Any:  # noqa: ANN401  # Runtime UUID dispatch cannot be type-safe
+    """Parse one (uuid, raw_data) payload inside a worker process."""
+    uuid, raw_data = payload
+    return CharacteristicParser().parse_characteristic(uuid, raw_data)
+
+
+class ProcessPoolParser:
+    """Fan characteristic parsing out to a ``ProcessPoolExecutor``.
+
+    The registry snapshot is written once and the worker pool is kept between
+    calls; asking for a different ``max_workers`` replaces the pool.
+    """
+
+    def __init__(self) -> None:
+        """Initialise without a snapshot or worker pool."""
+        self._lock = threading.Lock()
+        self._snapshot_dir: tempfile.TemporaryDirectory[str] | None = None
+        self._snapshot_path: Path | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._max_workers: int | None = None
+
+    def parse_characteristics_in_processes(
+        self,
+        payloads: Sequence[tuple[str, bytes]],
+        max_workers: int | None = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+    ) -> list[Any]:
+        """Parse independent payloads in worker processes.
+
+        Args:
+            payloads: (characteristic UUID, raw data) pairs
+            max_workers: Worker process count (``None`` = CPU count)
+            chunksize: Payloads sent to a worker per task
+
+        Returns:
+            Parsed values, in the same order as *payloads*
+
+        Raises:
+            SpecialValueDetectedError: Special sentinel value detected
+            CharacteristicParseError: Parse/validation failure
+
+        """
+        if not payloads:
+            return []
+        return list(self._get_executor(max_workers).map(_parse_payload, payloads, chunksize=chunksize))
+
+    def close(self) -> None:
+        """Shut the worker pool down and remove the snapshot file."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+            if self._snapshot_dir is not None:
+                self._snapshot_dir.cleanup()
+                self._snapshot_dir = None
+                self._snapshot_path = None
+
+    def _get_executor(self, max_workers: int | None) -> ProcessPoolExecutor:
+        """Return the worker pool, creating the snapshot and pool on first use."""
+        with self._lock:
+            if self._snapshot_path is None:
+                self._snapshot_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+                self._snapshot_path = write_registry_snapshot(Path(self._snapshot_dir.name) / _SNAPSHOT_FILENAME)
+            if self._executor is not None and self._max_workers != max_workers:
+                self._executor.shutdown()
+                self._executor = None
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=attach_registry_snapshot,
+                    initargs=(self._snapshot_path,),
+                )
+                self._max_workers = max_workers
+            return self._executor
@@ -6,17 +6,34 @@ Handles process_services, get_service_by_uuid, discovered_services, clear_servic
 
 from __future__ import annotations
 
+import hashlib
 from typing import Any
 
+import msgspec
+
+from ..gatt.discovery_cache import ServiceDiscoveryCache, ServiceTreePrototype, get_discovery_cache
 from ..gatt.services.base import BaseGattService
-from ..gatt.services.registry import GattServiceRegistry
 from ..types import CharacteristicInfo
 from ..types.gatt_enums import WIRE_TYPE_MAP
+from ..types.gatt_services import ServiceDiscoveryData
 from ..types.uuid import BluetoothUUID
 
 # Type alias for characteristic data in process_services
 CharacteristicDataDict = dict[str, Any]
 
+_KEY_DIGEST_SIZE = 16
+
+# Prototypes built here carry the caller's names and types, so they are kept
+# apart from prototypes other producers store in the shared cache.
+_KEY_PREFIX = b"services:"
+
+
+def _discovery_key(services: dict[str, dict[str, CharacteristicDataDict]]) -> bytes:
+    """Digest of the discovery input, including names and types used for unknown characteristics."""
+    # value_type may be a Python type; any stable text form will do for a key
+    encoded = msgspec.json.encode(services, enc_hook=repr)
+    return _KEY_PREFIX + hashlib.blake2b(encoded, digest_size=_KEY_DIGEST_SIZE).digest()
+
 
 class ServiceManager:
     """Manages discovered GATT services.
@@ -25,21 +42,49 @@ class ServiceManager:
     discovered services keyed by normalised UUID strings.
     """
 
-    def __init__(self) -> None:
-        """Initialise with an empty services dict."""
+    def __init__(self, discovery_cache: ServiceDiscoveryCache | None = None) -> None:
+        """Initialise with an empty services dict.
+
+        Args:
+            discovery_cache: Cache of resolved service trees (defaults to the
+                process-wide cache)
+
+        """
         # Performance: Use str keys (normalised UUIDs) for fast dict lookups
         self._services: dict[str, BaseGattService] = {}
-
-    def process_services(self, services: dict[str, dict[str, CharacteristicDataDict]]) -> None:
+        self._discovery_cache = get_discovery_cache() if discovery_cache is None else discovery_cache
+
+    def process_services(
+        self,
+        services: dict[str, dict[str, CharacteristicDataDict]],
+        *,
+        database_hash: bytes | None = None,
+    ) -> None:
         """Process discovered services and their characteristics.
 
+        Classes are resolved once per distinct database; repeated discoveries
+        of the same database instantiate the cached service tree.
+
         Args:
             services: Dictionary of service UUIDs to their characteristics
+            database_hash: Value of the device's Database Hash characteristic,
+                if read; identifies the database without hashing *services*
 
         """
+        key = _KEY_PREFIX + database_hash if database_hash is not None else _discovery_key(services)
+        prototype = self._discovery_cache.get(key)
+        if prototype is None:
+            prototype = self._discovery_cache.put(key, ServiceTreePrototype.resolve(self._discovery_data(services)))
+        self._services.update(prototype.instantiate())
+
+    @staticmethod
+    def _discovery_data(
+        services: dict[str, dict[str, CharacteristicDataDict]],
+    ) -> dict[BluetoothUUID, ServiceDiscoveryData]:
+        """Convert the raw discovery input into characteristic info per service."""
+        discovery: dict[BluetoothUUID, ServiceDiscoveryData] = {}
         for uuid_str, service_data in services.items():
-            uuid = BluetoothUUID(uuid_str)
-            characteristics: dict[BluetoothUUID, CharacteristicInfo] = {}
+            characteristics: ServiceDiscoveryData = {}
             for char_uuid_str, char_data in service_data.get("characteristics", {}).items():
                 char_uuid = BluetoothUUID(char_uuid_str)
                 vtype_raw = char_data.get("value_type", "bytes")
@@ -54,9 +99,8 @@ class ServiceManager:
                     unit=char_data.get("unit", ""),
                     python_type=python_type,
                 )
-            service = GattServiceRegistry.create_service(uuid, characteristics)
-            if service:
-                self._services[str(uuid)] = service
+            discovery[BluetoothUUID(uuid_str)] = characteristics
+        return discovery
 
     def get_service_by_uuid(self, uuid: str) -> BaseGattService | None:
         """Get a service instance by UUID.
@@ -8,6 +8,7 @@ delegates all work to five focused components:
 * :class:`~.encoder.CharacteristicEncoder` — encode, validate, create_value
 * :class:`~.registration.RegistrationManager` — custom class registration
 * :class:`~.service_manager.ServiceManager` — discovered-service lifecycle
+* :class:`~.process_pool.ProcessPoolParser` — process-pool batch parsing
 
 The facade preserves every public method signature, ``@overload``
 decorator, async wrapper, and the singleton pattern from the original
@@ -16,9 +17,11 @@ monolithic implementation.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any, TypeVar, overload
 
 from ..gatt.characteristics.base import BaseCharacteristic
+from ..gatt.characteristics.pipeline import ParseResult
 from ..gatt.services.base import BaseGattService
 from ..types import (
     CharacteristicContext,
@@ -31,6 +34,7 @@ from ..types.gatt_enums import CharacteristicName, ServiceName
 from ..types.uuid import BluetoothUUID
 from .encoder import CharacteristicEncoder
 from .parser import CharacteristicParser
+from .process_pool import DEFAULT_CHUNKSIZE, ProcessPoolParser
 from .query import CharacteristicQueryEngine
 from .registration import RegistrationManager
 from .service_manager import CharacteristicDataDict, ServiceManager
@@ -104,6 +108,7 @@ class BluetoothSIGTranslator:  # pylint: disable=too-many-public-methods
         self._encoder = CharacteristicEncoder(self._parser)
         self._registration = RegistrationManager()
         self._services = ServiceManager()
+        self._process_pool = ProcessPoolParser()
 
     def __str__(self) -> str:
         """Return string representation of the translator."""
@@ -165,6 +170,56 @@ class BluetoothSIGTranslator:  # pylint: disable=too-many-public-methods
         """
         return self._parser.parse_characteristic(char, raw_data, ctx)
 
+    @overload
+    def try_parse_characteristic(
+        self,
+        char: type[BaseCharacteristic[T]],
+        raw_data: bytes | bytearray,
+        ctx: CharacteristicContext | None = ...,
+    ) -> ParseResult[T]: ...
+
+    @overload
+    def try_parse_characteristic(
+        self,
+        char: str,
+        raw_data: bytes | bytearray,
+        ctx: CharacteristicContext | None = ...,
+    ) -> ParseResult[Any]: ...
+
+    def try_parse_characteristic(
+        self,
+        char: str | type[BaseCharacteristic[T]],
+        raw_data: bytes | bytearray,
+        ctx: CharacteristicContext | None = None,
+    ) -> ParseResult[T] | ParseResult[Any]:
+        r"""Parse a characteristic's raw data without raising.
+
+        Special values and parse failures are reported through the returned
+        result rather than ``SpecialValueDetectedError`` /
+        ``CharacteristicParseError``, avoiding exception construction on
+        streams where sentinels or malformed packets are frequent.
+
+        Args:
+            char: Characteristic class (type-safe) or UUID string (not type-safe).
+            raw_data: Raw bytes from the characteristic (bytes or bytearray)
+            ctx: Optional CharacteristicContext providing device-level info
+
+        Returns:
+            ParseResult with ``outcome`` ``OK``, ``SPECIAL_VALUE`` or ``ERROR``.
+
+        Example::
+
+            from bluetooth_sig import BluetoothSIGTranslator
+            from bluetooth_sig.types import ParseOutcome
+
+            translator = BluetoothSIGTranslator()
+            result = translator.try_parse_characteristic("2A6E", b"\\x00\\x80")
+            if result.outcome is ParseOutcome.SPECIAL_VALUE:
+                print(result.special_value.meaning)
+
+        """
+        return self._parser.try_parse_characteristic(char, raw_data, ctx)
+
     def parse_characteristics(
         self,
         char_data: dict[str, bytes],
@@ -200,6 +255,47 @@ class BluetoothSIGTranslator:  # pylint: disable=too-many-public-methods
         """
         return self._parser.parse_characteristics(char_data, ctx)
 
+    def parse_characteristics_in_processes(
+        self,
+        payloads: Sequence[tuple[str, bytes]],
+        max_workers: int | None = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+    ) -> list[Any]:
+        r"""Parse many independent payloads across a pool of worker processes.
+
+        Registries are loaded once in the calling process and shared with
+        workers through a read-only, memory-mapped registry snapshot, so
+        workers start without re-reading the SIG YAML files. The snapshot and
+        worker processes are kept for later calls until
+        :meth:`close_process_pool`. Payloads are parsed without context (no
+        cross-characteristic dependencies).
+
+        Args:
+            payloads: (characteristic UUID, raw data) pairs
+            max_workers: Worker process count (``None`` = CPU count)
+            chunksize: Payloads sent to a worker per task
+
+        Returns:
+            Parsed values, in the same order as *payloads*
+
+        Raises:
+            SpecialValueDetectedError: Special sentinel value detected
+            CharacteristicParseError: Parse/validation failure
+
+        Example::
+
+            from bluetooth_sig import BluetoothSIGTranslator
+
+            translator = BluetoothSIGTranslator()
+            levels = translator.parse_characteristics_in_processes([("2A19", b"\\x64")] * 10_000)
+
+        """
+        return self._process_pool.parse_characteristics_in_processes(payloads, max_workers, chunksize)
+
+    def close_process_pool(self) -> None:
+        """Shut down the worker processes used by :meth:`parse_characteristics_in_processes`."""
+        self._process_pool.close()
+
     # -------------------------------------------------------------------------
     # Encode
     # -------------------------------------------------------------------------
@@ -470,14 +566,24 @@ class BluetoothSIGTranslator:  # pylint: disable=too-many-public-methods
     # Service lifecycle
     # -------------------------------------------------------------------------
 
-    def process_services(self, services: dict[str, dict[str, CharacteristicDataDict]]) -> None:
+    def process_services(
+        self,
+        services: dict[str, dict[str, CharacteristicDataDict]],
+        *,
+        database_hash: bytes | None = None,
+    ) -> None:
         """Process discovered services and their characteristics.
 
+        Repeated discoveries of the same GATT database reuse the service tree
+        resolved the first time.
+
         Args:
             services: Dictionary of service UUIDs to their characteristics
+            database_hash: Value of the device's Database Hash characteristic
+                (0x2B2A), if read
 
         """
-        self._services.process_services(services)
+        self._services.process_services(services, database_hash=database_hash)
 
     def get_service_by_uuid(self, uuid: str) -> BaseGattService | None:
         """Get a service instance by UUID.
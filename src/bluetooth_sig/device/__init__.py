@@ -5,6 +5,9 @@ Additional composition-based subsystems are available for focused use cases:
 
 - DeviceAdvertising: Advertising packet interpretation
 - DeviceConnected: GATT connection operations (client/central role)
+- GattDatabaseCache: Persistent per-device GATT layout and static values
+- DevicePool: Link-limited, fair scheduling of operations across many devices
+- WritePipeline: Windowed, MTU-sized writes for bulk transfers
 """
 
 from __future__ import annotations
@@ -18,13 +21,16 @@ from bluetooth_sig.device.connected import (
 )
 from bluetooth_sig.device.dependency_resolver import DependencyResolutionMode
 from bluetooth_sig.device.device import Device
+from bluetooth_sig.device.gatt_cache import GattDatabaseCache
 from bluetooth_sig.device.peripheral import (
     CharacteristicDefinition,
     PeripheralManagerProtocol,
     ServiceDefinition,
 )
 from bluetooth_sig.device.peripheral_device import PeripheralDevice
+from bluetooth_sig.device.pool import DevicePool, DevicePoolStats
 from bluetooth_sig.device.protocols import SIGTranslatorProtocol
+from bluetooth_sig.device.write_pipeline import WritePipeline, WritePipelineStats
 
 __all__ = [
     "CharacteristicDefinition",
@@ -34,9 +40,14 @@ __all__ = [
     "DeviceAdvertising",
     "DeviceConnected",
     "DeviceEncryption",
+    "DevicePool",
+    "DevicePoolStats",
     "DeviceService",
+    "GattDatabaseCache",
     "PeripheralDevice",
     "PeripheralManagerProtocol",
     "ServiceDefinition",
     "SIGTranslatorProtocol",
+    "WritePipeline",
+    "WritePipelineStats",
 ]
@@ -19,11 +19,12 @@ Error Handling:
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import TypeVar, overload
 
 from bluetooth_sig.advertising import AdvertisingPDUParser
 from bluetooth_sig.advertising.base import AdvertisingData, PayloadInterpreter
+from bluetooth_sig.advertising.change_detection import AdvertisementChanges, AdvertisementChangeTracker
 from bluetooth_sig.advertising.exceptions import (
     AdvertisingParseError,
     DecryptionFailedError,
@@ -67,6 +68,14 @@ class DeviceAdvertising:  # pylint: disable=too-many-instance-attributes
         # Later, unsubscribe
         device.advertising.unsubscribe(on_advertisement)
 
+
+        # Or receive only what changed, ignoring temperature jitter below 0.2
+        def on_change(ad_data: AdvertisementData, changes: AdvertisementChanges) -> None:
+            print(f"Changed: {changes.values}")
+
+
+        device.advertising.subscribe_changes(on_change, thresholds={"temperature": 0.2})
+
         # Or process single advertisement manually
         ad_data = AdvertisingData(
             manufacturer_data={},
@@ -98,6 +107,9 @@ class DeviceAdvertising:  # pylint: disable=too-many-instance-attributes
         self._registry: PayloadInterpreterRegistry | None = None
         self._pdu_parser = AdvertisingPDUParser()
         self._callbacks: list[Callable[[AdvertisementData, object], None]] = []
+        self._change_subscriptions: list[
+            tuple[Callable[[AdvertisementData, AdvertisementChanges], None], AdvertisementChangeTracker]
+        ] = []
         self._backend_monitoring_enabled = False
 
     @property
@@ -400,8 +412,7 @@ class DeviceAdvertising:  # pylint: disable=too-many-instance-attributes
         self._callbacks.append(callback)
 
         # Automatically enable backend monitoring for first subscriber
-        if len(self._callbacks) == 1:
-            self._enable_backend_monitoring()
+        self._enable_backend_monitoring()
 
     def unsubscribe(self, callback: Callable[[AdvertisementData, object], None] | None = None) -> None:
         """Unsubscribe from advertisement updates.
@@ -423,7 +434,61 @@ class DeviceAdvertising:  # pylint: disable=too-many-instance-attributes
                 logger.warning("Callback not found in subscriptions")
 
         # Automatically disable backend monitoring when no callbacks remain
-        if not self._callbacks and self._backend_monitoring_enabled:
+        if not self._callbacks and not self._change_subscriptions:
+            self._disable_backend_monitoring()
+
+    def subscribe_changes(
+        self,
+        callback: Callable[[AdvertisementData, AdvertisementChanges], None],
+        thresholds: Mapping[str, float] | None = None,
+        *,
+        default_threshold: float = 0.0,
+    ) -> AdvertisementChangeTracker:
+        """Subscribe to advertisement changes only.
+
+        Unlike :meth:`subscribe`, the callback is not invoked for repeated
+        advertisements: an advertisement whose AD elements are byte-identical
+        to the previous ones is not even parsed, and the callback receives only
+        the elements and interpreted fields that changed.
+
+        Args:
+            callback: Function called with (AdvertisementData, AdvertisementChanges)
+            thresholds: Minimum change per numeric interpreted field before it
+                is reported
+            default_threshold: Minimum change for numeric fields not listed in
+                *thresholds* (``0`` reports any change)
+
+        Returns:
+            The subscription's tracker (e.g. to :meth:`~AdvertisementChangeTracker.reset` it)
+
+        Raises:
+            ValueError: If a threshold is negative
+
+        """
+        tracker = AdvertisementChangeTracker(thresholds, default_threshold=default_threshold)
+        self._change_subscriptions.append((callback, tracker))
+        self._enable_backend_monitoring()
+        return tracker
+
+    def unsubscribe_changes(
+        self,
+        callback: Callable[[AdvertisementData, AdvertisementChanges], None] | None = None,
+    ) -> None:
+        """Unsubscribe from advertisement changes.
+
+        Args:
+            callback: Specific callback to remove, or None to remove all
+
+        """
+        if callback is None:
+            self._change_subscriptions.clear()
+        else:
+            remaining = [entry for entry in self._change_subscriptions if entry[0] != callback]
+            if len(remaining) == len(self._change_subscriptions):
+                logger.warning("Change callback not found in subscriptions")
+            self._change_subscriptions = remaining
+
+        if not self._callbacks and not self._change_subscriptions:
             self._disable_backend_monitoring()
 
     def _dispatch_to_callbacks(
@@ -470,8 +535,32 @@ class DeviceAdvertising:  # pylint: disable=too-many-instance-attributes
     def _backend_callback_handler(self, raw_advertisement: AdvertisementData) -> None:
         """Process raw advertisement and dispatch to subscribers."""
         try:
-            processed_ad, interpreted_data = self.process_from_connection_manager(raw_advertisement)
+            # Processed at most once, and only if a subscriber needs the interpretation
+            processed: list[tuple[AdvertisementData, object | None]] = []
+
+            def interpret() -> object | None:
+                if not processed:
+                    processed.append(self.process_from_connection_manager(raw_advertisement))
+                return processed[0][1]
+
             if self._callbacks:
-                self._dispatch_to_callbacks(processed_ad, interpreted_data)
+                interpreted_data = interpret()
+                self._dispatch_to_callbacks(processed[0][0], interpreted_data)
+            for callback, tracker in list(self._change_subscriptions):
+                changes = tracker.observe(raw_advertisement, interpret)
+                if changes is not None:
+                    self._dispatch_change(callback, processed[0][0] if processed else raw_advertisement, changes)
         except Exception:  # pylint: disable=broad-exception-caught  # Catch-all to prevent backend crashes
             logger.exception("Error processing backend advertisement")
+
+    @staticmethod
+    def _dispatch_change(
+        callback: Callable[[AdvertisementData, AdvertisementChanges], None],
+        advertisement: AdvertisementData,
+        changes: AdvertisementChanges,
+    ) -> None:
+        """Invoke a change callback, logging rather than propagating its errors."""
+        try:
+            callback(advertisement, changes)
+        except Exception:  # pylint: disable=broad-exception-caught  # User callbacks may raise anything
+            logger.exception("Advertisement change callback raised exception")
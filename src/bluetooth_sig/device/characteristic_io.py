@@ -2,14 +2,23 @@
 
 Encapsulates read, write, and notification operations for GATT characteristics,
 including type-safe overloads for class-based and string/enum-based access.
+
+Concurrent reads of the same characteristic share a single ATT read, and
+characteristics given a TTL with :meth:`CharacteristicIO.set_read_cache_ttl`
+are answered from the last parsed value until it expires or the value is
+written or notified.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from collections.abc import Callable
 from typing import Any, TypeVar, cast, overload
 
+import msgspec
+
 from ..gatt.characteristics.base import BaseCharacteristic
 from ..gatt.characteristics.registry import CharacteristicName, CharacteristicRegistry
 from ..gatt.context import CharacteristicContext, DeviceInfo
@@ -17,12 +26,40 @@ from ..types.uuid import BluetoothUUID
 from .client import ClientManagerProtocol
 from .dependency_resolver import DependencyResolutionMode, DependencyResolver
 from .protocols import SIGTranslatorProtocol
+from .write_pipeline import WritePipeline
 
 logger = logging.getLogger(__name__)
 
 # Type variable for generic characteristic return types
 T = TypeVar("T")
 
+# Reads are shared per characteristic, separately for reads that skip dependencies
+_ReadKey = tuple[BluetoothUUID, bool]
+
+
+class ReadCacheStats(msgspec.Struct, kw_only=True):
+    """Counters for reads served by :class:`CharacteristicIO`.
+
+    Attributes:
+        reads: Read calls
+        device_reads: Reads issued to the device
+        hits: Reads answered from the TTL cache
+        coalesced: Reads that joined a read already in flight
+        invalidations: Cached or in-flight values dropped by writes and notifications
+
+    """
+
+    reads: int = 0
+    device_reads: int = 0
+    hits: int = 0
+    coalesced: int = 0
+    invalidations: int = 0
+
+    @property
+    def saved_ratio(self) -> float:
+        """Fraction of read calls that did not reach the device."""
+        return (self.hits + self.coalesced) / self.reads if self.reads else 0.0
+
 
 class CharacteristicIO:
     """Read, write, and notification operations for GATT characteristics.
@@ -41,6 +78,9 @@ class CharacteristicIO:
         translator: SIGTranslatorProtocol,
         dep_resolver: DependencyResolver,
         device_info_factory: Callable[[], DeviceInfo],
+        static_value_sink: Callable[[BluetoothUUID, bytes], None] | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         """Initialise with connection manager, translator, resolver, and info factory.
 
@@ -49,12 +89,21 @@ class CharacteristicIO:
             translator: Translator for parsing/encoding characteristics
             dep_resolver: Resolver for characteristic dependencies
             device_info_factory: Callable returning current DeviceInfo
+            static_value_sink: Optional callable receiving the raw value of
+                every static characteristic read
+            clock: Monotonic time source for read cache expiry, in seconds
 
         """
         self._connection_manager = connection_manager
         self._translator = translator
         self._dep_resolver = dep_resolver
         self._device_info_factory = device_info_factory
+        self._static_value_sink = static_value_sink
+        self._clock = clock
+        self._read_cache_ttls: dict[BluetoothUUID, float] = {}
+        self._read_cache: dict[_ReadKey, tuple[float, Any]] = {}
+        self._inflight_reads: dict[_ReadKey, asyncio.Future[Any]] = {}
+        self.read_stats = ReadCacheStats()
 
     # ------------------------------------------------------------------
     # Read
@@ -81,6 +130,10 @@ class CharacteristicIO:
     ) -> T | Any | None:  # Runtime UUID dispatch cannot be type-safe
         """Read a characteristic value from the device.
 
+        Concurrent calls for the same characteristic share one device read.
+        A value cached with :meth:`set_read_cache_ttl` is returned until it
+        expires; ``FORCE_REFRESH`` always reads the device.
+
         Args:
             char: Name, enum, or characteristic class to read.
                        Passing the class enables type-safe return values.
@@ -98,11 +151,87 @@ class CharacteristicIO:
             ValueError: If required dependencies cannot be resolved
 
         """
-        # Handle characteristic class input (type-safe path)
+        char_instance: BaseCharacteristic[Any] | None = None
         if isinstance(char, type) and issubclass(char, BaseCharacteristic):
-            char_class: type[BaseCharacteristic[Any]] = char
-            char_instance = char_class()
+            char_instance = char()
             resolved_uuid = char_instance.uuid
+        else:
+            resolved_uuid = self._resolve_characteristic_name(char)
+
+        key: _ReadKey = (resolved_uuid, resolution_mode == DependencyResolutionMode.SKIP_DEPENDENCIES)
+        stats = self.read_stats
+        stats.reads += 1
+        if resolution_mode != DependencyResolutionMode.FORCE_REFRESH:
+            cached = self._read_cache.get(key)
+            if cached is not None:
+                if cached[0] > self._clock():
+                    stats.hits += 1
+                    return cached[1]
+                del self._read_cache[key]
+            inflight = self._inflight_reads.get(key)
+            if inflight is not None:
+                stats.coalesced += 1
+                return await asyncio.shield(inflight)
+
+        stats.device_reads += 1
+        task = asyncio.ensure_future(self._read_from_device(resolved_uuid, char_instance, resolution_mode))
+        self._inflight_reads[key] = task
+        task.add_done_callback(lambda done: self._finish_read(key, done))
+        return await asyncio.shield(task)
+
+    def set_read_cache_ttl(
+        self,
+        char: str | CharacteristicName | type[BaseCharacteristic[Any]],
+        ttl: float | None,
+    ) -> None:
+        """Cache parsed values of a characteristic for *ttl* seconds.
+
+        Cached values are dropped early when the characteristic is written or
+        notified through this object.
+
+        Args:
+            char: Name, enum, or characteristic class to cache
+            ttl: Seconds a read value stays valid, or None to stop caching
+
+        Raises:
+            ValueError: If *ttl* is not positive
+
+        """
+        if isinstance(char, type) and issubclass(char, BaseCharacteristic):
+            resolved_uuid = char().uuid
+        else:
+            resolved_uuid = self._resolve_characteristic_name(char)
+        if ttl is None:
+            self._read_cache_ttls.pop(resolved_uuid, None)
+            self.invalidate_read_cache(resolved_uuid)
+            return
+        if ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        self._read_cache_ttls[resolved_uuid] = ttl
+
+    def invalidate_read_cache(self, char_uuid: BluetoothUUID | None = None) -> None:
+        """Drop cached values and stop sharing reads already in flight.
+
+        Args:
+            char_uuid: Characteristic to invalidate, or None for all
+
+        """
+        for store in (self._read_cache, self._inflight_reads):
+            stale = [key for key in store if char_uuid is None or key[0] == char_uuid]
+            for key in stale:
+                del store[key]
+            self.read_stats.invalidations += len(stale)
+
+    async def _read_from_device(
+        self,
+        resolved_uuid: BluetoothUUID,
+        char_instance: BaseCharacteristic[Any] | None,
+        resolution_mode: DependencyResolutionMode,
+    ) -> Any | None:  # noqa: ANN401  # Runtime UUID dispatch cannot be type-safe
+        """Resolve dependencies, read and parse one characteristic value."""
+        # Handle characteristic class input (type-safe path)
+        if char_instance is not None:
+            char_class: type[BaseCharacteristic[Any]] = type(char_instance)
 
             ctx: CharacteristicContext | None = None
             if resolution_mode != DependencyResolutionMode.SKIP_DEPENDENCIES:
@@ -110,11 +239,12 @@ class CharacteristicIO:
                 ctx = await self._dep_resolver.resolve(char_class, resolution_mode, device_info)
 
             raw = await self._connection_manager.read_gatt_char(resolved_uuid)
-            return char_instance.parse_value(raw, ctx=ctx)
+            value = char_instance.parse_value(raw, ctx=ctx)
+            if self._static_value_sink is not None and char_class.is_static():
+                self._static_value_sink(resolved_uuid, raw)
+            return value
 
         # Handle string/enum input (not type-safe path)
-        resolved_uuid = self._resolve_characteristic_name(char)
-
         char_class_lookup = CharacteristicRegistry.get_characteristic_class_by_uuid(resolved_uuid)
 
         # Resolve dependencies if characteristic class is known
@@ -125,7 +255,27 @@ class CharacteristicIO:
 
         # Read the characteristic
         raw = await self._connection_manager.read_gatt_char(resolved_uuid)
-        return self._translator.parse_characteristic(str(resolved_uuid), raw, ctx=ctx)
+        value = self._translator.parse_characteristic(str(resolved_uuid), raw, ctx=ctx)
+        if self._static_value_sink is not None and char_class_lookup is not None and char_class_lookup.is_static():
+            self._static_value_sink(resolved_uuid, raw)
+        return value
+
+    def _finish_read(self, key: _ReadKey, task: asyncio.Future[Any]) -> None:
+        """Stop sharing a completed read and cache its value if a TTL is set.
+
+        Reads invalidated while in flight are no longer registered and are
+        not cached.
+        """
+        if self._inflight_reads.get(key) is not task:
+            if not task.cancelled():
+                task.exception()  # Mark retrieved; every caller may have gone
+            return
+        del self._inflight_reads[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        ttl = self._read_cache_ttls.get(key[0])
+        if ttl is not None:
+            self._read_cache[key] = (self._clock() + ttl, task.result())
 
     # ------------------------------------------------------------------
     # Write
@@ -175,7 +325,10 @@ class CharacteristicIO:
             resolved_uuid = char_instance.uuid
             # data is typed value T, encode it
             encoded = char_instance.build_value(data)  # type: ignore[arg-type]  # T is erased at runtime; overload ensures type safety at call site
-            await self._connection_manager.write_gatt_char(resolved_uuid, bytes(encoded), response=response)
+            try:
+                await self._connection_manager.write_gatt_char(resolved_uuid, bytes(encoded), response=response)
+            finally:
+                self.invalidate_read_cache(resolved_uuid)
             return
 
         # Handle string/enum input (not type-safe path)
@@ -185,7 +338,32 @@ class CharacteristicIO:
 
         resolved_uuid = self._resolve_characteristic_name(char)
         # cast is safe: isinstance check above ensures data is bytes/bytearray
-        await self._connection_manager.write_gatt_char(resolved_uuid, cast("bytes", data), response=response)
+        try:
+            await self._connection_manager.write_gatt_char(resolved_uuid, cast("bytes", data), response=response)
+        finally:
+            self.invalidate_read_cache(resolved_uuid)
+
+    def write_pipeline(self, *, window: int = 4, response: bool = False) -> WritePipeline:
+        """Create a pipeline for streaming many writes at link rate.
+
+        Characteristics written through the pipeline have their cached read
+        values invalidated when it is flushed.
+
+        Args:
+            window: Most writes outstanding at once
+            response: Use write-with-response instead of write-without-response
+
+        Returns:
+            An empty :class:`WritePipeline` bound to this connection
+
+        """
+        return WritePipeline(
+            self._connection_manager,
+            self._resolve_characteristic_name,
+            window=window,
+            response=response,
+            on_written=self.invalidate_read_cache,
+        )
 
     # ------------------------------------------------------------------
     # Notifications
@@ -229,6 +407,7 @@ class CharacteristicIO:
 
             def _typed_cb(sender: str, data: bytes) -> None:
                 del sender  # Required by callback interface
+                self.invalidate_read_cache(resolved_uuid)
                 parsed = char_instance.parse_value(data)
                 try:
                     callback(parsed)
@@ -243,6 +422,7 @@ class CharacteristicIO:
         translator = self._translator
 
         def _internal_cb(sender: str, data: bytes) -> None:
+            self.invalidate_read_cache(resolved_uuid)
             parsed = translator.parse_characteristic(sender, data)
             try:
                 callback(parsed)
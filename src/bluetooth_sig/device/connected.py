@@ -18,12 +18,24 @@ import msgspec
 from bluetooth_sig.device.client import ClientManagerProtocol
 from bluetooth_sig.gatt.characteristics.base import BaseCharacteristic
 from bluetooth_sig.gatt.characteristics.registry import CharacteristicRegistry
+from bluetooth_sig.gatt.discovery_cache import (
+    ServiceDiscoveryCache,
+    ServiceTreePrototype,
+    get_discovery_cache,
+    layout_hash,
+)
 from bluetooth_sig.gatt.services.base import BaseGattService
 from bluetooth_sig.gatt.services.registry import GattServiceRegistry
+from bluetooth_sig.types.gatt_services import ServiceDiscoveryData
 from bluetooth_sig.types.uuid import BluetoothUUID
 
 logger = logging.getLogger(__name__)
 
+# Discovery-cache key namespaces. Layout prototypes have unnamed
+# characteristic info, so they must not be reused where names matter.
+_LAYOUT_KEY_PREFIX = b"layout:"
+_RESTORE_KEY_PREFIX = b"discovery:"
+
 
 class DeviceEncryption(msgspec.Struct, kw_only=True, frozen=False):
     """Encryption state for connected device.
@@ -93,16 +105,20 @@ class DeviceConnected:
         self,
         mac_address: str,
         connection_manager: ClientManagerProtocol | None = None,
+        discovery_cache: ServiceDiscoveryCache | None = None,
     ) -> None:
         """Initialise connection subsystem.
 
         Args:
             mac_address: Device MAC address.
             connection_manager: Optional connection manager (can be set later).
+            discovery_cache: Cache of resolved service trees shared between
+                devices (defaults to the process-wide cache).
 
         """
         self._mac_address = mac_address
         self._connection_manager = connection_manager
+        self._discovery_cache = get_discovery_cache() if discovery_cache is None else discovery_cache
         self.services: dict[str, DeviceService] = {}
         self.encryption = DeviceEncryption()
         self._is_connected = False
@@ -158,9 +174,17 @@ class DeviceConnected:
         self._is_connected = False
         self._subscriptions.clear()
 
-    async def discover_services(self) -> list[DeviceService]:
+    async def discover_services(self, *, database_hash: bytes | None = None) -> list[DeviceService]:
         """Discover and cache GATT services.
 
+        Service classes are resolved once per distinct GATT database and
+        shared through the discovery cache, so reconnecting to devices of the
+        same model skips the registry lookups.
+
+        Args:
+            database_hash: Value of the device's Database Hash characteristic
+                (0x2B2A), if read; otherwise the discovered layout is hashed.
+
         Returns:
             List of discovered services.
 
@@ -173,22 +197,68 @@ class DeviceConnected:
 
         # Get raw services from connection manager
         raw_services = await self._connection_manager.get_services()
+        identity = database_hash
+        if identity is None:
+            identity = layout_hash((raw_svc.service.uuid, raw_svc.characteristics) for raw_svc in raw_services)
+        key = _LAYOUT_KEY_PREFIX + identity
+        prototype = self._discovery_cache.get(key)
+        if prototype is None:
+            layout = [
+                (raw_svc.service.uuid, [BluetoothUUID(char_uuid) for char_uuid in raw_svc.characteristics])
+                for raw_svc in raw_services
+            ]
+            prototype = self._discovery_cache.put(key, ServiceTreePrototype.from_layout(layout))
+        service_classes = prototype.service_classes()
 
         self.services.clear()
         for raw_svc in raw_services:
-            uuid_str = str(raw_svc.service.uuid)
-            service_class = GattServiceRegistry.get_service_class_by_uuid(raw_svc.service.uuid)
-
-            device_service = DeviceService(
-                uuid=raw_svc.service.uuid,
-                service_class=service_class,
+            uuid = raw_svc.service.uuid
+            # The adapter's characteristic instances carry its runtime properties, so keep them
+            self.services[str(uuid)] = DeviceService(
+                uuid=uuid,
+                service_class=(
+                    service_classes[uuid] if uuid in service_classes else GattServiceRegistry.get_service_class(uuid)
+                ),
+                characteristics=dict(raw_svc.characteristics),
             )
 
-            # Discover characteristics for this service
-            for char_uuid_str, char_instance in raw_svc.characteristics.items():
-                device_service.characteristics[char_uuid_str] = char_instance
+        return list(self.services.values())
+
+    def restore_services(
+        self,
+        discovery: dict[BluetoothUUID, ServiceDiscoveryData],
+        *,
+        database_hash: bytes | None = None,
+    ) -> list[DeviceService]:
+        """Populate services from a previously discovered layout without GATT discovery.
+
+        Characteristic instances are created from the resolved classes, as no
+        adapter instances exist for a layout that was not discovered.
+
+        Args:
+            discovery: Characteristic information per service UUID, in
+                discovery order.
+            database_hash: Database Hash value the layout was stored with.
+
+        Returns:
+            List of restored services.
 
-            self.services[uuid_str] = device_service
+        """
+        identity = database_hash
+        if identity is None:
+            identity = layout_hash(discovery.items())
+        key = _RESTORE_KEY_PREFIX + identity
+        prototype = self._discovery_cache.get(key)
+        if prototype is None:
+            prototype = self._discovery_cache.put(key, ServiceTreePrototype.resolve(discovery))
+
+        self.services.clear()
+        for service in prototype.services:
+            self.services[str(service.uuid)] = DeviceService(
+                uuid=service.uuid,
+                service_class=service.service_class,
+                characteristics={str(char.uuid): char.instantiate() for char in service.characteristics},
+            )
 
         return list(self.services.values())
 
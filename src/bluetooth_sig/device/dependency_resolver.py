@@ -7,6 +7,7 @@ building a ``CharacteristicContext`` will all resolved dependency values.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from enum import Enum
 from typing import Any
 
@@ -38,16 +39,20 @@ class DependencyResolver:
         self,
         connection_manager: ClientManagerProtocol,
         connected: DeviceConnected,
+        static_value_sink: Callable[[BluetoothUUID, bytes], None] | None = None,
     ) -> None:
         """Initialise with connection manager and connected subsystem.
 
         Args:
             connection_manager: Connection manager for BLE reads
             connected: Connected subsystem for characteristic cache
+            static_value_sink: Optional callable receiving the raw value of
+                every static dependency read
 
         """
         self._connection_manager = connection_manager
         self._connected = connected
+        self._static_value_sink = static_value_sink
 
     async def resolve(
         self,
@@ -144,7 +149,7 @@ class DependencyResolver:
 
                 self._connected.cache_characteristic(dep_uuid, char_instance)
 
-            return char_instance.parse_value(raw_data)
+            parsed = char_instance.parse_value(raw_data)
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             if is_required:
@@ -154,6 +159,10 @@ class DependencyResolver:
             logger.warning("Failed to read optional dependency %s: %s", dep_class.__name__, e)
             return None
 
+        if self._static_value_sink is not None and dep_class.is_static():
+            self._static_value_sink(dep_uuid, raw_data)
+        return parsed
+
 
 class DependencyResolutionMode(Enum):
     """Mode for automatic dependency resolution during characteristic reads.
@@ -7,6 +7,7 @@ device.
 
 from __future__ import annotations
 
+import logging
 from collections.abc import Callable
 from typing import Any, TypeVar, overload
 
@@ -20,6 +21,7 @@ from ..gatt.descriptors.characteristic_user_description import (
     CharacteristicUserDescriptionDescriptor,
 )
 from ..gatt.descriptors.registry import DescriptorRegistry
+from ..gatt.discovery_cache import DATABASE_HASH_UUID
 from ..types import (
     DescriptorData,
     DescriptorInfo,
@@ -29,11 +31,17 @@ from ..types.device_types import ScannedDevice
 from ..types.gatt_enums import ServiceName
 from ..types.uuid import BluetoothUUID
 from .advertising import DeviceAdvertising
-from .characteristic_io import CharacteristicIO
+from .characteristic_io import CharacteristicIO, ReadCacheStats
 from .client import ClientManagerProtocol
 from .connected import DeviceConnected, DeviceEncryption, DeviceService
 from .dependency_resolver import DependencyResolutionMode, DependencyResolver
+from .gatt_cache import GattCacheEntry, GattDatabaseCache
 from .protocols import SIGTranslatorProtocol
+from .write_pipeline import WritePipeline
+
+logger = logging.getLogger(__name__)
+
+SERVICE_CHANGED_UUID = BluetoothUUID("2A05")
 
 # Type variable for generic characteristic return types
 T = TypeVar("T")
@@ -61,17 +69,27 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
     subsystem handles it.
     """
 
-    def __init__(self, connection_manager: ClientManagerProtocol, translator: SIGTranslatorProtocol) -> None:
+    def __init__(
+        self,
+        connection_manager: ClientManagerProtocol,
+        translator: SIGTranslatorProtocol,
+        *,
+        gatt_cache: GattDatabaseCache | None = None,
+    ) -> None:
         """Initialise Device instance with connection manager and translator.
 
         Args:
             connection_manager: Connection manager implementing ClientManagerProtocol
             translator: SIGTranslatorProtocol instance
+            gatt_cache: Optional persistent GATT cache; when given, known
+                devices skip discovery and static reads on reconnect
 
         """
         self.connection_manager = connection_manager
         self.translator = translator
         self._name: str = ""
+        self._gatt_cache = gatt_cache
+        self._gatt_entry: GattCacheEntry | None = None
 
         # Connected subsystem (composition pattern)
         self.connected = DeviceConnected(
@@ -85,10 +103,13 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         self.advertising.set_registry(PayloadInterpreterRegistry())
 
         # Dependency resolution delegate
-        self._dep_resolver = DependencyResolver(connection_manager, self.connected)
+        static_value_sink = self._remember_static_value if gatt_cache is not None else None
+        self._dep_resolver = DependencyResolver(connection_manager, self.connected, static_value_sink)
 
         # Characteristic I/O delegate
-        self._char_io = CharacteristicIO(connection_manager, translator, self._dep_resolver, lambda: self.device_info)
+        self._char_io = CharacteristicIO(
+            connection_manager, translator, self._dep_resolver, lambda: self.device_info, static_value_sink
+        )
 
         # Cache for device_info property and last advertisement
         self._device_info_cache: DeviceInfo | None = None
@@ -173,16 +194,92 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         """
         return await manager_class.scan(timeout)
 
-    async def connect(self) -> None:
+    async def connect(self, *, use_gatt_cache: bool = True) -> None:
         """Connect to the BLE device.
 
         Convenience method that delegates to device.connected.connect().
+        With a GATT cache attached, a known device's services and static
+        characteristic values are restored instead of being rediscovered;
+        ``self.services`` stays empty when there was nothing to restore.
+
+        Args:
+            use_gatt_cache: Whether to restore from the GATT cache, if any
 
         Raises:
             RuntimeError: If no connection manager is attached
 
         """
         await self.connected.connect()
+        if use_gatt_cache and self._gatt_cache is not None:
+            await self._restore_gatt_cache(self._gatt_cache)
+
+    async def _restore_gatt_cache(self, gatt_cache: GattDatabaseCache) -> bool:
+        """Restore services and static values from the GATT cache.
+
+        The stored Database Hash, if any, is compared with the device's
+        current value first; a mismatch invalidates the entry.
+
+        Returns:
+            True if the device's services were restored
+
+        """
+        entry = gatt_cache.load(self.address)
+        if entry is None:
+            return False
+        if entry.database_hash is not None and await self._read_database_hash() != entry.database_hash:
+            logger.debug("GATT database of %s changed since it was cached", self.address)
+            gatt_cache.invalidate(self.address)
+            return False
+
+        self.connected.restore_services(entry.discovery(), database_hash=entry.database_hash)
+        for uuid_str, raw in entry.values.items():
+            characteristic = self.connected.get_cached_characteristic(BluetoothUUID(uuid_str))
+            if characteristic is not None:
+                # Sets last_parsed, which dependency resolution reuses instead of reading
+                characteristic.try_parse_value(raw)
+        self._gatt_entry = entry
+        self._device_info_cache = None
+        await self._watch_service_changed()
+        return True
+
+    async def _read_database_hash(self) -> bytes | None:
+        """Read the Database Hash characteristic, or None if it cannot be read."""
+        try:
+            return bytes(await self.connection_manager.read_gatt_char(DATABASE_HASH_UUID))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.debug("Could not read Database Hash of %s: %s", self.address, e)
+            return None
+
+    async def _watch_service_changed(self) -> None:
+        """Invalidate the GATT cache entry when the device indicates Service Changed."""
+        if self.connected.get_cached_characteristic(SERVICE_CHANGED_UUID) is None:
+            return
+        try:
+            await self.connection_manager.start_notify(SERVICE_CHANGED_UUID, self._on_service_changed)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.debug("Could not subscribe to Service Changed on %s: %s", self.address, e)
+
+    def _on_service_changed(self, _sender: str, _data: bytes) -> None:
+        """Handle a Service Changed indication."""
+        logger.info("Service Changed indicated by %s; call discover_services() to refresh", self.address)
+        self.invalidate_gatt_cache()
+
+    def _remember_static_value(self, char_uuid: BluetoothUUID, raw: bytes) -> None:
+        """Persist the raw value of a static characteristic read from the device."""
+        entry = self._gatt_entry
+        if self._gatt_cache is None or entry is None:
+            return
+        key = str(char_uuid)
+        if entry.values.get(key) == raw:
+            return
+        entry.values[key] = bytes(raw)
+        self._gatt_cache.store(entry)
+
+    def invalidate_gatt_cache(self) -> None:
+        """Drop this device's GATT cache entry, so the next connection rediscovers."""
+        self._gatt_entry = None
+        if self._gatt_cache is not None:
+            self._gatt_cache.invalidate(self.address)
 
     async def disconnect(self) -> None:
         """Disconnect from the BLE device.
@@ -194,6 +291,7 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
 
         """
         await self.connected.disconnect()
+        self._char_io.invalidate_read_cache()
 
     # ------------------------------------------------------------------
     # Characteristic I/O (delegated to CharacteristicIO)
@@ -274,6 +372,21 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         """
         await self._char_io.write(char, data, response=response)  # type: ignore[arg-type, misc]  # Union narrowing handled by overloads; mypy can't infer across delegation
 
+    def write_pipeline(self, *, window: int = 4, response: bool = False) -> WritePipeline:
+        """Create a pipeline for bulk and burst writes to this device.
+
+        Delegates to :meth:`CharacteristicIO.write_pipeline`.
+
+        Args:
+            window: Most writes outstanding at once
+            response: Use write-with-response instead of write-without-response
+
+        Returns:
+            An empty :class:`WritePipeline` sized to the device's MTU
+
+        """
+        return self._char_io.write_pipeline(window=window, response=response)
+
     @overload
     async def start_notify(
         self,
@@ -307,6 +420,28 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         """
         await self._char_io.start_notify(char, callback)
 
+    def set_read_cache_ttl(
+        self,
+        char: str | CharacteristicName | type[BaseCharacteristic[Any]],
+        ttl: float | None,
+    ) -> None:
+        """Answer reads of a characteristic from its last value for *ttl* seconds.
+
+        Delegates to :meth:`CharacteristicIO.set_read_cache_ttl`. Writes,
+        notifications and disconnecting drop the cached value.
+
+        Args:
+            char: Name, enum, or characteristic class to cache
+            ttl: Seconds a read value stays valid, or None to stop caching
+
+        """
+        self._char_io.set_read_cache_ttl(char, ttl)
+
+    @property
+    def read_stats(self) -> ReadCacheStats:
+        """Cache hit and coalescing counters for characteristic reads."""
+        return self._char_io.read_stats
+
     async def stop_notify(self, char_name: str | CharacteristicName) -> None:
         """Stop notifications for a characteristic.
 
@@ -567,12 +702,18 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
             return char_instance.last_parsed
         return None
 
-    async def discover_services(self) -> dict[str, Any]:
+    async def discover_services(self, *, database_hash: bytes | None = None) -> dict[str, Any]:
         """Discover services and characteristics from the connected BLE device.
 
         Performs BLE service discovery via the connection manager.  The
         discovered :class:`DeviceService` objects (with characteristic
         instances and runtime properties) are stored in ``self.services``.
+        With a GATT cache attached, the layout is also persisted together
+        with the Database Hash, which is read here if the device exposes it.
+
+        Args:
+            database_hash: Value of the device's Database Hash characteristic,
+                if read; devices sharing a hash share resolved service classes.
 
         Returns:
             Dictionary mapping service UUIDs to DeviceService objects.
@@ -582,11 +723,18 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
 
         """
         # Delegate to connected subsystem
-        services_list = await self.connected.discover_services()
+        services_list = await self.connected.discover_services(database_hash=database_hash)
 
         # Invalidate device_info cache since services changed
         self._device_info_cache = None
 
+        if self._gatt_cache is not None:
+            if database_hash is None and self.connected.get_cached_characteristic(DATABASE_HASH_UUID) is not None:
+                database_hash = await self._read_database_hash()
+            self._gatt_entry = GattCacheEntry.from_services(self.address, services_list, database_hash=database_hash)
+            self._gatt_cache.store(self._gatt_entry)
+            await self._watch_service_changed()
+
         # Return as dict for backward compatibility
         return {str(svc.uuid): svc for svc in services_list}
 
@@ -0,0 +1,238 @@
+"""Persistent per-device GATT database cache.
+
+Reconnecting to a known device normally repeats service discovery and
+re-reads characteristics whose values never change for a given GATT
+database (Device Information strings, feature bitmasks, sensor location).
+:class:`GattDatabaseCache` persists, per device address, the discovered
+service layout, the device's Database Hash value when it exposes one, and the
+last raw values of characteristics declared static
+(:meth:`~bluetooth_sig.gatt.characteristics.base.BaseCharacteristic.is_static`).
+
+Entries are msgpack-encoded rows in a local SQLite file. A
+:class:`~bluetooth_sig.device.device.Device` created with a cache restores an
+entry on connect, verifying the Database Hash first when one was stored, and
+drops it when the device indicates Service Changed.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+
+import msgspec
+
+from ..types import CharacteristicInfo
+from ..types.gatt_services import ServiceDiscoveryData
+from ..types.uuid import BluetoothUUID
+from .connected import DeviceService
+
+logger = logging.getLogger(__name__)
+
+# Bump when the encoded entry layout changes; older files are discarded.
+_SCHEMA_VERSION = 1
+
+
+class CachedCharacteristic(msgspec.Struct, frozen=True, kw_only=True):
+    """Characteristic of a cached service.
+
+    Attributes:
+        uuid: Characteristic UUID string, as reported by the adapter
+        name: Characteristic name, used for characteristics without a class
+
+    """
+
+    uuid: str
+    name: str = ""
+
+
+class CachedService(msgspec.Struct, frozen=True, kw_only=True):
+    """Service of a cached GATT database.
+
+    Attributes:
+        uuid: Service UUID string
+        characteristics: The service's characteristics in discovery order
+
+    """
+
+    uuid: str
+    characteristics: tuple[CachedCharacteristic, ...] = ()
+
+
+class GattCacheEntry(msgspec.Struct, kw_only=True):
+    """Persisted state of one device's GATT database.
+
+    Attributes:
+        address: Device address
+        services: Discovered services in discovery order
+        database_hash: Value of the Database Hash characteristic at discovery,
+            or None if the device does not expose one
+        values: Last raw values of static characteristics by UUID string
+
+    """
+
+    address: str
+    services: tuple[CachedService, ...]
+    database_hash: bytes | None = None
+    values: dict[str, bytes] = msgspec.field(default_factory=dict)
+
+    @classmethod
+    def from_services(
+        cls,
+        address: str,
+        services: Iterable[DeviceService],
+        *,
+        database_hash: bytes | None = None,
+    ) -> GattCacheEntry:
+        """Build an entry from discovered services.
+
+        Args:
+            address: Device address
+            services: Services returned by discovery
+            database_hash: Database Hash value read after discovery, if any
+
+        Returns:
+            A new entry without static values
+
+        """
+        return cls(
+            address=address,
+            services=tuple(
+                CachedService(
+                    uuid=str(service.uuid),
+                    characteristics=tuple(
+                        CachedCharacteristic(uuid=char_uuid, name=characteristic.name)
+                        for char_uuid, characteristic in service.characteristics.items()
+                    ),
+                )
+                for service in services
+            ),
+            database_hash=database_hash,
+        )
+
+    def discovery(self) -> dict[BluetoothUUID, ServiceDiscoveryData]:
+        """Return the stored layout as characteristic information per service."""
+        discovery: dict[BluetoothUUID, ServiceDiscoveryData] = {}
+        for service in self.services:
+            characteristics: ServiceDiscoveryData = {}
+            for characteristic in service.characteristics:
+                char_uuid = BluetoothUUID(characteristic.uuid)
+                characteristics[char_uuid] = CharacteristicInfo(uuid=char_uuid, name=characteristic.name)
+            discovery[BluetoothUUID(service.uuid)] = characteristics
+        return discovery
+
+
+_entry_encoder = msgspec.msgpack.Encoder()
+_entry_decoder = msgspec.msgpack.Decoder(GattCacheEntry)
+
+
+class GattDatabaseCache:
+    """SQLite-backed store of :class:`GattCacheEntry` records keyed by address.
+
+    The store is local to the host and safe to share between threads. Use
+    ``":memory:"`` for a cache that lives only as long as the process.
+
+    Example::
+        >>> cache = GattDatabaseCache("~/.cache/gatt.sqlite3")
+        >>> device = Device(manager, translator, gatt_cache=cache)
+        >>> await device.connect()  # Services restored when the device is known
+        >>> if not device.services:
+        ...     await device.discover_services()  # Stored for the next connection
+
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        """Open (creating if needed) the cache database.
+
+        Args:
+            path: Database file path, or ``":memory:"``
+
+        """
+        location = str(path) if str(path) == ":memory:" else str(Path(path).expanduser())
+        self._connection = sqlite3.connect(location, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+            if version != _SCHEMA_VERSION:
+                self._connection.execute("DROP TABLE IF EXISTS gatt_database")
+                self._connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS gatt_database (address TEXT PRIMARY KEY, entry BLOB NOT NULL)"
+            )
+
+    def load(self, address: str) -> GattCacheEntry | None:
+        """Return the stored entry for *address*, or None.
+
+        Entries that no longer decode are removed.
+        """
+        key = address.upper()
+        with self._lock:
+            row = self._connection.execute("SELECT entry FROM gatt_database WHERE address = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return _entry_decoder.decode(row[0])
+        except (msgspec.DecodeError, msgspec.ValidationError):
+            logger.warning("Discarding unreadable GATT cache entry for %s", key)
+            self.invalidate(key)
+            return None
+
+    def store(self, entry: GattCacheEntry) -> None:
+        """Insert or replace the entry for ``entry.address``."""
+        encoded = _entry_encoder.encode(entry)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO gatt_database (address, entry) VALUES (?, ?)",
+                (entry.address.upper(), encoded),
+            )
+
+    def invalidate(self, address: str) -> bool:
+        """Remove the entry for *address*.
+
+        Returns:
+            True if an entry was removed
+
+        """
+        with self._lock, self._connection:
+            cursor = self._connection.execute("DELETE FROM gatt_database WHERE address = ?", (address.upper(),))
+        return cursor.rowcount > 0
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM gatt_database")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        with self._lock:
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM gatt_database").fetchone()
+        return int(count)
+
+    def __enter__(self) -> GattDatabaseCache:
+        """Return the cache for use as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the cache on leaving the context."""
+        self.close()
+
+
+__all__ = [
+    "CachedCharacteristic",
+    "CachedService",
+    "GattCacheEntry",
+    "GattDatabaseCache",
+]
@@ -0,0 +1,523 @@
+"""Shared connection slots and fair operation scheduling for many devices.
+
+A Bluetooth adapter supports a fixed number of simultaneous links, so a
+gateway serving more devices than that has to connect, use and release
+links in turn. :class:`DevicePool` owns that decision for a set of
+:class:`~bluetooth_sig.device.device.Device` instances:
+
+- at most ``max_links`` devices are connected at once; an idle connected
+  device is disconnected (least recently used first) when another needs a
+  link;
+- devices with queued operations take turns, ``quantum`` operations per
+  turn, with higher ``priority`` devices served first;
+- ``keep_connected`` devices (typically the ones streaming notifications)
+  hold their link permanently and are reconnected after a drop;
+- failed connection attempts are retried with exponential backoff.
+
+Operations run one at a time per device, matching the single outstanding
+ATT request of a BLE link. :class:`DevicePoolStats` reports queueing delay
+and link utilisation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from types import TracebackType
+from typing import Any, TypeVar
+
+import msgspec
+
+from ..gatt.characteristics.base import BaseCharacteristic
+from ..gatt.characteristics.registry import CharacteristicName
+from .dependency_resolver import DependencyResolutionMode
+from .device import Device
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class DevicePoolStats(msgspec.Struct, kw_only=True):
+    """Counters describing the work a :class:`DevicePool` has scheduled.
+
+    Attributes:
+        submitted: Operations submitted
+        started: Operations that started running
+        completed: Operations that returned a result
+        failed: Operations that raised, or were abandoned after connection failures
+        connects: Successful connections
+        connect_failures: Failed connection attempts
+        evictions: Idle links closed to serve another device
+        total_queue_delay: Seconds operations spent between submission and start
+        max_queue_delay: Longest single queueing delay, in seconds
+        busy_link_time: Link-seconds spent executing operations
+
+    """
+
+    submitted: int = 0
+    started: int = 0
+    completed: int = 0
+    failed: int = 0
+    connects: int = 0
+    connect_failures: int = 0
+    evictions: int = 0
+    total_queue_delay: float = 0.0
+    max_queue_delay: float = 0.0
+    busy_link_time: float = 0.0
+
+    @property
+    def mean_queue_delay(self) -> float:
+        """Average queueing delay of started operations, in seconds."""
+        return self.total_queue_delay / self.started if self.started else 0.0
+
+
+class _PoolJob:
+    """One queued operation and the future awaiting its result."""
+
+    __slots__ = ("future", "operation", "submitted")
+
+    def __init__(
+        self, operation: Callable[[Device], Awaitable[Any]], future: asyncio.Future[Any], submitted: float
+    ) -> None:
+        self.operation = operation
+        self.future = future
+        self.submitted = submitted
+
+
+class _PoolMember:  # pylint: disable=too-many-instance-attributes
+    """Scheduling state of one device in the pool."""
+
+    __slots__ = (
+        "connected",
+        "device",
+        "failures",
+        "jobs",
+        "keep_connected",
+        "last_used",
+        "priority",
+        "retry_at",
+        "running",
+        "turn",
+    )
+
+    def __init__(self, device: Device, priority: int, keep_connected: bool) -> None:
+        self.device = device
+        self.priority = priority
+        self.keep_connected = keep_connected
+        self.jobs: deque[_PoolJob] = deque()
+        self.connected = False
+        self.running = False
+        self.failures = 0
+        self.retry_at = 0.0
+        self.last_used = 0.0
+        # Sequence number of this member's current entry in the ready queue (0: not queued)
+        self.turn = 0
+
+    @property
+    def wants_link(self) -> bool:
+        """Whether the member has work, or must be connected regardless."""
+        return bool(self.jobs) or (self.keep_connected and not self.connected)
+
+
+class DevicePool:  # pylint: disable=too-many-instance-attributes
+    """Schedules operations on many devices over a limited number of links.
+
+    Example::
+        >>> pool = DevicePool(max_links=5)
+        >>> for manager in managers:
+        ...     pool.add(Device(manager, translator))
+        >>> pool.add(Device(hrm_manager, translator), priority=1, keep_connected=True)
+        >>> levels = await asyncio.gather(*(pool.read(address, "battery_level") for address in addresses))
+        >>> pool.stats.mean_queue_delay, pool.link_utilization
+        (0.41, 0.93)
+
+    Attributes:
+        max_links: Maximum number of devices connected at once
+        quantum: Operations a device may run per turn while others wait
+        reconnect_delay: Backoff after the first failed connection attempt
+        max_reconnect_delay: Upper bound of the exponential backoff
+        max_connect_attempts: Consecutive failures after which a device's
+            queued operations fail with the connection error
+        stats: Running counters
+
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        max_links: int = 7,
+        *,
+        quantum: int = 1,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        max_connect_attempts: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise an empty pool.
+
+        Args:
+            max_links: Maximum number of devices connected at once
+            quantum: Operations a device may run per turn while others wait
+            reconnect_delay: Backoff after the first failed connection attempt
+            max_reconnect_delay: Upper bound of the exponential backoff
+            max_connect_attempts: Consecutive failures after which a device's
+                queued operations fail with the connection error
+            clock: Time source for statistics and backoff
+
+        Raises:
+            ValueError: If max_links, quantum or max_connect_attempts is not positive
+
+        """
+        if max_links <= 0 or quantum <= 0 or max_connect_attempts <= 0:
+            raise ValueError("max_links, quantum and max_connect_attempts must be positive")
+        self.max_links = max_links
+        self.quantum = quantum
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.max_connect_attempts = max_connect_attempts
+        self.stats = DevicePoolStats()
+        self._clock = clock
+        self._members: dict[str, _PoolMember] = {}
+        # Members holding (or connecting on) a link
+        self._links: set[_PoolMember] = set()
+        # (-priority, turn, member) for members waiting to run
+        self._ready: list[tuple[int, int, _PoolMember]] = []
+        self._turns = 0
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._retry_timer: asyncio.TimerHandle | None = None
+        self._stats_since = clock()
+
+    def add(self, device: Device, *, priority: int = 0, keep_connected: bool = False) -> None:
+        """Add a device to the pool.
+
+        The pool takes over the device's disconnected callback to track
+        dropped links.
+
+        Args:
+            device: Device to schedule; it must not be connected elsewhere
+            priority: Devices with higher priority are served first
+            keep_connected: Hold a link for this device permanently, e.g. to
+                receive notifications; it is connected as soon as a link is free
+
+        Raises:
+            ValueError: If a device with the same address is already pooled,
+                or *keep_connected* is set and every link is already held by
+                a keep_connected device
+
+        """
+        address = device.address
+        if address in self._members:
+            raise ValueError(f"Device {address} is already in the pool")
+        if keep_connected and self._pinned_links() >= self.max_links:
+            raise ValueError(f"All {self.max_links} links are held by keep_connected devices")
+        member = _PoolMember(device, priority, keep_connected)
+        self._members[address] = member
+        device.set_disconnected_callback(lambda: self._on_disconnected(member))
+        if keep_connected:
+            self._enqueue(member)
+            self._schedule()
+
+    async def remove(self, address: str) -> None:
+        """Remove a device, failing its queued operations and disconnecting it.
+
+        Args:
+            address: Address of the pooled device
+
+        Raises:
+            KeyError: If the device is not in the pool
+
+        """
+        member = self._members.pop(address)
+        member.keep_connected = False
+        self._fail_jobs(member)
+        if member.connected and not member.running:
+            self._links.discard(member)
+            await self._disconnect(member)
+        self._schedule()
+
+    async def submit(self, address: str, operation: Callable[[Device], Awaitable[T]]) -> T:
+        """Queue *operation* for a device and wait for its result.
+
+        Args:
+            address: Address of the pooled device
+            operation: Coroutine function called with the connected device
+
+        Returns:
+            The operation's result
+
+        Raises:
+            KeyError: If the device is not in the pool
+            RuntimeError: If the device can never get a link because every
+                link is held by keep_connected devices
+
+        """
+        member = self._members[address]
+        if not member.keep_connected and self._pinned_links() >= self.max_links:
+            raise RuntimeError(f"No link for {address}: all {self.max_links} links are held by keep_connected devices")
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        member.jobs.append(_PoolJob(operation, future, self._clock()))
+        self.stats.submitted += 1
+        if not member.running:
+            self._enqueue(member)
+            self._schedule()
+        return await future
+
+    async def read(
+        self,
+        address: str,
+        char: str | CharacteristicName | type[BaseCharacteristic[Any]],
+        resolution_mode: DependencyResolutionMode = DependencyResolutionMode.NORMAL,
+    ) -> Any:  # noqa: ANN401  # Runtime UUID dispatch cannot be type-safe
+        """Read a characteristic through the pool; see :meth:`Device.read`."""
+        return await self.submit(address, lambda device: device.read(char, resolution_mode))
+
+    async def write(
+        self,
+        address: str,
+        char: str | CharacteristicName | type[BaseCharacteristic[Any]],
+        data: Any,  # noqa: ANN401  # Runtime UUID dispatch cannot be type-safe
+        response: bool = True,
+    ) -> None:
+        """Write a characteristic through the pool; see :meth:`Device.write`."""
+        await self.submit(address, lambda device: device.write(char, data, response))
+
+    @property
+    def links_in_use(self) -> int:
+        """Number of links currently held or being established."""
+        return len(self._links)
+
+    @property
+    def queued(self) -> int:
+        """Number of operations waiting to start."""
+        return sum(len(member.jobs) for member in self._members.values())
+
+    @property
+    def link_utilization(self) -> float:
+        """Fraction of available link time spent executing operations since the stats were reset."""
+        elapsed = self._clock() - self._stats_since
+        return self.stats.busy_link_time / (self.max_links * elapsed) if elapsed > 0 else 0.0
+
+    def reset_stats(self) -> None:
+        """Reset the counters and the utilisation window."""
+        self.stats = DevicePoolStats()
+        self._stats_since = self._clock()
+
+    async def close(self) -> None:
+        """Fail queued operations, wait for running ones and disconnect every device."""
+        if self._retry_timer is not None:
+            self._retry_timer.cancel()
+            self._retry_timer = None
+        for member in self._members.values():
+            member.keep_connected = False
+            self._fail_jobs(member)
+        self._ready.clear()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        for member in list(self._links):
+            self._links.discard(member)
+            await self._disconnect(member)
+
+    async def __aenter__(self) -> DevicePool:
+        """Return the pool for use as an async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the pool on leaving the context."""
+        await self.close()
+
+    def _enqueue(self, member: _PoolMember) -> None:
+        """Put *member* at the back of its priority level in the ready queue."""
+        if member.turn:
+            return
+        self._turns += 1
+        member.turn = self._turns
+        heapq.heappush(self._ready, (-member.priority, member.turn, member))
+
+    def _schedule(self) -> None:
+        """Start workers for ready members while links are available."""
+        now = self._clock()
+        backing_off: list[_PoolMember] = []
+        # Entries waiting for a link to become free; they keep their turn
+        blocked: list[tuple[int, int, _PoolMember]] = []
+        while self._ready:
+            _, turn, member = self._ready[0]
+            if turn != member.turn or member.running or not member.wants_link:
+                heapq.heappop(self._ready)
+                if turn == member.turn:
+                    member.turn = 0
+                continue
+            if member.retry_at > now:
+                heapq.heappop(self._ready)
+                member.turn = 0
+                backing_off.append(member)
+                continue
+            victim: _PoolMember | None = None
+            if not member.connected and len(self._links) >= self.max_links:
+                victim = self._pick_victim()
+                if victim is None:
+                    # Members further back may already hold a link
+                    blocked.append(heapq.heappop(self._ready))
+                    continue
+                self._links.discard(victim)
+                victim.connected = False
+                self.stats.evictions += 1
+            heapq.heappop(self._ready)
+            member.turn = 0
+            member.running = True
+            self._links.add(member)
+            task = asyncio.get_running_loop().create_task(self._serve(member, victim))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        for entry in blocked:
+            heapq.heappush(self._ready, entry)
+        for member in backing_off:
+            self._enqueue(member)
+        if backing_off:
+            self._arm_retry_timer(min(member.retry_at for member in backing_off) - now)
+
+    def _pinned_links(self) -> int:
+        """Number of links reserved for keep_connected devices."""
+        return sum(member.keep_connected for member in self._members.values())
+
+    def _pick_victim(self) -> _PoolMember | None:
+        """Choose the idle link to close: least recently used, preferring members without queued work."""
+        candidates = [
+            member for member in self._links if member.connected and not member.running and not member.keep_connected
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda member: (bool(member.jobs), member.last_used))
+
+    def _arm_retry_timer(self, delay: float) -> None:
+        """Re-run scheduling when the earliest backoff expires."""
+        if self._retry_timer is not None:
+            self._retry_timer.cancel()
+        self._retry_timer = asyncio.get_running_loop().call_later(max(delay, 0.0), self._on_retry_timer)
+
+    def _on_retry_timer(self) -> None:
+        self._retry_timer = None
+        self._schedule()
+
+    async def _serve(self, member: _PoolMember, victim: _PoolMember | None) -> None:
+        """Connect *member* if needed and run its share of queued operations."""
+        try:
+            if victim is not None:
+                await self._disconnect(victim)
+            if not member.connected and not await self._connect(member):
+                return
+            served = 0
+            while member.jobs and (served < self.quantum or not self._ready):
+                job = member.jobs.popleft()
+                if job.future.done():
+                    continue
+                await self._run_job(job, member.device)
+                served += 1
+                if not member.device.connection_manager.is_connected:
+                    self._on_disconnected(member)
+                    break
+        finally:
+            member.running = False
+            member.last_used = self._clock()
+            if self._members.get(member.device.address) is not member:
+                # Removed from the pool while running
+                self._links.discard(member)
+                if member.connected:
+                    await self._disconnect(member)
+            elif not member.connected:
+                self._links.discard(member)
+            if member.wants_link and self._members.get(member.device.address) is member:
+                self._enqueue(member)
+            self._schedule()
+
+    async def _run_job(self, job: _PoolJob, device: Device) -> None:
+        """Run one operation and resolve its future."""
+        started = self._clock()
+        delay = started - job.submitted
+        self.stats.started += 1
+        self.stats.total_queue_delay += delay
+        self.stats.max_queue_delay = max(self.stats.max_queue_delay, delay)
+        try:
+            result = await job.operation(device)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.stats.failed += 1
+            if not job.future.done():
+                job.future.set_exception(e)
+        else:
+            self.stats.completed += 1
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            self.stats.busy_link_time += self._clock() - started
+
+    async def _connect(self, member: _PoolMember) -> bool:
+        """Connect *member* on its reserved link, scheduling a retry on failure."""
+        try:
+            await member.device.connect()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self._links.discard(member)
+            member.failures += 1
+            self.stats.connect_failures += 1
+            delay = min(self.reconnect_delay * 2 ** (member.failures - 1), self.max_reconnect_delay)
+            if member.failures >= self.max_connect_attempts:
+                logger.warning(
+                    "Giving up on %s after %d connection attempts: %s", member.device.address, member.failures, e
+                )
+                member.failures = 0
+                self._fail_jobs(member, e)
+            else:
+                logger.debug("Connecting to %s failed (%s); retrying in %.2fs", member.device.address, e, delay)
+            # Also paces keep_connected devices, which stay queued after giving up
+            member.retry_at = self._clock() + delay
+            return False
+        member.connected = True
+        member.failures = 0
+        member.retry_at = 0.0
+        self.stats.connects += 1
+        return True
+
+    async def _disconnect(self, member: _PoolMember) -> None:
+        """Disconnect *member*, whose link has already been released."""
+        member.connected = False
+        try:
+            await member.device.disconnect()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.debug("Disconnecting %s failed: %s", member.device.address, e)
+
+    def _on_disconnected(self, member: _PoolMember) -> None:
+        """Release the link of a member whose connection dropped."""
+        if not member.connected:
+            return
+        member.connected = False
+        if not member.running:
+            self._links.discard(member)
+            if member.wants_link and self._members.get(member.device.address) is member:
+                self._enqueue(member)
+            self._schedule()
+
+    def _fail_jobs(self, member: _PoolMember, error: Exception | None = None) -> None:
+        """Fail every queued operation of *member* with *error*, or cancel them."""
+        while member.jobs:
+            job = member.jobs.popleft()
+            if job.future.done():
+                continue
+            self.stats.failed += 1
+            if error is None:
+                job.future.cancel()
+            else:
+                job.future.set_exception(error)
+
+
+__all__ = [
+    "DevicePool",
+    "DevicePoolStats",
+]
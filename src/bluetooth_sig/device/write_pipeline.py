@@ -0,0 +1,248 @@
+"""Pipelined characteristic writes for bulk transfers and control point bursts.
+
+Awaiting each write before issuing the next leaves the link idle for a full
+round trip per packet. :class:`WritePipeline` encodes queued values up front,
+splits them into packets that fit the connection's ATT MTU and keeps up to
+``window`` writes outstanding, in submission order, so transfers such as
+firmware images, LED frames or control point bursts run at link rate.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar, overload
+
+import msgspec
+
+from ..gatt.characteristics.base import BaseCharacteristic
+from ..types.gatt_enums import CharacteristicName
+from ..types.uuid import BluetoothUUID
+from .client import ClientManagerProtocol
+
+T = TypeVar("T")
+
+# Opcode and attribute handle preceding the value in ATT write PDUs
+ATT_WRITE_HEADER_SIZE = 3
+
+
+class WritePipelineStats(msgspec.Struct, kw_only=True):
+    """Outcome of one :meth:`WritePipeline.flush`.
+
+    Attributes:
+        values: Queued values written
+        writes: ATT writes issued
+        bytes_written: Value bytes written, excluding ATT headers
+        max_in_flight: Most writes outstanding at once
+        elapsed: Seconds from the first write to the last completion
+
+    """
+
+    values: int = 0
+    writes: int = 0
+    bytes_written: int = 0
+    max_in_flight: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Achieved value throughput, in bytes per second."""
+        return self.bytes_written / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def writes_per_second(self) -> float:
+        """Achieved ATT write rate."""
+        return self.writes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class WritePipeline:  # pylint: disable=too-many-instance-attributes
+    r"""Queue of encoded writes sent with a window of outstanding requests.
+
+    Values are encoded when queued, so encoding errors surface before anything
+    is sent. Values longer than one packet (``mtu_size - 3`` bytes) are split
+    into consecutive writes, which is what bulk transfer protocols expect;
+    pass ``split=False`` for values that must arrive whole.
+
+    Pipelines are usually created with
+    :meth:`~bluetooth_sig.device.device.Device.write_pipeline`.
+
+    Example::
+        >>> pipeline = device.write_pipeline(window=8)
+        >>> pipeline.add("2A06", b"\x01")
+        >>> pipeline.add_many(FirmwareDataCharacteristic, blocks)
+        >>> stats = await pipeline.flush()
+        >>> print(f"{stats.throughput:.0f} B/s")
+
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        connection_manager: ClientManagerProtocol,
+        resolve_uuid: Callable[[str | CharacteristicName], BluetoothUUID],
+        *,
+        window: int = 4,
+        response: bool = False,
+        on_written: Callable[[BluetoothUUID], None] | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Create an empty pipeline.
+
+        Args:
+            connection_manager: Connection manager used for the writes
+            resolve_uuid: Callable resolving characteristic names to UUIDs
+            window: Most writes outstanding at once
+            response: Use write-with-response instead of write-without-response
+            on_written: Optional callable receiving each characteristic UUID
+                written by a flush, after the flush completes
+            clock: Time source for throughput measurement, in seconds
+
+        Raises:
+            ValueError: If *window* is not positive
+
+        """
+        if window < 1:
+            raise ValueError(f"window must be positive, got {window}")
+        self._connection_manager = connection_manager
+        self._resolve_uuid = resolve_uuid
+        self._window = window
+        self._response = response
+        self._on_written = on_written
+        self._clock = clock
+        self._packets: list[tuple[BluetoothUUID, bytes]] = []
+        self._values = 0
+
+    @property
+    def packet_size(self) -> int:
+        """Largest value fitting one ATT write at the negotiated MTU."""
+        return self._connection_manager.mtu_size - ATT_WRITE_HEADER_SIZE
+
+    @property
+    def pending(self) -> int:
+        """Number of queued packets not yet written."""
+        return len(self._packets)
+
+    @overload
+    def add(self, char: type[BaseCharacteristic[T]], value: T, *, split: bool = ...) -> None: ...
+
+    @overload
+    def add(self, char: str | CharacteristicName, value: bytes, *, split: bool = ...) -> None: ...
+
+    def add(
+        self,
+        char: str | CharacteristicName | type[BaseCharacteristic[T]],
+        value: bytes | T,
+        *,
+        split: bool = True,
+    ) -> None:
+        """Encode a value and queue its packets.
+
+        Args:
+            char: Name, enum, or characteristic class to write to
+            value: Raw bytes (for string/enum) or typed value (for characteristic class)
+            split: Split values longer than :attr:`packet_size` into several writes
+
+        Raises:
+            TypeError: If *value* is not bytes for a string/enum characteristic
+            ValueError: If *split* is False and the value does not fit one packet
+            CharacteristicEncodeError: If encoding fails (when using characteristic class)
+
+        """
+        char_uuid, encoded = self._encode(char, value)
+        packet_size = self.packet_size
+        if len(encoded) <= packet_size:
+            self._packets.append((char_uuid, encoded))
+        elif not split:
+            raise ValueError(f"Value of {len(encoded)} bytes for {char_uuid} exceeds packet size {packet_size}")
+        else:
+            self._packets.extend(
+                (char_uuid, encoded[offset : offset + packet_size]) for offset in range(0, len(encoded), packet_size)
+            )
+        self._values += 1
+
+    def add_many(
+        self,
+        char: str | CharacteristicName | type[BaseCharacteristic[Any]],
+        values: Iterable[Any],
+        *,
+        split: bool = True,
+    ) -> None:
+        """Queue several values for one characteristic, in order.
+
+        Args:
+            char: Name, enum, or characteristic class to write to
+            values: Raw bytes (for string/enum) or typed values (for characteristic class)
+            split: Split values longer than :attr:`packet_size` into several writes
+
+        """
+        for value in values:
+            self.add(char, value, split=split)
+
+    def clear(self) -> None:
+        """Discard queued packets."""
+        self._packets.clear()
+        self._values = 0
+
+    async def flush(self) -> WritePipelineStats:
+        """Write every queued packet, keeping up to ``window`` writes outstanding.
+
+        Writes are issued in queue order. On the first failed write no further
+        writes are issued, outstanding ones are cancelled and the error is
+        raised; the queue is empty afterwards either way.
+
+        Returns:
+            Counters and timing of this flush
+
+        """
+        packets, values = self._packets, self._values
+        self._packets, self._values = [], 0
+        stats = WritePipelineStats(values=values)
+        in_flight: set[asyncio.Future[None]] = set()
+        started = self._clock()
+        try:
+            for char_uuid, packet in packets:
+                if len(in_flight) >= self._window:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for write in done:
+                        write.result()
+                in_flight.add(
+                    asyncio.ensure_future(
+                        self._connection_manager.write_gatt_char(char_uuid, packet, response=self._response)
+                    )
+                )
+                stats.writes += 1
+                stats.bytes_written += len(packet)
+                stats.max_in_flight = max(stats.max_in_flight, len(in_flight))
+            if in_flight:
+                await asyncio.gather(*in_flight)
+        except BaseException:
+            for write in in_flight:
+                write.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            raise
+        finally:
+            stats.elapsed = self._clock() - started
+            if self._on_written is not None:
+                for char_uuid in dict.fromkeys(char_uuid for char_uuid, _ in packets):
+                    self._on_written(char_uuid)
+        return stats
+
+    def _encode(
+        self,
+        char: str | CharacteristicName | type[BaseCharacteristic[Any]],
+        value: Any,  # noqa: ANN401  # Typed value for class-based access
+    ) -> tuple[BluetoothUUID, bytes]:
+        """Resolve the characteristic UUID and encode *value*."""
+        if isinstance(char, type) and issubclass(char, BaseCharacteristic):
+            char_instance = char()
+            return char_instance.uuid, bytes(char_instance.build_value(value))
+        if not isinstance(value, (bytes, bytearray)):
+            raise TypeError(f"When using string/enum char_name, data must be bytes, got {type(value).__name__}")
+        return self._resolve_uuid(char), bytes(value)
+
+
+__all__ = [
+    "ATT_WRITE_HEADER_SIZE",
+    "WritePipeline",
+    "WritePipelineStats",
+]
@@ -13,7 +13,6 @@ from __future__ import annotations
 
 import logging
 from abc import ABC
-from functools import cached_property
 from typing import Any, ClassVar, Generic, TypeVar, cast, get_args, get_origin
 
 from ...types import (
@@ -24,6 +23,7 @@ from ...types import (
     classify_special_value,
 )
 from ...types.gatt_enums import CharacteristicRole
+from ...types.parse_outcome import ParseOutcome
 from ...types.registry import CharacteristicSpec
 from ...types.uuid import BluetoothUUID
 from ..context import CharacteristicContext
@@ -34,7 +34,7 @@ from .characteristic_meta import CharacteristicMeta, SIGCharacteristicResolver
 from .characteristic_meta import ValidationConfig as ValidationConfig  # noqa: PLC0414  # explicit re-export
 from .context_lookup import ContextLookupMixin
 from .descriptor_mixin import DescriptorMixin
-from .pipeline import CharacteristicValidator, EncodePipeline, ParsePipeline
+from .pipeline import CharacteristicValidator, EncodePipeline, ParsePipeline, ParseResult
 from .role_classifier import classify_role
 from .templates import CodingTemplate
 
@@ -47,6 +47,82 @@ T = TypeVar("T")
 _SENTINEL = object()
 
 
+def _is_signed_data_type(data_type: str | None) -> bool:
+    """Check whether a YAML data type is signed."""
+    if not data_type:
+        return False
+    # Check for signed types: signed integers, medical floats, and standard floats
+    return data_type.startswith("sint") or data_type in ("medfloat16", "medfloat32", "float32", "float64")
+
+
+def _extract_gss_special_values(spec: CharacteristicSpec | None) -> dict[int, str]:
+    """Collect special values from a GSS spec (see ``BaseCharacteristic.gss_special_values``)."""
+    if not spec or not hasattr(spec, "structure") or not spec.structure:
+        return {}
+
+    signed = _is_signed_data_type(spec.data_type)
+    result: dict[int, str] = {}
+    for field in spec.structure:  # pylint: disable=too-many-nested-blocks  # Spec requires nested iteration for special values
+        for sv in field.special_values:
+            unsigned_val = sv.raw_value
+            result[unsigned_val] = sv.meaning
+
+            # For signed types, add the signed equivalent based on common bit widths.
+            # This handles cases like 0x8000 (32768) -> -32768 for sint16.
+            if signed:
+                for bits in (8, 16, 24, 32):
+                    max_unsigned = (1 << bits) - 1
+                    sign_bit = 1 << (bits - 1)
+                    if sign_bit <= unsigned_val <= max_unsigned:
+                        # This value would be negative when interpreted as signed
+                        signed_val = unsigned_val - (1 << bits)
+                        if signed_val not in result:
+                            result[signed_val] = sv.meaning
+    return result
+
+
+def _special_value_rules(values: dict[int, str]) -> dict[int, SpecialValueRule]:
+    """Classify raw value → meaning pairs into special value rules."""
+    return {
+        raw: SpecialValueRule(raw_value=raw, meaning=meaning, value_type=classify_special_value(meaning))
+        for raw, meaning in values.items()
+    }
+
+
+class _CharacteristicClassState:  # pylint: disable=too-few-public-methods
+    """Per-class data shared by every instance of a characteristic class.
+
+    Holds the YAML spec, the special value tables and resolver, the
+    SIG-resolved info and the resolved dependency UUIDs.  Built once per class
+    by ``BaseCharacteristic._get_class_state``; instances keep a reference to it.
+    """
+
+    __slots__ = (
+        "gss_special_values",
+        "info",
+        "optional_dependencies",
+        "required_dependencies",
+        "spec",
+        "special_resolver",
+    )
+
+    def __init__(self, char_class: type[BaseCharacteristic[Any]]) -> None:
+        """Resolve the spec and special values for *char_class*.
+
+        Info and dependencies are resolved lazily: info only exists for SIG
+        characteristics, and resolving dependencies may instantiate other classes.
+        """
+        self.spec: CharacteristicSpec | None = SIGCharacteristicResolver.resolve_yaml_spec_for_class(char_class)
+        self.gss_special_values: dict[int, str] = _extract_gss_special_values(self.spec)
+        self.special_resolver = SpecialValueResolver(
+            spec_rules=_special_value_rules(self.gss_special_values),
+            class_rules=_special_value_rules(char_class._special_values or {}),  # pylint: disable=protected-access
+        )
+        self.info: CharacteristicInfo | None = None
+        self.required_dependencies: list[str] | None = None
+        self.optional_dependencies: list[str] | None = None
+
+
 class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], metaclass=CharacteristicMeta):  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """Base class for all GATT characteristics.
 
@@ -98,11 +174,40 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
     _manual_role: ClassVar[CharacteristicRole | None] = None
     _cached_role: ClassVar[CharacteristicRole | None] = None
 
+    # Value fixed for the lifetime of the GATT database (device information,
+    # feature bitmasks, sensor location); eligible for persistent caching.
+    _is_static: ClassVar[bool] = False
+
     # Special value handling (GSS-derived)
     # Manual override for special values when GSS spec is incomplete/wrong.
     # Format: {raw_value: meaning_string}. GSS values are used by default.
     _special_values: dict[int, str] | None = None
 
+    # Stateless pipeline components shared by every characteristic
+    _validator: ClassVar[CharacteristicValidator] = CharacteristicValidator()
+    _parse_pipeline: ClassVar[ParsePipeline] = ParsePipeline(_validator)
+    _encode_pipeline: ClassVar[EncodePipeline] = EncodePipeline(_validator)
+
+    # Shared per-class state, built on first instantiation (see _get_class_state)
+    _class_state: ClassVar[_CharacteristicClassState | None] = None
+
+    # Class-level validation limits, collected by CharacteristicMeta
+    _class_validation: ClassVar[ValidationConfig]
+    _declared_validation: ClassVar[frozenset[str]]
+
+    # Everything else an instance needs is per class and lives in _class_state;
+    # _spec is a per-instance reference to the shared spec so it can be swapped.
+    # Subclasses inside this package are kept slotted by CharacteristicMeta.
+    __slots__ = (
+        "_provided_info",
+        "_resolved_info",
+        "_spec",
+        "_state",
+        "_validation",
+        "last_parsed",
+        "user_description",
+    )
+
     def __init__(
         self,
         info: CharacteristicInfo | None = None,
@@ -118,38 +223,11 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
         # Store provided info or None (will be resolved in __post_init__)
         self._provided_info = info
 
-        # Instance variables (will be set in __post_init__)
-        self._info: CharacteristicInfo
-        self._spec: CharacteristicSpec | None = None
-
-        # Manual overrides with proper types (using explicit class attributes)
-        self._manual_unit: str | None = self.__class__._manual_unit
-
-        # Set validation attributes from ValidationConfig or class defaults
-        if validation:
-            self.min_value = validation.min_value
-            self.max_value = validation.max_value
-            self.expected_length = validation.expected_length
-            self.min_length = validation.min_length
-            self.max_length = validation.max_length
-            self.allow_variable_length = validation.allow_variable_length
-            self.expected_type = validation.expected_type
-        else:
-            # Fall back to class attributes for Progressive API Level 2
-            self.min_value = self.__class__.min_value
-            self.max_value = self.__class__.max_value
-            self.expected_length = self.__class__.expected_length
-            self.min_length = self.__class__.min_length
-            self.max_length = self.__class__.max_length
-            self.allow_variable_length = self.__class__.allow_variable_length
-            self.expected_type = self.__class__.expected_type
-
-        # Dependency caches (resolved once per instance)
-        self._resolved_required_dependencies: list[str] | None = None
-        self._resolved_optional_dependencies: list[str] | None = None
-
-        # Descriptor support
-        self._descriptors: dict[str, BaseDescriptor] = {}
+        # Validation constraints: the class-wide config unless overridden for this instance
+        self._validation: ValidationConfig = validation or type(self)._class_validation
+
+        # Descriptor support (dict created on first add_descriptor)
+        self._descriptors: dict[str, BaseDescriptor] | None = None
 
         # Last parsed value for caching/debugging
         self.last_parsed: T | None = None
@@ -157,67 +235,63 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
         # Optional User Description (0x2901) label from device discovery
         self.user_description: str | None = None
 
-        # Pipeline composition — validator is shared by parse and encode pipelines
-        self._validator = CharacteristicValidator(self)
-        self._parse_pipeline = ParsePipeline(self, self._validator)
-        self._encode_pipeline = EncodePipeline(self, self._validator)
-
         # Call post-init to resolve characteristic info
         self.__post_init__()
 
     def __post_init__(self) -> None:
         """Initialize characteristic with resolved information."""
-        # Use provided info if available, otherwise resolve from SIG specs
+        state = self._get_class_state()
+        self._state = state
+        self._spec: CharacteristicSpec | None = state.spec
+
+        # Use provided info if available, otherwise the SIG info resolved once per class
         if self._provided_info:
-            self._info = self._provided_info
+            self._resolved_info = self._apply_info_overrides(self._provided_info)
         else:
-            # Resolve characteristic information using proper resolver
-            self._info = SIGCharacteristicResolver.resolve_for_class(type(self))
-
-        # Resolve YAML spec for access to detailed metadata
-        self._spec = self._resolve_yaml_spec()
-        spec_rules: dict[int, SpecialValueRule] = {}
-        for raw, meaning in self.gss_special_values.items():
-            spec_rules[raw] = SpecialValueRule(
-                raw_value=raw, meaning=meaning, value_type=classify_special_value(meaning)
-            )
-
-        class_rules: dict[int, SpecialValueRule] = {}
-        if self._special_values is not None:
-            for raw, meaning in self._special_values.items():
-                class_rules[raw] = SpecialValueRule(
-                    raw_value=raw, meaning=meaning, value_type=classify_special_value(meaning)
-                )
+            if state.info is None:
+                state.info = self._apply_info_overrides(SIGCharacteristicResolver.resolve_for_class(type(self)))
+            self._resolved_info = state.info
 
-        self._special_resolver = SpecialValueResolver(spec_rules=spec_rules, class_rules=class_rules)
+    @classmethod
+    def _get_class_state(cls) -> _CharacteristicClassState:
+        """Return the state shared by all instances of this class, building it on first use."""
+        state = cls.__dict__.get("_class_state")
+        if state is None:
+            state = _CharacteristicClassState(cls)
+            cls._class_state = state
+        return state
 
+    @classmethod
+    def _apply_info_overrides(cls, info: CharacteristicInfo) -> CharacteristicInfo:
+        """Apply the class's unit and python_type overrides to *info* (in place) and return it."""
         # Apply manual overrides to _info (single source of truth)
-        if self._manual_unit is not None:
-            self._info.unit = self._manual_unit
+        if cls._manual_unit is not None:
+            info.unit = cls._manual_unit
 
         # Auto-resolve python_type from template generic parameter.
         # Templates carry their decoded type (e.g. ScaledUint16Template → float),
         # which is more accurate than the YAML wire type (uint16 → int).
-        if self._template is not None:
-            template_type = type(self._template).resolve_python_type()
+        if cls._template is not None:
+            template_type = type(cls._template).resolve_python_type()
             if template_type is not None:
-                self._info.python_type = template_type
+                info.python_type = template_type
 
         # Auto-resolve python_type from the class generic parameter.
         # BaseCharacteristic[T] already declares the decoded type (e.g.
         # BaseCharacteristic[PushbuttonStatus8Data]).  This is the most
         # authoritative source — it overrides both YAML and template since
         # the class signature is the contract for what _decode_value returns.
-        generic_type = self._resolve_generic_python_type()
+        generic_type = cls._resolve_generic_python_type()
         if generic_type is not None:
-            self._info.python_type = generic_type
+            info.python_type = generic_type
 
         # Manual _python_type override wins over all auto-resolution.
         # Use sparingly — only when no other mechanism can express the correct type.
-        if self.__class__._python_type is not None:
-            self._info.python_type = self.__class__._python_type
-        if self.__class__._is_bitfield:
-            self._info.is_bitfield = True
+        if cls._python_type is not None:
+            info.python_type = cls._python_type
+        if cls._is_bitfield:
+            info.is_bitfield = True
+        return info
 
     @classmethod
     def _resolve_generic_python_type(cls) -> type | None:
@@ -256,23 +330,18 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
             if resolved is not None:
                 break
 
-        cls._cached_generic_python_type = resolved  # type: ignore[attr-defined]
+        cls._cached_generic_python_type = resolved
         return resolved
 
-    def _resolve_yaml_spec(self) -> CharacteristicSpec | None:
-        """Resolve specification using YAML cross-reference system."""
-        # Delegate to static method
-        return SIGCharacteristicResolver.resolve_yaml_spec_for_class(type(self))
-
     @property
     def uuid(self) -> BluetoothUUID:
         """Get the characteristic UUID from _info."""
-        return self._info.uuid
+        return self._resolved_info.uuid
 
     @property
     def info(self) -> CharacteristicInfo:
         """Characteristic information."""
-        return self._info
+        return self._resolved_info
 
     @property
     def spec(self) -> CharacteristicSpec | None:
@@ -282,7 +351,7 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
     @property
     def name(self) -> str:
         """Get the characteristic name from _info."""
-        return self._info.name
+        return self._resolved_info.name
 
     @property
     def description(self) -> str:
@@ -303,7 +372,7 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
                 cls._cached_role = cls._manual_role
             else:
                 cls._cached_role = classify_role(
-                    self.name, self._info.python_type, self._info.is_bitfield, self.unit, self._spec
+                    self.name, self._resolved_info.python_type, self._resolved_info.is_bitfield, self.unit, self._spec
                 )
         return cls._cached_role
 
@@ -314,10 +383,10 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
         Uses the canonical SIG/YAML name for lookup fidelity, then strips
         supported display markup for human-readable output.
         """
-        raw_name = self._characteristic_name or self._info.name
+        raw_name = self._characteristic_name or self._resolved_info.name
         return NameNormalizer.sanitize_display_markup(raw_name)
 
-    @cached_property
+    @property
     def gss_special_values(self) -> dict[int, str]:
         """Get special values from GSS specification.
 
@@ -331,29 +400,14 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
         Returns:
             Dictionary mapping raw integer values to their human-readable meanings.
             Includes both unsigned and signed interpretations for applicable values.
+            The dictionary is shared by all instances of the class.
         """
-        # extract special values from YAML
-        if not self._spec or not hasattr(self._spec, "structure") or not self._spec.structure:
-            return {}
-
-        result: dict[int, str] = {}
-        for field in self._spec.structure:  # pylint: disable=too-many-nested-blocks  # Spec requires nested iteration for special values
-            for sv in field.special_values:
-                unsigned_val = sv.raw_value
-                result[unsigned_val] = sv.meaning
-
-                # For signed types, add the signed equivalent based on common bit widths.
-                # This handles cases like 0x8000 (32768) -> -32768 for sint16.
-                if self.is_signed_from_yaml():
-                    for bits in (8, 16, 24, 32):
-                        max_unsigned = (1 << bits) - 1
-                        sign_bit = 1 << (bits - 1)
-                        if sign_bit <= unsigned_val <= max_unsigned:
-                            # This value would be negative when interpreted as signed
-                            signed_val = unsigned_val - (1 << bits)
-                            if signed_val not in result:
-                                result[signed_val] = sv.meaning
-        return result
+        return self._state.gss_special_values
+
+    @property
+    def _special_resolver(self) -> SpecialValueResolver:
+        """Special value resolver shared by all instances of the class."""
+        return self._state.special_resolver
 
     def is_special_value(self, raw_value: int) -> bool:
         """Check if a raw value is a special sentinel value.
@@ -449,10 +503,11 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
 
         Performance: Returns list[str] for efficient comparison with dict keys.
         """
-        if self._resolved_required_dependencies is None:
-            self._resolved_required_dependencies = self._resolve_dependencies("_required_dependencies")
+        state = self._state
+        if state.required_dependencies is None:
+            state.required_dependencies = self._resolve_dependencies("_required_dependencies")
 
-        return list(self._resolved_required_dependencies)
+        return list(state.required_dependencies)
 
     @property
     def optional_dependencies(self) -> list[str]:
@@ -460,10 +515,11 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
 
         Performance: Returns list[str] for efficient comparison with dict keys.
         """
-        if self._resolved_optional_dependencies is None:
-            self._resolved_optional_dependencies = self._resolve_dependencies("_optional_dependencies")
+        state = self._state
+        if state.optional_dependencies is None:
+            state.optional_dependencies = self._resolve_dependencies("_optional_dependencies")
 
-        return list(self._resolved_optional_dependencies)
+        return list(state.optional_dependencies)
 
     @classmethod
     def get_allows_sig_override(cls) -> bool:
@@ -503,6 +559,19 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
         """
         return cls._resolve_class_uuid()
 
+    @classmethod
+    def is_static(cls) -> bool:
+        """Whether the value only changes together with the GATT database.
+
+        Static values may be cached across connections and are only re-read
+        after the database changes.
+
+        Returns:
+            True if the characteristic is declared static.
+
+        """
+        return cls._is_static
+
     @classmethod
     def _resolve_class_uuid(cls) -> BluetoothUUID | None:
         """Resolve the characteristic UUID for this class without creating an instance."""
@@ -587,10 +656,29 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
             CharacteristicParseError: Parse/validation failure
 
         """
-        decoded: T = self._parse_pipeline.run(data, ctx, validate)
+        decoded: T = self._parse_pipeline.run(self, data, ctx, validate)
         self.last_parsed = decoded
         return decoded
 
+    def try_parse_value(
+        self, data: bytes | bytearray, ctx: CharacteristicContext | None = None, validate: bool = True
+    ) -> ParseResult[T]:
+        """Parse characteristic data without raising.
+
+        Same pipeline as :meth:`parse_value`, but special values and parse
+        failures are returned as a tagged :class:`ParseResult` instead of
+        exceptions. Prefer this on hot paths where sentinel values or
+        malformed packets are common.
+
+        Returns:
+            ParseResult whose ``outcome`` is ``OK``, ``SPECIAL_VALUE`` or ``ERROR``.
+
+        """
+        result: ParseResult[T] = self._parse_pipeline.run_outcome(self, data, ctx, validate)
+        if result.outcome is ParseOutcome.OK:
+            self.last_parsed = result.value
+        return result
+
     def _encode_value(self, data: Any) -> bytearray:  # noqa: ANN401
         """Encode a typed value into raw bytes (no validation).
 
@@ -618,7 +706,7 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
             CharacteristicEncodeError: If encoding or validation fails.
 
         """
-        return self._encode_pipeline.run(data, validate)
+        return self._encode_pipeline.run(self, data, validate)
 
     # -------------------- Encoding helpers for special values --------------------
     def encode_special(self, value_type: SpecialValueType) -> bytearray:
@@ -626,14 +714,14 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
 
         Raises ValueError if no raw value of that type is defined for this characteristic.
         """
-        return self._encode_pipeline.encode_special(value_type)
+        return self._encode_pipeline.encode_special(self, value_type)
 
     def encode_special_by_meaning(self, meaning: str) -> bytearray:
         """Encode a special value by a partial meaning string match.
 
         Raises ValueError if no matching special value is found.
         """
-        return self._encode_pipeline.encode_special_by_meaning(meaning)
+        return self._encode_pipeline.encode_special_by_meaning(self, meaning)
 
     @property
     def unit(self) -> str:
@@ -641,9 +729,9 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
 
         Returns empty string for characteristics without units (e.g., bitfields).
         """
-        return self._info.unit or ""
+        return self._resolved_info.unit or ""
 
-    @cached_property
+    @property
     def unit_symbol(self) -> str:
         """Get the canonical SIG unit symbol for this characteristic.
 
@@ -664,7 +752,7 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
             if symbol:
                 return symbol
 
-        return self._info.unit or ""
+        return self._resolved_info.unit or ""
 
     def get_field_unit(self, field_name: str) -> str:
         """Get the resolved unit symbol for a specific struct field.
@@ -716,12 +804,12 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
     @property
     def python_type(self) -> type | str | None:
         """Get the resolved Python type for this characteristic's values."""
-        return self._info.python_type
+        return self._resolved_info.python_type
 
     @property
     def is_bitfield(self) -> bool:
         """Whether this characteristic's value is a bitfield."""
-        return self._info.is_bitfield
+        return self._resolved_info.is_bitfield
 
     # YAML automation helper methods
     def get_yaml_data_type(self) -> str | None:
@@ -745,11 +833,7 @@ class BaseCharacteristic(ContextLookupMixin, DescriptorMixin, ABC, Generic[T], m
 
     def is_signed_from_yaml(self) -> bool:
         """Determine if the data type is signed based on YAML automation."""
-        data_type = self.get_yaml_data_type()
-        if not data_type:
-            return False
-        # Check for signed types: signed integers, medical floats, and standard floats
-        return data_type.startswith("sint") or data_type in ("medfloat16", "medfloat32", "float32", "float64")
+        return _is_signed_data_type(self.get_yaml_data_type())
 
     def get_byte_order_hint(self) -> str:
         """Get byte order hint (Bluetooth SIG uses little-endian by convention)."""
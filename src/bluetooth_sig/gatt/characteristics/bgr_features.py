@@ -23,4 +23,5 @@ class BGRFeaturesCharacteristic(BaseCharacteristic[BGRFeatures]):
     Bitfield indicating the supported Broadcast Game Receiver features.
     """
 
+    _is_static = True
     _template = FlagTemplate.uint8(BGRFeatures)
@@ -23,4 +23,5 @@ class BGSFeaturesCharacteristic(BaseCharacteristic[BGSFeatures]):
     Bitfield indicating the supported Broadcast Game Sender features.
     """
 
+    _is_static = True
     _template = FlagTemplate.uint8(BGSFeatures)
@@ -50,6 +50,7 @@ class BloodPressureFeatureCharacteristic(BaseCharacteristic[BloodPressureFeature
     available.
     """
 
+    _is_static = True
     # YAML has no range constraint; enforce full uint16 bitmap range.
     min_value: int = 0
     max_value: int = UINT16_MAX
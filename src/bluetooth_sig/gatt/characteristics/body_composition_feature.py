@@ -111,6 +111,7 @@ class BodyCompositionFeatureCharacteristic(BaseCharacteristic[BodyCompositionFea
     characteristic that describes device capabilities.
     """
 
+    _is_static = True
     expected_length: int = 4
     min_length: int = 4  # Features(4) fixed length
     max_length: int = 4  # Features(4) fixed length
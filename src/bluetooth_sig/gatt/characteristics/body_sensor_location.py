@@ -29,6 +29,7 @@ class BodySensorLocationCharacteristic(BaseCharacteristic[BodySensorLocation]):
     Spec: Bluetooth SIG Assigned Numbers, Body Sensor Location characteristic
     """
 
+    _is_static = True
     _template = EnumTemplate.uint8(BodySensorLocation)
 
     # YAML has no range constraint; enforce valid enum bounds.
@@ -44,6 +44,7 @@ class BondManagementFeatureCharacteristic(BaseCharacteristic[BondManagementFeatu
     Server sends only enough octets for the highest set bit.
     """
 
+    _is_static = True
     _MAX_OCTETS = 3
     _BITS_PER_BYTE = 8
     _BYTE_MASK = 0xFF
@@ -99,6 +99,7 @@ class CGMFeatureCharacteristic(BaseCharacteristic[CGMFeatureData]):
     E2E-CRC for a CGM sensor.  Fixed 6-byte structure.
     """
 
+    _is_static = True
     expected_type = CGMFeatureData
     expected_length: int = 6
 
@@ -7,6 +7,7 @@ the characteristic API itself.
 
 from __future__ import annotations
 
+import re
 from abc import ABCMeta
 from typing import Any
 
@@ -41,6 +42,35 @@ class ValidationConfig(msgspec.Struct, kw_only=True):
     expected_type: type | None = None
 
 
+_VALIDATION_FIELDS: tuple[str, ...] = ValidationConfig.__struct_fields__
+
+
+class _ValidationLimit:
+    """Data descriptor exposing one :class:`ValidationConfig` field as a characteristic attribute.
+
+    Class-level values are collected into one ``_class_validation`` config per
+    class by :class:`CharacteristicMeta`; instances share it unless a config is
+    passed to the constructor.  Assigning on an instance copies the config first,
+    so the shared one is never modified; assigning on a class rebuilds the
+    class config (see :meth:`CharacteristicMeta.__setattr__`).
+    """
+
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:  # noqa: ANN401  # Field type varies
+        """Return the limit from the instance's config, or the class config on class access."""
+        if obj is None:
+            return getattr(owner._class_validation, self._name)  # pylint: disable=protected-access
+        return getattr(obj._validation, self._name)  # pylint: disable=protected-access
+
+    def __set__(self, obj: Any, value: Any) -> None:  # noqa: ANN401  # Characteristic instance, field value
+        """Override the limit for one instance."""
+        obj._validation = msgspec.structs.replace(obj._validation, **{self._name: value})  # pylint: disable=protected-access
+
+
 # ---------------------------------------------------------------------------
 # SIG characteristic resolver
 # ---------------------------------------------------------------------------
@@ -145,9 +175,32 @@ class SIGCharacteristicResolver:
 # Metaclass
 # ---------------------------------------------------------------------------
 
+_WORD_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def context_lookup_name(class_name: str) -> str:
+    """Derive the SIG name used to find a characteristic class in a context.
+
+    Args:
+        class_name: Characteristic class name, e.g. ``"BodySensorLocationCharacteristic"``
+
+    Returns:
+        Space-separated name, e.g. ``"Body Sensor Location"``
+
+    """
+    return _WORD_BOUNDARY.sub(" ", class_name.replace("Characteristic", ""))
+
 
 class CharacteristicMeta(ABCMeta):
-    """Metaclass to automatically handle template flags for characteristics."""
+    """Metaclass handling template flags, validation limits and context-lookup keys for characteristics.
+
+    Validation attributes declared in a class body (``min_value``,
+    ``expected_length``, ...) are folded into a per-class ``ValidationConfig``
+    and read back through :class:`_ValidationLimit` descriptors; assigning one
+    on the class later updates that config.  Subclasses
+    defined inside this package get an empty ``__slots__`` unless they declare
+    their own, so SIG characteristic instances carry no ``__dict__``.
+    """
 
     def __new__(
         mcs,
@@ -171,4 +224,42 @@ class CharacteristicMeta(ABCMeta):
                 if has_template_parent and "_is_template" not in namespace:
                     namespace["_is_template"] = False
 
+        # Context lookups by class use these instead of deriving the name per call;
+        # the key itself is resolved against the registry on first lookup.
+        namespace["_context_lookup_name"] = context_lookup_name(name)
+        namespace["_context_key"] = None
+
+        limits = {field: namespace.pop(field) for field in _VALIDATION_FIELDS if field in namespace}
+        inherited: ValidationConfig | None = next(
+            (base._class_validation for base in bases if hasattr(base, "_class_validation")), None
+        )
+        if inherited is None:
+            # Root characteristic class: install the descriptors once
+            inherited = ValidationConfig()
+            namespace.update({field: _ValidationLimit(field) for field in _VALIDATION_FIELDS})
+        namespace["_class_validation"] = msgspec.structs.replace(inherited, **limits)
+        namespace["_declared_validation"] = frozenset(limits)
+
+        if "__slots__" not in namespace and namespace.get("__module__", "").startswith("bluetooth_sig."):
+            namespace["__slots__"] = ()
+
         return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    def __setattr__(cls, name: str, value: Any) -> None:  # noqa: ANN401  # Arbitrary class attribute
+        """Route validation limits assigned on a class into its validation config.
+
+        Subclasses that do not declare the limit themselves inherit the new
+        value, as they would a plain class attribute.  Instances created
+        earlier keep the config they were created with.
+        """
+        if name not in _VALIDATION_FIELDS:
+            super().__setattr__(name, value)
+            return
+        super().__setattr__("_declared_validation", cls.__dict__["_declared_validation"] | {name})
+        pending: list[type] = [cls]
+        while pending:
+            klass = pending.pop()
+            config = msgspec.structs.replace(klass.__dict__["_class_validation"], **{name: value})
+            type.__setattr__(klass, "_class_validation", config)
+            subclasses: list[type] = klass.__subclasses__()
+            pending.extend(sub for sub in subclasses if name not in sub.__dict__["_declared_validation"])
@@ -7,8 +7,6 @@ focused on core parsing/encoding.
 
 from __future__ import annotations
 
-import re
-from functools import lru_cache
 from typing import Any
 
 from ...types import CharacteristicInfo
@@ -16,6 +14,11 @@ from ...types.gatt_enums import CharacteristicName
 from ...types.uuid import BluetoothUUID
 from ..context import CharacteristicContext
 from ..uuid_registry import get_uuid_registry
+from .characteristic_meta import context_lookup_name
+
+# Context keys (UUID strings) by characteristic name; "" marks names the
+# registry does not know, which never match a context entry.
+_name_keys: dict[str, str] = {}
 
 
 class ContextLookupMixin:
@@ -23,21 +26,55 @@ class ContextLookupMixin:
 
     These methods allow a characteristic to resolve its dependencies and
     siblings from a shared :class:`CharacteristicContext` at parse/encode
-    time.
+    time. Lookup keys are resolved once per name or class and cached, so a
+    context-aware parse only pays for the mapping lookup itself.
     """
 
+    __slots__ = ()
+
     @staticmethod
-    @lru_cache(maxsize=32)
     def _get_characteristic_uuid_by_name(
         characteristic_name: CharacteristicName | str,
     ) -> BluetoothUUID | None:
-        """Get characteristic UUID by name using cached registry lookup."""
+        """Get characteristic UUID by name using the registry."""
         name_str = (
             characteristic_name.value if isinstance(characteristic_name, CharacteristicName) else characteristic_name
         )
         char_info = get_uuid_registry().get_characteristic_info(name_str)
         return char_info.uuid if char_info else None
 
+    @classmethod
+    def _context_key_for_name(cls, characteristic_name: CharacteristicName | str) -> str:
+        """Return the (cached) context key for a characteristic name."""
+        name_str = (
+            characteristic_name.value if isinstance(characteristic_name, CharacteristicName) else characteristic_name
+        )
+        key = _name_keys.get(name_str)
+        if key is None:
+            resolved_uuid = cls._get_characteristic_uuid_by_name(name_str)
+            key = str(resolved_uuid) if resolved_uuid is not None else ""
+            _name_keys[name_str] = key
+        return key
+
+    @classmethod
+    def _context_key_for_class(cls, char_class: type) -> str:
+        """Return the context key for a characteristic class, caching it on the class."""
+        key: str | None = getattr(char_class, "_context_key", None)
+        if key is not None:
+            return key
+
+        configured_info: CharacteristicInfo | None = getattr(char_class, "_configured_info", None)
+        if configured_info is not None:
+            key = str(configured_info.uuid)
+        else:
+            lookup_name = getattr(char_class, "_context_lookup_name", None) or context_lookup_name(char_class.__name__)
+            key = cls._context_key_for_name(lookup_name)
+
+        # Only characteristic classes (CharacteristicMeta) carry their own cache slot.
+        if "_context_key" in vars(char_class):
+            char_class._context_key = key  # type: ignore[attr-defined]
+        return key
+
     def get_context_characteristic(
         self,
         ctx: CharacteristicContext | None,
@@ -62,21 +99,7 @@ class ContextLookupMixin:
             return None
 
         if isinstance(characteristic_name, type):
-            configured_info: CharacteristicInfo | None = getattr(characteristic_name, "_configured_info", None)
-            if configured_info is not None:
-                char_uuid = configured_info.uuid
-            else:
-                class_name: str = characteristic_name.__name__
-                name_without_suffix: str = class_name.replace("Characteristic", "")
-                sig_name: str = re.sub(r"(?<!^)(?=[A-Z])", " ", name_without_suffix)
-                resolved_uuid = self._get_characteristic_uuid_by_name(sig_name)
-                if resolved_uuid is None:
-                    return None
-                char_uuid = resolved_uuid
+            key = self._context_key_for_class(characteristic_name)
         else:
-            resolved_uuid = self._get_characteristic_uuid_by_name(characteristic_name)
-            if resolved_uuid is None:
-                return None
-            char_uuid = resolved_uuid
-
-        return ctx.other_characteristics.get(str(char_uuid))
+            key = self._context_key_for_name(characteristic_name)
+        return ctx.other_characteristics.get(key) if key else None
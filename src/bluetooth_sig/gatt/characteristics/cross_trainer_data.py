@@ -37,8 +37,10 @@ from .fitness_machine_common import (
     encode_heart_rate,
     encode_metabolic_equivalent,
     encode_remaining_time,
+    trailing_field_groups,
 )
 from .utils import DataParser
+from .utils.flag_layout import FlagGroup, FlagLayout, LayoutField
 
 # Speed: M=1, d=-2, b=0 -> actual = raw / 100 km/h
 _SPEED_RESOLUTION = 100.0
@@ -80,6 +82,58 @@ class CrossTrainerDataFlags(IntFlag):
     MOVEMENT_DIRECTION_BACKWARD = 0x008000  # Semantic: 0=Forward, 1=Backward
 
 
+_LAYOUT = FlagLayout(
+    "uint24",
+    (
+        FlagGroup(
+            (LayoutField("instantaneous_speed", "uint16", divisor=_SPEED_RESOLUTION),),
+            mask=CrossTrainerDataFlags.MORE_DATA,
+            inverted=True,
+        ),
+        FlagGroup(
+            (LayoutField("average_speed", "uint16", divisor=_SPEED_RESOLUTION),),
+            mask=CrossTrainerDataFlags.AVERAGE_SPEED_PRESENT,
+        ),
+        FlagGroup((LayoutField("total_distance", "uint24"),), mask=CrossTrainerDataFlags.TOTAL_DISTANCE_PRESENT),
+        FlagGroup(
+            (LayoutField("steps_per_minute", "uint16"), LayoutField("average_step_rate", "uint16")),
+            mask=CrossTrainerDataFlags.STEP_COUNT_PRESENT,
+        ),
+        FlagGroup(
+            (LayoutField("stride_count", "uint16", divisor=_STRIDE_COUNT_RESOLUTION),),
+            mask=CrossTrainerDataFlags.STRIDE_COUNT_PRESENT,
+        ),
+        FlagGroup(
+            (LayoutField("positive_elevation_gain", "uint16"), LayoutField("negative_elevation_gain", "uint16")),
+            mask=CrossTrainerDataFlags.ELEVATION_GAIN_PRESENT,
+        ),
+        FlagGroup(
+            (
+                LayoutField("inclination", "sint16", divisor=_TENTH_RESOLUTION),
+                LayoutField("ramp_setting", "sint16", divisor=_TENTH_RESOLUTION),
+            ),
+            mask=CrossTrainerDataFlags.INCLINATION_AND_RAMP_PRESENT,
+        ),
+        FlagGroup(
+            (LayoutField("resistance_level", "uint8", multiplier=_RESISTANCE_RESOLUTION),),
+            mask=CrossTrainerDataFlags.RESISTANCE_LEVEL_PRESENT,
+        ),
+        FlagGroup(
+            (LayoutField("instantaneous_power", "sint16"),),
+            mask=CrossTrainerDataFlags.INSTANTANEOUS_POWER_PRESENT,
+        ),
+        FlagGroup((LayoutField("average_power", "sint16"),), mask=CrossTrainerDataFlags.AVERAGE_POWER_PRESENT),
+        *trailing_field_groups(
+            energy=CrossTrainerDataFlags.EXPENDED_ENERGY_PRESENT,
+            heart_rate=CrossTrainerDataFlags.HEART_RATE_PRESENT,
+            metabolic_equivalent=CrossTrainerDataFlags.METABOLIC_EQUIVALENT_PRESENT,
+            elapsed_time=CrossTrainerDataFlags.ELAPSED_TIME_PRESENT,
+            remaining_time=CrossTrainerDataFlags.REMAINING_TIME_PRESENT,
+        ),
+    ),
+)
+
+
 class CrossTrainerData(msgspec.Struct, frozen=True, kw_only=True):  # pylint: disable=too-few-public-methods,too-many-instance-attributes
     """Parsed data from Cross Trainer Data characteristic.
 
@@ -249,6 +303,14 @@ class CrossTrainerDataCharacteristic(BaseCharacteristic[CrossTrainerData]):
             CrossTrainerData with all present fields populated.
 
         """
+        values = _LAYOUT.decode(data)
+        if values is not None:
+            flags = CrossTrainerDataFlags(values["flags"])
+            values["flags"] = flags
+            values["movement_direction_backward"] = bool(flags & CrossTrainerDataFlags.MOVEMENT_DIRECTION_BACKWARD)
+            return CrossTrainerData(**values)
+
+        # Truncated packet: decode field by field, skipping fields that do not fit
         flags = CrossTrainerDataFlags(DataParser.parse_int24(data, 0, signed=False))
         offset = 3
 
@@ -36,6 +36,7 @@ class CSCFeatureCharacteristic(BaseCharacteristic[CSCFeatureData]):
     capabilities.
     """
 
+    _is_static = True
     expected_length: int = 2
     min_length: int = 2
 
@@ -35,7 +35,4 @@ class CurrentTimeCharacteristic(BaseCharacteristic[TimeData]):
     - Adjust Reason: uint8 bitfield
     """
 
-    def __init__(self) -> None:
-        """Initialize the Current Time characteristic."""
-        super().__init__()
-        self._template = TimeDataTemplate()
+    _template = TimeDataTemplate()
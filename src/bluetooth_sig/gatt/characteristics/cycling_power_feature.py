@@ -52,6 +52,7 @@ class CyclingPowerFeatureCharacteristic(BaseCharacteristic[CyclingPowerFeatureDa
     capabilities (bits 0-21 per CPS v1.1).
     """
 
+    _is_static = True
     expected_length: int = 4
     min_length: int = 4
 
@@ -12,6 +12,7 @@ from ..context import CharacteristicContext
 from .base import BaseCharacteristic
 from .cycling_power_feature import CyclingPowerFeatureCharacteristic
 from .utils import DataParser
+from .utils.flag_layout import FlagGroup, FlagLayout, LayoutField
 
 
 class CyclingPowerMeasurementFlags(IntFlag):
@@ -107,6 +108,24 @@ class CyclingPowerMeasurementCharacteristic(BaseCharacteristic[CyclingPowerMeasu
             ValueError: If data format is invalid.
 
         """
+        values = _LAYOUT.decode(data)
+        if values is not None:
+            raw_balance = values["pedal_power_balance"]
+            if raw_balance is not None:
+                values["pedal_power_balance"] = (
+                    None
+                    if raw_balance == self.UNKNOWN_PEDAL_POWER_BALANCE
+                    else raw_balance / self.PEDAL_POWER_BALANCE_RESOLUTION
+                )
+            extreme_angles = values.pop("extreme_angles")
+            if extreme_angles is not None:
+                values["maximum_angle"] = extreme_angles & 0x0FFF
+                values["minimum_angle"] = (extreme_angles >> 12) & 0x0FFF
+            self._validate_features(values["flags"], ctx)
+            values["flags"] = CyclingPowerMeasurementFlags(values["flags"])
+            return CyclingPowerMeasurementData(**values)
+
+        # Truncated packet: decode field by field, skipping fields that do not fit
         # Parse flags (16-bit)
         flags = DataParser.parse_int16(data, 0, signed=False)
 
@@ -197,7 +216,40 @@ class CyclingPowerMeasurementCharacteristic(BaseCharacteristic[CyclingPowerMeasu
             accumulated_energy = DataParser.parse_int16(data, offset, signed=False)  # kJ
             offset += 2
 
-        # Validate flags against Cycling Power Feature if available
+        self._validate_features(flags, ctx)
+
+        # Create struct with all parsed values
+        return CyclingPowerMeasurementData(
+            flags=CyclingPowerMeasurementFlags(flags),
+            instantaneous_power=instantaneous_power,
+            pedal_power_balance=pedal_power_balance,
+            accumulated_torque=accumulated_torque,
+            accumulated_energy=accumulated_energy,
+            cumulative_wheel_revolutions=cumulative_wheel_revolutions,
+            last_wheel_event_time=last_wheel_event_time,
+            cumulative_crank_revolutions=cumulative_crank_revolutions,
+            last_crank_event_time=last_crank_event_time,
+            maximum_force_magnitude=maximum_force_magnitude,
+            minimum_force_magnitude=minimum_force_magnitude,
+            maximum_torque_magnitude=maximum_torque_magnitude,
+            minimum_torque_magnitude=minimum_torque_magnitude,
+            maximum_angle=maximum_angle,
+            minimum_angle=minimum_angle,
+            top_dead_spot_angle=top_dead_spot_angle,
+            bottom_dead_spot_angle=bottom_dead_spot_angle,
+        )
+
+    def _validate_features(self, flags: int, ctx: CharacteristicContext | None) -> None:
+        """Validate flags against Cycling Power Feature if available.
+
+        Args:
+            flags: Raw measurement flags.
+            ctx: Optional context that may hold the Cycling Power Feature.
+
+        Raises:
+            ValueError: If a reported field is not supported by the feature.
+
+        """
         if ctx is not None:
             feature_data = self.get_context_characteristic(ctx, CyclingPowerFeatureCharacteristic)
             if feature_data is not None:
@@ -221,27 +273,6 @@ class CyclingPowerMeasurementCharacteristic(BaseCharacteristic[CyclingPowerMeasu
                 ):
                     raise ValueError("Crank revolution data reported but not supported by Cycling Power Feature")
 
-        # Create struct with all parsed values
-        return CyclingPowerMeasurementData(
-            flags=CyclingPowerMeasurementFlags(flags),
-            instantaneous_power=instantaneous_power,
-            pedal_power_balance=pedal_power_balance,
-            accumulated_torque=accumulated_torque,
-            accumulated_energy=accumulated_energy,
-            cumulative_wheel_revolutions=cumulative_wheel_revolutions,
-            last_wheel_event_time=last_wheel_event_time,
-            cumulative_crank_revolutions=cumulative_crank_revolutions,
-            last_crank_event_time=last_crank_event_time,
-            maximum_force_magnitude=maximum_force_magnitude,
-            minimum_force_magnitude=minimum_force_magnitude,
-            maximum_torque_magnitude=maximum_torque_magnitude,
-            minimum_torque_magnitude=minimum_torque_magnitude,
-            maximum_angle=maximum_angle,
-            minimum_angle=minimum_angle,
-            top_dead_spot_angle=top_dead_spot_angle,
-            bottom_dead_spot_angle=bottom_dead_spot_angle,
-        )
-
     def _encode_value(self, data: CyclingPowerMeasurementData) -> bytearray:  # noqa: PLR0912  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
         """Encode cycling power measurement value back to bytes.
 
@@ -374,3 +405,74 @@ class CyclingPowerMeasurementCharacteristic(BaseCharacteristic[CyclingPowerMeasu
             result.extend(DataParser.encode_int16(energy, signed=False))
 
         return result
+
+
+_LAYOUT = FlagLayout(
+    "uint16",
+    (
+        FlagGroup((LayoutField("instantaneous_power", "sint16"),)),
+        FlagGroup(
+            (LayoutField("pedal_power_balance", "uint8"),),  # 0xFF sentinel handled by the characteristic
+            mask=CyclingPowerMeasurementFlags.PEDAL_POWER_BALANCE_PRESENT,
+        ),
+        FlagGroup(
+            (
+                LayoutField(
+                    "accumulated_torque",
+                    "uint16",
+                    divisor=CyclingPowerMeasurementCharacteristic.ACCUMULATED_TORQUE_RESOLUTION,
+                ),
+            ),
+            mask=CyclingPowerMeasurementFlags.ACCUMULATED_TORQUE_PRESENT,
+        ),
+        FlagGroup(
+            (
+                LayoutField("cumulative_wheel_revolutions", "uint32"),
+                LayoutField(
+                    "last_wheel_event_time",
+                    "uint16",
+                    divisor=CyclingPowerMeasurementCharacteristic.WHEEL_TIME_RESOLUTION,
+                ),
+            ),
+            mask=CyclingPowerMeasurementFlags.WHEEL_REVOLUTION_DATA_PRESENT,
+        ),
+        FlagGroup(
+            (
+                LayoutField("cumulative_crank_revolutions", "uint16"),
+                LayoutField(
+                    "last_crank_event_time",
+                    "uint16",
+                    divisor=CyclingPowerMeasurementCharacteristic.CRANK_TIME_RESOLUTION,
+                ),
+            ),
+            mask=CyclingPowerMeasurementFlags.CRANK_REVOLUTION_DATA_PRESENT,
+        ),
+        FlagGroup(
+            (LayoutField("maximum_force_magnitude", "sint16"), LayoutField("minimum_force_magnitude", "sint16")),
+            mask=CyclingPowerMeasurementFlags.EXTREME_FORCE_MAGNITUDES_PRESENT,
+        ),
+        FlagGroup(
+            (
+                LayoutField("maximum_torque_magnitude", "sint16", divisor=32.0),
+                LayoutField("minimum_torque_magnitude", "sint16", divisor=32.0),
+            ),
+            mask=CyclingPowerMeasurementFlags.EXTREME_TORQUE_MAGNITUDES_PRESENT,
+        ),
+        FlagGroup(
+            (LayoutField("extreme_angles", "uint24"),),  # Two packed uint12, split by the characteristic
+            mask=CyclingPowerMeasurementFlags.EXTREME_ANGLES_PRESENT,
+        ),
+        FlagGroup(
+            (LayoutField("top_dead_spot_angle", "uint16"),),
+            mask=CyclingPowerMeasurementFlags.TOP_DEAD_SPOT_ANGLE_PRESENT,
+        ),
+        FlagGroup(
+            (LayoutField("bottom_dead_spot_angle", "uint16"),),
+            mask=CyclingPowerMeasurementFlags.BOTTOM_DEAD_SPOT_ANGLE_PRESENT,
+        ),
+        FlagGroup(
+            (LayoutField("accumulated_energy", "uint16"),),
+            mask=CyclingPowerMeasurementFlags.ACCUMULATED_ENERGY_PRESENT,
+        ),
+    ),
+)
@@ -23,11 +23,14 @@ from ..descriptors.characteristic_presentation_format import CharacteristicPrese
 class DescriptorMixin:
     """Mixin providing descriptor management and context lookup helpers.
 
-    Expects the consuming class to initialise ``_descriptors`` as an empty
-    ``dict[str, BaseDescriptor]`` in ``__init__``.
+    Expects the consuming class to initialise ``_descriptors`` to ``None`` in
+    ``__init__``; the dict is created when the first descriptor is added, since
+    most characteristics never get any.
     """
 
-    _descriptors: dict[str, BaseDescriptor]
+    __slots__ = ("_descriptors",)
+
+    _descriptors: dict[str, BaseDescriptor] | None
 
     # ------------------------------------------------------------------
     # Instance descriptor management
@@ -39,6 +42,8 @@ class DescriptorMixin:
         Args:
             descriptor: The descriptor instance to add.
         """
+        if self._descriptors is None:
+            self._descriptors = {}
         self._descriptors[str(descriptor.uuid)] = descriptor
 
     def get_descriptor(self, uuid: str | BluetoothUUID) -> BaseDescriptor | None:
@@ -58,6 +63,8 @@ class DescriptorMixin:
         else:
             uuid_obj = uuid
 
+        if self._descriptors is None:
+            return None
         return self._descriptors.get(uuid_obj.dashed_form)
 
     def get_descriptors(self) -> dict[str, BaseDescriptor]:
@@ -66,7 +73,7 @@ class DescriptorMixin:
         Returns:
             Dict mapping descriptor UUID strings to descriptor instances.
         """
-        return self._descriptors.copy()
+        return dict(self._descriptors) if self._descriptors is not None else {}
 
     def get_cccd(self) -> BaseDescriptor | None:
         """Get the Client Characteristic Configuration Descriptor (CCCD).
@@ -50,5 +50,6 @@ class DeviceTimeFeatureCharacteristic(BaseCharacteristic[DeviceTimeFeatureFlags]
     is not supported, the characteristic contains only DT_Features (2 octets).
     """
 
+    _is_static = True
     expected_length: int = 2
     _template = FlagTemplate.uint16(DeviceTimeFeatureFlags)
@@ -14,5 +14,6 @@ class FirmwareRevisionStringCharacteristic(BaseCharacteristic[str]):
     Represents the firmware revision as a UTF-8 string.
     """
 
+    _is_static = True
     _template = Utf8StringTemplate()
     min_length = 0
@@ -15,6 +15,7 @@ References:
 from __future__ import annotations
 
 from .utils import DataParser
+from .utils.flag_layout import FlagGroup, LayoutField
 
 # ---------------------------------------------------------------------------
 # Scaling constants (from YAML M/d/b parameters)
@@ -26,6 +27,43 @@ MET_RESOLUTION = 10.0  # M=1, d=-1, b=0 -> raw / 10
 # ---------------------------------------------------------------------------
 
 
+def trailing_field_groups(
+    *,
+    energy: int,
+    heart_rate: int,
+    metabolic_equivalent: int,
+    elapsed_time: int,
+    remaining_time: int,
+) -> tuple[FlagGroup, ...]:
+    """Build the :class:`FlagGroup` layout of the shared trailing field blocks.
+
+    Args:
+        energy: Flag bit gating the energy triplet.
+        heart_rate: Flag bit gating Heart Rate.
+        metabolic_equivalent: Flag bit gating Metabolic Equivalent.
+        elapsed_time: Flag bit gating Elapsed Time.
+        remaining_time: Flag bit gating Remaining Time.
+
+    Returns:
+        Groups in wire order, matching the ``decode_*`` helpers below.
+
+    """
+    return (
+        FlagGroup(
+            (
+                LayoutField("total_energy", "uint16"),
+                LayoutField("energy_per_hour", "uint16"),
+                LayoutField("energy_per_minute", "uint8"),
+            ),
+            mask=energy,
+        ),
+        FlagGroup((LayoutField("heart_rate", "uint8"),), mask=heart_rate),
+        FlagGroup((LayoutField("metabolic_equivalent", "uint8", divisor=MET_RESOLUTION),), mask=metabolic_equivalent),
+        FlagGroup((LayoutField("elapsed_time", "uint16"),), mask=elapsed_time),
+        FlagGroup((LayoutField("remaining_time", "uint16"),), mask=remaining_time),
+    )
+
+
 def decode_energy_triplet(data: bytearray, offset: int) -> tuple[int | None, int | None, int | None, int]:
     """Decode the shared Energy triplet (Total + Per Hour + Per Minute).
 
@@ -71,6 +71,7 @@ class FitnessMachineFeatureCharacteristic(BaseCharacteristic[FitnessMachineFeatu
     the supported target settings.
     """
 
+    _is_static = True
     expected_length: int = 8  # 2 x uint32
     min_length: int = 8
     expected_type = FitnessMachineFeatureData
@@ -79,6 +79,7 @@ class GlucoseFeatureCharacteristic(BaseCharacteristic[GlucoseFeatureData]):
     available.
     """
 
+    _is_static = True
     _characteristic_name: str = "Glucose Feature"
     _manual_unit: str = "bitmap"  # Feature bitmap
 
@@ -14,5 +14,6 @@ class HardwareRevisionStringCharacteristic(BaseCharacteristic[str]):
     Represents the hardware revision as a UTF-8 string.
     """
 
+    _is_static = True
     _template = Utf8StringTemplate()
     min_length = 0
@@ -22,4 +22,5 @@ class HealthSensorFeaturesCharacteristic(BaseCharacteristic[HealthSensorFeatures
     Bitfield indicating the supported Health Sensor features.
     """
 
+    _is_static = True
     _template = FlagTemplate.uint32(HealthSensorFeatures)
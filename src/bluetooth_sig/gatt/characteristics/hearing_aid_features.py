@@ -50,6 +50,7 @@ class HearingAidFeaturesCharacteristic(BaseCharacteristic[HearingAidFeaturesData
         Hearing Access Service 1.0, Section 3.1
     """
 
+    _is_static = True
     expected_length = 1
 
     _HEARING_AID_TYPE_MASK = 0x03
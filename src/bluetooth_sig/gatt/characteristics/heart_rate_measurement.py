@@ -14,6 +14,7 @@ from ..context import CharacteristicContext
 from .base import BaseCharacteristic
 from .body_sensor_location import BodySensorLocation, BodySensorLocationCharacteristic
 from .utils import DataParser
+from .utils.flag_layout import FlagGroup, FlagLayout, LayoutField
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,27 @@ class HeartRateMeasurementFlags(IntFlag):
     RR_INTERVAL_PRESENT = 0x10
 
 
+_LAYOUT = FlagLayout(
+    "uint8",
+    (
+        FlagGroup(
+            (LayoutField("heart_rate", "uint8"),),
+            mask=HeartRateMeasurementFlags.HEART_RATE_VALUE_FORMAT_UINT16,
+            inverted=True,
+        ),
+        FlagGroup(
+            (LayoutField("heart_rate", "uint16"),),
+            mask=HeartRateMeasurementFlags.HEART_RATE_VALUE_FORMAT_UINT16,
+        ),
+        FlagGroup((LayoutField("energy_expended", "uint16"),), mask=HeartRateMeasurementFlags.ENERGY_EXPENDED_PRESENT),
+    ),
+    tail=FlagGroup(
+        (LayoutField("rr_intervals", "uint16", divisor=RR_INTERVAL_RESOLUTION),),
+        mask=HeartRateMeasurementFlags.RR_INTERVAL_PRESENT,
+    ),
+)
+
+
 class SensorContactState(IntEnum):
     """Sensor contact state enumeration."""
 
@@ -94,6 +116,17 @@ class HeartRateData(msgspec.Struct, frozen=True, kw_only=True):  # pylint: disab
                 )
 
 
+# Field values in ``HeartRateData`` field order (see ``decode_row``).
+HeartRateDataRow = tuple[
+    int,
+    SensorContactState,
+    int | None,
+    tuple[float, ...],
+    HeartRateMeasurementFlags,
+    BodySensorLocation | None,
+]
+
+
 class HeartRateMeasurementCharacteristic(BaseCharacteristic[HeartRateData]):
     """Heart Rate Measurement characteristic (0x2A37).
 
@@ -137,7 +170,7 @@ class HeartRateMeasurementCharacteristic(BaseCharacteristic[HeartRateData]):
     min_length: int = 2  # Flags(1) + HR(1/2)
     allow_variable_length: bool = True  # Optional energy expended and RR intervals
 
-    def _decode_value(  # pylint: disable=too-many-branches  # Branches needed for spec-compliant parsing
+    def _decode_value(
         self, data: bytearray, ctx: CharacteristicContext | None = None, *, validate: bool = True
     ) -> HeartRateData:
         """Parse heart rate measurement data according to Bluetooth specification.
@@ -158,6 +191,62 @@ class HeartRateMeasurementCharacteristic(BaseCharacteristic[HeartRateData]):
             context-enhanced information.
 
         """
+        heart_rate, sensor_contact, energy_expended, rr_intervals, flags, _ = self.decode_row(data)
+
+        # Context enhancement: Body Sensor Location
+        sensor_location = None
+        if ctx:
+            location_value = self.get_context_characteristic(ctx, CharacteristicName.BODY_SENSOR_LOCATION)
+            if location_value is not None:
+                # Body Sensor Location is a uint8 enum value (0-6)
+                try:
+                    sensor_location = BodySensorLocation(location_value)
+                except ValueError:
+                    # Invalid value outside enum range, leave as None
+                    logger.warning(
+                        "Invalid Body Sensor Location value %s in context (valid range: 0-6), ignoring",
+                        location_value,
+                    )
+
+        return HeartRateData(
+            heart_rate=heart_rate,
+            sensor_contact=sensor_contact,
+            energy_expended=energy_expended,
+            rr_intervals=rr_intervals,
+            flags=flags,
+            sensor_location=sensor_location,
+        )
+
+    def decode_row(self, data: bytearray) -> HeartRateDataRow:  # pylint: disable=too-many-branches  # Spec-compliant parsing
+        """Decode raw bytes into field values in ``HeartRateData`` field order.
+
+        Skips struct construction, validation and context enhancement
+        (``sensor_location`` is always ``None``); used by :meth:`_decode_value`
+        and for direct columnar export.
+
+        Args:
+            data: Raw bytearray from BLE characteristic.
+
+        Returns:
+            Tuple of field values.
+
+        Raises:
+            ValueError: If a 16-bit heart rate value is truncated.
+
+        """
+        values = _LAYOUT.decode(data)
+        if values is not None:
+            flags = HeartRateMeasurementFlags(values["flags"])
+            return (
+                values["heart_rate"],
+                SensorContactState.from_flags(flags),
+                values["energy_expended"],
+                values["rr_intervals"] or (),
+                flags,
+                None,
+            )
+
+        # Truncated packet: decode field by field
         flags = HeartRateMeasurementFlags(data[0])
         offset = 1
 
@@ -187,28 +276,13 @@ class HeartRateMeasurementCharacteristic(BaseCharacteristic[HeartRateData]):
                 rr_intervals.append(rr_interval_raw / RR_INTERVAL_RESOLUTION)
                 offset += 2
 
-        # Context enhancement: Body Sensor Location
-        sensor_location = None
-        if ctx:
-            location_value = self.get_context_characteristic(ctx, CharacteristicName.BODY_SENSOR_LOCATION)
-            if location_value is not None:
-                # Body Sensor Location is a uint8 enum value (0-6)
-                try:
-                    sensor_location = BodySensorLocation(location_value)
-                except ValueError:
-                    # Invalid value outside enum range, leave as None
-                    logger.warning(
-                        "Invalid Body Sensor Location value %s in context (valid range: 0-6), ignoring",
-                        location_value,
-                    )
-
-        return HeartRateData(
-            heart_rate=heart_rate,
-            sensor_contact=sensor_contact,
-            energy_expended=energy_expended,
-            rr_intervals=tuple(rr_intervals),  # Convert list to tuple for immutable struct
-            flags=flags,
-            sensor_location=sensor_location,
+        return (
+            heart_rate,
+            sensor_contact,
+            energy_expended,
+            tuple(rr_intervals),  # Convert list to tuple for immutable struct
+            flags,
+            None,
         )
 
     def _encode_value(self, data: HeartRateData) -> bytearray:
@@ -66,6 +66,7 @@ class IDDFeaturesCharacteristic(BaseCharacteristic[IDDFeaturesData]):
     Structure: E2E-CRC(2) + E2E-Counter(1) + InsulinConcentration(2) + Flags(3) = 8 bytes.
     """
 
+    _is_static = True
     min_length = 8
     allow_variable_length = True
 
@@ -49,6 +49,7 @@ class IEEE1107320601RegulatoryCharacteristic(
     bytes by this library.
     """
 
+    _is_static = True
     _manual_role = CharacteristicRole.INFO
     _characteristic_name = "IEEE 11073-20601 Regulatory Certification Data List"
     expected_type = IEEE11073RegulatoryData
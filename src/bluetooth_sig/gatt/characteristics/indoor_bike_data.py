@@ -34,8 +34,10 @@ from .fitness_machine_common import (
     encode_heart_rate,
     encode_metabolic_equivalent,
     encode_remaining_time,
+    trailing_field_groups,
 )
 from .utils import DataParser
+from .utils.flag_layout import FlagGroup, FlagLayout, LayoutField
 
 # Speed: M=1, d=-2, b=0 -> actual = raw / 100 km/h
 _SPEED_RESOLUTION = 100.0
@@ -69,6 +71,68 @@ class IndoorBikeDataFlags(IntFlag):
     REMAINING_TIME_PRESENT = 0x1000
 
 
+_LAYOUT = FlagLayout(
+    "uint16",
+    (
+        FlagGroup(
+            (LayoutField("instantaneous_speed", "uint16", divisor=_SPEED_RESOLUTION),),
+            mask=IndoorBikeDataFlags.MORE_DATA,
+            inverted=True,
+        ),
+        FlagGroup(
+            (LayoutField("average_speed", "uint16", divisor=_SPEED_RESOLUTION),),
+            mask=IndoorBikeDataFlags.AVERAGE_SPEED_PRESENT,
+        ),
+        FlagGroup(
+            (LayoutField("instantaneous_cadence", "uint16", divisor=_CADENCE_DIVISOR),),
+            mask=IndoorBikeDataFlags.INSTANTANEOUS_CADENCE_PRESENT,
+        ),
+        FlagGroup(
+            (LayoutField("average_cadence", "uint16", divisor=_CADENCE_DIVISOR),),
+            mask=IndoorBikeDataFlags.AVERAGE_CADENCE_PRESENT,
+        ),
+        FlagGroup((LayoutField("total_distance", "uint24"),), mask=IndoorBikeDataFlags.TOTAL_DISTANCE_PRESENT),
+        FlagGroup(
+            (LayoutField("resistance_level", "uint8", multiplier=_RESISTANCE_RESOLUTION),),
+            mask=IndoorBikeDataFlags.RESISTANCE_LEVEL_PRESENT,
+        ),
+        FlagGroup(
+            (LayoutField("instantaneous_power", "sint16"),),
+            mask=IndoorBikeDataFlags.INSTANTANEOUS_POWER_PRESENT,
+        ),
+        FlagGroup((LayoutField("average_power", "sint16"),), mask=IndoorBikeDataFlags.AVERAGE_POWER_PRESENT),
+        *trailing_field_groups(
+            energy=IndoorBikeDataFlags.EXPENDED_ENERGY_PRESENT,
+            heart_rate=IndoorBikeDataFlags.HEART_RATE_PRESENT,
+            metabolic_equivalent=IndoorBikeDataFlags.METABOLIC_EQUIVALENT_PRESENT,
+            elapsed_time=IndoorBikeDataFlags.ELAPSED_TIME_PRESENT,
+            remaining_time=IndoorBikeDataFlags.REMAINING_TIME_PRESENT,
+        ),
+    ),
+)
+
+
+# Field values in ``IndoorBikeData`` field order (see ``decode_row``).
+IndoorBikeDataRow = tuple[
+    IndoorBikeDataFlags,
+    float | None,
+    float | None,
+    float | None,
+    float | None,
+    int | None,
+    float | None,
+    int | None,
+    int | None,
+    int | None,
+    int | None,
+    int | None,
+    int | None,
+    float | None,
+    int | None,
+    int | None,
+]
+
+
 class IndoorBikeData(msgspec.Struct, frozen=True, kw_only=True):  # pylint: disable=too-few-public-methods,too-many-instance-attributes
     """Parsed data from Indoor Bike Data characteristic.
 
@@ -203,6 +267,68 @@ class IndoorBikeDataCharacteristic(BaseCharacteristic[IndoorBikeData]):
             IndoorBikeData with all present fields populated.
 
         """
+        values = _LAYOUT.decode(data)
+        if values is not None:
+            values["flags"] = IndoorBikeDataFlags(values["flags"])
+            return IndoorBikeData(**values)
+
+        (
+            flags,
+            instantaneous_speed,
+            average_speed,
+            instantaneous_cadence,
+            average_cadence,
+            total_distance,
+            resistance_level,
+            instantaneous_power,
+            average_power,
+            total_energy,
+            energy_per_hour,
+            energy_per_minute,
+            heart_rate,
+            metabolic_equivalent,
+            elapsed_time,
+            remaining_time,
+        ) = self.decode_row(data)
+
+        return IndoorBikeData(
+            flags=flags,
+            instantaneous_speed=instantaneous_speed,
+            average_speed=average_speed,
+            instantaneous_cadence=instantaneous_cadence,
+            average_cadence=average_cadence,
+            total_distance=total_distance,
+            resistance_level=resistance_level,
+            instantaneous_power=instantaneous_power,
+            average_power=average_power,
+            total_energy=total_energy,
+            energy_per_hour=energy_per_hour,
+            energy_per_minute=energy_per_minute,
+            heart_rate=heart_rate,
+            metabolic_equivalent=metabolic_equivalent,
+            elapsed_time=elapsed_time,
+            remaining_time=remaining_time,
+        )
+
+    def decode_row(self, data: bytearray) -> IndoorBikeDataRow:
+        """Decode raw bytes into field values in ``IndoorBikeData`` field order.
+
+        Skips struct construction and range validation; used by
+        :meth:`_decode_value` and for direct columnar export.
+
+        Args:
+            data: Raw bytearray from BLE characteristic.
+
+        Returns:
+            Tuple of field values (absent fields are ``None``).
+
+        """
+        values = _LAYOUT.decode(data)
+        if values is not None:
+            values["flags"] = IndoorBikeDataFlags(values["flags"])
+            return tuple(values.values())  # Layout keys follow IndoorBikeData field order
+
+        # Truncated packet: decode field by field, skipping fields that do not fit
         flags = IndoorBikeDataFlags(DataParser.parse_int16(data, 0, signed=False))
         offset = 2
 
@@ -286,23 +412,23 @@ class IndoorBikeDataCharacteristic(BaseCharacteristic[IndoorBikeData]):
         if flags & IndoorBikeDataFlags.REMAINING_TIME_PRESENT:
             remaining_time, offset = decode_remaining_time(data, offset)
 
-        return IndoorBikeData(
-            flags=flags,
-            instantaneous_speed=instantaneous_speed,
-            average_speed=average_speed,
-            instantaneous_cadence=instantaneous_cadence,
-            average_cadence=average_cadence,
-            total_distance=total_distance,
-            resistance_level=resistance_level,
-            instantaneous_power=instantaneous_power,
-            average_power=average_power,
-            total_energy=total_energy,
-            energy_per_hour=energy_per_hour,
-            energy_per_minute=energy_per_minute,
-            heart_rate=heart_rate,
-            metabolic_equivalent=metabolic_equivalent,
-            elapsed_time=elapsed_time,
-            remaining_time=remaining_time,
+        return (
+            flags,
+            instantaneous_speed,
+            average_speed,
+            instantaneous_cadence,
+            average_cadence,
+            total_distance,
+            resistance_level,
+            instantaneous_power,
+            average_power,
+            total_energy,
+            energy_per_hour,
+            energy_per_minute,
+            heart_rate,
+            metabolic_equivalent,
+            elapsed_time,
+            remaining_time,
         )
 
     def _encode_value(self, data: IndoorBikeData) -> bytearray:  # noqa: PLR0912
@@ -70,6 +70,7 @@ class LNFeatureCharacteristic(BaseCharacteristic[LNFeatureData]):
     Used to represent the supported features of a location and navigation sensor.
     """
 
+    _is_static = True
     min_length = 4
 
     def _decode_value(
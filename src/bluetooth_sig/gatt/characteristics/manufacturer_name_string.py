@@ -14,5 +14,6 @@ class ManufacturerNameStringCharacteristic(BaseCharacteristic[str]):
     Manufacturer Name String characteristic.
     """
 
+    _is_static = True
     _template = Utf8StringTemplate()
     min_length = 0
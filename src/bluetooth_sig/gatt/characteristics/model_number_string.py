@@ -14,4 +14,5 @@ class ModelNumberStringCharacteristic(BaseCharacteristic[str]):
     Model Number String characteristic.
     """
 
+    _is_static = True
     _template = Utf8StringTemplate()
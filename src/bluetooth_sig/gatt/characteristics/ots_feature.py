@@ -54,6 +54,7 @@ class OTSFeatureCharacteristic(BaseCharacteristic[OTSFeatureData]):
     Contains two uint32 fields: OACP features and OLCP features.
     """
 
+    _is_static = True
     expected_length: int = 8
 
     def _decode_value(
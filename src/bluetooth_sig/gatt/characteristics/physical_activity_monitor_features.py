@@ -83,6 +83,7 @@ class PhysicalActivityMonitorFeaturesCharacteristic(BaseCharacteristic[PhysicalA
     64-bit feature bitfield (8 octets, no FlagTemplate.uint64 available).
     """
 
+    _is_static = True
     min_length = 8
     allow_variable_length = False
 
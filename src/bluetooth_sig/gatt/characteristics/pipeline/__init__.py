@@ -9,10 +9,12 @@ from __future__ import annotations
 
 from .encode_pipeline import EncodePipeline
 from .parse_pipeline import ParsePipeline
+from .parse_result import ParseResult
 from .validation import CharacteristicValidator
 
 __all__ = [
     "CharacteristicValidator",
     "EncodePipeline",
     "ParsePipeline",
+    "ParseResult",
 ]
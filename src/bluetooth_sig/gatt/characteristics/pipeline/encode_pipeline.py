@@ -25,21 +25,22 @@ class EncodePipeline:
         3. Value encoding (via template or subclass ``_encode_value``)
         4. Length validation (post-encode)
 
-    Uses a back-reference to the owning characteristic for:
+    Holds no per-characteristic state, so one instance serves every
+    characteristic.  The owning characteristic is passed to each call for:
     - ``_encode_value()`` dispatch (Template Method pattern)
     - Metadata access (``name``, ``uuid``, ``_template``, ``_spec``)
     - Special value resolver
     """
 
-    def __init__(self, char: Any, validator: CharacteristicValidator) -> None:  # noqa: ANN401
-        """Initialise with back-reference to the owning characteristic.
+    __slots__ = ("_validator",)
+
+    def __init__(self, validator: CharacteristicValidator) -> None:
+        """Initialise with the validator shared by the parse and encode pipelines.
 
         Args:
-            char: BaseCharacteristic instance.
             validator: Shared validator instance.
 
         """
-        self._char = char
         self._validator = validator
 
     # ------------------------------------------------------------------
@@ -48,12 +49,14 @@ class EncodePipeline:
 
     def run(  # pylint: disable=too-many-branches
         self,
+        char: Any,  # noqa: ANN401  # BaseCharacteristic
         data: Any,  # noqa: ANN401  # T | SpecialValueResult
         validate: bool = True,
     ) -> bytearray:
         """Execute the full encode pipeline.
 
         Args:
+            char: Characteristic whose value is encoded.
             data: Value to encode (type T) or ``SpecialValueResult``.
             validate: Enable validation (type, range, length checks).
                       Special values bypass validation.
@@ -65,8 +68,7 @@ class EncodePipeline:
             CharacteristicEncodeError: If encoding or validation fails.
 
         """
-        char = self._char
-        enable_trace = self._is_trace_enabled()
+        enable_trace = self._is_trace_enabled(char)
         build_trace: list[str] = ["Starting build"] if enable_trace else []
         validation = ValidationAccumulator()
 
@@ -75,7 +77,7 @@ class EncodePipeline:
             if enable_trace:
                 build_trace.append(f"Encoding special value: {data.meaning}")
             try:
-                return self._pack_raw_int(data.raw_value)
+                return self._pack_raw_int(char, data.raw_value)
             except Exception as e:
                 raise CharacteristicEncodeError(
                     message=f"Failed to encode special value: {e}",
@@ -90,7 +92,7 @@ class EncodePipeline:
             if validate:
                 if enable_trace:
                     build_trace.append("Validating type")
-                type_validation = self._validator.validate_type(data)
+                type_validation = self._validator.validate_type(char, data)
                 validation.errors.extend(type_validation.errors)
                 validation.warnings.extend(type_validation.warnings)
                 if not type_validation.valid:
@@ -100,7 +102,7 @@ class EncodePipeline:
             if validate and isinstance(data, (int, float)):
                 if enable_trace:
                     build_trace.append("Validating range")
-                range_validation = self._validator.validate_range(data, ctx=None)
+                range_validation = self._validator.validate_range(char, data, ctx=None)
                 validation.errors.extend(range_validation.errors)
                 validation.warnings.extend(range_validation.warnings)
                 if not range_validation.valid:
@@ -115,7 +117,7 @@ class EncodePipeline:
             if validate:
                 if enable_trace:
                     build_trace.append("Validating encoded length")
-                length_validation = self._validator.validate_length(encoded)
+                length_validation = self._validator.validate_length(char, encoded)
                 validation.errors.extend(length_validation.errors)
                 validation.warnings.extend(length_validation.warnings)
                 if not length_validation.valid:
@@ -142,10 +144,11 @@ class EncodePipeline:
     # Special value encoding helpers
     # ------------------------------------------------------------------
 
-    def encode_special(self, value_type: Any) -> bytearray:  # noqa: ANN401  # SpecialValueType
+    def encode_special(self, char: Any, value_type: Any) -> bytearray:  # noqa: ANN401  # BaseCharacteristic, SpecialValueType
         """Encode a special value type to bytes (reverse lookup).
 
         Args:
+            char: Characteristic defining the special value.
             value_type: ``SpecialValueType`` enum member.
 
         Returns:
@@ -155,15 +158,16 @@ class EncodePipeline:
             ValueError: If no raw value of that type is defined.
 
         """
-        raw = self._char._special_resolver.get_raw_for_type(value_type)
+        raw = char._special_resolver.get_raw_for_type(value_type)
         if raw is None:
             raise ValueError(f"No special value of type {value_type.name} defined for this characteristic")
-        return self._pack_raw_int(raw)
+        return self._pack_raw_int(char, raw)
 
-    def encode_special_by_meaning(self, meaning: str) -> bytearray:
+    def encode_special_by_meaning(self, char: Any, meaning: str) -> bytearray:  # noqa: ANN401  # BaseCharacteristic
         """Encode a special value by a partial meaning string match.
 
         Args:
+            char: Characteristic defining the special value.
             meaning: Partial meaning string to match.
 
         Returns:
@@ -173,18 +177,17 @@ class EncodePipeline:
             ValueError: If no matching special value is found.
 
         """
-        raw = self._char._special_resolver.get_raw_for_meaning(meaning)
+        raw = char._special_resolver.get_raw_for_meaning(meaning)
         if raw is None:
             raise ValueError(f"No special value matching '{meaning}' defined for this characteristic")
-        return self._pack_raw_int(raw)
+        return self._pack_raw_int(char, raw)
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
-    def _pack_raw_int(self, raw: int) -> bytearray:
+    def _pack_raw_int(self, char: Any, raw: int) -> bytearray:  # noqa: ANN401  # BaseCharacteristic
         """Pack a raw integer to bytes using template extractor or YAML extractor."""
-        char = self._char
         # Priority 1: template extractor
         if char._template is not None:
             extractor = getattr(char._template, "extractor", None)
@@ -200,9 +203,9 @@ class EncodePipeline:
 
         raise ValueError("No extractor available to pack raw integer for this characteristic")
 
-    def _is_trace_enabled(self) -> bool:
+    def _is_trace_enabled(self, char: Any) -> bool:  # noqa: ANN401  # BaseCharacteristic
         """Check if build trace is enabled."""
         env_value = os.getenv("BLUETOOTH_SIG_ENABLE_PARSE_TRACE", "").lower()
         if env_value in ("0", "false", "no"):
             return False
-        return self._char._enable_parse_trace is not False
+        return char._enable_parse_trace is not False
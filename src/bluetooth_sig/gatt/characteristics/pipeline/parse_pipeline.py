@@ -7,17 +7,21 @@ extraction → special value detection → value decoding → range/type validat
 from __future__ import annotations
 
 import os
+import time
 from typing import Any, TypeVar
 
 from ....types import ParseFieldError as FieldError
 from ....types import SpecialValueResult
 from ....types.data_types import ValidationAccumulator
+from ....types.parse_outcome import ParseErrorCode, ParseOutcome
+from ....utils.profiling import parse_telemetry
 from ...exceptions import (
     CharacteristicParseError,
     ParseFieldError,
     SpecialValueDetectedError,
 )
 from ..utils.extractors import get_extractor
+from .parse_result import ParseResult
 from .validation import CharacteristicValidator
 
 T = TypeVar("T")
@@ -34,21 +38,22 @@ class ParsePipeline:
         5. Range validation (post-decode)
         6. Type validation
 
-    Uses a back-reference to the owning characteristic for:
+    Holds no per-characteristic state, so one instance serves every
+    characteristic.  The owning characteristic is passed to each call for:
     - ``_decode_value()`` dispatch (Template Method pattern)
     - Metadata access (``name``, ``uuid``, ``_template``, ``_spec``)
     - Special value resolver
     """
 
-    def __init__(self, char: Any, validator: CharacteristicValidator) -> None:  # noqa: ANN401
-        """Initialise with back-reference to the owning characteristic.
+    __slots__ = ("_validator",)
+
+    def __init__(self, validator: CharacteristicValidator) -> None:
+        """Initialise with the validator shared by the parse and encode pipelines.
 
         Args:
-            char: BaseCharacteristic instance.
             validator: Shared validator instance.
 
         """
-        self._char = char
         self._validator = validator
 
     # ------------------------------------------------------------------
@@ -57,6 +62,7 @@ class ParsePipeline:
 
     def run(
         self,
+        char: Any,  # noqa: ANN401  # BaseCharacteristic
         data: bytes | bytearray,
         ctx: Any | None = None,  # noqa: ANN401  # CharacteristicContext
         validate: bool = True,
@@ -64,6 +70,7 @@ class ParsePipeline:
         """Execute the full parse pipeline.
 
         Args:
+            char: Characteristic whose data is parsed.
             data: Raw bytes from BLE read.
             ctx: Optional ``CharacteristicContext`` for dependency-aware parsing.
             validate: Whether to run validation stages.
@@ -76,17 +83,41 @@ class ParsePipeline:
             CharacteristicParseError: If parsing or validation fails.
 
         """
-        char = self._char
+        if not parse_telemetry.enabled:
+            return self._run(char, data, ctx, validate)
+
+        start = time.perf_counter_ns()
+        try:
+            decoded_value = self._run(char, data, ctx, validate)
+        except SpecialValueDetectedError:
+            parse_telemetry.record(
+                str(char.uuid), char.name, time.perf_counter_ns() - start, ParseOutcome.SPECIAL_VALUE
+            )
+            raise
+        except CharacteristicParseError:
+            parse_telemetry.record(str(char.uuid), char.name, time.perf_counter_ns() - start, ParseOutcome.ERROR)
+            raise
+        parse_telemetry.record(str(char.uuid), char.name, time.perf_counter_ns() - start, ParseOutcome.OK)
+        return decoded_value
+
+    def _run(
+        self,
+        char: Any,  # noqa: ANN401  # BaseCharacteristic
+        data: bytes | bytearray,
+        ctx: Any | None,  # noqa: ANN401  # CharacteristicContext
+        validate: bool,
+    ) -> Any:  # noqa: ANN401  # Returns T (generic of owning char)
+        """Execute the pipeline stages (see :meth:`run`)."""
         data_bytes = bytearray(data)
-        enable_trace = self._is_trace_enabled()
+        enable_trace = self._is_trace_enabled(char)
         parse_trace: list[str] = ["Starting parse"] if enable_trace else []
         field_errors: list[FieldError] = []
         validation = ValidationAccumulator()
         raw_int: int | None = None
 
         try:
-            self._perform_length_validation(data_bytes, enable_trace, parse_trace, validation, validate)
-            raw_int, parsed_value = self._extract_and_check_special(data_bytes, enable_trace, parse_trace, ctx)
+            self._perform_length_validation(char, data_bytes, enable_trace, parse_trace, validation, validate)
+            raw_int, parsed_value = self._extract_and_check_special(char, data_bytes, enable_trace, parse_trace, ctx)
         except Exception as e:
             if enable_trace:
                 parse_trace.append(f"Parse failed: {type(e).__name__}: {e}")
@@ -113,7 +144,9 @@ class ParsePipeline:
             )
 
         try:
-            decoded_value = self._decode_and_validate(data_bytes, enable_trace, parse_trace, ctx, validation, validate)
+            decoded_value = self._decode_and_validate(
+                char, data_bytes, enable_trace, parse_trace, ctx, validation, validate
+            )
         except SpecialValueDetectedError:
             raise
         except Exception as e:
@@ -144,12 +177,149 @@ class ParsePipeline:
 
         return decoded_value
 
+    def run_outcome(
+        self,
+        char: Any,  # noqa: ANN401  # BaseCharacteristic
+        data: bytes | bytearray,
+        ctx: Any | None = None,  # noqa: ANN401  # CharacteristicContext
+        validate: bool = True,
+    ) -> ParseResult[Any]:
+        """Execute the pipeline without raising.
+
+        Runs the same stages as :meth:`run` but reports special values and
+        failures through the returned :class:`ParseResult`. No parse trace is
+        collected, and error details are only built if the caller asks.
+
+        Args:
+            char: Characteristic whose data is parsed.
+            data: Raw bytes from BLE read.
+            ctx: Optional ``CharacteristicContext`` for dependency-aware parsing.
+            validate: Whether to run validation stages.
+
+        Returns:
+            Tagged parse result.
+
+        """
+        if not parse_telemetry.enabled:
+            return self._run_outcome(char, data, ctx, validate)
+
+        start = time.perf_counter_ns()
+        result = self._run_outcome(char, data, ctx, validate)
+        parse_telemetry.record(str(result.uuid), result.name, time.perf_counter_ns() - start, result.outcome)
+        return result
+
+    def _run_outcome(  # pylint: disable=too-many-return-statements
+        self,
+        char: Any,  # noqa: ANN401  # BaseCharacteristic
+        data: bytes | bytearray,
+        ctx: Any | None,  # noqa: ANN401  # CharacteristicContext
+        validate: bool,
+    ) -> ParseResult[Any]:
+        """Execute the pipeline stages without raising (see :meth:`run_outcome`)."""
+        name = char.name
+        uuid = char.uuid
+
+        if validate and not self._validator.length_ok(char, len(data)):
+            return ParseResult(
+                ParseOutcome.ERROR,
+                name,
+                uuid,
+                data,
+                error_code=ParseErrorCode.INVALID_LENGTH,
+                validation=self._failed_validation(char, data, validate),
+            )
+
+        data_bytes = bytearray(data)
+        raw_int: int | None = None
+        try:
+            raw_int = self._extract_raw_int(char, data_bytes, False, [])
+        except Exception as e:  # pylint: disable=broad-exception-caught  # Reported via the result
+            return ParseResult(
+                ParseOutcome.ERROR,
+                name,
+                uuid,
+                data,
+                error_code=ParseErrorCode.DECODE_FAILED,
+                cause=e,
+                validation=self._failed_validation(char, data, validate),
+            )
+
+        if raw_int is not None:
+            special = char._special_resolver.resolve(raw_int)
+            if special is not None:
+                return ParseResult(ParseOutcome.SPECIAL_VALUE, name, uuid, data, special_value=special, raw_int=raw_int)
+
+        try:
+            decoded_value = char._decode_value(data_bytes, ctx, validate=validate)
+        except SpecialValueDetectedError as e:
+            return ParseResult(
+                ParseOutcome.SPECIAL_VALUE, name, uuid, data, special_value=e.special_value, raw_int=e.raw_int
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught  # Reported via the result
+            return ParseResult(
+                ParseOutcome.ERROR,
+                name,
+                uuid,
+                data,
+                error_code=ParseErrorCode.DECODE_FAILED,
+                raw_int=raw_int,
+                cause=e,
+                validation=self._failed_validation(char, data, validate),
+            )
+
+        if validate:
+            range_validation = self._validator.validate_range(char, decoded_value, ctx)
+            if not range_validation.valid:
+                return ParseResult(
+                    ParseOutcome.ERROR,
+                    name,
+                    uuid,
+                    data,
+                    error_code=ParseErrorCode.OUT_OF_RANGE,
+                    raw_int=raw_int,
+                    validation=self._failed_validation(char, data, validate, range_validation),
+                )
+            type_validation = self._validator.validate_type(char, decoded_value)
+            if not type_validation.valid:
+                return ParseResult(
+                    ParseOutcome.ERROR,
+                    name,
+                    uuid,
+                    data,
+                    error_code=ParseErrorCode.TYPE_MISMATCH,
+                    raw_int=raw_int,
+                    validation=self._failed_validation(char, data, validate, range_validation, type_validation),
+                )
+
+        return ParseResult(ParseOutcome.OK, name, uuid, data, value=decoded_value, raw_int=raw_int)
+
+    def _failed_validation(
+        self,
+        char: Any,  # noqa: ANN401  # BaseCharacteristic
+        data: bytes | bytearray,
+        validate: bool,
+        *results: ValidationAccumulator,
+    ) -> ValidationAccumulator:
+        """Build the accumulator :meth:`run` holds when failing after the validation *results*.
+
+        Only called on failure, so the length check is repeated here rather
+        than collected on every parse.
+        """
+        validation = ValidationAccumulator()
+        if validate:
+            results = (self._validator.validate_length(char, data), *results)
+        for result in results:
+            validation.errors.extend(result.errors)
+            validation.warnings.extend(result.warnings)
+        return validation
+
     # ------------------------------------------------------------------
     # Pipeline stages
     # ------------------------------------------------------------------
 
     def _perform_length_validation(
         self,
+        char: Any,  # noqa: ANN401  # BaseCharacteristic
         data_bytes: bytearray,
         enable_trace: bool,
         parse_trace: list[str],
@@ -161,7 +331,7 @@ class ParsePipeline:
             return
         if enable_trace:
             parse_trace.append(f"Validating data length (got {len(data_bytes)} bytes)")
-        length_validation = self._validator.validate_length(data_bytes)
+        length_validation = self._validator.validate_length(char, data_bytes)
         validation.errors.extend(length_validation.errors)
         validation.warnings.extend(length_validation.warnings)
         if not length_validation.valid:
@@ -169,19 +339,20 @@ class ParsePipeline:
 
     def _extract_and_check_special(  # pylint: disable=unused-argument
         self,
+        char: Any,  # noqa: ANN401  # BaseCharacteristic
         data_bytes: bytearray,
         enable_trace: bool,
         parse_trace: list[str],
         ctx: Any | None,  # noqa: ANN401  # CharacteristicContext
     ) -> tuple[int | None, int | SpecialValueResult | None]:
         """Stage 2+3: extract raw int and check for special values."""
-        raw_int = self._extract_raw_int(data_bytes, enable_trace, parse_trace)
+        raw_int = self._extract_raw_int(char, data_bytes, enable_trace, parse_trace)
 
         parsed_value = None
         if raw_int is not None:
             if enable_trace:
                 parse_trace.append("Checking for special values")
-            parsed_value = self._check_special_value(raw_int)
+            parsed_value = self._check_special_value(char, raw_int)
             if enable_trace:
                 if isinstance(parsed_value, SpecialValueResult):
                     parse_trace.append(f"Found special value: {parsed_value}")
@@ -192,6 +363,7 @@ class ParsePipeline:
 
     def _decode_and_validate(
         self,
+        char: Any,  # noqa: ANN401  # BaseCharacteristic
         data_bytes: bytearray,
         enable_trace: bool,
         parse_trace: list[str],
@@ -202,19 +374,19 @@ class ParsePipeline:
         """Stage 4+5+6: decode value via template/subclass, then validate."""
         if enable_trace:
             parse_trace.append("Decoding value")
-        decoded_value = self._char._decode_value(data_bytes, ctx, validate=validate)
+        decoded_value = char._decode_value(data_bytes, ctx, validate=validate)
 
         if validate:
             if enable_trace:
                 parse_trace.append("Validating range")
-            range_validation = self._validator.validate_range(decoded_value, ctx)
+            range_validation = self._validator.validate_range(char, decoded_value, ctx)
             validation.errors.extend(range_validation.errors)
             validation.warnings.extend(range_validation.warnings)
             if not range_validation.valid:
                 raise ValueError("; ".join(range_validation.errors))
             if enable_trace:
                 parse_trace.append("Validating type")
-            type_validation = self._validator.validate_type(decoded_value)
+            type_validation = self._validator.validate_type(char, decoded_value)
             validation.errors.extend(type_validation.errors)
             validation.warnings.extend(type_validation.warnings)
             if not type_validation.valid:
@@ -227,13 +399,12 @@ class ParsePipeline:
 
     def _extract_raw_int(
         self,
+        char: Any,  # noqa: ANN401  # BaseCharacteristic
         data: bytearray,
         enable_trace: bool,
         parse_trace: list[str],
     ) -> int | None:
         """Extract raw integer from bytes using template or YAML extractors."""
-        char = self._char
-
         # Priority 1: Template extractor
         if char._template is not None and char._template.extractor is not None:
             if enable_trace:
@@ -260,16 +431,16 @@ class ParsePipeline:
             parse_trace.append("No extractor available for raw_int extraction")
         return None
 
-    def _check_special_value(self, raw_value: int) -> int | SpecialValueResult:
+    def _check_special_value(self, char: Any, raw_value: int) -> int | SpecialValueResult:  # noqa: ANN401  # BaseCharacteristic
         """Check if raw value is a special sentinel value."""
-        res: SpecialValueResult | None = self._char._special_resolver.resolve(raw_value)
+        res: SpecialValueResult | None = char._special_resolver.resolve(raw_value)
         if res is not None:
             return res
         return raw_value
 
-    def _is_trace_enabled(self) -> bool:
+    def _is_trace_enabled(self, char: Any) -> bool:  # noqa: ANN401  # BaseCharacteristic
         """Check if parse trace is enabled via environment variable or instance attribute."""
         env_value = os.getenv("BLUETOOTH_SIG_ENABLE_PARSE_TRACE", "").lower()
         if env_value in ("0", "false", "no"):
             return False
-        return self._char._enable_parse_trace is not False
+        return char._enable_parse_trace is not False
@@ -0,0 +1,194 @@
+"""Non-raising parse result for GATT characteristic values.
+
+:class:`ParseResult` is returned by the ``try_parse_*`` APIs instead of
+raising. Special values and failures are reported through :attr:`outcome`;
+the error message and exception objects are only built when requested, so
+noisy links (sentinel values, truncated packets) avoid exception
+construction and unwinding entirely.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Generic, TypeVar
+
+from ....types import ParseFieldError as FieldError
+from ....types import SpecialValueResult
+from ....types.data_types import ValidationAccumulator
+from ....types.parse_outcome import ParseErrorCode, ParseOutcome
+from ....types.uuid import BluetoothUUID
+from ...exceptions import CharacteristicParseError, ParseFieldError, SpecialValueDetectedError
+
+T = TypeVar("T")
+
+
+class ParseResult(Generic[T]):
+    """Tagged result of a characteristic parse.
+
+    Exactly one of :attr:`value` (``OK``), :attr:`special_value`
+    (``SPECIAL_VALUE``) or :attr:`error_code` (``ERROR``) is meaningful.
+
+    Attributes:
+        outcome: Outcome category
+        value: Parsed value (``None`` unless ``OK``)
+        special_value: Detected sentinel (``None`` unless ``SPECIAL_VALUE``)
+        error_code: Failure reason (``None`` unless ``ERROR``)
+        raw_int: Extracted raw integer, when extraction ran
+        name: Characteristic name
+        uuid: Characteristic UUID
+
+    """
+
+    __slots__ = (
+        "_cause",
+        "_error",
+        "_raw_data",
+        "_validation",
+        "error_code",
+        "name",
+        "outcome",
+        "raw_int",
+        "special_value",
+        "uuid",
+        "value",
+    )
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        outcome: ParseOutcome,
+        name: str,
+        uuid: BluetoothUUID,
+        raw_data: bytes | bytearray,
+        *,
+        value: T | None = None,
+        special_value: SpecialValueResult | None = None,
+        error_code: ParseErrorCode | None = None,
+        raw_int: int | None = None,
+        cause: Exception | None = None,
+        validation: ValidationAccumulator | None = None,
+    ) -> None:
+        """Initialise the result (built by the parse pipeline).
+
+        Args:
+            outcome: Outcome category
+            name: Characteristic name
+            uuid: Characteristic UUID
+            raw_data: Input bytes (referenced, not copied)
+            value: Parsed value for ``OK``
+            special_value: Detected sentinel for ``SPECIAL_VALUE``
+            error_code: Failure reason for ``ERROR``
+            raw_int: Extracted raw integer
+            cause: Underlying exception for decode failures
+            validation: Failed validation results
+
+        """
+        self.outcome = outcome
+        self.name = name
+        self.uuid = uuid
+        self.value = value
+        self.special_value = special_value
+        self.error_code = error_code
+        self.raw_int = raw_int
+        self._raw_data = raw_data
+        self._cause = cause
+        self._validation = validation
+        self._error: CharacteristicParseError | SpecialValueDetectedError | None = None
+
+    def __repr__(self) -> str:
+        """Return a compact representation."""
+        if self.outcome is ParseOutcome.OK:
+            detail = f"value={self.value!r}"
+        elif self.outcome is ParseOutcome.SPECIAL_VALUE:
+            detail = f"special_value={self.special_value!r}"
+        else:
+            detail = f"error_code={self.error_code!r}"
+        return f"ParseResult({self.outcome.name}, {self.name!r}, {detail})"
+
+    @property
+    def ok(self) -> bool:
+        """Whether parsing produced a value."""
+        return self.outcome is ParseOutcome.OK
+
+    @property
+    def message(self) -> str:
+        """Human-readable description of the outcome (built on access)."""
+        if self.outcome is ParseOutcome.OK:
+            return "Parse completed successfully"
+        if self.special_value is not None:
+            return f"{self.name} ({self.uuid}): Special value detected: {self.special_value.meaning}"
+        if self._validation is not None and self._validation.errors:
+            return "; ".join(self._validation.errors)
+        if self._cause is not None:
+            return str(self._cause)
+        return f"Parse failed for {self.name} ({self.uuid})"
+
+    def to_exception(self) -> CharacteristicParseError | SpecialValueDetectedError | None:
+        """Build the exception ``parse_value`` would have raised.
+
+        The exception carries the same message, cause, field errors, raw
+        integer and validation results; only ``parse_trace`` is empty, as
+        no trace is collected. It is built on the first call and reused.
+
+        Returns:
+            The equivalent exception, or ``None`` for ``OK`` results
+
+        """
+        if self.outcome is ParseOutcome.OK:
+            return None
+        if self._error is None:
+            self._error = self._build_exception()
+        return self._error
+
+    def _build_exception(self) -> CharacteristicParseError | SpecialValueDetectedError:
+        """Create the exception for a ``SPECIAL_VALUE`` or ``ERROR`` result."""
+        if self.special_value is not None:
+            return SpecialValueDetectedError(
+                special_value=self.special_value,
+                name=self.name,
+                uuid=self.uuid,
+                raw_data=bytes(self._raw_data),
+                raw_int=self.raw_int,
+            )
+        # parse_value reports validation failures as a ValueError cause
+        cause = self._cause if self._cause is not None else ValueError(self.message)
+        field_errors: list[FieldError] = []
+        if isinstance(cause, ParseFieldError):
+            field_errors.append(
+                FieldError(
+                    field=cause.field,
+                    reason=cause.field_reason,
+                    offset=cause.offset,
+                    raw_slice=bytes(cause.data) if hasattr(cause, "data") else None,
+                )
+            )
+        error = CharacteristicParseError(
+            message=str(cause),
+            name=self.name,
+            uuid=self.uuid,
+            raw_data=bytes(self._raw_data),
+            raw_int=self.raw_int,
+            field_errors=field_errors,
+            validation=self._validation if self._validation is not None else ValidationAccumulator(),
+        )
+        error.__cause__ = cause
+        return error
+
+    def unwrap(self) -> T:
+        """Return the parsed value, raising the equivalent exception otherwise.
+
+        Returns:
+            Parsed value
+
+        Raises:
+            SpecialValueDetectedError: Special sentinel value detected
+            CharacteristicParseError: Parse/validation failure
+
+        """
+        error = self.to_exception()
+        if error is not None:
+            raise error
+        return self.value  # type: ignore[return-value]
+
+    def value_or(self, default: Any) -> T | Any:  # noqa: ANN401  # Caller-chosen fallback
+        """Return the parsed value, or *default* when not ``OK``."""
+        return self.value if self.outcome is ParseOutcome.OK else default
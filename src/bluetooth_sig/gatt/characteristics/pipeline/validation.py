@@ -18,20 +18,14 @@ from ...descriptor_utils import get_valid_range_from_context as _get_valid_range
 class CharacteristicValidator:
     """Validates characteristic values against range, type, and length constraints.
 
-    Uses a back-reference to the owning characteristic to access validation
-    attributes (``min_value``, ``max_value``, ``expected_length``, etc.) and
-    YAML-derived metadata.  This class is an **internal** implementation detail
-    of ``BaseCharacteristic`` and should not be used directly.
+    Stateless: the characteristic being validated is passed to each call,
+    and its constraints (``min_value``, ``max_value``, ``expected_length``,
+    etc.) are read from its ``ValidationConfig`` along with YAML-derived
+    metadata.  This class is an **internal** implementation detail of
+    ``BaseCharacteristic`` and should not be used directly.
     """
 
-    def __init__(self, char: Any) -> None:  # noqa: ANN401  # Avoids circular BaseCharacteristic import
-        """Initialise with a back-reference to the owning characteristic.
-
-        Args:
-            char: BaseCharacteristic instance (typed as Any to avoid circular import)
-
-        """
-        self._char = char
+    __slots__ = ()
 
     # ------------------------------------------------------------------
     # Range validation
@@ -39,6 +33,7 @@ class CharacteristicValidator:
 
     def validate_range(  # pylint: disable=too-many-branches
         self,
+        char: Any,  # noqa: ANN401  # BaseCharacteristic (avoids circular import)
         value: Any,  # noqa: ANN401  # Validates values of various numeric types
         ctx: CharacteristicContext | None = None,
     ) -> ValidationAccumulator:
@@ -50,6 +45,7 @@ class CharacteristicValidator:
             3. YAML-derived value range from structure — Bluetooth SIG specification
 
         Args:
+            char: Characteristic the value belongs to.
             value: The value to validate.
             ctx: Optional characteristic context containing descriptors.
 
@@ -57,7 +53,6 @@ class CharacteristicValidator:
             ValidationAccumulator with errors if validation fails.
 
         """
-        char = self._char
         result = ValidationAccumulator()
 
         # Skip validation for SpecialValueResult
@@ -84,17 +79,18 @@ class CharacteristicValidator:
             return result
 
         # Fall back to class-level validation attributes
-        if char.min_value is not None and value < char.min_value:
+        limits = char._validation  # Internal composition
+        if limits.min_value is not None and value < limits.min_value:
             error_msg = (
-                f"Value {value} is below minimum {char.min_value} "
+                f"Value {value} is below minimum {limits.min_value} "
                 f"(source: class-level constraint for {char.__class__.__name__})"
             )
             if char.unit:
                 error_msg += f" [unit: {char.unit}]"
             result.add_error(error_msg)
-        if char.max_value is not None and value > char.max_value:
+        if limits.max_value is not None and value > limits.max_value:
             error_msg = (
-                f"Value {value} is above maximum {char.max_value} "
+                f"Value {value} is above maximum {limits.max_value} "
                 f"(source: class-level constraint for {char.__class__.__name__})"
             )
             if char.unit:
@@ -102,7 +98,8 @@ class CharacteristicValidator:
             result.add_error(error_msg)
 
         # Fall back to YAML-derived value range from structure
-        _validate_yaml_range(result, value, char)
+        if limits.min_value is None and limits.max_value is None:
+            _validate_yaml_range(result, value, char)
 
         return result
 
@@ -110,10 +107,11 @@ class CharacteristicValidator:
     # Type validation
     # ------------------------------------------------------------------
 
-    def validate_type(self, value: Any) -> ValidationAccumulator:  # noqa: ANN401
+    def validate_type(self, char: Any, value: Any) -> ValidationAccumulator:  # noqa: ANN401  # BaseCharacteristic, any value
         """Validate value type matches expected_type if specified.
 
         Args:
+            char: Characteristic the value belongs to.
             value: The value to validate.
 
         Returns:
@@ -122,10 +120,10 @@ class CharacteristicValidator:
         """
         result = ValidationAccumulator()
 
-        expected_type: type | None = self._char.expected_type
+        expected_type: type | None = char._validation.expected_type
         if expected_type is not None and not isinstance(value, (expected_type, SpecialValueResult)):
             error_msg = (
-                f"Type validation failed for {self._char.name}: "
+                f"Type validation failed for {char.name}: "
                 f"expected {expected_type.__name__}, got {type(value).__name__} "
                 f"(value: {value})"
             )
@@ -136,17 +134,36 @@ class CharacteristicValidator:
     # Length validation
     # ------------------------------------------------------------------
 
-    def validate_length(self, data: bytes | bytearray) -> ValidationAccumulator:
+    def length_ok(self, char: Any, length: int) -> bool:  # noqa: ANN401  # BaseCharacteristic
+        """Check *length* against the length constraints without building messages.
+
+        Args:
+            char: Characteristic the data belongs to.
+            length: Data length in bytes.
+
+        Returns:
+            ``True`` if :meth:`validate_length` would report no errors.
+
+        """
+        limits = char._validation  # Internal composition
+        if limits.expected_length is not None and length != limits.expected_length:
+            return False
+        if limits.min_length is not None and length < limits.min_length:
+            return False
+        return limits.max_length is None or length <= limits.max_length
+
+    def validate_length(self, char: Any, data: bytes | bytearray) -> ValidationAccumulator:  # noqa: ANN401  # BaseCharacteristic
         """Validate data length meets requirements.
 
         Args:
+            char: Characteristic the data belongs to.
             data: The data to validate.
 
         Returns:
             ValidationAccumulator with errors if validation fails.
 
         """
-        char = self._char
+        limits = char._validation  # Internal composition
         result = ValidationAccumulator()
         length = len(data)
 
@@ -155,25 +172,25 @@ class CharacteristicValidator:
         source_context = ""
         if yaml_size is not None:
             source_context = f" (YAML specification: {yaml_size} bytes)"
-        elif char.expected_length is not None or char.min_length is not None or char.max_length is not None:
+        elif limits.expected_length is not None or limits.min_length is not None or limits.max_length is not None:
             source_context = f" (class-level constraint for {char.__class__.__name__})"
 
-        if char.expected_length is not None and length != char.expected_length:
+        if limits.expected_length is not None and length != limits.expected_length:
             error_msg = (
                 f"Length validation failed for {char.name}: "
-                f"expected exactly {char.expected_length} bytes, got {length}{source_context}"
+                f"expected exactly {limits.expected_length} bytes, got {length}{source_context}"
             )
             result.add_error(error_msg)
-        if char.min_length is not None and length < char.min_length:
+        if limits.min_length is not None and length < limits.min_length:
             error_msg = (
                 f"Length validation failed for {char.name}: "
-                f"expected at least {char.min_length} bytes, got {length}{source_context}"
+                f"expected at least {limits.min_length} bytes, got {length}{source_context}"
             )
             result.add_error(error_msg)
-        if char.max_length is not None and length > char.max_length:
+        if limits.max_length is not None and length > limits.max_length:
             error_msg = (
                 f"Length validation failed for {char.name}: "
-                f"expected at most {char.max_length} bytes, got {length}{source_context}"
+                f"expected at most {limits.max_length} bytes, got {length}{source_context}"
             )
             result.add_error(error_msg)
         return result
@@ -191,10 +208,10 @@ def _validate_yaml_range(
 ) -> None:
     """Add YAML-derived range validation errors to *result* (mutates in-place).
 
-    Only applies when no class-level min/max constraints are set.
+    Only called when no class-level min/max constraints are set.
     """
     spec: CharacteristicSpec | None = char._spec  # Internal composition
-    if char.min_value is not None or char.max_value is not None or not spec or not spec.structure:
+    if not spec or not spec.structure:
         return
 
     for field in spec.structure:
@@ -36,6 +36,7 @@ class PLXFeaturesCharacteristic(BaseCharacteristic[PLXFeatureFlags]):
     Spec: Bluetooth SIG Assigned Numbers, PLX Features characteristic
     """
 
+    _is_static = True
     _is_bitfield = True
 
     # PLXS v1.0.1 Table 3.8: 2-byte features + optional 2-byte Measurement Status
@@ -47,6 +47,7 @@ class PnpIdCharacteristic(BaseCharacteristic[PnpIdData]):
     Contains PnP ID information (7 bytes).
     """
 
+    _is_static = True
     _manual_role = CharacteristicRole.INFO
     expected_length = 7
 
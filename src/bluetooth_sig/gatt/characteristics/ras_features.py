@@ -32,4 +32,5 @@ class RASFeaturesCharacteristic(BaseCharacteristic[RASFeatures]):
     Per RAS v1.0 Table 3.2: Boolean[32] = uint32 (4 bytes).
     """
 
+    _is_static = True
     _template = FlagTemplate.uint32(RASFeatures)
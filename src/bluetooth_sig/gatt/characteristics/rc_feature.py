@@ -66,6 +66,7 @@ class RCFeatureCharacteristic(BaseCharacteristic[RCFeatureData]):
     a variable-length RC Feature bit field (3+ octets).
     """
 
+    _is_static = True
     _E2E_CRC_SIZE = 2
     _MIN_FEATURE_OCTETS = 3
     _DEFINED_BITS_MASK = 0x03FFFF
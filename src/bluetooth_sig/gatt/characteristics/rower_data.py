@@ -34,8 +34,10 @@ from .fitness_machine_common import (
     encode_heart_rate,
     encode_metabolic_equivalent,
     encode_remaining_time,
+    trailing_field_groups,
 )
 from .utils import DataParser
+from .utils.flag_layout import FlagGroup, FlagLayout, LayoutField
 
 # Stroke rate: M=1, d=0, b=-1 -> actual = raw / 2
 _STROKE_RATE_DIVISOR = 2.0
@@ -66,6 +68,41 @@ class RowerDataFlags(IntFlag):
     REMAINING_TIME_PRESENT = 0x1000
 
 
+_LAYOUT = FlagLayout(
+    "uint16",
+    (
+        FlagGroup(
+            (
+                LayoutField("stroke_rate", "uint8", divisor=_STROKE_RATE_DIVISOR),
+                LayoutField("stroke_count", "uint16"),
+            ),
+            mask=RowerDataFlags.MORE_DATA,
+            inverted=True,
+        ),
+        FlagGroup(
+            (LayoutField("average_stroke_rate", "uint8", divisor=_STROKE_RATE_DIVISOR),),
+            mask=RowerDataFlags.AVERAGE_STROKE_RATE_PRESENT,
+        ),
+        FlagGroup((LayoutField("total_distance", "uint24"),), mask=RowerDataFlags.TOTAL_DISTANCE_PRESENT),
+        FlagGroup((LayoutField("instantaneous_pace", "uint16"),), mask=RowerDataFlags.INSTANTANEOUS_PACE_PRESENT),
+        FlagGroup((LayoutField("average_pace", "uint16"),), mask=RowerDataFlags.AVERAGE_PACE_PRESENT),
+        FlagGroup((LayoutField("instantaneous_power", "sint16"),), mask=RowerDataFlags.INSTANTANEOUS_POWER_PRESENT),
+        FlagGroup((LayoutField("average_power", "sint16"),), mask=RowerDataFlags.AVERAGE_POWER_PRESENT),
+        FlagGroup(
+            (LayoutField("resistance_level", "uint8", multiplier=_RESISTANCE_RESOLUTION),),
+            mask=RowerDataFlags.RESISTANCE_LEVEL_PRESENT,
+        ),
+        *trailing_field_groups(
+            energy=RowerDataFlags.EXPENDED_ENERGY_PRESENT,
+            heart_rate=RowerDataFlags.HEART_RATE_PRESENT,
+            metabolic_equivalent=RowerDataFlags.METABOLIC_EQUIVALENT_PRESENT,
+            elapsed_time=RowerDataFlags.ELAPSED_TIME_PRESENT,
+            remaining_time=RowerDataFlags.REMAINING_TIME_PRESENT,
+        ),
+    ),
+)
+
+
 class RowerData(msgspec.Struct, frozen=True, kw_only=True):  # pylint: disable=too-few-public-methods,too-many-instance-attributes
     """Parsed data from Rower Data characteristic.
 
@@ -199,6 +236,12 @@ class RowerDataCharacteristic(BaseCharacteristic[RowerData]):
             RowerData with all present fields populated.
 
         """
+        values = _LAYOUT.decode(data)
+        if values is not None:
+            values["flags"] = RowerDataFlags(values["flags"])
+            return RowerData(**values)
+
+        # Truncated packet: decode field by field, skipping fields that do not fit
         flags = RowerDataFlags(DataParser.parse_int16(data, 0, signed=False))
         offset = 2
 
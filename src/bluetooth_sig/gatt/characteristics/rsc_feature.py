@@ -40,6 +40,7 @@ class RSCFeatureCharacteristic(BaseCharacteristic[RSCFeatureData]):
     capabilities.
     """
 
+    _is_static = True
     expected_length: int = 2
     min_length: int = 2
 
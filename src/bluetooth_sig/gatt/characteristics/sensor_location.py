@@ -59,4 +59,5 @@ class SensorLocationCharacteristic(BaseCharacteristic[SensorLocationValue]):
     Values 17-255 are reserved for future use.
     """
 
+    _is_static = True
     _template = EnumTemplate.uint8(SensorLocationValue)
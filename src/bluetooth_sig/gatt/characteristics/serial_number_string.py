@@ -14,4 +14,5 @@ class SerialNumberStringCharacteristic(BaseCharacteristic[str]):
     Serial Number String characteristic.
     """
 
+    _is_static = True
     _template = Utf8StringTemplate()
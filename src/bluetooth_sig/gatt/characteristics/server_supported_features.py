@@ -22,6 +22,7 @@ class ServerSupportedFeaturesCharacteristic(BaseCharacteristic[ServerFeatures]):
     Variable-length bitfield indicating GATT features supported by the server.
     """
 
+    _is_static = True
     allow_variable_length: bool = True
     min_length: int = 1
 
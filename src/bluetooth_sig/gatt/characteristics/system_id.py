@@ -29,6 +29,7 @@ class SystemIdCharacteristic(BaseCharacteristic[SystemIdData]):
     Represents a 64-bit system identifier: 40-bit manufacturer ID + 24-bit organizationally unique ID.
     """
 
+    _is_static = True
     _manual_role = CharacteristicRole.INFO
     expected_length = 8
 
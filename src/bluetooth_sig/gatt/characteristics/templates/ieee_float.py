@@ -5,9 +5,11 @@ Covers IEEE11073FloatTemplate (SFLOAT 16-bit) and Float32Template (IEEE-754 32-b
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from ...context import CharacteristicContext
 from ...exceptions import InsufficientDataError
-from ..utils import DataParser
+from ..utils import DataParser, IEEE11073Parser
 from ..utils.extractors import (
     FLOAT32,
     UINT16,
@@ -19,6 +21,10 @@ from ..utils.translators import (
 )
 from .base import CodingTemplate
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
 
 class IEEE11073FloatTemplate(CodingTemplate[float]):
     """Template for IEEE 11073 SFLOAT format (16-bit medical device float)."""
@@ -52,6 +58,25 @@ class IEEE11073FloatTemplate(CodingTemplate[float]):
         raw = self.translator.untranslate(value)
         return self.extractor.pack(raw)
 
+    def decode_array(
+        self, data: bytes | bytearray | memoryview, offset: int = 0, count: int | None = None
+    ) -> NDArray[np.float64]:
+        """Decode many packed SFLOAT values at once (requires NumPy).
+
+        Intended for bulk paths, e.g. a buffer of concatenated notifications
+        from one concentration characteristic.
+
+        Args:
+            data: Buffer of consecutive 2-byte SFLOAT values
+            offset: Offset of the first value
+            count: Number of values (default: every complete value after *offset*)
+
+        Returns:
+            ``float64`` array, matching :meth:`decode_value` per element
+
+        """
+        return IEEE11073Parser.parse_sfloat_array(data, offset, count)
+
 
 class Float32Template(CodingTemplate[float]):
     """Template for IEEE-754 32-bit float parsing."""
@@ -33,8 +33,10 @@ from .fitness_machine_common import (
     encode_heart_rate,
     encode_metabolic_equivalent,
     encode_remaining_time,
+    trailing_field_groups,
 )
 from .utils import DataParser
+from .utils.flag_layout import FlagGroup, FlagLayout, LayoutField
 
 # Speed: M=1, d=-2, b=0 -> actual = raw / 100 km/h
 _SPEED_RESOLUTION = 100.0
@@ -66,6 +68,50 @@ class TreadmillDataFlags(IntFlag):
     FORCE_AND_POWER_PRESENT = 0x1000
 
 
+_LAYOUT = FlagLayout(
+    "uint16",
+    (
+        FlagGroup(
+            (LayoutField("instantaneous_speed", "uint16", divisor=_SPEED_RESOLUTION),),
+            mask=TreadmillDataFlags.MORE_DATA,
+            inverted=True,
+        ),
+        FlagGroup(
+            (LayoutField("average_speed", "uint16", divisor=_SPEED_RESOLUTION),),
+            mask=TreadmillDataFlags.AVERAGE_SPEED_PRESENT,
+        ),
+        FlagGroup((LayoutField("total_distance", "uint24"),), mask=TreadmillDataFlags.TOTAL_DISTANCE_PRESENT),
+        FlagGroup(
+            (
+                LayoutField("inclination", "sint16", divisor=_TENTH_RESOLUTION),
+                LayoutField("ramp_angle_setting", "sint16", divisor=_TENTH_RESOLUTION),
+            ),
+            mask=TreadmillDataFlags.INCLINATION_AND_RAMP_PRESENT,
+        ),
+        FlagGroup(
+            (
+                LayoutField("positive_elevation_gain", "uint16", divisor=_TENTH_RESOLUTION),
+                LayoutField("negative_elevation_gain", "uint16", divisor=_TENTH_RESOLUTION),
+            ),
+            mask=TreadmillDataFlags.ELEVATION_GAIN_PRESENT,
+        ),
+        FlagGroup((LayoutField("instantaneous_pace", "uint16"),), mask=TreadmillDataFlags.INSTANTANEOUS_PACE_PRESENT),
+        FlagGroup((LayoutField("average_pace", "uint16"),), mask=TreadmillDataFlags.AVERAGE_PACE_PRESENT),
+        *trailing_field_groups(
+            energy=TreadmillDataFlags.EXPENDED_ENERGY_PRESENT,
+            heart_rate=TreadmillDataFlags.HEART_RATE_PRESENT,
+            metabolic_equivalent=TreadmillDataFlags.METABOLIC_EQUIVALENT_PRESENT,
+            elapsed_time=TreadmillDataFlags.ELAPSED_TIME_PRESENT,
+            remaining_time=TreadmillDataFlags.REMAINING_TIME_PRESENT,
+        ),
+        FlagGroup(
+            (LayoutField("force_on_belt", "sint16"), LayoutField("power_output", "sint16")),
+            mask=TreadmillDataFlags.FORCE_AND_POWER_PRESENT,
+        ),
+    ),
+)
+
+
 class TreadmillData(msgspec.Struct, frozen=True, kw_only=True):  # pylint: disable=too-few-public-methods,too-many-instance-attributes
     """Parsed data from Treadmill Data characteristic.
 
@@ -227,6 +273,12 @@ class TreadmillDataCharacteristic(BaseCharacteristic[TreadmillData]):
             TreadmillData with all present fields populated.
 
         """
+        values = _LAYOUT.decode(data)
+        if values is not None:
+            values["flags"] = TreadmillDataFlags(values["flags"])
+            return TreadmillData(**values)
+
+        # Truncated packet: decode field by field, skipping fields that do not fit
         flags = TreadmillDataFlags(DataParser.parse_int16(data, 0, signed=False))
         offset = 2
 
@@ -24,4 +24,5 @@ class UGGFeaturesCharacteristic(BaseCharacteristic[UGGFeatures]):
     Bitfield indicating the supported Unicast Game Gateway features.
     """
 
+    _is_static = True
     _template = FlagTemplate.uint8(UGGFeatures)
@@ -28,4 +28,5 @@ class UGTFeaturesCharacteristic(BaseCharacteristic[UGTFeatures]):
     Bitfield indicating the supported Unicast Game Terminal features.
     """
 
+    _is_static = True
     _template = FlagTemplate.uint8(UGTFeatures)
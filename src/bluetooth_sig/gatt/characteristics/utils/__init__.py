@@ -36,6 +36,7 @@ from .extractors import (
     Uint32Extractor,
     get_extractor,
 )
+from .flag_layout import CompiledLayout, FlagGroup, FlagLayout, LayoutField
 from .ieee11073_parser import IEEE11073Parser
 from .parse_trace import ParseTrace
 from .translators import (
@@ -71,14 +72,19 @@ __all__ = [
     "UINT32",
     # Existing utilities
     "BitFieldUtils",
+    "CompiledLayout",
     "DataParser",
     "DataValidator",
     "DebugUtils",
+    # Flag-gated layouts
+    "FlagGroup",
+    "FlagLayout",
     "Float32Extractor",
     "Float32IEEE754Translator",
     "Float32IEEETranslator",
     "IEEE11073Parser",
     "IdentityTranslator",
+    "LayoutField",
     "LinearTranslator",
     "ParseTrace",
     "PercentageTranslator",
@@ -12,10 +12,24 @@ unless explicitly stated otherwise.
 
 from __future__ import annotations
 
+import struct
 from abc import ABC, abstractmethod
 from typing import Literal
 
-from .data_parser import DataParser
+from ...exceptions import InsufficientDataError, ValueRangeError
+
+_FLOAT32 = struct.Struct("<f")
+# 48-bit values are read as a 32-bit and a 16-bit word in one unpack.
+_UINT48_LE = struct.Struct("<IH")
+_UINT48_BE = struct.Struct(">HI")
+
+
+def _range_error(type_name: str, raw: int, byte_size: int, signed: bool) -> ValueRangeError:
+    """Build the range error for an out-of-bounds *raw* value."""
+    bits = byte_size * 8
+    if signed and type_name != "float32":
+        return ValueRangeError(type_name, raw, -(1 << (bits - 1)), (1 << (bits - 1)) - 1)
+    return ValueRangeError(type_name, raw, 0, (1 << bits) - 1)
 
 
 class RawExtractor(ABC):
@@ -29,26 +43,23 @@ class RawExtractor(ABC):
     - Interception of raw values for special value handling
     - Composition with translators for scaling
     - Reuse across templates and characteristics
+
+    Attributes:
+        byte_size: Number of bytes this extractor reads/writes.
+        signed: Whether the integer type is signed.
     """
 
-    __slots__ = ()
+    __slots__ = ("byte_size", "signed")
 
-    @property
-    @abstractmethod
-    def byte_size(self) -> int:
-        """Number of bytes this extractor reads/writes."""
+    byte_size: int
+    signed: bool
 
-    @property
     @abstractmethod
-    def signed(self) -> bool:
-        """Whether the integer type is signed."""
-
-    @abstractmethod
-    def extract(self, data: bytes | bytearray, offset: int = 0) -> int:
+    def extract(self, data: bytes | bytearray | memoryview, offset: int = 0) -> int:
         """Extract raw integer from bytes.
 
         Args:
-            data: Source bytes to extract from.
+            data: Source buffer to extract from (read in place, never sliced).
             offset: Byte offset to start reading from.
 
         Returns:
@@ -73,90 +84,129 @@ class RawExtractor(ABC):
         """
 
 
-class Uint8Extractor(RawExtractor):
-    """Extract/pack unsigned 8-bit integers (0 to 255)."""
+class _StructExtractor(RawExtractor):
+    """Extractor backed by a precompiled :class:`struct.Struct`.
 
-    __slots__ = ()
+    Bounds and range checks are left to ``unpack_from``/``pack``; their
+    ``struct.error`` is translated to the library exceptions only on failure.
+    """
 
-    @property
-    def byte_size(self) -> int:
-        """Size: 1 byte."""
-        return 1
+    __slots__ = ("_endian", "_pack", "_type_name", "_unpack_from")
 
-    @property
-    def signed(self) -> bool:
-        """Unsigned type."""
-        return False
+    def __init__(self, type_name: str, code: str, *, signed: bool, endian: Literal["little", "big"] | None) -> None:
+        """Compile the struct for *code*.
 
-    def extract(self, data: bytes | bytearray, offset: int = 0) -> int:
-        """Extract uint8 from bytes."""
-        return DataParser.parse_int8(data, offset, signed=False)
+        Args:
+            type_name: GSS type name used in range errors (e.g. ``"uint16"``).
+            code: Single ``struct`` format character.
+            signed: Whether the type is signed.
+            endian: Byte order, or ``None`` for types without one (little-endian).
+        """
+        compiled = struct.Struct((">" if endian == "big" else "<") + code)
+        self.byte_size = compiled.size
+        self.signed = signed
+        self._endian = endian
+        self._type_name = type_name
+        self._unpack_from = compiled.unpack_from
+        self._pack = compiled.pack
+
+    def __reduce__(self) -> tuple[type[_StructExtractor], tuple[str, ...]]:
+        """Pickle by constructor arguments (compiled structs are not picklable)."""
+        return type(self), () if self._endian is None else (self._endian,)
+
+    def extract(self, data: bytes | bytearray | memoryview, offset: int = 0) -> int:
+        """Extract the integer at *offset*."""
+        try:
+            value: int = self._unpack_from(data, offset)[0]
+        except struct.error:
+            raise InsufficientDataError(f"int{self.byte_size * 8}", bytes(data[offset:]), self.byte_size) from None
+        return value
 
     def pack(self, raw: int) -> bytearray:
-        """Pack uint8 to bytes."""
-        return DataParser.encode_int8(raw, signed=False)
+        """Pack *raw* to bytes."""
+        try:
+            return bytearray(self._pack(raw))
+        except struct.error:
+            raise _range_error(self._type_name, raw, self.byte_size, self.signed) from None
 
 
-class Sint8Extractor(RawExtractor):
-    """Extract/pack signed 8-bit integers (-128 to 127)."""
+class _WideExtractor(RawExtractor):
+    """Extractor for 24/48-bit integers, which ``struct`` has no format for."""
 
-    __slots__ = ()
+    __slots__ = ("_endian", "_type_name")
 
-    @property
-    def byte_size(self) -> int:
-        """Size: 1 byte."""
-        return 1
+    def __init__(self, type_name: str, byte_size: int, *, signed: bool, endian: Literal["little", "big"]) -> None:
+        """Initialise the extractor.
 
-    @property
-    def signed(self) -> bool:
-        """Signed type."""
-        return True
+        Args:
+            type_name: GSS type name used in range errors (e.g. ``"uint24"``).
+            byte_size: Encoded size in bytes.
+            signed: Whether the type is signed.
+            endian: Byte order.
+        """
+        self.byte_size = byte_size
+        self.signed = signed
+        self._endian: Literal["little", "big"] = endian
+        self._type_name = type_name
+
+    def __reduce__(self) -> tuple[type[_WideExtractor], tuple[str, ...]]:
+        """Pickle by constructor arguments."""
+        return type(self), (self._endian,)
 
-    def extract(self, data: bytes | bytearray, offset: int = 0) -> int:
-        """Extract sint8 from bytes."""
-        return DataParser.parse_int8(data, offset, signed=True)
+    def _insufficient(self, data: bytes | bytearray | memoryview, offset: int) -> InsufficientDataError:
+        return InsufficientDataError(f"int{self.byte_size * 8}", bytes(data[offset:]), self.byte_size)
 
     def pack(self, raw: int) -> bytearray:
-        """Pack sint8 to bytes."""
-        return DataParser.encode_int8(raw, signed=True)
+        """Pack *raw* to bytes."""
+        try:
+            return bytearray(raw.to_bytes(self.byte_size, self._endian, signed=self.signed))
+        except OverflowError:
+            raise _range_error(self._type_name, raw, self.byte_size, self.signed) from None
 
 
-class Uint16Extractor(RawExtractor):
-    """Extract/pack unsigned 16-bit integers (0 to 65535)."""
+class _Int24Extractor(_WideExtractor):
+    """24-bit integers assembled from three byte reads (faster than slicing)."""
 
-    __slots__ = ("_endian",)
+    __slots__ = ()
 
-    def __init__(self, endian: Literal["little", "big"] = "little") -> None:
-        """Initialize with endianness.
+    def extract(self, data: bytes | bytearray | memoryview, offset: int = 0) -> int:
+        """Extract the 24-bit integer at *offset*."""
+        try:
+            if self._endian == "little":
+                value = data[offset] | data[offset + 1] << 8 | data[offset + 2] << 16
+            else:
+                value = data[offset] << 16 | data[offset + 1] << 8 | data[offset + 2]
+        except IndexError:
+            raise self._insufficient(data, offset) from None
+        if self.signed and value & 0x800000:
+            return value - 0x1000000
+        return value
+
+
+class Uint8Extractor(_StructExtractor):
+    """Extract/pack unsigned 8-bit integers (0 to 255)."""
 
-        Args:
-            endian: Byte order, defaults to little-endian per BLE spec.
-        """
-        self._endian: Literal["little", "big"] = endian
+    __slots__ = ()
 
-    @property
-    def byte_size(self) -> int:
-        """Size: 2 bytes."""
-        return 2
+    def __init__(self) -> None:
+        """Initialize the extractor."""
+        super().__init__("uint8", "B", signed=False, endian=None)
 
-    @property
-    def signed(self) -> bool:
-        """Unsigned type."""
-        return False
 
-    def extract(self, data: bytes | bytearray, offset: int = 0) -> int:
-        """Extract uint16 from bytes."""
-        return DataParser.parse_int16(data, offset, signed=False, endian=self._endian)
+class Sint8Extractor(_StructExtractor):
+    """Extract/pack signed 8-bit integers (-128 to 127)."""
 
-    def pack(self, raw: int) -> bytearray:
-        """Pack uint16 to bytes."""
-        return DataParser.encode_int16(raw, signed=False, endian=self._endian)
+    __slots__ = ()
 
+    def __init__(self) -> None:
+        """Initialize the extractor."""
+        super().__init__("sint8", "b", signed=True, endian=None)
 
-class Sint16Extractor(RawExtractor):
-    """Extract/pack signed 16-bit integers (-32768 to 32767)."""
 
-    __slots__ = ("_endian",)
+class Uint16Extractor(_StructExtractor):
+    """Extract/pack unsigned 16-bit integers (0 to 65535)."""
+
+    __slots__ = ()
 
     def __init__(self, endian: Literal["little", "big"] = "little") -> None:
         """Initialize with endianness.
@@ -164,31 +214,27 @@ class Sint16Extractor(RawExtractor):
         Args:
             endian: Byte order, defaults to little-endian per BLE spec.
         """
-        self._endian: Literal["little", "big"] = endian
+        super().__init__("uint16", "H", signed=False, endian=endian)
 
-    @property
-    def byte_size(self) -> int:
-        """Size: 2 bytes."""
-        return 2
 
-    @property
-    def signed(self) -> bool:
-        """Signed type."""
-        return True
+class Sint16Extractor(_StructExtractor):
+    """Extract/pack signed 16-bit integers (-32768 to 32767)."""
 
-    def extract(self, data: bytes | bytearray, offset: int = 0) -> int:
-        """Extract sint16 from bytes."""
-        return DataParser.parse_int16(data, offset, signed=True, endian=self._endian)
+    __slots__ = ()
 
-    def pack(self, raw: int) -> bytearray:
-        """Pack sint16 to bytes."""
-        return DataParser.encode_int16(raw, signed=True, endian=self._endian)
+    def __init__(self, endian: Literal["little", "big"] = "little") -> None:
+        """Initialize with endianness.
+
+        Args:
+            endian: Byte order, defaults to little-endian per BLE spec.
+        """
+        super().__init__("sint16", "h", signed=True, endian=endian)
 
 
-class Uint24Extractor(RawExtractor):
+class Uint24Extractor(_Int24Extractor):
     """Extract/pack unsigned 24-bit integers (0 to 16777215)."""
 
-    __slots__ = ("_endian",)
+    __slots__ = ()
 
     def __init__(self, endian: Literal["little", "big"] = "little") -> None:
         """Initialize with endianness.
@@ -196,31 +242,13 @@ class Uint24Extractor(RawExtractor):
         Args:
             endian: Byte order, defaults to little-endian per BLE spec.
         """
-        self._endian: Literal["little", "big"] = endian
-
-    @property
-    def byte_size(self) -> int:
-        """Size: 3 bytes."""
-        return 3
+        super().__init__("uint24", 3, signed=False, endian=endian)
 
-    @property
-    def signed(self) -> bool:
-        """Unsigned type."""
-        return False
 
-    def extract(self, data: bytes | bytearray, offset: int = 0) -> int:
-        """Extract uint24 from bytes."""
-        return DataParser.parse_int24(data, offset, signed=False, endian=self._endian)
-
-    def pack(self, raw: int) -> bytearray:
-        """Pack uint24 to bytes."""
-        return DataParser.encode_int24(raw, signed=False, endian=self._endian)
-
-
-class Sint24Extractor(RawExtractor):
+class Sint24Extractor(_Int24Extractor):
     """Extract/pack signed 24-bit integers (-8388608 to 8388607)."""
 
-    __slots__ = ("_endian",)
+    __slots__ = ()
 
     def __init__(self, endian: Literal["little", "big"] = "little") -> None:
         """Initialize with endianness.
@@ -228,31 +256,13 @@ class Sint24Extractor(RawExtractor):
         Args:
             endian: Byte order, defaults to little-endian per BLE spec.
         """
-        self._endian: Literal["little", "big"] = endian
-
-    @property
-    def byte_size(self) -> int:
-        """Size: 3 bytes."""
-        return 3
-
-    @property
-    def signed(self) -> bool:
-        """Signed type."""
-        return True
-
-    def extract(self, data: bytes | bytearray, offset: int = 0) -> int:
-        """Extract sint24 from bytes."""
-        return DataParser.parse_int24(data, offset, signed=True, endian=self._endian)
-
-    def pack(self, raw: int) -> bytearray:
-        """Pack sint24 to bytes."""
-        return DataParser.encode_int24(raw, signed=True, endian=self._endian)
+        super().__init__("sint24", 3, signed=True, endian=endian)
 
 
-class Uint32Extractor(RawExtractor):
+class Uint32Extractor(_StructExtractor):
     """Extract/pack unsigned 32-bit integers (0 to 4294967295)."""
 
-    __slots__ = ("_endian",)
+    __slots__ = ()
 
     def __init__(self, endian: Literal["little", "big"] = "little") -> None:
         """Initialize with endianness.
@@ -260,31 +270,13 @@ class Uint32Extractor(RawExtractor):
         Args:
             endian: Byte order, defaults to little-endian per BLE spec.
         """
-        self._endian: Literal["little", "big"] = endian
-
-    @property
-    def byte_size(self) -> int:
-        """Size: 4 bytes."""
-        return 4
-
-    @property
-    def signed(self) -> bool:
-        """Unsigned type."""
-        return False
+        super().__init__("uint32", "I", signed=False, endian=endian)
 
-    def extract(self, data: bytes | bytearray, offset: int = 0) -> int:
-        """Extract uint32 from bytes."""
-        return DataParser.parse_int32(data, offset, signed=False, endian=self._endian)
 
-    def pack(self, raw: int) -> bytearray:
-        """Pack uint32 to bytes."""
-        return DataParser.encode_int32(raw, signed=False, endian=self._endian)
-
-
-class Sint32Extractor(RawExtractor):
+class Sint32Extractor(_StructExtractor):
     """Extract/pack signed 32-bit integers (-2147483648 to 2147483647)."""
 
-    __slots__ = ("_endian",)
+    __slots__ = ()
 
     def __init__(self, endian: Literal["little", "big"] = "little") -> None:
         """Initialize with endianness.
@@ -292,31 +284,13 @@ class Sint32Extractor(RawExtractor):
         Args:
             endian: Byte order, defaults to little-endian per BLE spec.
         """
-        self._endian: Literal["little", "big"] = endian
-
-    @property
-    def byte_size(self) -> int:
-        """Size: 4 bytes."""
-        return 4
+        super().__init__("sint32", "i", signed=True, endian=endian)
 
-    @property
-    def signed(self) -> bool:
-        """Signed type."""
-        return True
 
-    def extract(self, data: bytes | bytearray, offset: int = 0) -> int:
-        """Extract sint32 from bytes."""
-        return DataParser.parse_int32(data, offset, signed=True, endian=self._endian)
-
-    def pack(self, raw: int) -> bytearray:
-        """Pack sint32 to bytes."""
-        return DataParser.encode_int32(raw, signed=True, endian=self._endian)
-
-
-class Uint48Extractor(RawExtractor):
+class Uint48Extractor(_WideExtractor):
     """Extract/pack unsigned 48-bit integers (0 to 281474976710655)."""
 
-    __slots__ = ("_endian",)
+    __slots__ = ("_unpack_from",)
 
     def __init__(self, endian: Literal["little", "big"] = "little") -> None:
         """Initialize with endianness.
@@ -324,28 +298,20 @@ class Uint48Extractor(RawExtractor):
         Args:
             endian: Byte order, defaults to little-endian per BLE spec.
         """
-        self._endian: Literal["little", "big"] = endian
+        super().__init__("uint48", 6, signed=False, endian=endian)
+        self._unpack_from = (_UINT48_LE if endian == "little" else _UINT48_BE).unpack_from
 
-    @property
-    def byte_size(self) -> int:
-        """Size: 6 bytes."""
-        return 6
-
-    @property
-    def signed(self) -> bool:
-        """Unsigned type."""
-        return False
-
-    def extract(self, data: bytes | bytearray, offset: int = 0) -> int:
+    def extract(self, data: bytes | bytearray | memoryview, offset: int = 0) -> int:
         """Extract uint48 from bytes."""
-        return DataParser.parse_int48(data, offset, signed=False, endian=self._endian)
+        try:
+            first, second = self._unpack_from(data, offset)
+        except struct.error:
+            raise self._insufficient(data, offset) from None
+        value: int = first | second << 32 if self._endian == "little" else first << 32 | second
+        return value
 
-    def pack(self, raw: int) -> bytearray:
-        """Pack uint48 to bytes."""
-        return DataParser.encode_int48(raw, signed=False, endian=self._endian)
 
-
-class Float32Extractor(RawExtractor):
+class Float32Extractor(_StructExtractor):
     """Extract/pack IEEE-754 32-bit floats.
 
     Unlike integer extractors, this returns the raw bits as an integer
@@ -355,36 +321,21 @@ class Float32Extractor(RawExtractor):
 
     __slots__ = ()
 
-    @property
-    def byte_size(self) -> int:
-        """Size: 4 bytes."""
-        return 4
-
-    @property
-    def signed(self) -> bool:
-        """Floats are inherently signed."""
-        return True
-
-    def extract(self, data: bytes | bytearray, offset: int = 0) -> int:
-        """Extract float32 as raw bits for special value checking.
-
-        Returns the raw 32-bit integer representation of the float,
-        which allows special value detection (NaN patterns, etc.).
-        """
-        raw_bytes = data[offset : offset + 4]
-        return int.from_bytes(raw_bytes, byteorder="little", signed=False)
-
-    def pack(self, raw: int) -> bytearray:
-        """Pack raw bits to float32 bytes."""
-        return bytearray(raw.to_bytes(4, byteorder="little", signed=False))
+    def __init__(self) -> None:
+        """Initialize the extractor (raw bits are read as a little-endian uint32)."""
+        super().__init__("float32", "I", signed=True, endian=None)
 
-    def extract_float(self, data: bytes | bytearray, offset: int = 0) -> float:
+    def extract_float(self, data: bytes | bytearray | memoryview, offset: int = 0) -> float:
         """Extract as actual float value (convenience method)."""
-        return DataParser.parse_float32(bytearray(data), offset)
+        try:
+            value: float = _FLOAT32.unpack_from(data, offset)[0]
+        except struct.error:
+            raise InsufficientDataError("float32", bytes(data[offset:]), 4) from None
+        return value
 
     def pack_float(self, value: float) -> bytearray:
         """Pack float value to bytes (convenience method)."""
-        return DataParser.encode_float32(value)
+        return bytearray(_FLOAT32.pack(value))
 
 
 # Singleton instances for common extractors (immutable, thread-safe)
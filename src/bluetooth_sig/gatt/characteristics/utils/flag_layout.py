@@ -0,0 +1,284 @@
+"""Declarative flag-gated field layouts with precompiled decoders.
+
+Many measurement characteristics (Fitness Machine data, Heart Rate
+Measurement, Cycling Power Measurement) start with a flags field whose bits
+gate a fixed sequence of optional fields. Decoding them field by field
+re-evaluates every flag and bounds check on every packet, although a device
+almost always streams the same few flag combinations.
+
+A :class:`FlagLayout` describes the wire layout once. For each distinct
+flags value it compiles a single little-endian :class:`struct.Struct` plus a
+scaling plan, caches it, and decodes a whole packet with one
+``unpack_from`` call.
+
+Packets shorter than the compiled size return ``None`` from
+:meth:`FlagLayout.decode` so the caller can fall back to its lenient
+field-by-field decoder, which keeps the existing truncation semantics.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Any, Literal
+
+import msgspec
+
+FieldKind = Literal["uint8", "sint8", "uint16", "sint16", "uint24", "sint24", "uint32", "sint32"]
+
+# Struct codes per kind; 24-bit kinds are read as a uint16 low word plus a high byte.
+_KIND_CODES: dict[str, str] = {
+    "uint8": "B",
+    "sint8": "b",
+    "uint16": "H",
+    "sint16": "h",
+    "uint24": "HB",
+    "sint24": "Hb",
+    "uint32": "I",
+    "sint32": "i",
+}
+
+_FLAGS_SIZES: dict[str, int] = {"uint8": 1, "uint16": 2, "uint24": 3}
+
+# Upper bound on cached flag combinations per layout (devices stream only a few).
+MAX_COMPILED_LAYOUTS = 1024
+
+
+class LayoutField(msgspec.Struct, frozen=True):
+    """One wire field inside a :class:`FlagGroup`.
+
+    Attributes:
+        name: Output key the decoded value is stored under
+        kind: Wire encoding (little-endian integer)
+        divisor: Decoded value is ``raw / divisor`` when set
+        multiplier: Decoded value is ``raw * multiplier`` when set
+
+    """
+
+    name: str
+    kind: FieldKind
+    divisor: float | None = None
+    multiplier: float | None = None
+
+
+class FlagGroup(msgspec.Struct, frozen=True):
+    """Fields that are present or absent together, gated by flag bits.
+
+    Attributes:
+        fields: Wire fields in order
+        mask: Flag bits gating the group (``0`` = always present)
+        inverted: Present when the masked bits are clear instead of set
+
+    """
+
+    fields: tuple[LayoutField, ...]
+    mask: int = 0
+    inverted: bool = False
+
+    def present(self, flags: int) -> bool:
+        """Whether the group is present for *flags*."""
+        if not self.mask:
+            return True
+        return not flags & self.mask if self.inverted else bool(flags & self.mask)
+
+
+class CompiledLayout:
+    """Decoder for one flags value of a :class:`FlagLayout`.
+
+    Attributes:
+        struct: Struct covering every present field (flags excluded)
+        size: Total packet size including the flags field
+
+    """
+
+    __slots__ = ("_divided", "_multiplied", "_plain", "_tail", "_wide", "size", "struct")
+
+    def __init__(self, layout: FlagLayout, flags: int) -> None:
+        """Compile the plan for *flags*.
+
+        Args:
+            layout: Owning layout
+            flags: Flags value to compile for
+
+        """
+        codes: list[str] = []
+        plain: list[tuple[str, int]] = []
+        divided: list[tuple[str, int, float]] = []
+        multiplied: list[tuple[str, int, float]] = []
+        wide: list[tuple[str, int, float | None, float | None]] = []
+        for group in layout.groups:
+            if not group.present(flags):
+                continue
+            for field in group.fields:
+                index = len(codes)
+                kind_codes = _KIND_CODES[field.kind]
+                codes.extend(kind_codes)
+                if len(kind_codes) == 2:  # noqa: PLR2004  # 24-bit: low word + high byte
+                    wide.append((field.name, index, field.divisor, field.multiplier))
+                elif field.divisor is not None:
+                    divided.append((field.name, index, field.divisor))
+                elif field.multiplier is not None:
+                    multiplied.append((field.name, index, field.multiplier))
+                else:
+                    plain.append((field.name, index))
+
+        self.struct = struct.Struct("<" + "".join(codes))
+        self.size = layout.flags_size + self.struct.size
+        self._plain = tuple(plain)
+        self._divided = tuple(divided)
+        self._multiplied = tuple(multiplied)
+        self._wide = tuple(wide)
+        tail = layout.tail
+        self._tail = tail if tail is not None and tail.present(flags) else None
+
+    def decode(self, data: bytes | bytearray, values: dict[str, Any], offset: int) -> None:
+        """Unpack *data* into *values* (caller guarantees ``len(data) >= size``).
+
+        Args:
+            data: Raw packet
+            values: Output mapping pre-filled with ``None``
+            offset: Offset of the first field after the flags
+
+        """
+        raw = self.struct.unpack_from(data, offset)
+        for name, index in self._plain:
+            values[name] = raw[index]
+        for name, index, divisor in self._divided:
+            values[name] = raw[index] / divisor
+        for name, index, multiplier in self._multiplied:
+            values[name] = raw[index] * multiplier
+        for name, index, divisor, multiplier in self._wide:
+            wide_value = raw[index] | (raw[index + 1] << 16)
+            if divisor is not None:
+                values[name] = wide_value / divisor
+            elif multiplier is not None:
+                values[name] = wide_value * multiplier
+            else:
+                values[name] = wide_value
+        if self._tail is not None:
+            values[self._tail.fields[0].name] = _decode_tail(self._tail.fields[0], data, self.size)
+
+
+_TAIL_STRUCTS: dict[tuple[str, int], struct.Struct] = {}
+
+
+def _decode_tail(field: LayoutField, data: bytes | bytearray, offset: int) -> tuple[Any, ...]:
+    """Decode a field repeated until the end of *data*."""
+    code = _KIND_CODES[field.kind]
+    item_size = struct.calcsize("<" + code)
+    count = (len(data) - offset) // item_size
+    key = (code, count)
+    tail_struct = _TAIL_STRUCTS.get(key)
+    if tail_struct is None:
+        tail_struct = struct.Struct(f"<{count}{code}")
+        if len(_TAIL_STRUCTS) < MAX_COMPILED_LAYOUTS:
+            _TAIL_STRUCTS[key] = tail_struct
+    raw = tail_struct.unpack_from(data, offset)
+    if field.divisor is not None:
+        divisor = field.divisor
+        return tuple(value / divisor for value in raw)
+    if field.multiplier is not None:
+        multiplier = field.multiplier
+        return tuple(value * multiplier for value in raw)
+    return raw
+
+
+class FlagLayout:
+    """Flag-gated wire layout with a per-flags compiled decoder cache.
+
+    Example::
+        >>> layout = FlagLayout(
+        ...     "uint16",
+        ...     (
+        ...         FlagGroup((LayoutField("speed", "uint16", divisor=100.0),), mask=0x0001, inverted=True),
+        ...         FlagGroup((LayoutField("distance", "uint24"),), mask=0x0004),
+        ...     ),
+        ... )
+        >>> layout.decode(bytearray([0x05, 0x00, 0x10, 0x27, 0x00]))
+        {'flags': 5, 'speed': None, 'distance': 10000}
+
+    """
+
+    __slots__ = ("_compiled", "_relevant_mask", "_template", "flags_kind", "flags_size", "groups", "tail")
+
+    def __init__(self, flags_kind: FieldKind, groups: tuple[FlagGroup, ...], *, tail: FlagGroup | None = None) -> None:
+        """Initialise the layout.
+
+        Args:
+            flags_kind: Encoding of the leading flags field (8, 16 or 24 bit unsigned)
+            groups: Flag-gated field groups in wire order
+            tail: Optional single-field group repeated until the end of the packet
+
+        Raises:
+            ValueError: If *flags_kind* is unsupported or *tail* has more than one field
+
+        """
+        if flags_kind not in _FLAGS_SIZES:
+            raise ValueError(f"Unsupported flags kind: {flags_kind!r}")
+        if tail is not None and len(tail.fields) != 1:
+            raise ValueError("Tail group must contain exactly one field")
+        self.flags_kind = flags_kind
+        self.flags_size = _FLAGS_SIZES[flags_kind]
+        self.groups = groups
+        self.tail = tail
+        all_groups = (*groups, tail) if tail is not None else groups
+        relevant_mask = 0
+        for group in all_groups:
+            relevant_mask |= int(group.mask)
+        self._relevant_mask = relevant_mask
+        self._template: dict[str, Any] = dict.fromkeys(("flags", *(f.name for g in all_groups for f in g.fields)))
+        self._compiled: dict[int, CompiledLayout] = {}
+
+    @property
+    def field_names(self) -> tuple[str, ...]:
+        """Output keys in declaration order (``"flags"`` first)."""
+        return tuple(self._template)
+
+    def compile(self, flags: int) -> CompiledLayout:
+        """Return the (cached) compiled decoder for *flags*.
+
+        Args:
+            flags: Flags value; bits no group refers to are ignored
+
+        Returns:
+            Compiled decoder
+
+        """
+        key = flags & self._relevant_mask
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = CompiledLayout(self, key)
+            if len(self._compiled) < MAX_COMPILED_LAYOUTS:
+                self._compiled[key] = compiled
+        return compiled
+
+    def decode(self, data: bytes | bytearray) -> dict[str, Any] | None:
+        """Decode a complete packet in one ``struct`` call.
+
+        Args:
+            data: Raw packet starting with the flags field
+
+        Returns:
+            Mapping of ``"flags"`` and every declared field (absent fields are
+            ``None``, tail fields a tuple), or ``None`` when *data* is shorter
+            than the flags imply and the caller should use its lenient decoder
+
+        """
+        flags_size = self.flags_size
+        if len(data) < flags_size:
+            return None
+        flags = int.from_bytes(data[:flags_size], "little")
+        compiled = self._compiled.get(flags & self._relevant_mask) or self.compile(flags)
+        if len(data) < compiled.size:
+            return None
+        values = self._template.copy()
+        values["flags"] = flags
+        compiled.decode(data, values, flags_size)
+        return values
+
+    def cache_size(self) -> int:
+        """Number of compiled flag combinations currently cached."""
+        return len(self._compiled)
+
+    def clear_cache(self) -> None:
+        """Drop all compiled decoders."""
+        self._compiled.clear()
@@ -1,14 +1,73 @@
-"""IEEE 11073 medical device format support utilities."""
+"""IEEE 11073 medical device format support utilities.
+
+SFLOAT values decode through precomputed exponent scales, or through an
+optional 65,536-entry table enabled with
+:meth:`IEEE11073Parser.enable_sfloat_table`. Arrays of packed SFLOAT/FLOAT32
+values can be decoded in one vectorized call when NumPy is installed.
+"""
 
 from __future__ import annotations
 
 import math
 import struct
+from array import array
 from datetime import MAXYEAR, datetime
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from ...exceptions import InsufficientDataError, ValueRangeError
 from .bit_field_utils import BitFieldUtils
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+# SFLOAT reserved values: NaN, NRes, +INFINITY, -INFINITY
+_SFLOAT_SPECIAL_VALUES: dict[int, float] = {
+    0x07FF: math.nan,
+    0x0800: math.nan,
+    0x07FE: math.inf,
+    0x0802: -math.inf,
+}
+# ``10.0 ** exponent`` per stored (biased) 4-bit SFLOAT exponent field
+_SFLOAT_SCALES = tuple(10.0 ** (field - 8) for field in range(16))
+_SFLOAT_VALUE_COUNT = 0x10000
+
+# FLOAT32 exponents above this have no exact double power of ten
+_FLOAT32_EXACT_EXPONENT_MAX = 22
+
+# NumPy lookup arrays, built on first vectorized decode
+_numpy_tables: dict[str, Any] = {}
+
+
+def _decode_sfloat_bits(raw_value: int) -> float:
+    """Decode raw 16-bit SFLOAT bits arithmetically."""
+    special = _SFLOAT_SPECIAL_VALUES.get(raw_value)
+    if special is not None:
+        return special
+    mantissa = raw_value & 0x0FFF
+    if mantissa >= 0x0800:  # noqa: PLR2004  # Mantissa sign bit
+        mantissa -= 0x1000
+    return float(mantissa * _SFLOAT_SCALES[raw_value >> 12])
+
+
+def _require_numpy(feature: str) -> ModuleType:
+    try:
+        import numpy  # noqa: PLC0415  # Optional dependency
+    except ImportError as e:
+        raise ImportError(f"{feature} requires numpy: pip install numpy") from e
+    return numpy
+
+
+def _packed_count(data: bytes | bytearray | memoryview, offset: int, count: int | None, item_size: int) -> int:
+    """Validate and return the number of packed values to decode."""
+    available = (len(data) - offset) // item_size if len(data) > offset else 0
+    if count is None:
+        return available
+    if count > available:
+        raise InsufficientDataError("IEEE 11073 array", bytes(data[offset:]), count * item_size)
+    return count
+
 
 class IEEE11073Parser:
     """Utility class for IEEE-11073 medical device format support."""
@@ -76,6 +135,45 @@ class IEEE11073Parser:
     # Common constants
     TIMESTAMP_LENGTH = 7
 
+    # Optional precomputed value of every SFLOAT bit pattern (see enable_sfloat_table)
+    _sfloat_table: ClassVar[array[float] | None] = None
+
+    @staticmethod
+    def enable_sfloat_table() -> None:
+        """Precompute all 65,536 SFLOAT values for O(1) scalar decoding.
+
+        The table holds one double per bit pattern (512 KiB), including the
+        NaN/NRes/±INFINITY reserved values. Idempotent.
+        """
+        if IEEE11073Parser._sfloat_table is None:
+            IEEE11073Parser._sfloat_table = array("d", map(_decode_sfloat_bits, range(_SFLOAT_VALUE_COUNT)))
+
+    @staticmethod
+    def disable_sfloat_table() -> None:
+        """Drop the SFLOAT table and decode arithmetically again."""
+        IEEE11073Parser._sfloat_table = None
+
+    @staticmethod
+    def sfloat_table_enabled() -> bool:
+        """Whether scalar SFLOAT decoding uses the precomputed table."""
+        return IEEE11073Parser._sfloat_table is not None
+
+    @staticmethod
+    def decode_sfloat(raw_value: int) -> float:
+        """Decode raw 16-bit SFLOAT bits (``0`` to ``0xFFFF``).
+
+        Args:
+            raw_value: Unsigned 16-bit SFLOAT bit pattern
+
+        Returns:
+            Decoded value, or NaN/±inf for reserved values
+
+        """
+        table = IEEE11073Parser._sfloat_table
+        if table is not None:
+            return table[raw_value]
+        return _decode_sfloat_bits(raw_value)
+
     @staticmethod
     def parse_sfloat(data: bytes | bytearray, offset: int = 0) -> float:
         """Parse IEEE 11073 16-bit SFLOAT.
@@ -87,31 +185,42 @@ class IEEE11073Parser:
         """
         if len(data) < offset + 2:
             raise InsufficientDataError("IEEE 11073 SFLOAT", data[offset:], 2)
-        raw_value = int.from_bytes(data[offset : offset + 2], byteorder="little")
+        raw_value = data[offset] | data[offset + 1] << 8
+        table = IEEE11073Parser._sfloat_table
+        if table is not None:
+            return table[raw_value]
+        return _decode_sfloat_bits(raw_value)
 
-        # Handle special values
-        if raw_value == IEEE11073Parser.SFLOAT_NAN:
-            return float("nan")  # NaN
-        if raw_value == IEEE11073Parser.SFLOAT_NRES:
-            return float("nan")  # NRes (Not a valid result)
-        if raw_value == IEEE11073Parser.SFLOAT_POSITIVE_INFINITY:
-            return float("inf")  # +INFINITY
-        if raw_value == IEEE11073Parser.SFLOAT_NEGATIVE_INFINITY:
-            return float("-inf")  # -INFINITY
+    @staticmethod
+    def parse_sfloat_array(
+        data: bytes | bytearray | memoryview, offset: int = 0, count: int | None = None
+    ) -> NDArray[np.float64]:
+        """Decode packed little-endian SFLOAT values in one vectorized lookup.
 
-        # Extract mantissa and exponent
-        mantissa = BitFieldUtils.extract_bits(raw_value, IEEE11073Parser.SFLOAT_MANTISSA_MASK)
-        if mantissa >= IEEE11073Parser.SFLOAT_MANTISSA_SIGN_BIT:  # Negative mantissa
-            mantissa = mantissa - IEEE11073Parser.SFLOAT_MANTISSA_CONVERSION
+        Requires NumPy. Results are identical to :meth:`parse_sfloat` per value.
 
-        exponent = BitFieldUtils.extract_bit_field_from_mask(
-            raw_value,
-            IEEE11073Parser.SFLOAT_EXPONENT_MASK,
-            IEEE11073Parser.SFLOAT_EXPONENT_START_BIT,
-        )
-        exponent = exponent - IEEE11073Parser.SFLOAT_EXPONENT_BIAS
+        Args:
+            data: Buffer of consecutive 2-byte SFLOAT values
+            offset: Offset of the first value
+            count: Number of values (default: every complete value after *offset*)
 
-        return float(mantissa * (10.0**exponent))
+        Returns:
+            ``float64`` array of decoded values
+
+        Raises:
+            ImportError: If NumPy is not installed
+            InsufficientDataError: If *data* holds fewer than *count* values
+
+        """
+        numpy = _require_numpy("parse_sfloat_array")
+        count = _packed_count(data, offset, count, 2)
+        table = _numpy_tables.get("sfloat")
+        if table is None:
+            source = IEEE11073Parser._sfloat_table or array("d", map(_decode_sfloat_bits, range(_SFLOAT_VALUE_COUNT)))
+            table = _numpy_tables["sfloat"] = numpy.frombuffer(source, dtype=numpy.float64).copy()
+        raw = numpy.frombuffer(data, dtype="<u2", count=count, offset=offset)
+        result: NDArray[np.float64] = table[raw]
+        return result
 
     @staticmethod
     def parse_float32(data: bytes | bytearray, offset: int = 0) -> float:
@@ -145,6 +254,54 @@ class IEEE11073Parser:
 
         return float(mantissa * (10**exponent))
 
+    @staticmethod
+    def parse_float32_array(
+        data: bytes | bytearray | memoryview, offset: int = 0, count: int | None = None
+    ) -> NDArray[np.float64]:
+        """Decode packed little-endian IEEE 11073 FLOAT32 values vectorized.
+
+        Requires NumPy. Results are identical to :meth:`parse_float32` per
+        value; the rare exponents above 22 (no exact double power of ten)
+        are decoded individually to keep that guarantee.
+
+        Args:
+            data: Buffer of consecutive 4-byte FLOAT values
+            offset: Offset of the first value
+            count: Number of values (default: every complete value after *offset*)
+
+        Returns:
+            ``float64`` array of decoded values
+
+        Raises:
+            ImportError: If NumPy is not installed
+            InsufficientDataError: If *data* holds fewer than *count* values
+
+        """
+        numpy = _require_numpy("parse_float32_array")
+        count = _packed_count(data, offset, count, 4)
+        scales = _numpy_tables.get("float32_scales")
+        if scales is None:
+            bias = IEEE11073Parser.FLOAT32_EXPONENT_BIAS
+            scales = _numpy_tables["float32_scales"] = numpy.array(
+                [float(10 ** (field - bias)) for field in range(IEEE11073Parser.FLOAT32_EXPONENT_CONVERSION)],
+                dtype=numpy.float64,
+            )
+        raw = numpy.frombuffer(data, dtype="<u4", count=count, offset=offset)
+        mantissa = (raw & IEEE11073Parser.FLOAT32_MANTISSA_MASK).astype(numpy.int64)
+        mantissa -= (mantissa & IEEE11073Parser.FLOAT32_MANTISSA_SIGN_BIT) << 1
+        field = raw >> IEEE11073Parser.FLOAT32_EXPONENT_START_BIT
+        result: NDArray[np.float64] = mantissa * scales[field]
+
+        inexact = numpy.flatnonzero(field > IEEE11073Parser.FLOAT32_EXPONENT_BIAS + _FLOAT32_EXACT_EXPONENT_MAX)
+        for index in inexact.tolist():
+            exponent = int(field[index]) - IEEE11073Parser.FLOAT32_EXPONENT_BIAS
+            result[index] = float(int(mantissa[index]) * 10**exponent)
+
+        result[(raw == IEEE11073Parser.FLOAT32_NAN) | (raw == IEEE11073Parser.FLOAT32_NRES)] = math.nan
+        result[raw == IEEE11073Parser.FLOAT32_POSITIVE_INFINITY] = math.inf
+        result[raw == IEEE11073Parser.FLOAT32_NEGATIVE_INFINITY] = -math.inf
+        return result
+
     @staticmethod
     def encode_sfloat(value: float) -> bytearray:
         """Encode float to IEEE 11073 16-bit SFLOAT."""
@@ -194,8 +194,7 @@ class SfloatTranslator(ValueTranslator[float]):
         Returns:
             Decoded float value, or NaN/Inf for special values.
         """
-        raw_bytes = raw.to_bytes(2, byteorder="little", signed=False)
-        return IEEE11073Parser.parse_sfloat(raw_bytes, offset=0)
+        return IEEE11073Parser.decode_sfloat(raw)
 
     def untranslate(self, value: float) -> int:
         """Encode float to SFLOAT raw bits.
@@ -21,5 +21,6 @@ class VoiceAssistantSupportedFeaturesCharacteristic(BaseCharacteristic[VoiceAssi
     org.bluetooth.characteristic.voice_assistant_supported_features
     """
 
+    _is_static = True
     expected_length = SIZE_UINT8
     _template = FlagTemplate.uint8(VoiceAssistantSupportedFeatures)
@@ -102,6 +102,7 @@ class WeightScaleFeatureCharacteristic(BaseCharacteristic[WeightScaleFeatureData
     capabilities.
     """
 
+    _is_static = True
     _characteristic_name: str = "Weight Scale Feature"
 
     expected_length: int = 4
@@ -0,0 +1,315 @@
+"""Reusable service trees for repeated discovery of identical GATT databases.
+
+Resolving a discovered database into service and characteristic classes
+means a registry lookup per attribute, and UUIDs no class claims fall through
+to a scan of every service class. A gateway that reconnects to many devices
+of the same model repeats that work for an identical tree each time.
+
+:class:`ServiceTreePrototype` records the resolved classes for one database,
+and :class:`ServiceDiscoveryCache` keeps prototypes keyed by the database's
+identity: the value of the Database Hash characteristic (0x2B2A) when the
+caller has read it, or :func:`layout_hash` of the discovered service and
+characteristic UUIDs. On a hit, :meth:`ServiceTreePrototype.instantiate`
+builds fresh service and characteristic instances without any lookups.
+
+The cache is shared by every producer, and prototypes record the
+characteristic information their producer had: a layout known only by UUIDs
+yields unnamed characteristics. Each producer therefore prefixes its keys
+with its own namespace, so one never reuses another's prototype for the
+same database.
+
+Prototypes remember the registry generations they were resolved against, so
+registering or removing a custom class invalidates them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+import msgspec
+
+from ..types import CharacteristicInfo
+from ..types.gatt_services import ServiceDiscoveryData
+from ..types.uuid import BluetoothUUID
+from .characteristics.base import BaseCharacteristic
+from .characteristics.registry import CharacteristicRegistry
+from .characteristics.unknown import UnknownCharacteristic
+from .services.base import BaseGattService
+from .services.registry import GattServiceRegistry
+
+DATABASE_HASH_UUID = BluetoothUUID("2B2A")
+
+_LAYOUT_DIGEST_SIZE = 16
+
+
+def layout_hash(services: Iterable[tuple[BluetoothUUID | str, Iterable[BluetoothUUID | str]]]) -> bytes:
+    """Return a key identifying a discovered GATT layout.
+
+    Use this when the Database Hash characteristic is not available. The
+    connection manager interface exposes no attribute handles, so the key
+    covers the ordered service and characteristic UUIDs.
+
+    Args:
+        services: ``(service_uuid, characteristic_uuids)`` pairs in discovery order
+
+    Returns:
+        A 16-byte digest
+
+    """
+    digest = hashlib.blake2b(digest_size=_LAYOUT_DIGEST_SIZE)
+    for service_uuid, characteristic_uuids in services:
+        digest.update(b"S" + str(service_uuid).upper().encode())
+        for characteristic_uuid in characteristic_uuids:
+            digest.update(b"C" + str(characteristic_uuid).upper().encode())
+    return digest.digest()
+
+
+def _registry_generation() -> tuple[int, int]:
+    """Return the current service and characteristic registry generations."""
+    return GattServiceRegistry.get_instance().generation, CharacteristicRegistry.get_instance().generation
+
+
+class CharacteristicPrototype(msgspec.Struct, kw_only=True, frozen=True):
+    """Resolved characteristic of a prototype service.
+
+    Attributes:
+        uuid: Characteristic UUID
+        char_class: Registered class, or None for an unknown characteristic
+        info: Discovery information, used to build unknown characteristics
+
+    """
+
+    uuid: BluetoothUUID
+    char_class: type[BaseCharacteristic[Any]] | None
+    info: CharacteristicInfo
+
+    def instantiate(self) -> BaseCharacteristic[Any]:
+        """Create a new characteristic instance."""
+        if self.char_class is not None:
+            return self.char_class()
+        return UnknownCharacteristic(info=self.info)
+
+
+class ServicePrototype(msgspec.Struct, kw_only=True, frozen=True):
+    """Resolved service of a prototype tree.
+
+    Attributes:
+        uuid: Service UUID
+        service_class: Registered class, or None for an unknown service
+        characteristics: The service's characteristics in discovery order
+
+    """
+
+    uuid: BluetoothUUID
+    service_class: type[BaseGattService] | None
+    characteristics: tuple[CharacteristicPrototype, ...]
+
+    @classmethod
+    def resolve(cls, uuid: BluetoothUUID, characteristics: ServiceDiscoveryData) -> ServicePrototype:
+        """Resolve the classes for one discovered service.
+
+        Args:
+            uuid: Service UUID
+            characteristics: Discovered characteristics by UUID
+
+        Returns:
+            The resolved prototype
+
+        """
+        return cls(
+            uuid=uuid,
+            service_class=GattServiceRegistry.get_service_class(uuid),
+            characteristics=tuple(
+                CharacteristicPrototype(
+                    uuid=char_uuid,
+                    char_class=CharacteristicRegistry.get_characteristic_class_by_uuid(char_uuid),
+                    info=info,
+                )
+                for char_uuid, info in characteristics.items()
+            ),
+        )
+
+    def instantiate(self) -> BaseGattService | None:
+        """Create a new service with new characteristic instances.
+
+        Returns:
+            The service, or None if no class is registered for its UUID
+
+        """
+        service_class = self.service_class
+        if service_class is None:
+            return None
+        service = service_class()
+        if type(service).process_characteristics is not BaseGattService.process_characteristics:
+            # Custom processing must still see the discovery data
+            service.process_characteristics({char.uuid: char.info for char in self.characteristics})
+            return service
+        service.characteristics = {char.uuid: char.instantiate() for char in self.characteristics}
+        return service
+
+
+class ServiceTreePrototype(msgspec.Struct, kw_only=True, frozen=True):
+    """Resolved classes for a whole discovered GATT database.
+
+    Example::
+        >>> prototype = ServiceTreePrototype.resolve({BluetoothUUID("180F"): {battery_uuid: battery_info}})
+        >>> services = prototype.instantiate()  # Fresh instances, no registry lookups
+        >>> services["0000180F-0000-1000-8000-00805F9B34FB"].characteristics
+        {BluetoothUUID('2A19'): BatteryLevelCharacteristic(...)}
+
+    Attributes:
+        services: The services in discovery order
+        generation: Registry generations the classes were resolved against
+
+    """
+
+    services: tuple[ServicePrototype, ...]
+    generation: tuple[int, int] = msgspec.field(default_factory=_registry_generation)
+
+    @classmethod
+    def resolve(cls, discovery: dict[BluetoothUUID, ServiceDiscoveryData]) -> ServiceTreePrototype:
+        """Resolve the classes for a discovered database.
+
+        Args:
+            discovery: Discovered characteristics by service UUID
+
+        Returns:
+            The resolved prototype
+
+        """
+        return cls(
+            services=tuple(
+                ServicePrototype.resolve(uuid, characteristics) for uuid, characteristics in discovery.items()
+            )
+        )
+
+    @classmethod
+    def from_layout(cls, services: Iterable[tuple[BluetoothUUID, Iterable[BluetoothUUID]]]) -> ServiceTreePrototype:
+        """Resolve the classes for a layout known only by UUIDs.
+
+        Args:
+            services: ``(service_uuid, characteristic_uuids)`` pairs in discovery order
+
+        Returns:
+            The resolved prototype; unknown characteristics get unnamed info
+
+        """
+        return cls.resolve(
+            {
+                service_uuid: {char_uuid: CharacteristicInfo(uuid=char_uuid, name="") for char_uuid in char_uuids}
+                for service_uuid, char_uuids in services
+            }
+        )
+
+    @property
+    def is_current(self) -> bool:
+        """Whether no class has been registered or removed since resolution."""
+        return self.generation == _registry_generation()
+
+    def service_classes(self) -> dict[BluetoothUUID, type[BaseGattService] | None]:
+        """Return the resolved service class for each service UUID."""
+        return {service.uuid: service.service_class for service in self.services}
+
+    def instantiate(self) -> dict[str, BaseGattService]:
+        """Create fresh instances of every known service, keyed by UUID string."""
+        created: dict[str, BaseGattService] = {}
+        for prototype in self.services:
+            service = prototype.instantiate()
+            if service is not None:
+                created[str(prototype.uuid)] = service
+        return created
+
+
+class ServiceDiscoveryCache:
+    """Bounded LRU cache of service tree prototypes keyed by database identity.
+
+    Example::
+        >>> cache = ServiceDiscoveryCache()
+        >>> key = layout_hash([(service_uuid, characteristic_uuids)])
+        >>> prototype = cache.get(key) or cache.put(key, ServiceTreePrototype.resolve(discovery))
+
+    Attributes:
+        max_entries: Maximum number of prototypes kept
+        hits: Lookups that returned a current prototype
+        misses: Lookups that found nothing or an outdated prototype
+
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        """Initialise an empty cache.
+
+        Args:
+            max_entries: Maximum number of prototypes kept
+
+        Raises:
+            ValueError: If max_entries is not positive
+
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, ServiceTreePrototype] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> ServiceTreePrototype | None:
+        """Return the prototype stored for *key* if it is still current."""
+        with self._lock:
+            prototype = self._entries.get(key)
+            if prototype is not None and prototype.is_current:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return prototype
+            if prototype is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: bytes, prototype: ServiceTreePrototype) -> ServiceTreePrototype:
+        """Store *prototype* under *key*, evicting the least recently used entry if full.
+
+        Returns:
+            The stored prototype
+
+        """
+        with self._lock:
+            self._entries[key] = prototype
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return prototype
+
+    def clear(self) -> None:
+        """Remove all prototypes and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored prototypes."""
+        return len(self._entries)
+
+
+_default_cache = ServiceDiscoveryCache()
+
+
+def get_discovery_cache() -> ServiceDiscoveryCache:
+    """Return the process-wide discovery cache shared by translators and devices."""
+    return _default_cache
+
+
+__all__ = [
+    "DATABASE_HASH_UUID",
+    "CharacteristicPrototype",
+    "ServiceDiscoveryCache",
+    "ServicePrototype",
+    "ServiceTreePrototype",
+    "get_discovery_cache",
+    "layout_hash",
+]
@@ -420,6 +420,22 @@ class CharacteristicParseError(CharacteristicError):
         self.parse_trace = parse_trace or []
         self.validation = validation
 
+    def __reduce__(self) -> tuple[type[CharacteristicParseError], tuple[Any, ...]]:
+        """Support pickling so parse errors can cross process boundaries."""
+        return (
+            type(self),
+            (
+                self.args[0],
+                self.name,
+                self.uuid,
+                self.raw_data,
+                self.raw_int,
+                self.field_errors,
+                self.parse_trace,
+                self.validation,
+            ),
+        )
+
     def __str__(self) -> str:
         """Format error with field-level details."""
         base = f"{self.name} ({self.uuid}): {self.args[0]}"
@@ -479,6 +495,10 @@ class SpecialValueDetectedError(CharacteristicError):
         self.raw_data = raw_data
         self.raw_int = raw_int
 
+    def __reduce__(self) -> tuple[type[SpecialValueDetectedError], tuple[Any, ...]]:
+        """Support pickling so special-value errors can cross process boundaries."""
+        return (type(self), (self.special_value, self.name, self.uuid, self.raw_data, self.raw_int))
+
 
 class CharacteristicEncodeError(CharacteristicError):
     """Raised when characteristic encoding fails.
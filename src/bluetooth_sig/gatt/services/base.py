@@ -26,6 +26,9 @@ ServiceCharacteristicCollection = CharacteristicCollection  # Alias for compatib
 ServiceCharacteristics = TypeVar("ServiceCharacteristics")
 
 
+# SIG service info resolved per class; the registry search is too slow to repeat per instance
+_resolved_service_info: dict[type[BaseGattService], ServiceInfo] = {}
+
 # Internal collections are plain dicts keyed by `CharacteristicName` enums.
 # Do not perform implicit string-based lookups here; callers must convert
 # strings to `CharacteristicName` explicitly at public boundaries.
@@ -71,9 +74,12 @@ class SIGServiceResolver:
             # Protected access is necessary to maintain API consistency
             return service_class._info  # pylint: disable=protected-access
 
-        # Try registry resolution
+        # Try registry resolution, once per class
+        if cached := _resolved_service_info.get(service_class):
+            return cached
         registry_info = SIGServiceResolver.resolve_from_registry(service_class)
         if registry_info:
+            _resolved_service_info[service_class] = registry_info
             return registry_info
 
         # No resolution found
@@ -381,7 +387,7 @@ class BaseGattService:  # pylint: disable=too-many-public-methods
 
         """
         for uuid_obj, char_info in characteristics.items():
-            char_instance = CharacteristicRegistry.get_characteristic(uuid=uuid_obj.normalized)
+            char_instance = CharacteristicRegistry.get_characteristic(uuid=uuid_obj)
 
             if char_instance is None:
                 # Create UnknownCharacteristic for unregistered characteristics
@@ -13,7 +13,7 @@ from bluetooth_sig.types.registry.descriptor_types import DescriptorInfo
 from bluetooth_sig.types.registry.gss_characteristic import GssCharacteristicSpec
 from bluetooth_sig.types.uuid import BluetoothUUID
 
-from ..registry.utils import find_bluetooth_sig_path, load_yaml_uuids, normalize_uuid_string
+from ..registry.utils import compact_mapping, find_bluetooth_sig_path, load_yaml_uuids, normalize_uuid_string
 from ..types.registry import CharacteristicSpec, FieldInfo, UnitMetadata
 
 __all__ = [
@@ -89,6 +89,16 @@ class UuidRegistry:  # pylint: disable=too-many-instance-attributes
         """Public API to eagerly load UUID registry data."""
         self._ensure_loaded()
 
+    def compact(self) -> None:
+        """Repack canonical stores and alias indices into compact, key-interned dicts."""
+        with self._lock:
+            self._services = compact_mapping(self._services)
+            self._characteristics = compact_mapping(self._characteristics)
+            self._descriptors = compact_mapping(self._descriptors)
+            self._service_aliases = compact_mapping(self._service_aliases)
+            self._characteristic_aliases = compact_mapping(self._characteristic_aliases)
+            self._descriptor_aliases = compact_mapping(self._descriptor_aliases)
+
     def _store_service(self, info: ServiceInfo) -> None:
         """Store service info with canonical storage + aliases."""
         canonical_key = info.uuid.normalized
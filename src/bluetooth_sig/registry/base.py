@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any, ClassVar, Generic, TypeVar, cast
 
 from bluetooth_sig.registry.utils import (
+    compact_mapping,
     find_bluetooth_sig_path,
     load_yaml_uuids,
     normalize_uuid_string,
@@ -72,6 +73,18 @@ class RegistryMixin:
         """
         self._ensure_loaded()
 
+    def compact(self) -> None:
+        """Repack loaded lookup tables into compact, key-interned dicts.
+
+        Intended to run once after loading and before forking worker
+        processes (see :func:`~bluetooth_sig.utils.prewarm.prewarm_registries`),
+        so that registry data occupies few, densely packed pages.
+        """
+        with self._lock:
+            for attr_name, attr_value in list(vars(self).items()):
+                if isinstance(attr_value, dict):
+                    setattr(self, attr_name, compact_mapping(attr_value))
+
     @abstractmethod
     def _load(self) -> None:
         """Perform the actual loading of registry data."""
@@ -330,6 +343,15 @@ class BaseUUIDClassRegistry(RegistryMixin, ABC, Generic[E, C]):
         self._custom_classes: dict[BluetoothUUID, type[C]] = {}
         self._sig_class_cache: dict[BluetoothUUID, type[C]] | None = None
         self._enum_map_cache: dict[E, type[C]] | None = None
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever the UUID → class mapping may have changed.
+
+        Lets callers that cache lookup results detect runtime registrations.
+        """
+        return self._generation
 
     @abstractmethod
     def _get_base_class(self) -> type[C]:
@@ -441,6 +463,7 @@ class BaseUUIDClassRegistry(RegistryMixin, ABC, Generic[E, C]):
                     )
 
             self._custom_classes[bt_uuid] = cls
+            self._generation += 1
 
     def unregister_class(self, uuid: str | BluetoothUUID | int) -> None:
         """Unregister a custom class.
@@ -451,6 +474,7 @@ class BaseUUIDClassRegistry(RegistryMixin, ABC, Generic[E, C]):
         bt_uuid = uuid if isinstance(uuid, BluetoothUUID) else BluetoothUUID(uuid)
         with self._lock:
             self._custom_classes.pop(bt_uuid, None)
+            self._generation += 1
 
     def get_class_by_uuid(self, uuid: str | BluetoothUUID | int) -> type[C] | None:
         """Get the class for a given UUID.
@@ -504,6 +528,7 @@ class BaseUUIDClassRegistry(RegistryMixin, ABC, Generic[E, C]):
         """
         self._enum_map_cache = None
         self._sig_class_cache = None
+        self._generation += 1
 
     @classmethod
     def get_instance(cls: type[BC]) -> BC:
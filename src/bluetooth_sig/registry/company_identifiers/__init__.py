@@ -10,8 +10,11 @@ from .company_identifiers_registry import (
     CompanyIdentifiersRegistry,
     get_company_identifiers_registry,
 )
+from .company_table import CompanyNameTable, compile_company_table
 
 __all__ = [
     "CompanyIdentifiersRegistry",
+    "CompanyNameTable",
+    "compile_company_table",
     "get_company_identifiers_registry",
 ]
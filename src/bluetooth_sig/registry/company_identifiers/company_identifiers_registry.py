@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, cast
 
 import msgspec
 
 from bluetooth_sig.registry.base import BaseGenericRegistry
-from bluetooth_sig.registry.utils import find_bluetooth_sig_path
+from bluetooth_sig.registry.company_identifiers.company_table import COMPANY_TABLE_PATH, CompanyNameTable, yaml_digest
+from bluetooth_sig.registry.utils import find_bluetooth_sig_path, load_yaml_document
 
 
 class CompanyIdentifierInfo(msgspec.Struct, frozen=True, kw_only=True):
@@ -23,65 +23,54 @@ class CompanyIdentifiersRegistry(BaseGenericRegistry[CompanyIdentifierInfo]):
 
     This registry resolves manufacturer company IDs to company names from
     the official Bluetooth SIG assigned numbers. Data is lazily loaded on
-    first access for performance.
+    first access, from the precompiled :class:`CompanyNameTable` when one
+    matching the YAML is available and from the YAML otherwise.
 
     Thread-safe: Multiple threads can safely access the registry concurrently.
+    Lookups need no lock once loaded since the table is immutable.
     """
 
-    def __init__(self) -> None:
-        """Initialize the company identifiers registry."""
-        super().__init__()
-        self._companies: dict[int, CompanyIdentifierInfo] = {}
-
-    def _load_company_identifiers(self, yaml_path: Path) -> None:
-        """Load company identifiers from YAML file.
+    def __init__(self, table_path: Path | None = COMPANY_TABLE_PATH) -> None:
+        """Initialize the company identifiers registry.
 
         Args:
-            yaml_path: Path to the company_identifiers.yaml file
+            table_path: Precompiled table to prefer over the YAML source
+                (``None`` to always parse the YAML)
         """
-        if not yaml_path.exists():
-            return
-
-        with yaml_path.open("r", encoding="utf-8") as file_handle:
-            data = msgspec.yaml.decode(file_handle.read())
+        super().__init__()
+        self._table_path = table_path
+        self._table = CompanyNameTable(())
 
-        if not isinstance(data, dict):
-            return
+    def _read_precompiled(self) -> CompanyNameTable | None:
+        """Read the precompiled table, or return None if absent or unreadable."""
+        if self._table_path is None:
+            return None
+        try:
+            return CompanyNameTable.decode(self._table_path.read_bytes())
+        except (OSError, ValueError):
+            return None
 
-        data_dict = cast("dict[str, Any]", data)
-        company_entries = data_dict.get("company_identifiers")
-        if not isinstance(company_entries, list):
-            return
+    def _load_table(self, yaml_path: Path | None) -> CompanyNameTable:
+        """Load the table, using the precompiled form unless it is stale.
 
-        # Load all company identifiers into cache
-        for entry in company_entries:
-            if isinstance(entry, dict):
-                company_id = entry.get("value")
-                company_name = entry.get("name")
-                if company_id is not None and company_name:
-                    self._companies[company_id] = CompanyIdentifierInfo(id=company_id, name=company_name)
+        Args:
+            yaml_path: Path to company_identifiers.yaml, if it exists
+        """
+        precompiled = self._read_precompiled()
+        if yaml_path is None:
+            return precompiled if precompiled is not None else CompanyNameTable(())
+        if precompiled is not None and precompiled.source_digest == yaml_digest(yaml_path.read_bytes()):
+            return precompiled
+        return CompanyNameTable.from_yaml_document(load_yaml_document(yaml_path))
 
     def _load(self) -> None:
         """Perform the actual loading of company identifiers data."""
         # Use find_bluetooth_sig_path and navigate to company_identifiers
         uuids_path = find_bluetooth_sig_path()
-        if not uuids_path:
-            self._loaded = True
-            return
-
-        # Navigate from uuids/ to company_identifiers/
-        base_path = uuids_path.parent / "company_identifiers"
-        if not base_path.exists():
-            self._loaded = True
-            return
-
-        yaml_path = base_path / "company_identifiers.yaml"
-        if not yaml_path.exists():
-            self._loaded = True
-            return
-
-        # Load company identifiers from YAML
-        self._load_company_identifiers(yaml_path)
+        yaml_path = (
+            uuids_path.parent / "company_identifiers" / "company_identifiers.yaml" if uuids_path is not None else None
+        )
+        self._table = self._load_table(yaml_path if yaml_path is not None and yaml_path.exists() else None)
         self._loaded = True
 
     def get_company_name(self, company_id: int) -> str | None:
@@ -105,9 +94,7 @@ class CompanyIdentifiersRegistry(BaseGenericRegistry[CompanyIdentifierInfo]):
             None
         """
         self._ensure_loaded()
-        with self._lock:
-            info = self._companies.get(company_id)
-            return info.name if info else None
+        return self._table.get(company_id)
 
 
 # Singleton instance for global use
@@ -0,0 +1,191 @@
+"""Compact company identifier name table and its precompiled form.
+
+``company_identifiers.yaml`` lists several thousand companies and is by far the
+slowest registry document to parse. :class:`CompanyNameTable` holds the same
+data as a sorted ``array('H')`` of IDs with a parallel tuple of names, and
+round-trips through a small msgpack blob. Wheels ship that blob precompiled
+next to this module (see ``hatch_build.py``); it records a digest of the YAML it
+was built from, so a stale table is ignored whenever the source is present.
+
+This module only depends on the standard library and msgspec so that the
+build hook can load it without importing the package.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import msgspec
+
+COMPANY_TABLE_FILENAME = "company_identifiers.msgpack"
+COMPANY_TABLE_PATH = Path(__file__).with_name(COMPANY_TABLE_FILENAME)
+
+_TABLE_MAGIC = b"BTSIGCT1"
+_UINT16_MAX = 0xFFFF
+
+
+class _EncodedTable(msgspec.Struct, array_like=True):
+    """On-disk layout: source digest, little-endian uint16 IDs, names."""
+
+    source_digest: str
+    ids: bytes
+    names: list[str]
+
+
+def yaml_digest(data: bytes) -> str:
+    """Return the digest a precompiled table records for its YAML source."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class CompanyNameTable:
+    """Immutable company ID → name table backed by a sorted ``array('H')``.
+
+    Example::
+        >>> table = CompanyNameTable([(0x004C, "Apple, Inc."), (0x0006, "Microsoft")])
+        >>> table.get(0x004C)
+        'Apple, Inc.'
+        >>> CompanyNameTable.decode(table.encode()).get(0x0006)
+        'Microsoft'
+
+    Attributes:
+        source_digest: Digest of the YAML document the table was built from
+            (empty if not built from a file)
+
+    """
+
+    __slots__ = ("_ids", "_names", "source_digest")
+
+    def __init__(self, entries: Iterable[tuple[int, str]], *, source_digest: str = "") -> None:
+        """Build a table from ``(company_id, name)`` pairs.
+
+        Args:
+            entries: Company entries; IDs outside uint16 are dropped and the
+                last name wins for duplicate IDs
+            source_digest: Digest of the source document, if any
+
+        """
+        ordered = sorted({cid: name for cid, name in entries if 0 <= cid <= _UINT16_MAX}.items())
+        self._ids = array("H", [cid for cid, _ in ordered])
+        self._names = tuple(name for _, name in ordered)
+        self.source_digest = source_digest
+
+    @classmethod
+    def from_yaml_document(cls, document: Any, *, source_digest: str = "") -> CompanyNameTable:  # noqa: ANN401  # YAML documents are untyped
+        """Build a table from a decoded ``company_identifiers.yaml`` document.
+
+        Args:
+            document: Decoded YAML document
+            source_digest: Digest of the YAML bytes
+
+        Returns:
+            Table with every well-formed entry (empty for unexpected layouts)
+
+        """
+        entries = document.get("company_identifiers") if isinstance(document, dict) else None
+        if not isinstance(entries, list):
+            return cls((), source_digest=source_digest)
+        return cls(
+            (
+                (entry["value"], entry["name"])
+                for entry in entries
+                if isinstance(entry, dict) and isinstance(entry.get("value"), int) and entry.get("name")
+            ),
+            source_digest=source_digest,
+        )
+
+    @classmethod
+    def from_yaml(cls, yaml_path: Path) -> CompanyNameTable:
+        """Parse ``company_identifiers.yaml`` into a table.
+
+        Args:
+            yaml_path: Path to the YAML file
+
+        Returns:
+            Table recording the digest of the file
+
+        Raises:
+            OSError: If the file cannot be read
+            msgspec.DecodeError: If the file is not valid YAML
+
+        """
+        raw = yaml_path.read_bytes()
+        return cls.from_yaml_document(msgspec.yaml.decode(raw), source_digest=yaml_digest(raw))
+
+    @classmethod
+    def decode(cls, buffer: bytes | memoryview) -> CompanyNameTable:
+        """Load a table from its precompiled form.
+
+        Args:
+            buffer: Bytes produced by :meth:`encode`
+
+        Returns:
+            The decoded table
+
+        Raises:
+            ValueError: If *buffer* is not a precompiled company table
+
+        """
+        view = memoryview(buffer)
+        header_len = len(_TABLE_MAGIC)
+        if view[:header_len] != _TABLE_MAGIC:
+            raise ValueError("Buffer is not a precompiled company identifier table")
+        try:
+            encoded = msgspec.msgpack.decode(view[header_len:], type=_EncodedTable)
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Corrupt precompiled company identifier table: {e}") from e
+        ids = array("H")
+        ids.frombytes(encoded.ids)
+        if sys.byteorder == "big":
+            ids.byteswap()
+        if len(ids) != len(encoded.names):
+            raise ValueError("Corrupt precompiled company identifier table: ID and name counts differ")
+        table = cls.__new__(cls)
+        table._ids = ids
+        table._names = tuple(encoded.names)
+        table.source_digest = encoded.source_digest
+        return table
+
+    def encode(self) -> bytes:
+        """Return the precompiled form of the table."""
+        ids = array("H", self._ids)
+        if sys.byteorder == "big":
+            ids.byteswap()
+        encoded = _EncodedTable(source_digest=self.source_digest, ids=ids.tobytes(), names=list(self._names))
+        return _TABLE_MAGIC + msgspec.msgpack.encode(encoded)
+
+    def get(self, company_id: int) -> str | None:
+        """Return the name for *company_id*, or ``None`` if it is not listed."""
+        ids = self._ids
+        index = bisect_left(ids, company_id)
+        if index < len(ids) and ids[index] == company_id:
+            return self._names[index]
+        return None
+
+    def __len__(self) -> int:
+        """Return the number of companies in the table."""
+        return len(self._ids)
+
+
+def compile_company_table(yaml_path: Path, output_path: Path = COMPANY_TABLE_PATH) -> CompanyNameTable:
+    """Write the precompiled form of ``company_identifiers.yaml``.
+
+    Args:
+        yaml_path: Source YAML file
+        output_path: Destination file
+
+    Returns:
+        The compiled table
+
+    Raises:
+        OSError: If the source cannot be read or the output cannot be written
+
+    """
+    table = CompanyNameTable.from_yaml(yaml_path)
+    output_path.write_bytes(table.encode())
+    return table
@@ -9,11 +9,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import msgspec
-
 from bluetooth_sig.gatt.constants import UINT16_MAX
 from bluetooth_sig.registry.base import BaseGenericRegistry
-from bluetooth_sig.registry.utils import find_bluetooth_sig_path
+from bluetooth_sig.registry.utils import find_bluetooth_sig_path, load_yaml_document
 from bluetooth_sig.types.registry.appearance_info import AppearanceInfo, AppearanceSubcategoryInfo
 
 
@@ -71,8 +69,7 @@ class AppearanceValuesRegistry(BaseGenericRegistry[AppearanceInfo]):
         Args:
             yaml_path: Path to the appearance_values.yaml file
         """
-        with yaml_path.open("r", encoding="utf-8") as f:
-            data = msgspec.yaml.decode(f.read())
+        data = load_yaml_document(yaml_path)
 
         if not data or not isinstance(data, dict):
             return
@@ -11,10 +11,8 @@ from enum import IntEnum, IntFlag
 from pathlib import Path
 from typing import Any
 
-import msgspec
-
 from bluetooth_sig.registry.base import BaseGenericRegistry
-from bluetooth_sig.registry.utils import find_bluetooth_sig_path
+from bluetooth_sig.registry.utils import find_bluetooth_sig_path, load_yaml_document
 from bluetooth_sig.types.registry.class_of_device import (
     ClassOfDeviceInfo,
     CodServiceClassInfo,
@@ -109,8 +107,7 @@ class ClassOfDeviceRegistry(BaseGenericRegistry[ClassOfDeviceInfo]):
             yaml_path: Path to the class_of_device.yaml file
         """
         data: dict[str, Any] = {}
-        with yaml_path.open("r", encoding="utf-8") as f:
-            data = msgspec.yaml.decode(f.read())
+        data = load_yaml_document(yaml_path)
 
         if not data:
             return
@@ -7,7 +7,7 @@ import logging
 import msgspec
 
 from bluetooth_sig.registry.base import BaseGenericRegistry
-from bluetooth_sig.registry.utils import find_bluetooth_sig_path
+from bluetooth_sig.registry.utils import find_bluetooth_sig_path, load_yaml_document
 from bluetooth_sig.types.registry.formattypes import FormatTypeInfo
 
 logger = logging.getLogger(__name__)
@@ -45,8 +45,7 @@ class FormatTypesRegistry(BaseGenericRegistry[FormatTypeInfo]):
             return
 
         try:
-            with yaml_path.open("r", encoding="utf-8") as f:
-                data = msgspec.yaml.decode(f.read())
+            data = load_yaml_document(yaml_path)
 
             if not data or "formattypes" not in data:
                 logger.warning("Invalid format types YAML format. Registry will be empty.")
@@ -14,7 +14,7 @@ import logging
 import msgspec
 
 from bluetooth_sig.registry.base import BaseGenericRegistry
-from bluetooth_sig.registry.utils import find_bluetooth_sig_path
+from bluetooth_sig.registry.utils import find_bluetooth_sig_path, load_yaml_document
 from bluetooth_sig.types.registry.namespace import NamespaceDescriptionInfo
 
 logger = logging.getLogger(__name__)
@@ -65,8 +65,7 @@ class NamespaceDescriptionRegistry(BaseGenericRegistry[NamespaceDescriptionInfo]
             return
 
         try:
-            with yaml_path.open("r", encoding="utf-8") as f:
-                data = msgspec.yaml.decode(f.read())
+            data = load_yaml_document(yaml_path)
 
             if not data or "namespace" not in data:
                 logger.warning("Invalid namespace YAML format. Registry will be empty.")
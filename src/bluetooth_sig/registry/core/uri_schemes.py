@@ -11,7 +11,7 @@ import logging
 import msgspec
 
 from bluetooth_sig.registry.base import BaseGenericRegistry
-from bluetooth_sig.registry.utils import find_bluetooth_sig_path
+from bluetooth_sig.registry.utils import find_bluetooth_sig_path, load_yaml_document
 from bluetooth_sig.types.registry.uri_schemes import UriSchemeInfo
 
 logger = logging.getLogger(__name__)
@@ -58,8 +58,7 @@ class UriSchemesRegistry(BaseGenericRegistry[UriSchemeInfo]):
             return
 
         try:
-            with yaml_path.open("r", encoding="utf-8") as f:
-                data = msgspec.yaml.decode(f.read())
+            data = load_yaml_document(yaml_path)
 
             if not data or "uri_schemes" not in data:
                 logger.warning("Invalid URI schemes YAML format. Registry will be empty.")
@@ -14,6 +14,7 @@ from typing import Any, cast
 import msgspec
 
 from bluetooth_sig.registry.base import BaseGenericRegistry
+from bluetooth_sig.registry.utils import load_yaml_document
 from bluetooth_sig.registry.uuids.units import UnitsRegistry
 from bluetooth_sig.types.gatt_enums import WIRE_TYPE_MAP
 from bluetooth_sig.types.registry.gss_characteristic import (
@@ -80,8 +81,7 @@ class GssRegistry(BaseGenericRegistry[GssCharacteristicSpec]):
     def _process_gss_file(self, yaml_file: Path) -> None:
         """Process a single GSS YAML file and store as typed GssCharacteristicSpec."""
         try:
-            with yaml_file.open("r", encoding="utf-8") as f:
-                data = msgspec.yaml.decode(f.read())
+            data = load_yaml_document(yaml_file)
 
             if not data or "characteristic" not in data:
                 return
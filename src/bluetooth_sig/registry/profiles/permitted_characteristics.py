@@ -5,10 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, cast
 
-import msgspec
-
 from bluetooth_sig.registry.base import BaseGenericRegistry
-from bluetooth_sig.registry.utils import find_bluetooth_sig_path
+from bluetooth_sig.registry.utils import find_bluetooth_sig_path, load_yaml_document
 from bluetooth_sig.types.registry.profile_types import PermittedCharacteristicEntry
 
 # Profile subdirectories that contain ``*_permitted_characteristics.yaml``.
@@ -40,8 +38,7 @@ class PermittedCharacteristicsRegistry(
         if not yaml_path.exists():
             return
 
-        with yaml_path.open("r", encoding="utf-8") as fh:
-            data = msgspec.yaml.decode(fh.read())
+        data = load_yaml_document(yaml_path)
 
         if not isinstance(data, dict):
             return
@@ -5,10 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, cast
 
-import msgspec
-
 from bluetooth_sig.registry.base import BaseGenericRegistry
-from bluetooth_sig.registry.utils import find_bluetooth_sig_path
+from bluetooth_sig.registry.utils import find_bluetooth_sig_path, load_yaml_document
 from bluetooth_sig.types.registry.profile_types import ProfileLookupEntry
 
 # Field names tried (in order) when extracting the integer value from a YAML entry.
@@ -99,8 +97,7 @@ class ProfileLookupRegistry(BaseGenericRegistry["ProfileLookupRegistry"]):
 
     def _load_yaml_file(self, yaml_path: Path) -> None:
         """Load a single YAML file and store entries keyed by top-level key."""
-        with yaml_path.open("r", encoding="utf-8") as fh:
-            data = msgspec.yaml.decode(fh.read())
+        data = load_yaml_document(yaml_path)
 
         if not isinstance(data, dict):
             return
@@ -2,14 +2,77 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
 import msgspec
 
 from bluetooth_sig.gatt.constants import UINT16_MAX
 from bluetooth_sig.types.uuid import BluetoothUUID
 
+K = TypeVar("K")
+V = TypeVar("V")
+
+# Pre-decoded YAML documents keyed by absolute path, installed from a registry
+# snapshot (see bluetooth_sig.utils.registry_snapshot). Values are msgpack
+# views into the snapshot buffer and are decoded on first use.
+_document_source: dict[str, msgspec.Raw] = {}
+
+# msgpack encoding of every YAML document loaded in this process, keyed by
+# path in load order, so snapshots are built without re-reading the files.
+_loaded_documents: dict[str, msgspec.Raw] = {}
+
+
+def load_yaml_document(file_path: Path) -> Any:  # noqa: ANN401  # YAML documents are untyped
+    """Load a registry YAML document, preferring an attached registry snapshot.
+
+    Every registry reads its source files through this function so that
+    worker processes attached to a snapshot skip YAML parsing entirely.
+
+    Args:
+        file_path: Path to the YAML file
+
+    Returns:
+        The decoded document (usually a dict)
+
+    Raises:
+        OSError: If the file cannot be read and no snapshot entry exists
+        msgspec.DecodeError: If the file is not valid YAML
+    """
+    key = str(file_path)
+    raw = _document_source.get(key)
+    if raw is not None:
+        _loaded_documents[key] = raw
+        return msgspec.msgpack.decode(raw)
+
+    with file_path.open("r", encoding="utf-8") as file_handle:
+        document = msgspec.yaml.decode(file_handle.read())
+    _loaded_documents[key] = msgspec.Raw(msgspec.msgpack.encode(document))
+    return document
+
+
+def get_loaded_document_paths() -> list[Path]:
+    """Return the paths of all registry YAML documents loaded so far."""
+    return [Path(key) for key in _loaded_documents]
+
+
+def get_loaded_documents() -> dict[str, msgspec.Raw]:
+    """Return every registry YAML document loaded so far, msgpack-encoded, keyed by path."""
+    return dict(_loaded_documents)
+
+
+def set_document_source(source: Mapping[str, msgspec.Raw] | None) -> None:
+    """Install (or clear, with ``None``) the pre-decoded document source.
+
+    Args:
+        source: Mapping of absolute YAML path to msgpack-encoded document
+    """
+    _document_source.clear()
+    if source is not None:
+        _document_source.update(source)
+
 
 def load_yaml_uuids(file_path: Path) -> list[dict[str, Any]]:
     """Load UUID entries from a YAML file.
@@ -23,8 +86,7 @@ def load_yaml_uuids(file_path: Path) -> list[dict[str, Any]]:
     if not file_path.exists():
         return []
 
-    with file_path.open("r", encoding="utf-8") as file_handle:
-        data = msgspec.yaml.decode(file_handle.read())
+    data = load_yaml_document(file_path)
 
     if not isinstance(data, dict):
         return []
@@ -42,6 +104,23 @@ def load_yaml_uuids(file_path: Path) -> list[dict[str, Any]]:
     return typed_entries
 
 
+def compact_mapping(mapping: dict[K, V]) -> dict[K, V]:
+    """Rebuild a loaded lookup table as a compact dict with interned string keys.
+
+    Dicts that grew incrementally during YAML loading keep spare slots from
+    resizes. Rebuilding packs the entries into a single right-sized table,
+    and interning string keys lets alias and canonical indices share one
+    key object instead of holding equal copies.
+
+    Args:
+        mapping: Lookup table to compact
+
+    Returns:
+        A new dict with the same items, in the same order
+    """
+    return {cast("K", sys.intern(key)) if isinstance(key, str) else key: value for key, value in mapping.items()}
+
+
 def normalize_uuid_string(uuid: str | int) -> str:
     """Normalize a UUID string or int to uppercase hex without 0x prefix.
 
@@ -65,6 +65,7 @@ from .mesh import (
     SecureNetworkBeacon,
     UnprovisionedDeviceBeacon,
 )
+from .parse_outcome import ParseErrorCode, ParseOutcome
 from .protocols import CharacteristicProtocol
 from .registry.ad_types import AdTypeInfo
 from .registry.appearance_info import AppearanceInfo
@@ -155,7 +156,9 @@ __all__ = [
     "NETWORK_ID_LENGTH",
     "NETWORK_KEY_LENGTH",
     "DEVICE_UUID_LENGTH",
+    "ParseErrorCode",
     "ParseFieldError",
+    "ParseOutcome",
     "ProvisioningBearerData",
     "PercentageUnit",
     "PhysicalUnit",
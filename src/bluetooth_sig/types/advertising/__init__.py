@@ -29,6 +29,7 @@ from bluetooth_sig.types.advertising.ad_structures import (
 from bluetooth_sig.types.advertising.builder import (
     ADStructure,
     AdvertisementBuilder,
+    MutableAdvertisementBuilder,
     encode_manufacturer_data,
     encode_service_uuids_16bit,
     encode_service_uuids_128bit,
@@ -67,6 +68,7 @@ __all__ = [
     # builder types
     "ADStructure",
     "AdvertisementBuilder",
+    "MutableAdvertisementBuilder",
     "encode_manufacturer_data",
     "encode_service_uuids_16bit",
     "encode_service_uuids_128bit",
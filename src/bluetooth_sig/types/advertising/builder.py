@@ -22,6 +22,36 @@ from bluetooth_sig.types.uuid import BluetoothUUID
 # Maximum data length for a single AD structure (255 - 1 for length byte - 1 for type byte)
 AD_STRUCTURE_MAX_DATA_SIZE: int = 254
 
+# Advertising payload limits (legacy PDUs / extended advertising)
+LEGACY_ADVERTISING_MAX_SIZE: int = 31
+EXTENDED_ADVERTISING_MAX_SIZE: int = 254
+
+_UINT16 = struct.Struct("<H")
+
+
+def _sig_short_id(bt_uuid: BluetoothUUID) -> int | None:
+    """Return the 16-bit ID of a SIG base UUID, or ``None`` for custom UUIDs."""
+    full_form = bt_uuid.full_form
+    if full_form.endswith(BluetoothUUID.SIG_BASE_SUFFIX) and full_form.startswith("0000"):
+        return int(full_form[4:8], 16)
+    return None
+
+
+def _encode_service_uuid_lists(uuids: Sequence[str | BluetoothUUID]) -> tuple[bytes, bytes]:
+    """Split *uuids* into packed 16-bit and 128-bit UUID lists."""
+    uuid_16bit = bytearray()
+    uuid_128bit = bytearray()
+    for uuid in uuids:
+        bt_uuid = BluetoothUUID(str(uuid))
+        short_id = _sig_short_id(bt_uuid)
+        if short_id is not None:
+            # Use compact 16-bit encoding for SIG UUIDs
+            uuid_16bit += _UINT16.pack(short_id)
+        else:
+            # Custom 128-bit UUID
+            uuid_128bit += bt_uuid.to_bytes()
+    return bytes(uuid_16bit), bytes(uuid_128bit)
+
 
 class ADStructure(msgspec.Struct, frozen=True, kw_only=True):
     """Single AD structure (Length-Type-Data format).
@@ -91,8 +121,8 @@ class AdvertisementBuilder(msgspec.Struct, frozen=True, kw_only=True):
     """
 
     # Standard advertising payload limits
-    LEGACY_MAX_SIZE: int = 31
-    EXTENDED_MAX_SIZE: int = 254
+    LEGACY_MAX_SIZE: int = LEGACY_ADVERTISING_MAX_SIZE
+    EXTENDED_MAX_SIZE: int = EXTENDED_ADVERTISING_MAX_SIZE
 
     structures: list[ADStructure] = msgspec.field(default_factory=list)
     max_payload_size: int = LEGACY_MAX_SIZE
@@ -202,34 +232,17 @@ class AdvertisementBuilder(msgspec.Struct, frozen=True, kw_only=True):
             )
 
         builder = self
-
-        # Group by size for efficient encoding
-        uuid_16bit: list[bytes] = []
-        uuid_128bit: list[bytes] = []
-
-        for uuid in uuids:
-            bt_uuid = BluetoothUUID(str(uuid))
-            full_form = bt_uuid.full_form
-
-            # Check if this uses the SIG base UUID (can be encoded as 16-bit)
-            if full_form.endswith(BluetoothUUID.SIG_BASE_SUFFIX) and full_form.startswith("0000"):
-                # Use compact 16-bit encoding for SIG UUIDs
-                short_hex = full_form[4:8]
-                short_id = int(short_hex, 16)
-                uuid_16bit.append(struct.pack("<H", short_id))
-            else:
-                # Custom 128-bit UUID
-                uuid_128bit.append(bt_uuid.to_bytes())
+        uuid_16bit, uuid_128bit = _encode_service_uuid_lists(uuids)
 
         # Add 16-bit service UUIDs
         if uuid_16bit:
             ad_type = ADType.COMPLETE_16BIT_SERVICE_UUIDS if complete else ADType.INCOMPLETE_16BIT_SERVICE_UUIDS
-            builder = builder._add_structure(ad_type, b"".join(uuid_16bit))
+            builder = builder._add_structure(ad_type, uuid_16bit)
 
         # Add 128-bit service UUIDs
         if uuid_128bit:
             ad_type = ADType.COMPLETE_128BIT_SERVICE_UUIDS if complete else ADType.INCOMPLETE_128BIT_SERVICE_UUIDS
-            builder = builder._add_structure(ad_type, b"".join(uuid_128bit))
+            builder = builder._add_structure(ad_type, uuid_128bit)
 
         return builder
 
@@ -267,7 +280,7 @@ class AdvertisementBuilder(msgspec.Struct, frozen=True, kw_only=True):
             New builder with manufacturer data added.
 
         """
-        return self.with_manufacturer_data(mfr_data.company.id, mfr_data.payload)
+        return self.with_manufacturer_data(mfr_data.company_id, mfr_data.payload)
 
     def with_service_data(
         self,
@@ -285,15 +298,11 @@ class AdvertisementBuilder(msgspec.Struct, frozen=True, kw_only=True):
 
         """
         bt_uuid = BluetoothUUID(str(service_uuid))
-        full_form = bt_uuid.full_form
+        short_id = _sig_short_id(bt_uuid)
 
-        # Check if this uses the SIG base UUID (can be encoded as 16-bit)
-        if full_form.endswith(BluetoothUUID.SIG_BASE_SUFFIX) and full_form.startswith("0000"):
+        if short_id is not None:
             # 16-bit service data
-            short_hex = full_form[4:8]
-            short_id = int(short_hex, 16)
-            uuid_bytes = struct.pack("<H", short_id)
-            return self._add_structure(ADType.SERVICE_DATA_16BIT, uuid_bytes + data)
+            return self._add_structure(ADType.SERVICE_DATA_16BIT, _UINT16.pack(short_id) + data)
 
         # 128-bit service data
         uuid_bytes = bt_uuid.to_bytes()
@@ -362,6 +371,254 @@ class AdvertisementBuilder(msgspec.Struct, frozen=True, kw_only=True):
 
         return payload
 
+    def to_mutable(self) -> MutableAdvertisementBuilder:
+        """Copy the accumulated structures into a buffer-backed mutable builder.
+
+        Returns:
+            Mutable builder with the same structures and size limit.
+
+        Raises:
+            ValueError: If the structures exceed max_payload_size.
+
+        """
+        mutable = MutableAdvertisementBuilder(self.max_payload_size)
+        for structure in self.structures:
+            mutable.add_raw_structure(structure.ad_type, structure.data)
+        return mutable
+
+
+def _check_range(field: str, value: int, minimum: int, maximum: int) -> None:
+    """Raise ValueError unless ``minimum <= value <= maximum``."""
+    if not minimum <= value <= maximum:
+        raise ValueError(f"{field} out of range: {value}, expected {minimum}..{maximum}")
+
+
+class MutableAdvertisementBuilder:
+    r"""Buffer-backed advertising payload builder for high-volume generation.
+
+    Unlike the immutable :class:`AdvertisementBuilder`, each ``add_*`` call
+    writes its AD structure straight into a preallocated 31/254-byte
+    ``bytearray`` and returns the same builder, so building is linear in the
+    payload size and :meth:`reset` lets one buffer serve any number of
+    advertisements. Size and value limits are enforced as structures are
+    added; an add that raises ``ValueError`` leaves the payload unchanged.
+
+    Example::
+        >>> builder = MutableAdvertisementBuilder()
+        >>> payload = builder.add_flags(0x06).add_complete_local_name("Dev").build()
+        >>> payload.hex()
+        '0201060409446576'
+        >>> len(builder.reset())
+        0
+
+    Attributes:
+        max_payload_size: Maximum payload size (31 for legacy, 254 for extended).
+
+    """
+
+    __slots__ = ("_buffer", "_size", "max_payload_size")
+
+    def __init__(self, max_payload_size: int = LEGACY_ADVERTISING_MAX_SIZE) -> None:
+        """Initialise an empty builder.
+
+        Args:
+            max_payload_size: Payload limit; also the preallocated buffer size.
+
+        """
+        self.max_payload_size = max_payload_size
+        self._buffer = bytearray(max_payload_size)
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Current encoded payload size."""
+        return self._size
+
+    def _begin_structure(self, ad_type: int, data_length: int) -> int:
+        """Write a structure header past the payload end and reserve *data_length* bytes.
+
+        Nothing is committed until :meth:`_commit`, so a failure while writing
+        the data leaves the payload unchanged.
+
+        Returns:
+            Buffer offset where the structure data starts.
+
+        Raises:
+            ValueError: If the structure or the payload would be too long.
+
+        """
+        if data_length > AD_STRUCTURE_MAX_DATA_SIZE:
+            raise ValueError(f"AD structure data too long: {data_length} bytes, max {AD_STRUCTURE_MAX_DATA_SIZE}")
+        start = self._size
+        end = start + 2 + data_length
+        if end > self.max_payload_size:
+            raise ValueError(f"Advertising payload too large: {end} bytes, max {self.max_payload_size}")
+        buffer = self._buffer
+        buffer[start] = data_length + 1  # +1 for AD type byte
+        buffer[start + 1] = ad_type
+        return start + 2
+
+    def _commit(self, end: int) -> MutableAdvertisementBuilder:
+        """Extend the payload to *end*, making the structure being written part of it."""
+        self._size = end
+        return self
+
+    def add_raw_structure(self, ad_type: int, data: bytes | bytearray | memoryview) -> MutableAdvertisementBuilder:
+        """Add a raw AD structure.
+
+        Args:
+            ad_type: AD type constant.
+            data: Raw data bytes.
+
+        Returns:
+            This builder.
+
+        """
+        offset = self._begin_structure(ad_type, len(data))
+        end = offset + len(data)
+        self._buffer[offset:end] = data
+        return self._commit(end)
+
+    def _add_uint16_prefixed(
+        self, ad_type: int, prefix: int, data: bytes | bytearray | memoryview
+    ) -> MutableAdvertisementBuilder:
+        """Add a structure whose data is a little-endian uint16 followed by *data*."""
+        _check_range("16-bit value", prefix, 0, 0xFFFF)
+        offset = self._begin_structure(ad_type, 2 + len(data))
+        end = offset + 2 + len(data)
+        buffer = self._buffer
+        _UINT16.pack_into(buffer, offset, prefix)
+        buffer[offset + 2 : end] = data
+        return self._commit(end)
+
+    def add_flags(self, flags: BLEAdvertisingFlags | int) -> MutableAdvertisementBuilder:
+        """Add advertising flags."""
+        _check_range("Flags", int(flags), 0, 0xFF)
+        offset = self._begin_structure(ADType.FLAGS, 1)
+        self._buffer[offset] = int(flags)
+        return self._commit(offset + 1)
+
+    def add_complete_local_name(self, name: str) -> MutableAdvertisementBuilder:
+        """Add complete local name (UTF-8 encoded)."""
+        return self.add_raw_structure(ADType.COMPLETE_LOCAL_NAME, name.encode("utf-8"))
+
+    def add_shortened_local_name(self, name: str) -> MutableAdvertisementBuilder:
+        """Add shortened local name (UTF-8 encoded)."""
+        return self.add_raw_structure(ADType.SHORTENED_LOCAL_NAME, name.encode("utf-8"))
+
+    def add_tx_power(self, power_dbm: int) -> MutableAdvertisementBuilder:
+        """Add TX power level in dBm (-127 to +127)."""
+        _check_range("TX power", power_dbm, -127, 127)
+        offset = self._begin_structure(ADType.TX_POWER_LEVEL, 1)
+        struct.pack_into("b", self._buffer, offset, power_dbm)
+        return self._commit(offset + 1)
+
+    def add_appearance(self, appearance: int) -> MutableAdvertisementBuilder:
+        """Add 16-bit device appearance."""
+        _check_range("Appearance", appearance, 0, 0xFFFF)
+        offset = self._begin_structure(ADType.APPEARANCE, 2)
+        _UINT16.pack_into(self._buffer, offset, appearance)
+        return self._commit(offset + 2)
+
+    def add_service_uuids(
+        self,
+        uuids: Sequence[str | BluetoothUUID],
+        *,
+        complete: bool = True,
+    ) -> MutableAdvertisementBuilder:
+        """Add service UUIDs, using 16-bit encoding for SIG UUIDs.
+
+        Args:
+            uuids: Service UUIDs to advertise.
+            complete: If True, use "Complete" list types; else "Incomplete".
+
+        Returns:
+            This builder (unchanged if uuids is empty).
+
+        Raises:
+            ValueError: If the lists do not fit; neither list is added then.
+
+        """
+        uuid_16bit, uuid_128bit = _encode_service_uuid_lists(uuids)
+        start = self._size
+        try:
+            if uuid_16bit:
+                ad_type = ADType.COMPLETE_16BIT_SERVICE_UUIDS if complete else ADType.INCOMPLETE_16BIT_SERVICE_UUIDS
+                self.add_raw_structure(ad_type, uuid_16bit)
+            if uuid_128bit:
+                ad_type = ADType.COMPLETE_128BIT_SERVICE_UUIDS if complete else ADType.INCOMPLETE_128BIT_SERVICE_UUIDS
+                self.add_raw_structure(ad_type, uuid_128bit)
+        except ValueError:
+            self._size = start
+            raise
+        return self
+
+    def add_manufacturer_data(
+        self,
+        company_id: int | CompanyIdentifier,
+        payload: bytes | bytearray | memoryview,
+    ) -> MutableAdvertisementBuilder:
+        """Add manufacturer-specific data (company ID + payload)."""
+        cid = company_id.id if isinstance(company_id, CompanyIdentifier) else company_id
+        return self._add_uint16_prefixed(ADType.MANUFACTURER_SPECIFIC_DATA, cid, payload)
+
+    def add_manufacturer_data_struct(self, mfr_data: ManufacturerData) -> MutableAdvertisementBuilder:
+        """Add manufacturer-specific data from a ManufacturerData struct."""
+        return self.add_manufacturer_data(mfr_data.company_id, mfr_data.payload)
+
+    def add_service_data(
+        self,
+        service_uuid: str | BluetoothUUID | int,
+        data: bytes | bytearray | memoryview,
+    ) -> MutableAdvertisementBuilder:
+        """Add service data.
+
+        Args:
+            service_uuid: Service UUID, or a 16-bit SIG UUID as an int.
+            data: Service-specific data bytes.
+
+        Returns:
+            This builder.
+
+        """
+        if isinstance(service_uuid, int):
+            return self._add_uint16_prefixed(ADType.SERVICE_DATA_16BIT, service_uuid, data)
+        bt_uuid = BluetoothUUID(str(service_uuid))
+        short_id = _sig_short_id(bt_uuid)
+        if short_id is not None:
+            return self._add_uint16_prefixed(ADType.SERVICE_DATA_16BIT, short_id, data)
+        offset = self._begin_structure(ADType.SERVICE_DATA_128BIT, 16 + len(data))
+        end = offset + 16 + len(data)
+        buffer = self._buffer
+        buffer[offset : offset + 16] = bt_uuid.to_bytes()
+        buffer[offset + 16 : end] = data
+        return self._commit(end)
+
+    def current_size(self) -> int:
+        """Get current encoded payload size."""
+        return self._size
+
+    def remaining_space(self) -> int:
+        """Get bytes remaining before max_payload_size."""
+        return self.max_payload_size - self._size
+
+    def reset(self) -> MutableAdvertisementBuilder:
+        """Discard all structures, keeping the buffer for reuse."""
+        self._size = 0
+        return self
+
+    def view(self) -> memoryview:
+        """Zero-copy view of the payload, valid until the builder is next modified."""
+        return memoryview(self._buffer)[: self._size]
+
+    def build(self) -> bytes:
+        """Build the final advertising payload.
+
+        Returns:
+            Copy of the encoded AD structures.
+
+        """
+        return bytes(self._buffer[: self._size])
+
 
 def encode_manufacturer_data(company_id: int, payload: bytes) -> bytes:
     """Encode manufacturer-specific data to bytes.
@@ -425,6 +682,7 @@ def encode_service_uuids_128bit(uuids: Sequence[str | BluetoothUUID]) -> bytes:
 __all__ = [
     "ADStructure",
     "AdvertisementBuilder",
+    "MutableAdvertisementBuilder",
     "encode_manufacturer_data",
     "encode_service_uuids_16bit",
     "encode_service_uuids_128bit",
@@ -2,15 +2,23 @@
 
 Provides a unified type that encapsulates both the numeric company ID
 and its resolved human-readable name from the Bluetooth SIG registry.
+
+:meth:`CompanyIdentifier.from_id` interns one instance per ID, so parsing
+advertisements consults the company name table once per company rather than
+once per advertisement.
 """
 
 from __future__ import annotations
 
 import msgspec
 
-from bluetooth_sig.gatt.constants import SIZE_UINT16
+from bluetooth_sig.gatt.constants import SIZE_UINT16, UINT16_MAX
 from bluetooth_sig.registry.company_identifiers import get_company_identifiers_registry
 
+# One interned CompanyIdentifier per 16-bit company ID, filled by from_id.
+# msgspec frozen Structs cannot cache per instance, so this lives at module level.
+_interned: dict[int, CompanyIdentifier] = {}
+
 
 class CompanyIdentifier(msgspec.Struct, kw_only=True, frozen=True):
     """Bluetooth SIG company identifier with resolved name.
@@ -47,6 +55,9 @@ class CompanyIdentifier(msgspec.Struct, kw_only=True, frozen=True):
     def from_id(cls, company_id: int) -> CompanyIdentifier:
         """Create CompanyIdentifier from numeric ID with registry lookup.
 
+        Instances for valid 16-bit IDs are interned, so repeated calls return
+        the same object and only the first one consults the registry.
+
         Args:
             company_id: Manufacturer company identifier (e.g., 0x004C for Apple).
 
@@ -61,10 +72,16 @@ class CompanyIdentifier(msgspec.Struct, kw_only=True, frozen=True):
             'Apple, Inc.'
 
         """
+        company = _interned.get(company_id)
+        if company is not None and cls is CompanyIdentifier:
+            return company
         name = get_company_identifiers_registry().get_company_name(company_id)
         if not name:
             name = f"Unknown (0x{company_id:04X})"
-        return cls(id=company_id, name=name)
+        company = cls(id=company_id, name=name)
+        if cls is CompanyIdentifier and 0 <= company_id <= UINT16_MAX:
+            company = _interned.setdefault(company_id, company)
+        return company
 
     def __str__(self) -> str:
         """String representation showing name and hex ID."""
@@ -78,6 +95,10 @@ class CompanyIdentifier(msgspec.Struct, kw_only=True, frozen=True):
 class ManufacturerData(msgspec.Struct, kw_only=True, frozen=True):
     r"""Manufacturer-specific advertising data.
 
+    The factory methods take :attr:`company` from the interned
+    :class:`CompanyIdentifier` instances, so after the first advertisement
+    from a company no further name lookups or allocations are needed.
+
     Attributes:
         company: Resolved company identifier with ID and name.
         payload: Raw manufacturer-specific data bytes.
@@ -85,6 +106,7 @@ class ManufacturerData(msgspec.Struct, kw_only=True, frozen=True):
     Example::
         # Parse from raw bytes
         mfr_data = ManufacturerData.from_bytes(b"\x4c\x00\x02\x15...")
+        print(mfr_data.company_id)  # 76
         print(mfr_data.company.name)  # "Apple, Inc."
         print(mfr_data.payload.hex())  # "0215..."
 
@@ -93,6 +115,11 @@ class ManufacturerData(msgspec.Struct, kw_only=True, frozen=True):
     company: CompanyIdentifier
     payload: bytes
 
+    @property
+    def company_id(self) -> int:
+        """Numeric company identifier (16-bit unsigned integer)."""
+        return self.company.id
+
     @classmethod
     def from_bytes(cls, data: bytes) -> ManufacturerData:
         """Parse manufacturer data from raw AD structure bytes.
@@ -110,25 +137,21 @@ class ManufacturerData(msgspec.Struct, kw_only=True, frozen=True):
         if len(data) < SIZE_UINT16:
             raise ValueError(f"Manufacturer data too short: {len(data)} bytes, need at least {SIZE_UINT16}")
 
-        company_id = int.from_bytes(data[:2], byteorder="little", signed=False)
-        payload = data[2:]
-        company = CompanyIdentifier.from_id(company_id)
-
-        return cls(company=company, payload=payload)
+        return cls(company=CompanyIdentifier.from_id(data[0] | data[1] << 8), payload=data[2:])
 
     @classmethod
-    def from_id_and_payload(cls, company_id: int, payload: bytes) -> ManufacturerData:
+    def from_id_and_payload(cls, company_id: int | CompanyIdentifier, payload: bytes) -> ManufacturerData:
         """Create manufacturer data from company ID and payload.
 
         Args:
-            company_id: Numeric company identifier.
+            company_id: Numeric company identifier or CompanyIdentifier instance.
             payload: Raw manufacturer-specific data bytes.
 
         Returns:
             ManufacturerData with resolved company info.
 
         """
-        company = CompanyIdentifier.from_id(company_id)
+        company = company_id if isinstance(company_id, CompanyIdentifier) else CompanyIdentifier.from_id(company_id)
         return cls(company=company, payload=payload)
 
     def to_bytes(self) -> bytes:
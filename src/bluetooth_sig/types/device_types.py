@@ -84,6 +84,9 @@ class ScanFilter(msgspec.Struct, kw_only=True):
     For OR logic across different filter types, perform multiple scans or use
     a custom `filter_func`.
 
+    To reject advertisements before they are parsed, compile the filter with
+    :class:`~bluetooth_sig.advertising.scan_prefilter.CompiledScanFilter`.
+
     Field descriptions:
         service_uuids: Only include devices advertising these service UUIDs.
             On some platforms (macOS), this filtering happens at the OS level
@@ -93,6 +96,8 @@ class ScanFilter(msgspec.Struct, kw_only=True):
             Useful for reconnecting to known devices. Case-insensitive matching.
         names: Only include devices with names containing any of these substrings.
             Case-insensitive partial matching. Device must have a name to match.
+        manufacturer_ids: Only include devices advertising manufacturer data from
+            any of these Bluetooth SIG company identifiers (e.g. 0x004C for Apple).
         rssi_threshold: Only include devices with RSSI >= this value (in dBm).
             Typical values: -30 (very close), -60 (nearby), -90 (far).
         filter_func: Custom filter function for complex matching logic.
@@ -129,6 +134,7 @@ class ScanFilter(msgspec.Struct, kw_only=True):
     service_uuids: list[str] | None = None
     addresses: list[str] | None = None
     names: list[str] | None = None
+    manufacturer_ids: list[int] | None = None
     rssi_threshold: int | None = None
     filter_func: ScanFilterFunc | None = None
 
@@ -170,6 +176,16 @@ class ScanFilter(msgspec.Struct, kw_only=True):
         normalized_advertised = {uuid.normalized for uuid in advertised}
         return bool(normalized_filters & normalized_advertised)
 
+    def _passes_manufacturer_filter(self, device: ScannedDevice) -> bool:
+        """Check if device passes the manufacturer filter (No filter means passes filter)."""
+        manufacturer_ids = self.manufacturer_ids
+        if manufacturer_ids is None:
+            return True
+        if device.advertisement_data is None:
+            return False
+        advertised = device.advertisement_data.ad_structures.core.manufacturer_data
+        return any(company_id in advertised for company_id in manufacturer_ids)  # pylint: disable=not-an-iterable
+
     def matches(self, device: ScannedDevice) -> bool:
         """Check if a device passes all specified filters.
 
@@ -189,6 +205,8 @@ class ScanFilter(msgspec.Struct, kw_only=True):
             return False
         if not self._passes_service_uuid_filter(device):
             return False
+        if not self._passes_manufacturer_filter(device):
+            return False
 
         # Check custom filter function
         filter_func = self.filter_func
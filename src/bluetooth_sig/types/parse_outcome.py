@@ -0,0 +1,23 @@
+"""Outcome categories for characteristic parsing."""
+
+from __future__ import annotations
+
+from enum import IntEnum
+
+
+class ParseOutcome(IntEnum):
+    """Outcome category of a characteristic parse."""
+
+    OK = 0
+    SPECIAL_VALUE = 1
+    ERROR = 2
+
+
+class ParseErrorCode(IntEnum):
+    """Reason a characteristic parse failed."""
+
+    INVALID_LENGTH = 1
+    DECODE_FAILED = 2
+    OUT_OF_RANGE = 3
+    TYPE_MISMATCH = 4
+    UNKNOWN_CHARACTERISTIC = 5
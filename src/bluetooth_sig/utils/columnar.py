@@ -0,0 +1,364 @@
+"""Streaming columnar export of parsed characteristic values.
+
+:class:`ColumnarSink` derives a fixed column schema from a characteristic's
+parsed ``msgspec.Struct`` type and appends values into typed, array-backed
+columns, handing them off in fixed-size chunks. This avoids building one
+dict per value before assembling a dataframe.
+
+Column storage per field type:
+
+* ``bool`` → ``array('b')``
+* ``int`` / ``IntEnum`` / ``IntFlag`` → ``array('q')`` (enum members as ints)
+* ``float`` → ``array('d')``
+* optional numeric (``int | None``, ``float | None``) → ``array('d')``, ``None`` as NaN
+* anything else → ``list`` (non-integer enums stored by name)
+
+NumPy is optional; it is only imported by :class:`NpzChunkWriter`.
+"""
+
+from __future__ import annotations
+
+import csv
+import enum
+import math
+from array import array
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any, Protocol, TypeAlias, runtime_checkable
+
+import msgspec
+
+from .values import to_primitive
+
+Column: TypeAlias = "array[Any] | list[Any]"
+ColumnChunk: TypeAlias = "dict[str, Column]"
+
+DEFAULT_CHUNK_SIZE = 4096
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+_NUMERIC_TYPES = (msgspec.inspect.BoolType, msgspec.inspect.IntType, msgspec.inspect.FloatType)
+
+
+@runtime_checkable
+class RowDecoder(Protocol):
+    """Characteristic that can decode raw bytes straight into a column row.
+
+    ``decode_row`` returns the parsed field values in struct field order,
+    without constructing (or validating) the result struct.
+    """
+
+    def decode_row(self, data: bytearray) -> tuple[Any, ...]:
+        """Decode *data* into a tuple of field values."""
+
+
+class ColumnSpec(msgspec.Struct, frozen=True, kw_only=True):
+    """One column of a :class:`ColumnarSink` schema.
+
+    Attributes:
+        name: Struct field name
+        typecode: ``array`` typecode, or ``None`` for a list-backed column
+        nullable: Whether ``None`` is stored (as NaN for numeric columns)
+
+    """
+
+    name: str
+    typecode: str | None
+    nullable: bool = False
+
+
+def _enum_to_name(value: enum.Enum | None) -> str | None:
+    return None if value is None else value.name
+
+
+def _to_float_or_nan(value: float | None) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _column_for(name: str, field_type: msgspec.inspect.Type) -> tuple[ColumnSpec, Callable[[Any], Any] | None]:
+    """Map one inspected field type to its column spec and value converter."""
+    if isinstance(field_type, msgspec.inspect.BoolType):
+        return ColumnSpec(name=name, typecode="b"), None
+    if isinstance(field_type, msgspec.inspect.IntType):
+        return ColumnSpec(name=name, typecode="q"), None
+    if isinstance(field_type, msgspec.inspect.FloatType):
+        return ColumnSpec(name=name, typecode="d"), None
+    if isinstance(field_type, msgspec.inspect.EnumType):
+        if issubclass(field_type.cls, int):
+            return ColumnSpec(name=name, typecode="q"), int
+        return ColumnSpec(name=name, typecode=None), _enum_to_name
+
+    if isinstance(field_type, msgspec.inspect.UnionType):
+        members = [t for t in field_type.types if not isinstance(t, msgspec.inspect.NoneType)]
+        nullable = len(members) != len(field_type.types)
+        if len(members) == 1 and nullable:
+            member = members[0]
+            is_int_enum = isinstance(member, msgspec.inspect.EnumType) and issubclass(member.cls, int)
+            if isinstance(member, _NUMERIC_TYPES) or is_int_enum:
+                return ColumnSpec(name=name, typecode="d", nullable=True), _to_float_or_nan
+            if isinstance(member, msgspec.inspect.EnumType):
+                return ColumnSpec(name=name, typecode=None, nullable=True), _enum_to_name
+        return ColumnSpec(name=name, typecode=None, nullable=nullable), None
+
+    return ColumnSpec(name=name, typecode=None), None
+
+
+def derive_column_schema(value_type: type[msgspec.Struct]) -> tuple[ColumnSpec, ...]:
+    """Derive the column schema for a parsed struct type.
+
+    Args:
+        value_type: ``msgspec.Struct`` subclass returned by a characteristic
+
+    Returns:
+        One :class:`ColumnSpec` per struct field, in field order
+
+    """
+    return tuple(spec for spec, _ in _derive_columns(value_type))
+
+
+def _derive_columns(value_type: type[msgspec.Struct]) -> list[tuple[ColumnSpec, Callable[[Any], Any] | None]]:
+    info = msgspec.inspect.type_info(value_type)
+    if not isinstance(info, msgspec.inspect.StructType):
+        raise TypeError(f"{value_type!r} is not a msgspec.Struct type")
+    return [_column_for(field.name, field.type) for field in info.fields]
+
+
+class ColumnarSink:
+    """Accumulate parsed values of one characteristic into typed columns.
+
+    Values are buffered until ``chunk_size`` rows are held, then the columns
+    are passed to ``on_flush`` and fresh buffers are started. Call
+    :meth:`flush` (or use the sink as a context manager) to hand off the
+    final partial chunk.
+
+    Example::
+        >>> sink = ColumnarSink(HeartRateMeasurementCharacteristic, chunk_size=1024, on_flush=CsvChunkWriter("hr.csv"))
+        >>> with sink:
+        ...     for payload in notifications:
+        ...         sink.append_raw(payload)
+
+    """
+
+    def __init__(
+        self,
+        characteristic: Any,  # noqa: ANN401  # BaseCharacteristic class or instance
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        on_flush: Callable[[ColumnChunk], None] | None = None,
+    ) -> None:
+        """Initialise the sink for *characteristic*.
+
+        Args:
+            characteristic: Characteristic class or instance whose parsed
+                values are ``msgspec.Struct`` instances
+            chunk_size: Rows buffered before ``on_flush`` is called
+            on_flush: Receives each full chunk; without it, chunks are only
+                returned from :meth:`flush`
+
+        Raises:
+            TypeError: If the characteristic does not parse to a struct
+            ValueError: If *chunk_size* is not positive
+
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        self._characteristic = characteristic() if isinstance(characteristic, type) else characteristic
+        value_type = type(self._characteristic)._resolve_generic_python_type()  # pylint: disable=protected-access
+        if not (isinstance(value_type, type) and issubclass(value_type, msgspec.Struct)):
+            raise TypeError(f"{type(self._characteristic).__name__} does not parse to a msgspec.Struct")
+
+        self.value_type: type[msgspec.Struct] = value_type
+        columns = _derive_columns(value_type)
+        self.schema: tuple[ColumnSpec, ...] = tuple(spec for spec, _ in columns)
+        self._converters = tuple(converter for _, converter in columns)
+        self._field_names = tuple(spec.name for spec in self.schema)
+        self._row_decoder = self._characteristic if isinstance(self._characteristic, RowDecoder) else None
+        self.chunk_size = chunk_size
+        self.on_flush = on_flush
+        self._columns = self._new_columns()
+        self._rows = 0
+
+    def __len__(self) -> int:
+        """Return the number of buffered (unflushed) rows."""
+        return self._rows
+
+    def __enter__(self) -> ColumnarSink:
+        """Return the sink; buffered rows are flushed on exit."""
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Flush the final partial chunk."""
+        self.flush()
+
+    @property
+    def supports_direct_decode(self) -> bool:
+        """Whether :meth:`append_raw` decodes straight into columns."""
+        return self._row_decoder is not None
+
+    def _new_columns(self) -> list[Column]:
+        return [array(spec.typecode) if spec.typecode else [] for spec in self.schema]
+
+    def append(self, value: msgspec.Struct) -> None:
+        """Append one parsed struct value.
+
+        Args:
+            value: Parsed value of the sink's struct type
+
+        """
+        self.append_row(msgspec.structs.astuple(value))
+
+    def append_row(self, row: Sequence[Any]) -> None:
+        """Append one row of field values in schema order.
+
+        Args:
+            row: Field values, ordered as :attr:`schema`
+
+        """
+        for column, converter, value in zip(self._columns, self._converters, row, strict=True):
+            column.append(converter(value) if converter is not None else value)
+        self._rows += 1
+        if self._rows >= self.chunk_size and self.on_flush is not None:
+            self.flush()
+
+    def append_raw(self, data: bytes | bytearray) -> None:
+        """Parse raw characteristic bytes and append the result.
+
+        Characteristics implementing ``decode_row`` are decoded straight into
+        the columns, skipping struct construction and range validation; all
+        others go through the normal parse pipeline.
+
+        Args:
+            data: Raw characteristic value
+
+        Raises:
+            SpecialValueDetectedError: Special sentinel value detected (pipeline path)
+            CharacteristicParseError: Parse/validation failure (pipeline path)
+
+        """
+        if self._row_decoder is not None:
+            self.append_row(self._row_decoder.decode_row(data if isinstance(data, bytearray) else bytearray(data)))
+        else:
+            self.append(self._characteristic.parse_value(data))
+
+    def flush(self) -> ColumnChunk | None:
+        """Hand off buffered rows and start a new chunk.
+
+        Returns:
+            The flushed columns keyed by field name, or ``None`` if empty
+
+        """
+        if not self._rows:
+            return None
+        chunk: ColumnChunk = dict(zip(self._field_names, self._columns, strict=True))
+        self._columns = self._new_columns()
+        self._rows = 0
+        if self.on_flush is not None:
+            self.on_flush(chunk)
+        return chunk
+
+
+class CsvChunkWriter:
+    """``on_flush`` target that appends chunks to one CSV file.
+
+    The header row is written with the first chunk. List-backed column
+    values are written via :func:`~bluetooth_sig.utils.values.to_primitive`.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialise the writer.
+
+        Args:
+            path: Destination CSV file (truncated on the first chunk)
+
+        """
+        self.path = Path(path)
+        self._header_written = False
+
+    def __call__(self, chunk: ColumnChunk) -> None:
+        """Append *chunk* to the CSV file."""
+        columns = [col if isinstance(col, array) else [_csv_value(v) for v in col] for col in chunk.values()]
+        mode = "a" if self._header_written else "w"
+        with self.path.open(mode, newline="", encoding="utf-8") as file_handle:
+            writer = csv.writer(file_handle)
+            if not self._header_written:
+                writer.writerow(chunk.keys())
+                self._header_written = True
+            writer.writerows(zip(*columns, strict=True))
+
+
+def _csv_value(value: Any) -> Any:  # noqa: ANN401  # Any column value
+    return "" if value is None else to_primitive(value)
+
+
+def _typed_column(np: Any, column: list[Any]) -> tuple[Any, Any | None]:  # noqa: ANN401  # numpy module and arrays
+    """Convert a list-backed column to a typed NumPy array and optional null mask.
+
+    Values go through :func:`~bluetooth_sig.utils.values.to_primitive`; the
+    array is ``bool``, ``int64`` or ``float64`` when every value allows it,
+    and a fixed-width string array otherwise. ``None`` entries are stored as
+    the dtype's zero value and flagged in the returned mask.
+    """
+    mask = [value is None for value in column]
+    values = [to_primitive(value) for value in column if value is not None]
+    kinds = {bool if isinstance(value, bool) else type(value) for value in values}
+    dtype: Any
+    fill: Any
+    if kinds == {bool}:
+        dtype, fill = np.bool_, False
+    elif kinds == {int} and all(isinstance(value, int) and _INT64_MIN <= value <= _INT64_MAX for value in values):
+        dtype, fill = np.int64, 0
+    elif kinds and kinds <= {int, float}:
+        dtype, fill = np.float64, 0.0
+    else:
+        dtype, fill = np.str_, ""
+        values = [str(value) for value in values]
+    filled = iter(values)
+    typed = np.array([fill if is_null else next(filled) for is_null in mask], dtype=dtype)
+    return typed, np.array(mask, dtype=np.bool_) if any(mask) else None
+
+
+class NpzChunkWriter:
+    """``on_flush`` target that writes each chunk to its own ``.npz`` file.
+
+    Files are named ``<prefix>-00000.npz``, ``<prefix>-00001.npz``, ...
+    Requires NumPy. Every array has a plain dtype, so files load with the
+    default ``np.load(..., allow_pickle=False)``. List-backed columns are
+    coerced with :func:`~bluetooth_sig.utils.values.to_primitive` into a
+    ``bool``, ``int64``, ``float64`` or fixed-width string array; if a column
+    holds ``None``, a boolean ``"<name>.mask"`` array marks those rows.
+    """
+
+    def __init__(self, directory: str | Path, prefix: str = "chunk") -> None:
+        """Initialise the writer.
+
+        Args:
+            directory: Output directory (created if missing)
+            prefix: File name prefix
+
+        """
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.paths: list[Path] = []
+
+    def __call__(self, chunk: ColumnChunk) -> None:
+        """Write *chunk* to the next ``.npz`` file."""
+        try:
+            import numpy as np  # noqa: PLC0415  # Optional dependency
+        except ImportError as e:
+            raise ImportError("NpzChunkWriter requires numpy: pip install numpy") from e
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{self.prefix}-{len(self.paths):05d}.npz"
+        # Typed loosely: numpy's stubs match **arrays against savez's own keyword arguments
+        arrays: dict[str, Any] = {}
+        for name, col in chunk.items():
+            if isinstance(col, array):
+                arrays[name] = np.frombuffer(col, dtype=col.typecode).copy()
+                continue
+            arrays[name], mask = _typed_column(np, col)
+            if mask is not None:
+                arrays[f"{name}.mask"] = mask
+        np.savez(path, **arrays)
+        self.paths.append(path)
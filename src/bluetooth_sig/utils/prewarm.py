@@ -3,18 +3,23 @@
 Consumers that run inside an event loop (e.g. Home Assistant) should call
 :func:`prewarm_registries` in an executor thread during setup to avoid
 blocking I/O on first access.
+
+Pre-fork worker pools should call ``prewarm_registries(freeze=True)`` in the
+parent process before forking, so that children inherit fully loaded
+registries instead of each re-reading the YAML files.
 """
 
 from __future__ import annotations
 
+import gc
 import logging
 
-from .prewarm_catalog import get_prewarm_loaders
+from .prewarm_catalog import get_prewarm_targets
 
 logger = logging.getLogger(__name__)
 
 
-def prewarm_registries() -> None:
+def prewarm_registries(*, freeze: bool = False) -> None:
     """Eagerly load all bluetooth-sig YAML registries.
 
     Triggers the lazy-load path for every registry so that subsequent
@@ -46,9 +51,29 @@ def prewarm_registries() -> None:
     - SDO UUIDs registry (standards body UUIDs)
     - Service classes registry (service class UUIDs)
     - UUID registry (service/characteristic/descriptor metadata hub)
+
+    Args:
+        freeze: Prepare the loaded registries for sharing with forked
+            children. Each registry repacks its lookup tables into compact,
+            key-interned dicts, then a full collection runs and
+            :func:`gc.freeze` moves every surviving object into the
+            permanent generation. Later collections in the parent or in
+            children then never touch those objects, so their memory pages
+            stay shared copy-on-write. Call this once, immediately before
+            forking workers.
     """
-    for loader_name, loader in get_prewarm_loaders():
-        loader()
-        logger.debug("pre-warmed %s", loader_name)
+    targets = get_prewarm_targets()
+    for target_name, target in targets:
+        target.ensure_loaded()
+        logger.debug("pre-warmed %s", target_name)
 
     logger.debug("bluetooth-sig registries pre-warmed")
+
+    if freeze:
+        for target_name, target in targets:
+            target.compact()
+            logger.debug("compacted %s", target_name)
+
+        gc.collect()
+        gc.freeze()
+        logger.debug("bluetooth-sig registries frozen (%d objects in permanent generation)", gc.get_freeze_count())
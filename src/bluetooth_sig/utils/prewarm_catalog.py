@@ -12,7 +12,7 @@ import importlib
 import pkgutil
 import re
 from collections.abc import Callable
-from typing import Any
+from typing import Any, Protocol
 
 from ..gatt.uuid_registry import get_uuid_registry
 from ..registry.base import BaseGenericRegistry, BaseUUIDClassRegistry, BaseUUIDRegistry
@@ -27,6 +27,19 @@ _EXTRA_DISCOVERY_MODULES: tuple[str, ...] = (
 RegistryLoader = tuple[str, Callable[[], Any]]
 
 
+class PrewarmTarget(Protocol):
+    """Registry surface used by prewarming: eager load plus post-load compaction."""
+
+    def ensure_loaded(self) -> None:
+        """Load registry data if not already loaded."""
+
+    def compact(self) -> None:
+        """Repack loaded registry data into compact containers."""
+
+
+RegistryTarget = tuple[str, PrewarmTarget]
+
+
 def _to_snake_case(name: str) -> str:
     """Convert CamelCase/PascalCase names to snake_case."""
     first_pass = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", name)
@@ -61,8 +74,8 @@ def _import_registry_modules() -> None:
         importlib.import_module(module_name)
 
 
-def _build_discovered_registry_loaders() -> tuple[RegistryLoader, ...]:
-    """Build ensure-loaded loaders from registry base-class descendants."""
+def _build_discovered_registry_targets() -> tuple[RegistryTarget, ...]:
+    """Build prewarm targets from registry base-class descendants."""
     _import_registry_modules()
 
     registry_classes: set[type[Any]] = set()
@@ -70,26 +83,30 @@ def _build_discovered_registry_loaders() -> tuple[RegistryLoader, ...]:
     registry_classes.update(_iter_subclasses(BaseUUIDRegistry))
     registry_classes.update(_iter_subclasses(BaseUUIDClassRegistry))
 
-    loaders: list[RegistryLoader] = []
+    targets: list[RegistryTarget] = []
     for registry_cls in sorted(registry_classes, key=lambda cls: f"{cls.__module__}.{cls.__qualname__}"):
-        loader_name = _to_snake_case(registry_cls.__name__.replace("Registry", "")) + "_registry"
-        loader = registry_cls.get_instance().ensure_loaded
-        loaders.append((loader_name, loader))
+        target_name = _to_snake_case(registry_cls.__name__.replace("Registry", "")) + "_registry"
+        targets.append((target_name, registry_cls.get_instance()))
 
-    return tuple(loaders)
+    return tuple(targets)
 
 
-def _build_outlier_loaders() -> tuple[RegistryLoader, ...]:
-    """Build loaders for registries that do not use shared base registry classes."""
-    return (("uuid_registry", lambda: get_uuid_registry().ensure_loaded()),)
+def _build_outlier_targets() -> tuple[RegistryTarget, ...]:
+    """Build targets for registries that do not use shared base registry classes."""
+    return (("uuid_registry", get_uuid_registry()),)
 
 
 @functools.lru_cache(maxsize=1)
-def _cached_prewarm_loaders() -> tuple[RegistryLoader, ...]:
-    """Build and cache the full prewarm loader list."""
-    return _build_discovered_registry_loaders() + _build_outlier_loaders()
+def _cached_prewarm_targets() -> tuple[RegistryTarget, ...]:
+    """Build and cache the full prewarm target list."""
+    return _build_discovered_registry_targets() + _build_outlier_targets()
+
+
+def get_prewarm_targets() -> tuple[RegistryTarget, ...]:
+    """Return cached prewarm targets (name, registry instance), building discovery state on first call."""
+    return _cached_prewarm_targets()
 
 
 def get_prewarm_loaders() -> tuple[RegistryLoader, ...]:
     """Return cached prewarm loaders, building discovery state on first call."""
-    return _cached_prewarm_loaders()
+    return tuple((name, target.ensure_loaded) for name, target in _cached_prewarm_targets())
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import gc
+import threading
 import time
+import tracemalloc
+import weakref
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
-from typing import Any, TypeVar
+from typing import Any, TypeVar, cast
 
 import msgspec
 
+from ..types.parse_outcome import ParseOutcome
+
 T = TypeVar("T")
 
 
@@ -211,3 +217,310 @@ def format_comparison(results: dict[str, TimingResult], baseline: str | None = N
         lines.append(f"{name:<30} {avg_str:<15} {throughput_str:<20} {comparison}")
 
     return "\n".join(lines)
+
+
+class MemoryResult(msgspec.Struct, kw_only=True):
+    """Result of a memory measurement."""
+
+    operation: str
+    count: int
+    retained_bytes: int
+    peak_bytes: int
+    per_item_bytes: float
+
+    def __str__(self) -> str:
+        """Format memory result as human-readable string."""
+        return (
+            f"{self.operation}:\n"
+            f"  Items:     {self.count}\n"
+            f"  Retained:  {self.retained_bytes / 1024:.1f} KiB\n"
+            f"  Peak:      {self.peak_bytes / 1024:.1f} KiB\n"
+            f"  Per item:  {self.per_item_bytes:.0f} bytes"
+        )
+
+
+def measure_memory(
+    func: Callable[[], Any],
+    count: int = 1,
+    operation: str = "function",
+) -> MemoryResult:
+    """Measure memory retained by the objects a function creates.
+
+    Args:
+        func: Function to measure (should take no arguments). Whatever it
+            returns is kept alive until the measurement ends, so return the
+            objects whose footprint should be counted.
+        count: Number of items *func* creates, for the per-item figure
+        operation: Name of the operation for reporting
+
+    Returns:
+        MemoryResult with retained and peak bytes
+
+    Example::
+        >>> result = measure_memory(
+        ...     lambda: [HeartRateMeasurementCharacteristic() for _ in range(100)],
+        ...     count=100,
+        ...     operation="Heart Rate Measurement instances",
+        ... )
+        >>> print(result)
+
+    Note:
+        Uses :mod:`tracemalloc`, so only allocations made through Python's
+        allocators are counted. Tracing is started for the call if it is not
+        already running, and a collection runs first so that earlier garbage
+        does not distort the baseline.
+
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        kept = func()
+        gc.collect()
+        after, peak = tracemalloc.get_traced_memory()
+        del kept
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    retained = after - before
+    return MemoryResult(
+        operation=operation,
+        count=count,
+        retained_bytes=retained,
+        peak_bytes=peak - before,
+        per_item_bytes=retained / count if count else 0.0,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Parse telemetry
+# ---------------------------------------------------------------------------
+
+# Latency histogram bucket ``i`` counts parses taking at most 2**i nanoseconds
+# (and more than 2**(i-1)). The last bucket also takes anything slower than
+# ~1.1 s, so it is only exported as the +Inf bucket.
+TELEMETRY_BUCKET_COUNT = 32
+
+
+class _CharacteristicCounters:
+    """Mutable per-thread counters for one characteristic UUID."""
+
+    __slots__ = ("buckets", "calls", "errors", "name", "special_values", "total_ns")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.special_values = 0
+        self.total_ns = 0
+        self.buckets = [0] * TELEMETRY_BUCKET_COUNT
+
+    def add(self, other: _CharacteristicCounters) -> None:
+        """Add *other*'s counts to these counters."""
+        self.calls += other.calls
+        self.errors += other.errors
+        self.special_values += other.special_values
+        self.total_ns += other.total_ns
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets, strict=True)]
+
+
+class _ShardOwner:
+    """Thread-local marker whose collection signals that its thread has exited."""
+
+    __slots__ = ("__weakref__",)
+
+
+class CharacteristicParseStats(msgspec.Struct, frozen=True, kw_only=True):
+    """Aggregated parse statistics for one characteristic UUID.
+
+    Attributes:
+        uuid: Characteristic UUID string
+        name: Characteristic name
+        calls: Total parse calls
+        errors: Parses that raised ``CharacteristicParseError``
+        special_values: Parses that detected a special sentinel value
+        total_ns: Summed parse latency in nanoseconds
+        latency_buckets: Log2 latency histogram; bucket ``i`` counts parses
+            taking at most ``2**i`` ns, the last bucket any slower parse
+
+    """
+
+    uuid: str
+    name: str
+    calls: int
+    errors: int
+    special_values: int
+    total_ns: int
+    latency_buckets: tuple[int, ...]
+
+    @property
+    def mean_ns(self) -> float:
+        """Mean parse latency in nanoseconds."""
+        return self.total_ns / self.calls if self.calls else 0.0
+
+
+class TelemetrySnapshot(msgspec.Struct, frozen=True, kw_only=True):
+    """Point-in-time view of all parse telemetry."""
+
+    characteristics: dict[str, CharacteristicParseStats]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export as plain builtins (JSON-serialisable)."""
+        return cast("dict[str, Any]", msgspec.to_builtins(self))
+
+    def to_prometheus(self, prefix: str = "bluetooth_sig_parse") -> str:
+        """Export in Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Exposition text with counters and a cumulative latency histogram
+            (in seconds) per characteristic UUID.
+
+        """
+        lines = [
+            f"# TYPE {prefix}_calls_total counter",
+            f"# TYPE {prefix}_errors_total counter",
+            f"# TYPE {prefix}_special_values_total counter",
+            f"# TYPE {prefix}_duration_seconds histogram",
+        ]
+        for stats in self.characteristics.values():
+            name = stats.name.replace("\\", "\\\\").replace('"', '\\"')
+            labels = f'uuid="{stats.uuid}",name="{name}"'
+            lines.append(f"{prefix}_calls_total{{{labels}}} {stats.calls}")
+            lines.append(f"{prefix}_errors_total{{{labels}}} {stats.errors}")
+            lines.append(f"{prefix}_special_values_total{{{labels}}} {stats.special_values}")
+            cumulative = 0
+            # The last bucket is open-ended and is covered by +Inf
+            for index, count in enumerate(stats.latency_buckets[:-1]):
+                cumulative += count
+                upper_seconds = (1 << index) / 1e9
+                lines.append(f'{prefix}_duration_seconds_bucket{{{labels},le="{upper_seconds:.9g}"}} {cumulative}')
+            lines.append(f'{prefix}_duration_seconds_bucket{{{labels},le="+Inf"}} {stats.calls}')
+            lines.append(f"{prefix}_duration_seconds_sum{{{labels}}} {stats.total_ns / 1e9:.9g}")
+            lines.append(f"{prefix}_duration_seconds_count{{{labels}}} {stats.calls}")
+        return "\n".join(lines) + "\n"
+
+
+class ParseTelemetry:
+    r"""Opt-in, low-overhead per-characteristic parse metrics.
+
+    Each thread records into its own shard, so recording takes no locks;
+    :meth:`snapshot` merges all shards. When a thread exits, its shard is
+    folded into a shared total and dropped. When disabled (the default) the
+    parse pipeline skips telemetry after a single attribute check.
+
+    Example::
+        >>> from bluetooth_sig.utils.profiling import parse_telemetry
+        >>> parse_telemetry.enable()
+        >>> translator.parse_characteristic("2A19", b"\\x64")
+        >>> print(parse_telemetry.snapshot().to_prometheus())
+
+    """
+
+    def __init__(self) -> None:
+        """Initialise disabled, with no recorded data."""
+        self.enabled = False
+        self._local = threading.local()
+        self._shards: dict[int, dict[str, _CharacteristicCounters]] = {}
+        self._retired: dict[str, _CharacteristicCounters] = {}
+        self._shards_lock = threading.Lock()
+
+    def enable(self) -> None:
+        """Start recording parse metrics."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording parse metrics (recorded data is kept)."""
+        self.enabled = False
+
+    def _shard(self) -> dict[str, _CharacteristicCounters]:
+        """Return the calling thread's shard, creating it on first use."""
+        try:
+            return cast("dict[str, _CharacteristicCounters]", self._local.shard)
+        except AttributeError:
+            shard: dict[str, _CharacteristicCounters] = {}
+            owner = _ShardOwner()
+            with self._shards_lock:
+                self._shards[id(shard)] = shard
+            # Thread-local values are released when the thread exits
+            weakref.finalize(owner, self._retire, shard)
+            self._local.shard = shard
+            self._local.owner = owner
+            return shard
+
+    def _retire(self, shard: dict[str, _CharacteristicCounters]) -> None:
+        """Fold the shard of an exited thread into the retired totals."""
+        with self._shards_lock:
+            if self._shards.pop(id(shard), None) is None:
+                return
+            for uuid, counters in shard.items():
+                total = self._retired.get(uuid)
+                if total is None:
+                    total = self._retired[uuid] = _CharacteristicCounters(counters.name)
+                total.add(counters)
+
+    def record(self, uuid: str, name: str, elapsed_ns: int, outcome: ParseOutcome) -> None:
+        """Record one parse.
+
+        Args:
+            uuid: Characteristic UUID string
+            name: Characteristic name
+            elapsed_ns: Parse latency in nanoseconds
+            outcome: Parse outcome category
+
+        """
+        shard = self._shard()
+        counters = shard.get(uuid)
+        if counters is None:
+            counters = shard[uuid] = _CharacteristicCounters(name)
+        counters.calls += 1
+        counters.total_ns += elapsed_ns
+        counters.buckets[min((elapsed_ns - 1 if elapsed_ns else 0).bit_length(), TELEMETRY_BUCKET_COUNT - 1)] += 1
+        if outcome is ParseOutcome.ERROR:
+            counters.errors += 1
+        elif outcome is ParseOutcome.SPECIAL_VALUE:
+            counters.special_values += 1
+
+    def snapshot(self) -> TelemetrySnapshot:
+        """Merge all thread shards into an immutable snapshot."""
+        with self._shards_lock:
+            shards = [dict(shard) for shard in self._shards.values()]
+            shards.append(dict(self._retired))
+
+        merged: dict[str, CharacteristicParseStats] = {}
+        for shard in shards:
+            for uuid, counters in shard.items():
+                previous = merged.get(uuid)
+                buckets = tuple(counters.buckets)
+                if previous is not None:
+                    buckets = tuple(a + b for a, b in zip(previous.latency_buckets, buckets, strict=True))
+                merged[uuid] = CharacteristicParseStats(
+                    uuid=uuid,
+                    name=counters.name,
+                    calls=counters.calls + (previous.calls if previous else 0),
+                    errors=counters.errors + (previous.errors if previous else 0),
+                    special_values=counters.special_values + (previous.special_values if previous else 0),
+                    total_ns=counters.total_ns + (previous.total_ns if previous else 0),
+                    latency_buckets=buckets,
+                )
+        return TelemetrySnapshot(characteristics=merged)
+
+    def reset(self) -> None:
+        """Discard all recorded data.
+
+        Increments racing with a reset on other threads may be lost.
+        """
+        with self._shards_lock:
+            for shard in self._shards.values():
+                shard.clear()
+            self._retired.clear()
+
+
+# Process-wide telemetry used by the characteristic parse pipeline.
+parse_telemetry = ParseTelemetry()
@@ -0,0 +1,118 @@
+"""Read-only registry snapshots for process-pool workers.
+
+A snapshot holds every SIG YAML document the registries loaded, re-encoded
+as msgpack behind a small header. The parent writes it once; each worker
+memory-maps the file read-only and installs it as the registry document
+source, so registry loading in workers skips file parsing entirely and
+decodes each document straight out of the shared page cache on first use.
+
+Class-based registries (characteristics, services) are rebuilt from module
+imports as usual; their UUID and GSS resolution reads the snapshot data.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+from collections.abc import Mapping
+from pathlib import Path
+
+import msgspec
+
+from ..registry.utils import get_loaded_documents, set_document_source
+from .prewarm import prewarm_registries
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"BTSIGRS1"
+
+# Keeps attached snapshot buffers alive: installed documents are views into them.
+_attached_buffers: list[mmap.mmap] = []
+
+
+def encode_registry_snapshot(documents: Mapping[str, msgspec.Raw]) -> bytes:
+    """Encode msgpack-encoded YAML documents into snapshot bytes.
+
+    Args:
+        documents: msgpack-encoded documents keyed by YAML path, as returned
+            by :func:`~bluetooth_sig.registry.utils.get_loaded_documents`
+
+    Returns:
+        Snapshot bytes (header followed by a msgpack path → document map)
+    """
+    return SNAPSHOT_MAGIC + msgspec.msgpack.encode(dict(documents))
+
+
+def build_registry_snapshot() -> bytes:
+    """Load every registry and encode all documents they read into a snapshot.
+
+    Documents are taken as kept when they were loaded; no file is read again.
+
+    Returns:
+        Snapshot bytes suitable for :func:`load_registry_snapshot`
+    """
+    prewarm_registries()
+    return encode_registry_snapshot(get_loaded_documents())
+
+
+def load_registry_snapshot(buffer: bytes | memoryview | mmap.mmap) -> int:
+    """Install snapshot documents as the registry document source.
+
+    Documents are referenced in place, so *buffer* must stay alive (and
+    unmodified) for as long as registries may load. Registries that are
+    already loaded in this process are not affected.
+
+    Args:
+        buffer: Snapshot bytes, e.g. a ``multiprocessing.shared_memory``
+            buffer or a memory-mapped snapshot file
+
+    Returns:
+        Number of documents installed
+
+    Raises:
+        ValueError: If *buffer* does not start with the snapshot header
+    """
+    view = memoryview(buffer)
+    header_len = len(SNAPSHOT_MAGIC)
+    if view[:header_len] != SNAPSHOT_MAGIC:
+        raise ValueError("Buffer is not a bluetooth-sig registry snapshot")
+
+    documents = msgspec.msgpack.decode(view[header_len:], type=dict[str, msgspec.Raw])
+    set_document_source(documents)
+    logger.debug("installed registry snapshot with %d documents", len(documents))
+    return len(documents)
+
+
+def write_registry_snapshot(path: Path) -> Path:
+    """Build a registry snapshot and write it to *path*.
+
+    Args:
+        path: Destination file
+
+    Returns:
+        The written path
+    """
+    path.write_bytes(build_registry_snapshot())
+    return path
+
+
+def attach_registry_snapshot(path: Path) -> int:
+    """Memory-map a snapshot file read-only and install it.
+
+    Intended as a ``ProcessPoolExecutor`` initializer: all workers map the
+    same file, so the snapshot occupies the page cache once per host.
+
+    Args:
+        path: Snapshot file written by :func:`write_registry_snapshot`
+
+    Returns:
+        Number of documents installed
+
+    Raises:
+        ValueError: If the file is not a registry snapshot
+    """
+    with path.open("rb") as file_handle:
+        mapped = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+    count = load_registry_snapshot(mapped)
+    _attached_buffers.append(mapped)
+    return count
@@ -0,0 +1,323 @@
+"""Bulk msgspec serialization of parse results.
+
+:class:`ResultEncoder` turns batches of parsed characteristic values into
+msgpack or JSON bytes in a single ``msgspec`` encoder call. Each result
+type gets a precomputed encoding plan, so per value only the fields that
+need converting are touched:
+
+* ``IntFlag`` / ``Flag`` → ``int``
+* other ``Enum`` members (including ``IntEnum``) → member name
+* ``datetime`` → Unix epoch seconds (naive datetimes are taken as UTC)
+* ``timedelta`` → seconds
+* nested structs, tuples, lists and dicts are converted recursively
+
+:class:`ResultDecoder` reverses the plan to rebuild typed values for replay.
+"""
+
+from __future__ import annotations
+
+import datetime
+import enum
+from collections.abc import Callable, Iterable
+from typing import Any, Generic, Literal, TypeVar
+
+import msgspec
+
+T = TypeVar("T")
+
+SerializationFormat = Literal["msgpack", "json"]
+
+Converter = Callable[[Any], Any]
+
+_UTC = datetime.timezone.utc
+
+
+def _enum_name(value: enum.Enum) -> str:
+    return value.name
+
+
+def _datetime_to_epoch(value: datetime.datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=_UTC)
+    return value.timestamp()
+
+
+def _timedelta_to_seconds(value: datetime.timedelta) -> float:
+    return value.total_seconds()
+
+
+def _enum_converter(enum_cls: type[enum.Enum]) -> Converter:
+    return int if issubclass(enum_cls, enum.Flag) else _enum_name
+
+
+def _enum_from_name(enum_cls: type[enum.Enum]) -> Converter:
+    def convert(name: str) -> enum.Enum:
+        try:
+            return enum_cls[name]
+        except KeyError:
+            raise msgspec.ValidationError(f"Invalid {enum_cls.__name__} member name: {name!r}") from None
+
+    return convert
+
+
+def _sequence(item: Converter) -> Converter:
+    return lambda values: [item(value) for value in values]
+
+
+def _optional(inner: Converter) -> Converter:
+    return lambda value: None if value is None else inner(value)
+
+
+def _struct_fields(fields: list[tuple[str, Converter]]) -> Converter:
+    def convert(value: msgspec.Struct) -> dict[str, Any]:
+        result = msgspec.structs.asdict(value)
+        for name, field_converter in fields:
+            result[name] = field_converter(result[name])
+        return result
+
+    return convert
+
+
+def _make_encoder(fmt: SerializationFormat) -> msgspec.msgpack.Encoder | msgspec.json.Encoder:
+    if fmt == "msgpack":
+        return msgspec.msgpack.Encoder()
+    if fmt == "json":
+        return msgspec.json.Encoder()
+    raise ValueError(f"Unsupported serialization format: {fmt!r}")
+
+
+def _make_decoder(fmt: SerializationFormat) -> msgspec.msgpack.Decoder[Any] | msgspec.json.Decoder[Any]:
+    if fmt == "msgpack":
+        return msgspec.msgpack.Decoder()
+    if fmt == "json":
+        return msgspec.json.Decoder()
+    raise ValueError(f"Unsupported serialization format: {fmt!r}")
+
+
+class ResultEncoder:
+    """Serialize parsed characteristic values to msgpack or JSON bytes.
+
+    Encoding plans are compiled on first use of each result type and cached
+    on the encoder, so a long-lived instance should be reused.
+
+    Example::
+        >>> encoder = ResultEncoder("json")
+        >>> payload = encoder.encode_batch([heart_rate_data, indoor_bike_data])
+
+    """
+
+    def __init__(self, fmt: SerializationFormat = "msgpack") -> None:
+        """Initialise the encoder.
+
+        Args:
+            fmt: Output format, ``"msgpack"`` or ``"json"``
+
+        Raises:
+            ValueError: If *fmt* is not supported
+
+        """
+        self.format = fmt
+        self._encoder = _make_encoder(fmt)
+        # type -> converter, or None when msgspec can encode the value as-is
+        self._plans: dict[type, Converter | None] = {}
+
+    def to_builtins(self, value: Any) -> Any:  # noqa: ANN401  # Any parse result
+        """Convert one parse result into its encodable form.
+
+        Args:
+            value: Parsed characteristic value
+
+        Returns:
+            *value* with enums, datetimes and timedeltas converted
+
+        """
+        value_type = type(value)
+        try:
+            plan = self._plans[value_type]
+        except KeyError:
+            plan = self._compile_type(value_type)
+        return value if plan is None else plan(value)
+
+    def encode(self, value: Any) -> bytes:  # noqa: ANN401  # Any parse result
+        """Serialize a single parse result.
+
+        Args:
+            value: Parsed characteristic value
+
+        Returns:
+            Encoded bytes
+
+        """
+        return self._encoder.encode(self.to_builtins(value))
+
+    def encode_batch(self, values: Iterable[Any]) -> bytes:
+        """Serialize a batch of parse results as one array.
+
+        Args:
+            values: Parsed characteristic values (types may be mixed)
+
+        Returns:
+            Encoded bytes of an array with one entry per value
+
+        """
+        to_builtins = self.to_builtins
+        return self._encoder.encode([to_builtins(value) for value in values])
+
+    def _compile_type(self, value_type: type) -> Converter | None:
+        """Build and cache the plan for a runtime value type."""
+        plan: Converter | None
+        if issubclass(value_type, msgspec.Struct):
+            plan = self._compile(msgspec.inspect.type_info(value_type))
+        elif issubclass(value_type, enum.Enum):
+            plan = _enum_converter(value_type)
+        elif issubclass(value_type, datetime.datetime):
+            plan = _datetime_to_epoch
+        elif issubclass(value_type, datetime.timedelta):
+            plan = _timedelta_to_seconds
+        elif issubclass(value_type, (tuple, list)):
+            plan = _sequence(self.to_builtins)
+        elif issubclass(value_type, dict):
+            to_builtins = self.to_builtins
+            plan = lambda mapping: {key: to_builtins(item) for key, item in mapping.items()}  # noqa: E731
+        else:
+            plan = None
+        self._plans[value_type] = plan
+        return plan
+
+    def _compile(self, field_type: msgspec.inspect.Type) -> Converter | None:  # noqa: PLR0911  # One branch per type kind
+        """Build the converter for a declared field type (``None`` = as-is)."""
+        if isinstance(field_type, msgspec.inspect.StructType):
+            fields = [(f.name, conv) for f in field_type.fields if (conv := self._compile(f.type)) is not None]
+            return _struct_fields(fields) if fields else None
+        if isinstance(field_type, msgspec.inspect.EnumType):
+            return _enum_converter(field_type.cls)
+        if isinstance(field_type, msgspec.inspect.DateTimeType):
+            return _datetime_to_epoch
+        if isinstance(field_type, msgspec.inspect.TimeDeltaType):
+            return _timedelta_to_seconds
+        if isinstance(field_type, (msgspec.inspect.VarTupleType, msgspec.inspect.ListType)):
+            item = self._compile(field_type.item_type)
+            return None if item is None else _sequence(item)
+        if isinstance(field_type, msgspec.inspect.DictType):
+            value_converter = self._compile(field_type.value_type)
+            if value_converter is None:
+                return None
+            return lambda mapping: {key: value_converter(item) for key, item in mapping.items()}
+        if isinstance(field_type, msgspec.inspect.UnionType):
+            members = [t for t in field_type.types if not isinstance(t, msgspec.inspect.NoneType)]
+            converters = [self._compile(member) for member in members]
+            if all(conv is None for conv in converters):
+                return None
+            if len(members) == 1 and converters[0] is not None:
+                return _optional(converters[0])
+            return self.to_builtins
+        if isinstance(field_type, (msgspec.inspect.AnyType, msgspec.inspect.TupleType, msgspec.inspect.CustomType)):
+            return self.to_builtins
+        return None
+
+
+class ResultDecoder(Generic[T]):
+    """Rebuild typed parse results from :class:`ResultEncoder` output.
+
+    Example::
+        >>> decoder = ResultDecoder(HeartRateData, "json")
+        >>> values = decoder.decode_batch(payload)
+
+    """
+
+    def __init__(self, result_type: type[T], fmt: SerializationFormat = "msgpack") -> None:
+        """Initialise the decoder for one result type.
+
+        Args:
+            result_type: Type every decoded value is rebuilt as
+            fmt: Input format, ``"msgpack"`` or ``"json"``
+
+        Raises:
+            ValueError: If *fmt* is not supported
+
+        """
+        self.result_type = result_type
+        self.format = fmt
+        self._decoder = _make_decoder(fmt)
+        self._plan = self._compile(msgspec.inspect.type_info(result_type))
+        self._batch_type: Any = list[result_type]  # type: ignore[valid-type]
+
+    def decode(self, data: bytes) -> T:
+        """Decode one serialized result.
+
+        Args:
+            data: Bytes produced by :meth:`ResultEncoder.encode`
+
+        Returns:
+            The rebuilt value
+
+        Raises:
+            msgspec.ValidationError: If the data does not match ``result_type``
+
+        """
+        raw = self._decoder.decode(data)
+        if self._plan is not None:
+            raw = self._plan(raw)
+        return msgspec.convert(raw, self.result_type)
+
+    def decode_batch(self, data: bytes) -> list[T]:
+        """Decode a serialized batch.
+
+        Args:
+            data: Bytes produced by :meth:`ResultEncoder.encode_batch`
+
+        Returns:
+            The rebuilt values, in order
+
+        Raises:
+            msgspec.ValidationError: If the data does not match ``result_type``
+
+        """
+        raw = self._decoder.decode(data)
+        if self._plan is not None:
+            plan = self._plan
+            raw = [plan(item) for item in raw]
+        return msgspec.convert(raw, self._batch_type)  # type: ignore[no-any-return]
+
+    def _compile(self, field_type: msgspec.inspect.Type) -> Converter | None:
+        """Build the inverse converter for a declared type (``None`` = as-is)."""
+        if isinstance(field_type, msgspec.inspect.StructType):
+            fields = [(f.name, conv) for f in field_type.fields if (conv := self._compile(f.type)) is not None]
+            if not fields:
+                return None
+
+            def convert(mapping: dict[str, Any]) -> dict[str, Any]:
+                for name, field_converter in fields:
+                    if name in mapping:
+                        mapping[name] = field_converter(mapping[name])
+                return mapping
+
+            return convert
+        if isinstance(field_type, msgspec.inspect.EnumType):
+            enum_cls = field_type.cls
+            # Flags were encoded as ints, which msgspec.convert handles natively.
+            return None if issubclass(enum_cls, enum.Flag) else _enum_from_name(enum_cls)
+        if isinstance(field_type, msgspec.inspect.DateTimeType):
+            aware = field_type.tz is True
+
+            def from_epoch(seconds: float) -> datetime.datetime:
+                value = datetime.datetime.fromtimestamp(seconds, tz=_UTC)
+                return value if aware else value.replace(tzinfo=None)
+
+            return from_epoch
+        if isinstance(field_type, msgspec.inspect.TimeDeltaType):
+            return lambda seconds: datetime.timedelta(seconds=seconds)
+        if isinstance(field_type, (msgspec.inspect.VarTupleType, msgspec.inspect.ListType)):
+            item = self._compile(field_type.item_type)
+            return None if item is None else _sequence(item)
+        if isinstance(field_type, msgspec.inspect.DictType):
+            value_converter = self._compile(field_type.value_type)
+            if value_converter is None:
+                return None
+            return lambda mapping: {key: value_converter(item) for key, item in mapping.items()}
+        if isinstance(field_type, msgspec.inspect.UnionType):
+            members = [t for t in field_type.types if not isinstance(t, msgspec.inspect.NoneType)]
+            # Only Optional[X] can be reversed unambiguously; other unions decode as-is.
+            if len(members) == 1 and (inner := self._compile(members[0])) is not None:
+                return _optional(inner)
+        return None
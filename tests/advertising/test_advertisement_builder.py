@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 import pytest
 
 from bluetooth_sig.types.ad_types_constants import ADType
 from bluetooth_sig.types.advertising.builder import (
     AD_STRUCTURE_MAX_DATA_SIZE,
+    EXTENDED_ADVERTISING_MAX_SIZE,
     ADStructure,
     AdvertisementBuilder,
+    MutableAdvertisementBuilder,
     encode_manufacturer_data,
     encode_service_uuids_16bit,
     encode_service_uuids_128bit,
@@ -267,6 +271,89 @@ class TestMixedUUIDs:
         assert ADType.COMPLETE_128BIT_SERVICE_UUIDS in types
 
 
+class TestMutableAdvertisementBuilder:
+    """Tests for the buffer-backed mutable builder."""
+
+    def test_matches_immutable_builder(self) -> None:
+        """Test every add_* method encodes exactly like its with_* counterpart."""
+        custom_uuid = "12345678-1234-1234-1234-123456789abc"
+        immutable = (
+            AdvertisementBuilder()
+            .with_extended_advertising()
+            .with_flags(BLEAdvertisingFlags.LE_GENERAL_DISCOVERABLE_MODE)
+            .with_complete_local_name("Sensor")
+            .with_shortened_local_name("Sen")
+            .with_tx_power(-8)
+            .with_appearance(0x0340)
+            .with_service_uuids(["180F", custom_uuid])
+            .with_manufacturer_data(CompanyIdentifier.from_id(0x004C), b"\x02\x15")
+            .with_service_data("181A", b"\x01\x02")
+            .with_service_data(custom_uuid, b"\x03")
+        )
+        mutable = (
+            MutableAdvertisementBuilder(EXTENDED_ADVERTISING_MAX_SIZE)
+            .add_flags(BLEAdvertisingFlags.LE_GENERAL_DISCOVERABLE_MODE)
+            .add_complete_local_name("Sensor")
+            .add_shortened_local_name("Sen")
+            .add_tx_power(-8)
+            .add_appearance(0x0340)
+            .add_service_uuids(["180F", custom_uuid])
+            .add_manufacturer_data(CompanyIdentifier.from_id(0x004C), b"\x02\x15")
+            .add_service_data(0x181A, b"\x01\x02")
+            .add_service_data(custom_uuid, b"\x03")
+        )
+        assert mutable.build() == immutable.build()
+        assert bytes(mutable.view()) == immutable.build()
+        assert mutable.current_size() == immutable.current_size()
+        assert immutable.to_mutable().build() == immutable.build()
+
+    def test_reset_reuses_buffer(self) -> None:
+        """Test reset empties the payload so the builder can be reused."""
+        builder = MutableAdvertisementBuilder().add_complete_local_name("First")
+        first = builder.build()
+        second = builder.reset().add_flags(0x06).build()
+        assert first == bytes([0x06, ADType.COMPLETE_LOCAL_NAME]) + b"First"
+        assert second == bytes([0x02, ADType.FLAGS, 0x06])
+        assert builder.remaining_space() == 28
+
+    def test_legacy_limit_enforced_on_add(self) -> None:
+        """Test exceeding 31 bytes raises immediately and leaves the payload intact."""
+        builder = MutableAdvertisementBuilder().add_flags(0x06)
+        with pytest.raises(ValueError, match="Advertising payload too large"):
+            builder.add_complete_local_name("x" * 27)
+        assert builder.build() == bytes([0x02, ADType.FLAGS, 0x06])
+        builder.add_complete_local_name("x" * 26)
+        assert len(builder) == 31
+
+    def test_structure_data_limit(self) -> None:
+        """Test a single structure cannot exceed the AD structure maximum."""
+        builder = MutableAdvertisementBuilder(300)
+        with pytest.raises(ValueError, match="AD structure data too long"):
+            builder.add_raw_structure(0xFF, bytes(AD_STRUCTURE_MAX_DATA_SIZE + 1))
+
+    @pytest.mark.parametrize(
+        "add",
+        [
+            lambda builder: builder.add_tx_power(200),
+            lambda builder: builder.add_tx_power(-128),
+            lambda builder: builder.add_appearance(0x10000),
+            lambda builder: builder.add_flags(0x100),
+            lambda builder: builder.add_manufacturer_data(0x10000, b"ab"),
+            lambda builder: builder.add_manufacturer_data(-1, b"ab"),
+            lambda builder: builder.add_service_data(0x10000, b"\x01"),
+            lambda builder: builder.add_service_uuids(["180F", "12345678-1234-1234-1234-123456789abc"]),
+        ],
+    )
+    def test_rejected_add_leaves_payload_unchanged(self, add: Callable[[MutableAdvertisementBuilder], object]) -> None:
+        """Test out-of-range values and partial UUID lists raise ValueError without committing anything."""
+        builder = MutableAdvertisementBuilder().add_flags(0x06).add_complete_local_name("x" * 8)
+        before = builder.build()
+        with pytest.raises(ValueError):
+            add(builder)
+        assert builder.build() == before
+        assert builder.add_tx_power(0).build() == before + bytes([0x02, ADType.TX_POWER_LEVEL, 0x00])
+
+
 def _decode_ad_structures(payload: bytes) -> list[tuple[int, bytes]]:
     """Decode AD structures from payload for testing.
 
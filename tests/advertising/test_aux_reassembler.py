@@ -0,0 +1,219 @@
+"""Tests for reassembly of extended advertisements chained across AUX PDUs."""
+
+from __future__ import annotations
+
+import pytest
+
+from bluetooth_sig.advertising import AuxChainReassembler
+from bluetooth_sig.types.address import mac_address_to_bytes
+from bluetooth_sig.types.advertising.builder import AdvertisementBuilder
+from bluetooth_sig.types.advertising.pdu import ExtendedHeaderFlags, PDUType
+
+ADDRESS = "AA:BB:CC:DD:EE:FF"
+OTHER_ADDRESS = "11:22:33:44:55:66"
+AUX_PTR = bytes([0x05, 0x10, 0x00])  # Channel 5, 30 µs offset units; contents are not interpreted
+
+
+def _pdu(payload: bytes, *, sid: int, did: int, address: str | None = ADDRESS, more: bool = False) -> bytes:
+    """Build an extended advertising PDU carrying AdvA (optional), ADI and optionally AuxPtr."""
+    adv_mode = ExtendedHeaderFlags.ADV_DATA_INFO
+    fields = b""
+    if address is not None:
+        adv_mode |= ExtendedHeaderFlags.ADV_ADDR
+        fields += mac_address_to_bytes(address)[::-1]  # AdvA is sent least significant byte first
+    fields += (did | sid << 12).to_bytes(2, "little")
+    if more:
+        adv_mode |= ExtendedHeaderFlags.AUX_PTR
+        fields += AUX_PTR
+    extended_header = bytes([len(fields) + 1, adv_mode]) + fields
+    header = bytes([PDUType.ADV_EXT_IND | 0x40, 0x00])
+    return header + bytes([len(extended_header) + len(payload)]) + extended_header + payload
+
+
+def _chain(payload: bytes, *, sid: int = 1, did: int = 0x123, size: int = 40, address: str = ADDRESS) -> list[bytes]:
+    """Split *payload* into a chain: AdvA on the first fragment only, AuxPtr on all but the last."""
+    parts = [payload[i : i + size] for i in range(0, len(payload), size)]
+    return [
+        _pdu(
+            part,
+            sid=sid,
+            did=did,
+            address=address if index == 0 else None,
+            more=index < len(parts) - 1,
+        )
+        for index, part in enumerate(parts)
+    ]
+
+
+LONG_NAME = "Extended advertising sensor with a long name"
+PAYLOAD = (
+    AdvertisementBuilder()
+    .with_extended_advertising()
+    .with_complete_local_name(LONG_NAME)
+    .with_manufacturer_data(0x004C, bytes(range(40)))
+    .with_service_uuids(["180d", "180f"])
+    .build()
+)
+
+
+class _Clock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAuxChainReassembler:
+    """Test chain reassembly, limits and duplicate suppression."""
+
+    def test_reassembles_chain_in_order(self) -> None:
+        """Test fragments are stitched into one advertisement on the final PDU."""
+        reassembler = AuxChainReassembler()
+        fragments = _chain(PAYLOAD)
+        assert len(fragments) > 2
+
+        results = [reassembler.feed(fragment, rssi=-55) for fragment in fragments]
+
+        assert results[:-1] == [None] * (len(fragments) - 1)
+        advertisement = results[-1]
+        assert advertisement is not None
+        assert advertisement.raw_data == fragments[0]
+        assert advertisement.rssi == -55
+        assert advertisement.extended is not None
+        assert advertisement.extended.extended_payload == PAYLOAD
+        assert len(advertisement.extended.auxiliary_packets) == len(fragments) - 1
+        core = advertisement.ad_structures.core
+        assert core.local_name == LONG_NAME
+        assert core.manufacturer_data[0x004C].payload == bytes(range(40))
+        assert reassembler.pending_count == 0
+        assert reassembler.stats.completed == 1
+
+    def test_single_pdu_completes_immediately(self) -> None:
+        """Test a PDU without AuxPtr is a complete one-fragment chain."""
+        reassembler = AuxChainReassembler()
+        advertisement = reassembler.feed(_pdu(PAYLOAD[:30], sid=2, did=7))
+        assert advertisement is not None
+        assert advertisement.extended is not None
+        assert advertisement.extended.auxiliary_packets == []
+
+    def test_duplicate_did_dropped(self) -> None:
+        """Test a repeated chain with the same DID is dropped at its first fragment."""
+        reassembler = AuxChainReassembler()
+        for fragment in _chain(PAYLOAD):
+            reassembler.feed(fragment)
+
+        repeat = _chain(PAYLOAD)
+        assert reassembler.feed(repeat[0]) is None
+        assert reassembler.pending_count == 0
+        assert reassembler.stats.duplicates == 1
+        # Its AdvA-less continuations then match nothing
+        assert all(reassembler.feed(fragment) is None for fragment in repeat[1:])
+        assert reassembler.stats.orphaned == len(repeat) - 1
+        assert reassembler.stats.completed == 1
+
+        # New data (new DID) from the same set is delivered
+        assert [reassembler.feed(fragment) for fragment in _chain(PAYLOAD, did=0x124)][-1] is not None
+
+    def test_deduplicate_disabled(self) -> None:
+        """Test repeated chains are delivered when duplicate suppression is off."""
+        reassembler = AuxChainReassembler(deduplicate=False)
+        for _ in range(2):
+            assert [reassembler.feed(fragment) for fragment in _chain(PAYLOAD)][-1] is not None
+        assert reassembler.stats.completed == 2
+
+    def test_incomplete_chain_times_out(self) -> None:
+        """Test a chain that stops receiving fragments is dropped after the timeout."""
+        clock = _Clock()
+        reassembler = AuxChainReassembler(timeout=0.5, clock=clock)
+        fragments = _chain(PAYLOAD)
+        reassembler.feed(fragments[0])
+        assert reassembler.pending_count == 1
+
+        clock.now = 0.6
+        assert reassembler.feed(fragments[1]) is None
+        assert reassembler.pending_count == 0
+        assert reassembler.stats.timed_out == 1
+        assert reassembler.stats.orphaned == 1
+
+    def test_explicit_timestamps(self) -> None:
+        """Test timestamps passed to feed drive expiry instead of the clock."""
+        reassembler = AuxChainReassembler(timeout=1.0)
+        fragments = _chain(PAYLOAD)
+        reassembler.feed(fragments[0], timestamp=10.0)
+        assert reassembler.expire(10.5) == 0
+        assert reassembler.feed(fragments[1], timestamp=10.9) is None
+        assert reassembler.expire(11.5) == 0
+        assert reassembler.expire(12.0) == 1
+
+    def test_max_pending_evicts_stalest(self) -> None:
+        """Test the least recently updated chain is evicted when the limit is reached."""
+        reassembler = AuxChainReassembler(max_pending=2)
+        first = _chain(PAYLOAD, sid=1)
+        second = _chain(PAYLOAD, sid=2)
+        third = _chain(PAYLOAD, sid=3)
+        reassembler.feed(first[0])
+        reassembler.feed(second[0])
+        reassembler.feed(first[1], ADDRESS)  # First chain is now the most recent
+        reassembler.feed(third[0])
+
+        assert reassembler.pending_count == 2
+        assert reassembler.stats.evicted == 1
+        assert reassembler.feed(second[1]) is None
+        assert reassembler.stats.orphaned == 1
+        assert [reassembler.feed(fragment) for fragment in first[2:]][-1] is not None
+
+    def test_oversized_chain_dropped(self) -> None:
+        """Test a chain exceeding the maximum data length is discarded."""
+        reassembler = AuxChainReassembler(max_data_length=60)
+        results = [reassembler.feed(fragment) for fragment in _chain(PAYLOAD)]
+        assert results == [None] * len(results)
+        assert reassembler.stats.oversized == 1
+        assert reassembler.pending_count == 0
+
+    def test_new_did_supersedes_pending_chain(self) -> None:
+        """Test a set starting new data abandons its incomplete chain."""
+        reassembler = AuxChainReassembler()
+        reassembler.feed(_chain(PAYLOAD, did=1)[0])
+        results = [reassembler.feed(fragment) for fragment in _chain(PAYLOAD, did=2)]
+        assert results[-1] is not None
+        assert reassembler.stats.superseded == 1
+
+    def test_interleaved_advertisers(self) -> None:
+        """Test chains from different advertisers with the same ADI stay separate."""
+        reassembler = AuxChainReassembler()
+        ours = _chain(PAYLOAD)
+        theirs = _chain(PAYLOAD[::-1], address=OTHER_ADDRESS)
+        results: dict[str, object] = {}
+        for mine, other in zip(ours, theirs, strict=True):
+            # Identical ADIs make AdvA-less fragments ambiguous, so the receiver supplies the address
+            results[ADDRESS] = reassembler.feed(mine, ADDRESS) or results.get(ADDRESS)
+            results[OTHER_ADDRESS] = reassembler.feed(other, OTHER_ADDRESS) or results.get(OTHER_ADDRESS)
+        assert reassembler.stats.completed == 2
+        assert reassembler.stats.orphaned == 0
+
+    def test_ambiguous_continuation_is_orphaned(self) -> None:
+        """Test an AdvA-less fragment matching several pending chains is not guessed."""
+        reassembler = AuxChainReassembler()
+        reassembler.feed(_chain(PAYLOAD)[0])
+        reassembler.feed(_chain(PAYLOAD, address=OTHER_ADDRESS)[0])
+        assert reassembler.feed(_chain(PAYLOAD)[1]) is None
+        assert reassembler.stats.orphaned == 1
+        assert reassembler.pending_count == 2
+
+    def test_invalid_pdus_counted(self) -> None:
+        """Test PDUs that are too short or lack an ADI are rejected."""
+        reassembler = AuxChainReassembler()
+        no_adi = bytes([PDUType.ADV_EXT_IND, 0x00, 0x02, 0x01, 0x00])
+        assert reassembler.feed(b"\x07\x00") is None
+        assert reassembler.feed(no_adi) is None
+        assert reassembler.stats.invalid == 2
+
+    def test_rejects_non_positive_limits(self) -> None:
+        """Test limits must be positive."""
+        with pytest.raises(ValueError, match="positive"):
+            AuxChainReassembler(max_pending=0)
+        with pytest.raises(ValueError, match="positive"):
+            AuxChainReassembler(timeout=0)
@@ -0,0 +1,150 @@
+"""Tests for per-device advertisement change detection."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import msgspec
+import pytest
+
+from bluetooth_sig.advertising import AdvertisementChangeTracker
+from bluetooth_sig.advertising.change_detection import SCALAR_FIELD
+from bluetooth_sig.types.advertising.ad_structures import AdvertisingDataStructures, CoreAdvertisingData
+from bluetooth_sig.types.advertising.result import AdvertisementData
+from bluetooth_sig.types.company import ManufacturerData
+from bluetooth_sig.types.uuid import BluetoothUUID
+
+BTHOME_UUID = BluetoothUUID("FCD2")
+
+
+def _advertisement(
+    manufacturer: dict[int, bytes] | None = None,
+    service: dict[BluetoothUUID, bytes] | None = None,
+    local_name: str = "",
+    interpreted: object = None,
+) -> AdvertisementData:
+    core = CoreAdvertisingData(
+        manufacturer_data={
+            cid: ManufacturerData.from_id_and_payload(cid, payload) for cid, payload in (manufacturer or {}).items()
+        },
+        service_data=service or {},
+        local_name=local_name,
+    )
+    return AdvertisementData(ad_structures=AdvertisingDataStructures(core=core), rssi=-60, interpreted_data=interpreted)
+
+
+class _Reading(msgspec.Struct, frozen=True):
+    temperature: float
+    battery: int
+
+
+@dataclasses.dataclass
+class _DataclassReading:
+    temperature: float
+
+
+class TestPayloadChanges:
+    """Test raw AD element change detection."""
+
+    def test_first_advertisement_reports_everything(self) -> None:
+        """Test every element of the first advertisement is new."""
+        tracker = AdvertisementChangeTracker()
+        changes = tracker.observe(_advertisement({0x004C: b"\x01"}, {BTHOME_UUID: b"\x40"}, "Sensor"))
+        assert changes is not None
+        assert changes.manufacturer_data[0x004C].payload == b"\x01"
+        assert changes.service_data == {BTHOME_UUID: b"\x40"}
+        assert changes.local_name == "Sensor"
+
+    def test_identical_advertisement_skipped_without_interpreting(self) -> None:
+        """Test a repeated payload reports nothing and never calls interpret."""
+        tracker = AdvertisementChangeTracker()
+        calls: list[int] = []
+
+        def interpret() -> int:
+            calls.append(1)
+            return 5
+
+        advertisement = _advertisement({0x004C: b"\x01"}, local_name="Sensor")
+        assert tracker.observe(advertisement, interpret) is not None
+        assert tracker.observe(_advertisement({0x004C: b"\x01"}, local_name="Sensor"), interpret) is None
+        assert len(calls) == 1
+
+    def test_only_changed_elements_reported(self) -> None:
+        """Test unchanged elements are omitted and missing ones are not removals."""
+        tracker = AdvertisementChangeTracker()
+        tracker.observe(_advertisement({0x004C: b"\x01", 0x0006: b"\x02"}, {BTHOME_UUID: b"\x40"}))
+        changes = tracker.observe(_advertisement({0x004C: b"\x01", 0x0006: b"\x03"}))
+        assert changes is not None
+        assert list(changes.manufacturer_data) == [0x0006]
+        assert changes.service_data == {}
+        assert tracker.observe(_advertisement(service={BTHOME_UUID: b"\x40"})) is None
+
+    def test_reset(self) -> None:
+        """Test reset makes the next advertisement report everything again."""
+        tracker = AdvertisementChangeTracker()
+        advertisement = _advertisement({0x004C: b"\x01"})
+        tracker.observe(advertisement)
+        tracker.reset()
+        assert tracker.observe(advertisement) is not None
+
+
+class TestValueChanges:
+    """Test interpreted field change detection and thresholds."""
+
+    def test_struct_fields_diffed(self) -> None:
+        """Test only the struct fields that changed are reported."""
+        tracker = AdvertisementChangeTracker()
+        tracker.observe(_advertisement({1: b"\x01"}), lambda: _Reading(temperature=20.0, battery=90))
+        changes = tracker.observe(_advertisement({1: b"\x02"}), lambda: _Reading(temperature=20.5, battery=90))
+        assert changes is not None
+        assert changes.values == {"temperature": 20.5}
+
+    def test_threshold_deadband_accumulates(self) -> None:
+        """Test small moves are held back until they add up past the threshold."""
+        tracker = AdvertisementChangeTracker({"temperature": 0.5})
+        readings = [20.0, 20.2, 20.4, 20.6, 20.7]
+        reported = []
+        for index, temperature in enumerate(readings):
+            changes = tracker.observe(_advertisement({1: bytes([index])}), lambda t=temperature: {"temperature": t})
+            reported.append(changes.values["temperature"] if changes is not None else None)
+        assert reported == [20.0, None, None, 20.6, None]
+
+    def test_default_threshold_and_non_numeric_fields(self) -> None:
+        """Test the default threshold covers numbers only; other fields report any change."""
+        tracker = AdvertisementChangeTracker(default_threshold=5)
+        tracker.observe(_advertisement({1: b"\x01"}), lambda: {"battery": 90, "mode": "idle", "ok": True})
+        changes = tracker.observe(_advertisement({1: b"\x02"}), lambda: {"battery": 88, "mode": "run", "ok": False})
+        assert changes is not None
+        assert changes.values == {"mode": "run", "ok": False}
+
+    def test_payload_change_without_value_change_suppressed(self) -> None:
+        """Test a rolling counter in the payload alone does not notify."""
+        tracker = AdvertisementChangeTracker()
+        tracker.observe(_advertisement({1: b"\x01\x10"}), lambda: {"temperature": 20.0})
+        assert tracker.observe(_advertisement({1: b"\x02\x10"}), lambda: {"temperature": 20.0}) is None
+
+    def test_scalar_and_dataclass_values(self) -> None:
+        """Test scalars and dataclasses are flattened into named fields."""
+        scalar = AdvertisementChangeTracker()
+        changes = scalar.observe(_advertisement({1: b"\x01"}), lambda: 42)
+        assert changes is not None
+        assert changes.values == {SCALAR_FIELD: 42}
+        record = AdvertisementChangeTracker()
+        changes = record.observe(_advertisement({1: b"\x01"}), lambda: _DataclassReading(temperature=1.5))
+        assert changes is not None
+        assert changes.values == {"temperature": 1.5}
+
+    def test_uses_interpreted_data_by_default(self) -> None:
+        """Test the advertisement's own interpreted_data is diffed without a callable."""
+        tracker = AdvertisementChangeTracker()
+        tracker.observe(_advertisement({1: b"\x01"}, interpreted={"temperature": 1.0}))
+        changes = tracker.observe(_advertisement({1: b"\x02"}, interpreted={"temperature": 2.0}))
+        assert changes is not None
+        assert changes.values == {"temperature": 2.0}
+
+    def test_negative_threshold_rejected(self) -> None:
+        """Test negative thresholds are rejected."""
+        with pytest.raises(ValueError, match="negative"):
+            AdvertisementChangeTracker({"temperature": -1})
+        with pytest.raises(ValueError, match="negative"):
+            AdvertisementChangeTracker(default_threshold=-0.1)
@@ -0,0 +1,223 @@
+"""Tests for following periodic advertising trains."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator
+
+import pytest
+
+from bluetooth_sig.advertising import AdvertisementSynthesizer, PeriodicAdvertisingTracker
+from bluetooth_sig.types.address import mac_address_to_bytes
+from bluetooth_sig.types.advertising.pdu import ExtendedHeaderFlags, PDUType
+
+ADDRESS = "AA:BB:CC:DD:EE:FF"
+SID = 3
+INTERVAL_UNITS = 80  # 100 ms
+INTERVAL = INTERVAL_UNITS * 0.00125
+AUX_PTR = bytes([0x05, 0x10, 0x00])
+
+
+def _pdu(payload: bytes, *, fields: bytes = b"", adv_mode: int = 0) -> bytes:
+    """Build an extended PDU from extended header fields and AdvData."""
+    extended_header = bytes([len(fields) + 1, adv_mode]) + fields
+    header = bytes([PDUType.ADV_EXT_IND | 0x40, 0x00])
+    return header + bytes([len(extended_header) + len(payload)]) + extended_header + payload
+
+
+def _aux_adv_ind(*, sync_counter: int, interval: int = INTERVAL_UNITS) -> bytes:
+    """Build an AUX_ADV_IND announcing a periodic train through SyncInfo."""
+    sync_info = bytes(2) + interval.to_bytes(2, "little") + bytes(12) + sync_counter.to_bytes(2, "little")
+    fields = mac_address_to_bytes(ADDRESS)[::-1] + (SID << 12 | 1).to_bytes(2, "little") + sync_info
+    adv_mode = ExtendedHeaderFlags.ADV_ADDR | ExtendedHeaderFlags.ADV_DATA_INFO | ExtendedHeaderFlags.SYNC_INFO
+    return _pdu(b"", fields=fields, adv_mode=adv_mode)
+
+
+class _PeriodicTrainGenerator:  # pylint: disable=too-few-public-methods
+    """Synthetic periodic advertiser: AUX_SYNC_IND (+ AUX_CHAIN_IND) PDUs per event.
+
+    Data changes every ``change_every`` events (bumping the DID) and each
+    event is lost with probability ``loss``. Yields ``(event_counter,
+    timestamp, pdu)`` for every PDU received, and records the ground truth.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        seed: int,
+        *,
+        change_every: int = 10,
+        loss: float = 0.0,
+        chain_size: int | None = None,
+        with_adi: bool = True,
+        first_counter: int = 0,
+    ) -> None:
+        self._rng = random.Random(seed)
+        self._synthesizer = AdvertisementSynthesizer(seed=seed, extended_ratio=1.0)
+        self.change_every = change_every
+        self.loss = loss
+        self.chain_size = chain_size
+        self.with_adi = with_adi
+        self.counter = first_counter
+        self.received_events = 0
+        self.lost_events = 0
+        self.changes_received: list[bytes] = []
+
+    def events(self, count: int) -> Iterator[tuple[int, float, bytes]]:
+        did = 0
+        data = b""
+        last_received_data: bytes | None = None
+        for index in range(count):
+            if index % self.change_every == 0:
+                did = (did + 1) & 0x0FFF
+                data = self._synthesizer.generate(extended=True)
+            counter = (self.counter + index) & 0xFFFF
+            if index and self._rng.random() < self.loss:
+                self.lost_events += 1
+                continue
+            self.received_events += 1
+            if data != last_received_data:
+                self.changes_received.append(data)
+                last_received_data = data
+            timestamp = index * INTERVAL
+            for offset, pdu in enumerate(self._event_pdus(data, did)):
+                yield counter, timestamp + offset * 0.001, pdu
+
+    def _event_pdus(self, data: bytes, did: int) -> list[bytes]:
+        size = self.chain_size or len(data) or 1
+        parts = [data[i : i + size] for i in range(0, len(data), size)] or [b""]
+        pdus = []
+        for index, part in enumerate(parts):
+            fields = (SID << 12 | did).to_bytes(2, "little") if self.with_adi else b""
+            adv_mode = ExtendedHeaderFlags.ADV_DATA_INFO if self.with_adi else 0
+            if index < len(parts) - 1:
+                fields += AUX_PTR
+                adv_mode |= ExtendedHeaderFlags.AUX_PTR
+            pdus.append(_pdu(part, fields=fields, adv_mode=adv_mode))
+        return pdus
+
+
+class TestPeriodicAdvertisingTracker:
+    """Test train following, change detection and per-train statistics."""
+
+    def test_synchronize_from_aux_adv_ind(self) -> None:
+        """Test SyncInfo provides the train's identity and interval."""
+        tracker = PeriodicAdvertisingTracker()
+        train = tracker.synchronize_from_pdu(_aux_adv_ind(sync_counter=500))
+        assert train is not None
+        assert (train.address, train.sid) == (ADDRESS, SID)
+        assert train.interval == pytest.approx(INTERVAL)
+        assert train.last_event_counter == 499
+        assert tracker.get_train(ADDRESS, SID) is train
+        assert tracker.synchronize_from_pdu(_pdu(b"\x02\x01\x06")) is None
+
+    def test_only_changed_data_is_parsed(self) -> None:
+        """Test events repeating the DID are skipped and changes are delivered once."""
+        generator = _PeriodicTrainGenerator(seed=1, change_every=10)
+        tracker = PeriodicAdvertisingTracker()
+        delivered = [
+            result
+            for counter, _, pdu in generator.events(100)
+            if (result := tracker.feed(ADDRESS, SID, pdu, event_counter=counter)) is not None
+        ]
+        assert [result.extended.periodic_advertising_data for result in delivered if result.extended] == (
+            generator.changes_received
+        )
+        stats = tracker.trains[0].stats
+        assert (stats.events, stats.updates, stats.duplicates, stats.missed_events) == (100, 10, 90, 0)
+        assert stats.duplicate_ratio == pytest.approx(0.9)
+        assert tracker.trains[0].latest is delivered[-1]
+
+    def test_parsed_periodic_data(self) -> None:
+        """Test delivered events carry the parsed AD structures."""
+        generator = _PeriodicTrainGenerator(seed=2, change_every=1)
+        tracker = PeriodicAdvertisingTracker()
+        for counter, _, pdu in generator.events(5):
+            advertisement = tracker.feed(ADDRESS, SID, pdu, event_counter=counter)
+            assert advertisement is not None
+            assert advertisement.ad_structures.properties.flags is not None
+
+    def test_chained_events_reassembled(self) -> None:
+        """Test AUX_CHAIN_IND fragments are stitched, and skipped for duplicate DIDs."""
+        generator = _PeriodicTrainGenerator(seed=3, change_every=5, chain_size=20)
+        tracker = PeriodicAdvertisingTracker()
+        delivered = [
+            result.extended.periodic_advertising_data
+            for counter, _, pdu in generator.events(50)
+            if (result := tracker.feed(ADDRESS, SID, pdu, event_counter=counter)) is not None and result.extended
+        ]
+        assert delivered == generator.changes_received
+        stats = tracker.trains[0].stats
+        assert (stats.events, stats.updates, stats.duplicates, stats.incomplete) == (50, 10, 40, 0)
+
+    def test_missed_events_from_counter(self) -> None:
+        """Test event counter gaps are counted as missed events, across wraparound."""
+        generator = _PeriodicTrainGenerator(seed=4, loss=0.3, first_counter=0xFFC0)
+        tracker = PeriodicAdvertisingTracker()
+        for counter, _, pdu in generator.events(200):
+            tracker.feed(ADDRESS, SID, pdu, event_counter=counter)
+        stats = tracker.trains[0].stats
+        assert generator.lost_events > 0
+        assert stats.events == generator.received_events
+        assert stats.missed_events == generator.lost_events
+        assert stats.missed_ratio == pytest.approx(generator.lost_events / 200)
+
+    def test_missed_events_from_timestamps(self) -> None:
+        """Test missed events are inferred from the interval without an event counter."""
+        generator = _PeriodicTrainGenerator(seed=5, loss=0.2, chain_size=30)
+        tracker = PeriodicAdvertisingTracker()
+        tracker.synchronize(ADDRESS, SID).interval = INTERVAL
+        for _, timestamp, pdu in generator.events(200):
+            tracker.feed(ADDRESS, SID, pdu, timestamp=timestamp)
+        stats = tracker.trains[0].stats
+        assert stats.events == generator.received_events
+        assert stats.missed_events == generator.lost_events
+        assert stats.incomplete == 0
+
+    def test_missed_events_from_sync_counter(self) -> None:
+        """Test events missed before the first one received count against SyncInfo's counter."""
+        tracker = PeriodicAdvertisingTracker()
+        tracker.synchronize_from_pdu(_aux_adv_ind(sync_counter=10))
+        tracker.feed(ADDRESS, SID, _pdu(b"\x02\x01\x06"), event_counter=13)
+        assert tracker.trains[0].stats.missed_events == 3
+
+    def test_without_adi_compares_payloads(self) -> None:
+        """Test unchanged data is still skipped when the PDUs carry no ADI."""
+        generator = _PeriodicTrainGenerator(seed=6, change_every=4, with_adi=False)
+        tracker = PeriodicAdvertisingTracker()
+        delivered = [tracker.feed(ADDRESS, SID, pdu, event_counter=counter) for counter, _, pdu in generator.events(40)]
+        stats = tracker.trains[0].stats
+        assert sum(result is not None for result in delivered) == stats.updates == 10
+        assert stats.duplicates == 30
+
+    def test_truncated_chain_counted_incomplete(self) -> None:
+        """Test an event whose chain stops early is dropped when the next event starts."""
+        tracker = PeriodicAdvertisingTracker()
+        adi = (SID << 12 | 1).to_bytes(2, "little")
+        adv_mode = ExtendedHeaderFlags.ADV_DATA_INFO
+        first = _pdu(b"\x02\x01", fields=adi + AUX_PTR, adv_mode=adv_mode | ExtendedHeaderFlags.AUX_PTR)
+        assert tracker.feed(ADDRESS, SID, first, event_counter=1) is None
+        complete = _pdu(b"\x02\x01\x06", fields=adi, adv_mode=adv_mode)
+        assert tracker.feed(ADDRESS, SID, complete, event_counter=2) is not None
+        stats = tracker.trains[0].stats
+        assert (stats.events, stats.incomplete, stats.updates) == (2, 1, 1)
+
+    def test_stale_and_invalid_pdus(self) -> None:
+        """Test out-of-order events are ignored and malformed PDUs counted."""
+        tracker = PeriodicAdvertisingTracker()
+        pdu = _pdu(b"\x02\x01\x06")
+        tracker.feed(ADDRESS, SID, pdu, event_counter=100)
+        assert tracker.feed(ADDRESS, SID, _pdu(b"\x02\x01\x04"), event_counter=99) is None
+        assert tracker.feed(ADDRESS, SID, b"\x07\x00") is None
+        stats = tracker.trains[0].stats
+        assert (stats.events, stats.invalid) == (1, 1)
+
+    def test_trains_are_independent(self) -> None:
+        """Test each (address, SID) pair keeps its own state, and terminate forgets it."""
+        tracker = PeriodicAdvertisingTracker()
+        pdu = _pdu(b"\x02\x01\x06")
+        assert tracker.feed(ADDRESS, 1, pdu) is not None
+        assert tracker.feed(ADDRESS, 2, pdu) is not None
+        assert tracker.feed(ADDRESS, 1, pdu) is None
+        assert len(tracker.trains) == 2
+        assert tracker.terminate(ADDRESS, 1) is not None
+        assert tracker.get_train(ADDRESS, 1) is None
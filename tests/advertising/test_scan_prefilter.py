@@ -0,0 +1,119 @@
+"""Tests for scan filters compiled to run on raw advertising payloads."""
+
+from __future__ import annotations
+
+import pytest
+
+from bluetooth_sig.advertising import AdvertisementSynthesizer, AdvertisingPDUParser, CompiledScanFilter
+from bluetooth_sig.types.ad_types_constants import ADType
+from bluetooth_sig.types.advertising.builder import AdvertisementBuilder
+from bluetooth_sig.types.advertising.result import AdvertisementData
+from bluetooth_sig.types.device_types import ScanFilter, ScannedDevice
+
+ADDRESS = "AA:BB:CC:DD:EE:FF"
+CUSTOM_UUID = "12345678-9ABC-DEF0-1234-56789ABCDEF0"
+
+FILTERS = [
+    ScanFilter(service_uuids=["180d"]),
+    ScanFilter(service_uuids=["0000180f-0000-1000-8000-00805f9b34fb", "fcd2"]),
+    ScanFilter(manufacturer_ids=[0x004C]),
+    ScanFilter(manufacturer_ids=[0x0059, 0x0499], service_uuids=["181a"]),
+    ScanFilter(names=["a", "Z"]),
+    ScanFilter(names=["b"], manufacturer_ids=[0x0006]),
+    ScanFilter(rssi_threshold=-60),
+    ScanFilter(addresses=[ADDRESS.lower()], service_uuids=["fe95"]),
+]
+
+
+def _scanned(payload: bytes, parser: AdvertisingPDUParser, rssi: int) -> ScannedDevice:
+    structures = parser.parse_advertising_data(payload).ad_structures
+    return ScannedDevice(
+        address=ADDRESS,
+        name=structures.core.local_name or None,
+        advertisement_data=AdvertisementData(ad_structures=structures, rssi=rssi),
+    )
+
+
+class TestCompiledScanFilter:
+    """Test raw-payload decisions against ScanFilter.matches on parsed data."""
+
+    @pytest.mark.parametrize("scan_filter", FILTERS, ids=range(len(FILTERS)))
+    def test_agrees_with_matches(self, scan_filter: ScanFilter) -> None:
+        """Test the compiled filter accepts exactly the payloads matches() accepts."""
+        compiled = CompiledScanFilter(scan_filter)
+        parser = AdvertisingPDUParser()
+        accepted = 0
+        for index, payload in enumerate(AdvertisementSynthesizer(seed=11, extended_ratio=0.3).stream(1500)):
+            rssi = -40 - index % 50
+            expected = scan_filter.matches(_scanned(payload, parser, rssi))
+            assert compiled.accepts(payload, ADDRESS, rssi) is expected, payload.hex()
+            accepted += expected
+        assert 0 < accepted < 1500
+
+    def test_uuid_widths(self) -> None:
+        """Test 16/32/128-bit lists and service data all match a filter UUID."""
+        compiled = CompiledScanFilter(ScanFilter(service_uuids=["180d", CUSTOM_UUID]))
+        custom = bytes.fromhex(CUSTOM_UUID.replace("-", ""))
+        assert compiled.accepts(bytes([0x05, ADType.COMPLETE_16BIT_SERVICE_UUIDS, 0x0F, 0x18, 0x0D, 0x18]))
+        assert compiled.accepts(bytes([0x05, ADType.COMPLETE_32BIT_SERVICE_UUIDS, 0x0D, 0x18, 0x00, 0x00]))
+        assert compiled.accepts(bytes([0x04, ADType.SERVICE_DATA_16BIT, 0x0D, 0x18, 0x01]))
+        assert compiled.accepts(bytes([0x11, ADType.COMPLETE_128BIT_SERVICE_UUIDS]) + custom)
+        assert compiled.accepts(bytes([0x12, ADType.SERVICE_DATA_128BIT]) + custom + b"\x01")
+        assert not compiled.accepts(bytes([0x03, ADType.COMPLETE_16BIT_SERVICE_UUIDS, 0x0F, 0x18]))
+        assert not compiled.accepts(bytes([0x05, ADType.COMPLETE_32BIT_SERVICE_UUIDS, 0x0D, 0x18, 0x01, 0x00]))
+
+    def test_all_criteria_required(self) -> None:
+        """Test payload criteria combine with AND, like ScanFilter.matches."""
+        compiled = CompiledScanFilter(ScanFilter(service_uuids=["180d"], manufacturer_ids=[0x004C]))
+        uuid_only = AdvertisementBuilder().with_service_uuids(["180d"]).build()
+        both = AdvertisementBuilder().with_service_uuids(["180d"]).with_manufacturer_data(0x004C, b"\x01").build()
+        assert not compiled.accepts(uuid_only)
+        assert compiled.accepts(both)
+
+    def test_address_and_rssi(self) -> None:
+        """Test address and RSSI criteria are checked without the payload."""
+        compiled = CompiledScanFilter(ScanFilter(addresses=[ADDRESS.lower()], rssi_threshold=-70))
+        assert compiled.accepts(b"", ADDRESS, -50)
+        assert not compiled.accepts(b"", ADDRESS, -80)
+        assert not compiled.accepts(b"", "11:22:33:44:55:66", -50)
+        assert not compiled.accepts(b"", None, -50)
+        assert not compiled.accepts(b"", ADDRESS, None)
+
+    def test_truncated_structures_stop_scan(self) -> None:
+        """Test a structure overrunning the payload ends the scan, as in the parser."""
+        compiled = CompiledScanFilter(ScanFilter(service_uuids=["180d"]))
+        assert not compiled.accepts(bytes([0x09, ADType.COMPLETE_16BIT_SERVICE_UUIDS, 0x0D, 0x18]))
+        assert not compiled.accepts(bytes([0x00, 0x03, ADType.COMPLETE_16BIT_SERVICE_UUIDS, 0x0D, 0x18]))
+
+    def test_scan_response_criteria(self) -> None:
+        """Test a name or UUID only present in the scan response is found there."""
+        compiled = CompiledScanFilter(ScanFilter(names=["thermo"], service_uuids=["181a"]))
+        advertising = AdvertisementBuilder().with_service_uuids(["181a"]).build()
+        scan_response = AdvertisementBuilder().with_complete_local_name("Thermometer").build()
+        device = _scanned(advertising + scan_response, AdvertisingPDUParser(), -50)
+        assert ScanFilter(names=["thermo"], service_uuids=["181a"]).matches(device)
+        assert compiled.accepts(advertising, scan_response=scan_response)
+        assert compiled.accepts(scan_response, scan_response=advertising)
+        assert not compiled.accepts(advertising)
+        assert not compiled.accepts(
+            advertising, scan_response=AdvertisementBuilder().with_complete_local_name("Scale").build()
+        )
+
+    def test_post_filter_flag(self) -> None:
+        """Test filter_func is reported as still needing the full match."""
+        assert CompiledScanFilter(ScanFilter(filter_func=lambda _device: True)).needs_post_filter
+        assert not CompiledScanFilter(ScanFilter(names=["x"])).needs_post_filter
+
+
+class TestScanFilterManufacturerIds:
+    """Test the manufacturer_ids criterion on parsed devices."""
+
+    def test_matches_company_id(self) -> None:
+        """Test only devices advertising a listed company identifier match."""
+        parser = AdvertisingPDUParser()
+        apple = AdvertisementBuilder().with_manufacturer_data(0x004C, b"\x02\x15").build()
+        nordic = AdvertisementBuilder().with_manufacturer_data(0x0059, b"\x01").build()
+        scan_filter = ScanFilter(manufacturer_ids=[0x004C])
+        assert scan_filter.matches(_scanned(apple, parser, -50))
+        assert not scan_filter.matches(_scanned(nordic, parser, -50))
+        assert not scan_filter.matches(ScannedDevice(address=ADDRESS))
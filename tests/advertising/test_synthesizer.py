@@ -0,0 +1,74 @@
+"""Tests for the seeded advertisement synthesizer."""
+
+from __future__ import annotations
+
+from itertools import islice
+
+import pytest
+
+from bluetooth_sig.advertising import AdvertisementSynthesizer, AdvertisingPDUParser
+from bluetooth_sig.types.ad_types_constants import ADType
+
+SINGLETON_TYPES = {
+    ADType.FLAGS,
+    ADType.COMPLETE_LOCAL_NAME,
+    ADType.SHORTENED_LOCAL_NAME,
+    ADType.TX_POWER_LEVEL,
+    ADType.APPEARANCE,
+}
+
+
+def _structures(payload: bytes) -> list[tuple[int, bytes]]:
+    """Split a payload into (ad_type, data), asserting it is well formed."""
+    structures: list[tuple[int, bytes]] = []
+    offset = 0
+    while offset < len(payload):
+        length = payload[offset]
+        assert length >= 1
+        assert offset + 1 + length <= len(payload)
+        structures.append((payload[offset + 1], payload[offset + 2 : offset + 1 + length]))
+        offset += 1 + length
+    return structures
+
+
+class TestAdvertisementSynthesizer:
+    """Test determinism and validity of synthesized payloads."""
+
+    def test_same_seed_same_stream(self) -> None:
+        """Test a seed fully determines the stream."""
+        first = list(AdvertisementSynthesizer(seed=7).stream(200))
+        second = list(AdvertisementSynthesizer(seed=7).stream(200))
+        assert first == second
+        assert first != list(AdvertisementSynthesizer(seed=8).stream(200))
+
+    def test_payloads_are_spec_valid(self) -> None:
+        """Test size limits, well-formed structures, leading flags and unique singletons."""
+        parser = AdvertisingPDUParser()
+        for payload in AdvertisementSynthesizer(seed=3, extended_ratio=0.5).stream(2000):
+            assert len(payload) <= 254
+            structures = _structures(payload)
+            assert structures[0][0] == ADType.FLAGS
+            types = [ad_type for ad_type, _ in structures]
+            for ad_type in SINGLETON_TYPES:
+                assert types.count(ad_type) <= 1
+            parsed = parser.parse_advertising_data(payload)
+            assert parsed.ad_structures.properties.flags is not None
+
+    def test_legacy_and_extended_modes(self) -> None:
+        """Test forced modes respect their payload limits and extended payloads grow larger."""
+        synthesizer = AdvertisementSynthesizer(seed=1)
+        legacy = list(synthesizer.stream(500, extended=False))
+        extended = list(synthesizer.stream(500, extended=True))
+        assert max(map(len, legacy)) <= 31
+        assert max(map(len, extended)) > 31
+        mixed = _structures(max(extended, key=len))
+        assert {ADType.SERVICE_DATA_16BIT, ADType.MANUFACTURER_SPECIFIC_DATA} & {t for t, _ in mixed}
+
+    def test_endless_stream(self) -> None:
+        """Test stream() without a count keeps producing payloads."""
+        assert len(list(islice(AdvertisementSynthesizer().stream(), 5000))) == 5000
+
+    def test_invalid_ratio(self) -> None:
+        """Test the extended ratio is validated."""
+        with pytest.raises(ValueError):
+            AdvertisementSynthesizer(extended_ratio=1.5)
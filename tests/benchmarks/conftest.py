@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 
 from bluetooth_sig import BluetoothSIGTranslator
+from bluetooth_sig.advertising import AdvertisementSynthesizer
 
 # Mark all benchmark tests to be excluded by default
 pytestmark = pytest.mark.benchmark
@@ -65,3 +66,30 @@ def batch_characteristics_medium() -> dict[str, bytearray]:
         "2A27": bytearray(b"HW1"),  # Hardware Revision
         "2A28": bytearray(b"SW1"),  # Software Revision
     }
+
+
+# Fifty characteristics that all accept a two-byte 0x01 0x00 payload, including
+# feature/measurement pairs with declared dependencies (e.g. CSC Measurement/Feature).
+BATCH_50_UUIDS = (
+    *("2A00", "2A01", "2A06", "2A07", "2A09", "2A0E", "2A0F", "2A12", "2A13", "2A16"),
+    *("2A17", "2A19", "2A1D", "2A21", "2A22", "2A24", "2A25", "2A26", "2A27", "2A28"),
+    *("2A29", "2A2A", "2A2C", "2A31", "2A38", "2A39", "2A41", "2A42", "2A43", "2A44"),
+    *("2A45", "2A46", "2A47", "2A48", "2A49", "2A4B", "2A4D", "2A51", "2A52", "2A54"),
+    *("2A55", "2A56", "2A58", "2A5A", "2A5B", "2A5C", "2A5D", "2A60", "2A64", "2A66"),
+)
+
+
+@pytest.fixture
+def batch_characteristics_large() -> dict[str, bytearray]:
+    """Fifty-characteristic batch for benchmarking."""
+    return {uuid: bytearray([0x01, 0x00]) for uuid in BATCH_50_UUIDS}
+
+
+# Packets per advertising/device benchmark round; throughput is reported per packet.
+ADVERTISEMENT_CORPUS_SIZE = 500
+
+
+@pytest.fixture(scope="session")
+def advertisement_corpus() -> list[bytes]:
+    """Seeded mix of legacy and extended advertising payloads."""
+    return list(AdvertisementSynthesizer(seed=0x5EED).stream(ADVERTISEMENT_CORPUS_SIZE))
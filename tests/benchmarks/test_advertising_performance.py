@@ -0,0 +1,386 @@
+"""Throughput benchmarks for the advertising scan path and device notifications.
+
+Every benchmark processes a whole corpus per round and records the corpus size
+in ``extra_info["packets"]`` so ``scripts/update_benchmark_history.py`` can
+track packets/sec alongside the per-round timings.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import pytest
+
+from bluetooth_sig import BluetoothSIGTranslator
+from bluetooth_sig.advertising import (
+    AdvertisementSynthesizer,
+    AuxChainReassembler,
+    CompiledScanFilter,
+    PeriodicAdvertisingTracker,
+)
+from bluetooth_sig.advertising.base import AdvertisingData, DataSource, InterpreterInfo, PayloadInterpreter
+from bluetooth_sig.advertising.ead_decryptor import EADDecryptor, build_ead_nonce
+from bluetooth_sig.advertising.pdu_parser import AdvertisingPDUParser
+from bluetooth_sig.advertising.registry import PayloadContext, PayloadInterpreterRegistry, parse_advertising_payloads
+from bluetooth_sig.advertising.service_data_parser import ServiceDataParser
+from bluetooth_sig.advertising.sig_characteristic_interpreter import SIGCharacteristicInterpreter
+from bluetooth_sig.advertising.state import DeviceAdvertisingState
+from bluetooth_sig.device import Device
+from bluetooth_sig.device.client import ClientManagerProtocol
+from bluetooth_sig.gatt.characteristics import (
+    GlucoseMeasurementCharacteristic,
+    GlucoseMeasurementContextCharacteristic,
+    HeartRateMeasurementCharacteristic,
+)
+from bluetooth_sig.stream import DependencyPairingBuffer
+from bluetooth_sig.types.address import mac_address_to_bytes
+from bluetooth_sig.types.advertising.ad_structures import AdvertisingDataStructures, CoreAdvertisingData
+from bluetooth_sig.types.advertising.pdu import ExtendedHeaderFlags, PDUType
+from bluetooth_sig.types.advertising.result import AdvertisementData
+from bluetooth_sig.types.company import ManufacturerData
+from bluetooth_sig.types.device_types import DeviceService, ScanFilter
+from bluetooth_sig.types.uuid import BluetoothUUID
+
+MAC_ADDRESS = "AA:BB:CC:DD:EE:FF"
+EAD_KEY = bytes.fromhex("0123456789abcdef0123456789abcdef")
+APPLE = 0x004C
+BTHOME_UUID = BluetoothUUID("FCD2")
+TEMPERATURE_UUID = BluetoothUUID("2A6E")
+HUMIDITY_UUID = BluetoothUUID("2A6F")
+BATTERY_LEVEL_UUID = BluetoothUUID("2A19")
+PRESSURE_UUID = BluetoothUUID("2A6D")
+HEART_RATE_MEASUREMENT_UUID = "2A37"
+
+
+def _run_corpus(benchmark: Any, corpus: Sequence[Any], handle: Callable[[Any], Any]) -> list[Any]:
+    """Benchmark *handle* over every packet of *corpus*, recording the packet count."""
+    benchmark.extra_info["packets"] = len(corpus)
+    return benchmark(lambda: [handle(packet) for packet in corpus])  # type: ignore[no-any-return]
+
+
+def _extended_pdu(payload: bytes, rng: random.Random) -> bytes:
+    """Wrap AD structures in an ADV_EXT_IND PDU with AdvA, ADI and TX power fields."""
+    adv_mode = ExtendedHeaderFlags.ADV_ADDR | ExtendedHeaderFlags.ADV_DATA_INFO | ExtendedHeaderFlags.TX_POWER
+    fields = rng.randbytes(6) + rng.randbytes(2) + rng.randint(-40, 20).to_bytes(1, "little", signed=True)
+    extended_header = bytes([len(fields) + 1, adv_mode]) + fields
+    header = bytes([PDUType.ADV_EXT_IND | 0x40, 0x00])  # TxAdd: random advertiser address
+    return header + bytes([len(extended_header) + len(payload)]) + extended_header + payload
+
+
+def _periodic_pdu(payload: bytes, did: int) -> bytes:
+    """Wrap AD structures in an AUX_SYNC_IND PDU carrying only an ADI."""
+    extended_header = bytes([3, ExtendedHeaderFlags.ADV_DATA_INFO]) + (1 << 12 | did).to_bytes(2, "little")
+    header = bytes([PDUType.ADV_EXT_IND, 0x00])
+    return header + bytes([len(extended_header) + len(payload)]) + extended_header + payload
+
+
+def _service_data_corpus(count: int) -> list[dict[BluetoothUUID, bytes]]:
+    """Environmental sensor service data carrying one to three SIG characteristics."""
+    rng = random.Random(0x2A6E)
+    writers: list[tuple[BluetoothUUID, Callable[[], bytes]]] = [
+        (TEMPERATURE_UUID, lambda: rng.randint(-4000, 4000).to_bytes(2, "little", signed=True)),
+        (HUMIDITY_UUID, lambda: rng.randint(0, 10000).to_bytes(2, "little")),
+        (BATTERY_LEVEL_UUID, lambda: bytes([rng.randint(0, 100)])),
+        (PRESSURE_UUID, lambda: rng.randint(900_000, 1_100_000).to_bytes(4, "little")),
+    ]
+    return [{uuid: write() for uuid, write in rng.sample(writers, rng.randint(1, 3))} for _ in range(count)]
+
+
+class _BenchmarkInterpreter(PayloadInterpreter[int]):
+    """Trivial interpreter returning the payload length."""
+
+    _is_base_class = True  # Registered only on the benchmark registry
+
+    @classmethod
+    def supports(cls, advertising_data: AdvertisingData) -> bool:
+        return True
+
+    def interpret(self, advertising_data: AdvertisingData, state: DeviceAdvertisingState) -> int:
+        return len(advertising_data.manufacturer_data) + len(advertising_data.service_data)
+
+
+class _AppleInterpreter(_BenchmarkInterpreter):
+    _info = InterpreterInfo(company_id=APPLE, name="Apple", data_source=DataSource.MANUFACTURER)
+
+
+class _BTHomeInterpreter(_BenchmarkInterpreter):
+    _info = InterpreterInfo(service_uuid=BTHOME_UUID, name="BTHome", data_source=DataSource.SERVICE)
+
+
+@pytest.fixture(scope="module")
+def interpreter_registry() -> PayloadInterpreterRegistry:
+    """Registry with manufacturer, service and fallback routes."""
+    registry = PayloadInterpreterRegistry()
+    for interpreter_class in (_AppleInterpreter, _BTHomeInterpreter, SIGCharacteristicInterpreter):
+        registry.register(interpreter_class)
+    return registry
+
+
+@pytest.fixture(scope="module")
+def scan_corpus(advertisement_corpus: list[bytes]) -> list[tuple[dict[int, bytes], dict[BluetoothUUID, bytes]]]:
+    """Manufacturer and service data as seen by a scanner, with SIG service data mixed in."""
+    parser = AdvertisingPDUParser()
+    service_data = _service_data_corpus(len(advertisement_corpus))
+    corpus: list[tuple[dict[int, bytes], dict[BluetoothUUID, bytes]]] = []
+    for raw, sig_service_data in zip(advertisement_corpus, service_data, strict=True):
+        core = parser.parse_advertising_data(raw).ad_structures.core
+        manufacturer = {company_id: data.payload for company_id, data in core.manufacturer_data.items()}
+        corpus.append((manufacturer, {**core.service_data, **sig_service_data}))
+    return corpus
+
+
+@pytest.mark.benchmark
+class TestAdvertisingParsePerformance:
+    """Benchmark raw advertising PDU parsing."""
+
+    def test_parse_advertising_data(self, benchmark: Any, advertisement_corpus: list[bytes]) -> None:
+        """Benchmark AD structure parsing over mixed legacy/extended payloads."""
+        parser = AdvertisingPDUParser()
+        results = _run_corpus(benchmark, advertisement_corpus, parser.parse_advertising_data)
+        assert all(result.ad_structures.properties.flags is not None for result in results)
+
+    def test_prefilter_rejects_raw_payloads(self, benchmark: Any, advertisement_corpus: list[bytes]) -> None:
+        """Benchmark rejecting payloads from raw bytes before any parsing."""
+        compiled = CompiledScanFilter(ScanFilter(service_uuids=["181A"], manufacturer_ids=[APPLE]))
+        results = _run_corpus(benchmark, advertisement_corpus, compiled.accepts)
+        assert not all(results)
+
+    def test_parse_extended_pdus(self, benchmark: Any) -> None:
+        """Benchmark ADV_EXT_IND parsing including the extended header."""
+        rng = random.Random(0xADE)
+        payloads = AdvertisementSynthesizer(seed=0xADE, extended_ratio=0.0).stream(500)
+        corpus = [_extended_pdu(payload, rng) for payload in payloads]
+        parser = AdvertisingPDUParser()
+        results = _run_corpus(benchmark, corpus, parser.parse_advertising_data)
+        assert all(result.is_extended_advertising for result in results)
+
+    def test_parse_extended_header(self, benchmark: Any) -> None:
+        """Benchmark extended PDU header parsing alone."""
+        rng = random.Random(0xEA)
+        corpus = [_extended_pdu(b"", rng) for _ in range(500)]
+        parser = AdvertisingPDUParser()
+        results = _run_corpus(benchmark, corpus, parser.parse_extended_pdu)
+        assert all(pdu is not None and pdu.extended_header.tx_power is not None for pdu in results)
+
+    def test_reassembler_drops_repeated_did(self, benchmark: Any) -> None:
+        """Benchmark dropping re-broadcast extended advertisements whose DID was already delivered."""
+        rng = random.Random(0xD1D)
+        payloads = AdvertisementSynthesizer(seed=0xD1D, extended_ratio=0.0).stream(500)
+        corpus = [_extended_pdu(payload, rng) for payload in payloads]
+        reassembler = AuxChainReassembler(max_tracked_sets=len(corpus))
+        assert all(reassembler.feed(pdu, timestamp=0.0) is not None for pdu in corpus)
+        results = _run_corpus(benchmark, corpus, lambda pdu: reassembler.feed(pdu, timestamp=0.0))
+        assert results == [None] * len(corpus)
+
+    def test_periodic_tracker_skips_unchanged_events(self, benchmark: Any) -> None:
+        """Benchmark a periodic train whose data changes every tenth event."""
+        payloads = AdvertisementSynthesizer(seed=0x5A, extended_ratio=1.0).stream(50)
+        corpus = [_periodic_pdu(payload, did) for did, payload in enumerate(payloads) for _ in range(10)]
+        counters = iter(range(1 << 30))
+
+        def feed(pdu: bytes) -> object:
+            return tracker.feed(MAC_ADDRESS, 1, pdu, event_counter=next(counters) & 0xFFFF)
+
+        tracker = PeriodicAdvertisingTracker()
+        _run_corpus(benchmark, corpus, feed)
+        assert tracker.trains[0].stats.duplicate_ratio >= 0.9
+
+
+@pytest.mark.benchmark
+class TestPayloadRoutingPerformance:
+    """Benchmark interpreter routing and payload interpretation."""
+
+    def test_find_all_interpreter_classes(
+        self,
+        benchmark: Any,
+        interpreter_registry: PayloadInterpreterRegistry,
+        scan_corpus: list[tuple[dict[int, bytes], dict[BluetoothUUID, bytes]]],
+    ) -> None:
+        """Benchmark routing scanned advertisements to interpreter classes."""
+        corpus = [
+            AdvertisingData(
+                manufacturer_data={
+                    company_id: ManufacturerData.from_id_and_payload(company_id, payload)
+                    for company_id, payload in manufacturer.items()
+                },
+                service_data=service_data,
+            )
+            for manufacturer, service_data in scan_corpus
+        ]
+        results = _run_corpus(benchmark, corpus, interpreter_registry.find_all_interpreter_classes)
+        assert any(SIGCharacteristicInterpreter in classes for classes in results)
+
+    def test_parse_advertising_payloads(
+        self,
+        benchmark: Any,
+        interpreter_registry: PayloadInterpreterRegistry,
+        scan_corpus: list[tuple[dict[int, bytes], dict[BluetoothUUID, bytes]]],
+    ) -> None:
+        """Benchmark the high-level parse-everything API."""
+        context = PayloadContext(mac_address=MAC_ADDRESS, rssi=-60)
+        state = DeviceAdvertisingState(address=MAC_ADDRESS)
+
+        def handle(packet: tuple[dict[int, bytes], dict[BluetoothUUID, bytes]]) -> list[Any]:
+            manufacturer, service_data = packet
+            return parse_advertising_payloads(manufacturer, service_data, context, state, registry=interpreter_registry)
+
+        results = _run_corpus(benchmark, scan_corpus, handle)
+        assert all(results)
+
+    def test_service_data_parse(self, benchmark: Any) -> None:
+        """Benchmark decoding SIG characteristic service data."""
+        parser = ServiceDataParser()
+        results = _run_corpus(benchmark, _service_data_corpus(500), parser.parse)
+        assert all(results)
+
+
+@pytest.mark.benchmark
+class TestEADDecryptPerformance:
+    """Benchmark Encrypted Advertising Data decryption."""
+
+    def test_decrypt(self, benchmark: Any) -> None:
+        """Benchmark decrypting EAD payloads with a cached cipher."""
+        aead = pytest.importorskip("cryptography.hazmat.primitives.ciphers.aead")
+        cipher = aead.AESCCM(EAD_KEY, tag_length=4)
+        rng = random.Random(0xEAD)
+        device_address = mac_address_to_bytes(MAC_ADDRESS)
+        corpus: list[bytes] = []
+        for plaintext in AdvertisementSynthesizer(seed=0xEAD, extended_ratio=0.0).stream(500):
+            randomizer = rng.randbytes(5)
+            corpus.append(randomizer + cipher.encrypt(build_ead_nonce(randomizer, device_address), plaintext, None))
+
+        decryptor = EADDecryptor.from_key(EAD_KEY)
+        results = _run_corpus(benchmark, corpus, lambda raw: decryptor.decrypt(raw, MAC_ADDRESS))
+        assert all(result.success for result in results)
+
+
+@pytest.mark.benchmark
+class TestDependencyPairingPerformance:
+    """Benchmark pairing of dependent notifications."""
+
+    def test_ingest_glucose_pairs(self, benchmark: Any, translator: BluetoothSIGTranslator) -> None:
+        """Benchmark ingesting interleaved Glucose Measurement/Context notifications."""
+        measurement_uuid = str(GlucoseMeasurementCharacteristic().uuid)
+        context_uuid = str(GlucoseMeasurementContextCharacteristic().uuid)
+        corpus: list[tuple[str, bytes]] = []
+        for seq in range(250):
+            sequence = seq.to_bytes(2, "little")
+            # Flags, sequence, base time 2024-03-15 14:30:45, glucose SFLOAT
+            corpus.append((measurement_uuid, b"\x00" + sequence + b"\xe8\x07\x03\x0f\x0e\x1e\x2d\x80\x17"))
+            corpus.append((context_uuid, b"\x00" + sequence))
+
+        pairs: list[dict[str, Any]] = []
+        buffer = DependencyPairingBuffer(
+            translator=translator,
+            required_uuids={measurement_uuid, context_uuid},
+            group_key=lambda _uuid, parsed: int(parsed.sequence_number),
+            on_pair=pairs.append,
+        )
+        _run_corpus(benchmark, corpus, lambda packet: buffer.ingest(*packet))
+        assert buffer.stats().pending == 0
+        assert len(pairs) % 250 == 0
+
+
+class _NotifyingClientManager(ClientManagerProtocol):
+    """Connection manager that only records notification callbacks."""
+
+    def __init__(self) -> None:
+        super().__init__(MAC_ADDRESS)
+        self.callbacks: dict[str, Callable[[str, bytes], None]] = {}
+
+    @property
+    def is_connected(self) -> bool:
+        return True
+
+    @property
+    def mtu_size(self) -> int:
+        return 247
+
+    @property
+    def name(self) -> str:
+        return "Benchmark Device"
+
+    async def connect(self, *, timeout: float = 10.0) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def read_gatt_char(self, char_uuid: BluetoothUUID) -> bytes:
+        return b""
+
+    async def write_gatt_char(self, char_uuid: BluetoothUUID, data: bytes, response: bool = True) -> None:
+        pass
+
+    async def read_gatt_descriptor(self, desc_uuid: BluetoothUUID) -> bytes:
+        return b"\x00\x00"
+
+    async def write_gatt_descriptor(self, desc_uuid: BluetoothUUID, data: bytes) -> None:
+        pass
+
+    async def get_services(self) -> list[DeviceService]:
+        return []
+
+    async def start_notify(self, char_uuid: BluetoothUUID, callback: Callable[[str, bytes], None]) -> None:
+        self.callbacks[str(char_uuid)] = callback
+
+    async def stop_notify(self, char_uuid: BluetoothUUID) -> None:
+        self.callbacks.pop(str(char_uuid), None)
+
+    async def pair(self) -> None:
+        pass
+
+    async def unpair(self) -> None:
+        pass
+
+    async def read_rssi(self) -> int:
+        return -60
+
+    async def get_advertisement_rssi(self, refresh: bool = False) -> int | None:
+        return None
+
+    def set_disconnected_callback(self, callback: Callable[[], None]) -> None:
+        pass
+
+    @classmethod
+    def convert_advertisement(cls, _advertisement: object) -> AdvertisementData:
+        return AdvertisementData(ad_structures=AdvertisingDataStructures(core=CoreAdvertisingData()))
+
+    async def get_latest_advertisement(self, refresh: bool = False) -> AdvertisementData | None:
+        return None
+
+
+def _heart_rate_corpus(count: int) -> list[bytes]:
+    """Heart Rate Measurements with uint8/uint16 rates and optional RR intervals."""
+    rng = random.Random(0x2A37)
+    corpus: list[bytes] = []
+    for _ in range(count):
+        wide = rng.random() < 0.2  # Mostly uint8 heart rates
+        rr_count = rng.randint(0, 3)
+        flags = (0x01 if wide else 0x00) | (0x10 if rr_count else 0x00)
+        rate = rng.randint(40, 200).to_bytes(2 if wide else 1, "little")
+        rr_intervals = b"".join(rng.randint(300, 1500).to_bytes(2, "little") for _ in range(rr_count))
+        corpus.append(bytes([flags]) + rate + rr_intervals)
+    return corpus
+
+
+@pytest.mark.benchmark
+class TestDeviceNotificationPerformance:
+    """Benchmark notifications dispatched through Device to user callbacks."""
+
+    @pytest.mark.parametrize("subscribe_by", ["class", "uuid"])
+    def test_notification_dispatch(self, benchmark: Any, translator: BluetoothSIGTranslator, subscribe_by: str) -> None:
+        """Benchmark parsing and dispatching Heart Rate Measurement notifications."""
+        manager = _NotifyingClientManager()
+        device = Device(manager, translator)
+        received: list[Any] = []
+        char = HeartRateMeasurementCharacteristic if subscribe_by == "class" else HEART_RATE_MEASUREMENT_UUID
+        asyncio.run(device.start_notify(char, received.append))
+        ((sender, callback),) = manager.callbacks.items()
+
+        _run_corpus(benchmark, _heart_rate_corpus(500), lambda data: callback(sender, data))
+        assert received
+        assert all(value.heart_rate >= 40 for value in received)  # Corpus minimum
@@ -0,0 +1,125 @@
+"""Memory footprint benchmarks with regression thresholds.
+
+Measures, with :mod:`tracemalloc`, the bytes retained by each loaded registry,
+per characteristic instance and per tracked advertising device. Each
+benchmark records ``bytes`` and ``threshold_bytes`` in ``extra_info`` so that
+``scripts/update_benchmark_history.py`` keeps them in the history, and fails
+when a figure exceeds its threshold in ``memory_thresholds.json``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from bluetooth_sig.advertising import AdvertisementSynthesizer
+from bluetooth_sig.advertising.pdu_parser import AdvertisingPDUParser
+from bluetooth_sig.advertising.state import DeviceAdvertisingState
+from bluetooth_sig.gatt.characteristics.registry import CharacteristicRegistry
+from bluetooth_sig.utils.profiling import MemoryResult, measure_memory
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+THRESHOLDS: dict[str, int] = json.loads((Path(__file__).parent / "memory_thresholds.json").read_text(encoding="utf-8"))
+TRACKED_DEVICES = 500
+
+REGISTRIES = ("company_identifiers_registry", "gss_registry", "uuid_registry")
+
+# Registries earlier in REGISTRIES are loaded before the measured one, so the
+# UUID registry figure excludes the GSS registry it builds on.
+_REGISTRY_SCRIPT = """
+import json
+import sys
+
+from bluetooth_sig.gatt.uuid_registry import get_uuid_registry
+from bluetooth_sig.registry.company_identifiers.company_identifiers_registry import get_company_identifiers_registry
+from bluetooth_sig.registry.gss import get_gss_registry
+from bluetooth_sig.utils.profiling import measure_memory
+
+registries = {{
+    "company_identifiers_registry": get_company_identifiers_registry(),
+    "gss_registry": get_gss_registry(),
+    "uuid_registry": get_uuid_registry(),
+}}
+for name in {preload!r}:
+    registries[name].ensure_loaded()
+print(json.dumps(measure_memory(registries[{name!r}].ensure_loaded, operation={name!r}).retained_bytes))
+"""
+
+
+def _measure_registry(name: str) -> int:
+    """Load *name* in a fresh interpreter and return the bytes it retains."""
+    script = _REGISTRY_SCRIPT.format(name=name, preload=REGISTRIES[: REGISTRIES.index(name)])
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env={**os.environ, "PYTHONPATH": str(REPO_ROOT / "src")},
+    )
+    return int(result.stdout.strip())
+
+
+def _record(benchmark: Any, name: str, measured: float) -> None:
+    """Attach the measurement to the benchmark report and gate it on its threshold."""
+    threshold = THRESHOLDS[name]
+    benchmark.extra_info["bytes"] = round(measured)
+    benchmark.extra_info["threshold_bytes"] = threshold
+    assert measured <= threshold, f"{name} uses {measured:.0f} bytes, threshold is {threshold}"
+
+
+@pytest.mark.benchmark
+class TestRegistryMemory:
+    """Memory retained by loaded registries."""
+
+    @pytest.mark.parametrize("registry", REGISTRIES)
+    def test_registry_footprint(self, benchmark: Any, registry: str) -> None:
+        """Report bytes retained by one registry once loaded (timing covers interpreter start-up)."""
+        measured = benchmark.pedantic(_measure_registry, args=(registry,), rounds=1, iterations=1)
+        _record(benchmark, registry, measured)
+
+
+@pytest.mark.benchmark
+class TestObjectMemory:
+    """Memory retained per characteristic instance and per tracked device."""
+
+    def test_characteristic_instance(self, benchmark: Any) -> None:
+        """Report average bytes per instance across every registered characteristic."""
+        classes = list(CharacteristicRegistry.get_all_characteristics().values())
+        for cls in classes:
+            cls()  # Warm class-level caches so only instance state is counted
+
+        def measure() -> MemoryResult:
+            return measure_memory(lambda: [cls() for cls in classes], len(classes), "characteristic instances")
+
+        result = benchmark.pedantic(measure, rounds=1, iterations=1)
+        _record(benchmark, "characteristic_instance", result.per_item_bytes)
+
+    def test_tracked_device(self, benchmark: Any) -> None:
+        """Report bytes per device holding its latest AdvertisingData and DeviceAdvertisingState."""
+        synthesizer = AdvertisementSynthesizer(seed=0x5EED)
+        parser = AdvertisingPDUParser()
+
+        def track() -> dict[str, tuple[Any, DeviceAdvertisingState]]:
+            devices: dict[str, tuple[Any, DeviceAdvertisingState]] = {}
+            for index in range(TRACKED_DEVICES):
+                address = f"AA:BB:CC:DD:{index >> 8:02X}:{index & 0xFF:02X}"
+                devices[address] = (
+                    parser.parse_advertising_data(synthesizer.generate()),
+                    DeviceAdvertisingState(address=address),
+                )
+            return devices
+
+        track()
+
+        def measure() -> MemoryResult:
+            return measure_memory(track, TRACKED_DEVICES, "tracked devices")
+
+        result = benchmark.pedantic(measure, rounds=1, iterations=1)
+        _record(benchmark, "tracked_device", result.per_item_bytes)
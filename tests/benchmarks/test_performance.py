@@ -2,12 +2,44 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, ClassVar
 
+import msgspec
 import pytest
 
+from bluetooth_sig.advertising import AdvertisementSynthesizer
+from bluetooth_sig.core.service_manager import ServiceManager
 from bluetooth_sig.core.translator import BluetoothSIGTranslator
+from bluetooth_sig.gatt.characteristics import indoor_bike_data
+from bluetooth_sig.gatt.characteristics.body_sensor_location import BodySensorLocationCharacteristic
+from bluetooth_sig.gatt.characteristics.heart_rate_measurement import HeartRateMeasurementCharacteristic
+from bluetooth_sig.gatt.characteristics.utils.data_parser import DataParser
+from bluetooth_sig.gatt.characteristics.utils.extractors import (
+    FLOAT32,
+    SINT8,
+    SINT16,
+    SINT24,
+    SINT32,
+    UINT8,
+    UINT16,
+    UINT24,
+    UINT32,
+    UINT48,
+    RawExtractor,
+)
+from bluetooth_sig.gatt.characteristics.utils.ieee11073_parser import IEEE11073Parser
+from bluetooth_sig.gatt.context import CharacteristicContext
+from bluetooth_sig.gatt.discovery_cache import ServiceDiscoveryCache, ServiceTreePrototype
+from bluetooth_sig.gatt.exceptions import CharacteristicParseError, SpecialValueDetectedError
 from bluetooth_sig.gatt.uuid_registry import UuidRegistry
+from bluetooth_sig.types.advertising.builder import (
+    EXTENDED_ADVERTISING_MAX_SIZE,
+    AdvertisementBuilder,
+    MutableAdvertisementBuilder,
+)
+from bluetooth_sig.utils.profiling import benchmark_function, parse_telemetry
+from bluetooth_sig.utils.serialization import ResultEncoder
+from bluetooth_sig.utils.values import to_primitive
 
 
 @pytest.mark.benchmark
@@ -82,6 +114,22 @@ class TestBatchParsingPerformance:
         result = benchmark(translator.parse_characteristics, batch_characteristics_medium)
         assert len(result) == 10
 
+    def test_batch_parse_large(
+        self, benchmark: Any, translator: BluetoothSIGTranslator, batch_characteristics_large: dict[str, bytearray]
+    ) -> None:
+        """Benchmark batch parsing (50 characteristics)."""
+        result = benchmark(translator.parse_characteristics, batch_characteristics_large)
+        assert len(result) == 50
+
+    def test_batch_parse_large_with_context(
+        self, benchmark: Any, translator: BluetoothSIGTranslator, batch_characteristics_large: dict[str, bytearray]
+    ) -> None:
+        """Benchmark a 50-characteristic batch layered over a populated base context."""
+        previous = translator.parse_characteristics(batch_characteristics_large)
+        ctx = CharacteristicContext(other_characteristics=previous)
+        result = benchmark(translator.parse_characteristics, batch_characteristics_large, ctx)
+        assert len(result) == 50
+
     def test_batch_vs_individual(
         self, benchmark: Any, translator: BluetoothSIGTranslator, batch_characteristics_small: dict[str, bytearray]
     ) -> None:
@@ -179,3 +227,337 @@ class TestRegistryLifecyclePerformance:
 
         result = benchmark(registry.get_characteristic_info, "2A19")
         assert result is not None
+
+
+@pytest.mark.benchmark
+class TestParseTelemetryOverhead:
+    """Benchmark parse telemetry recording overhead."""
+
+    def test_parse_with_telemetry_enabled(
+        self, benchmark: Any, translator: BluetoothSIGTranslator, battery_level_data: bytearray
+    ) -> None:
+        """Benchmark Battery Level parsing with telemetry recording."""
+        parse_telemetry.enable()
+        try:
+            result = benchmark(translator.parse_characteristic, "2A19", battery_level_data)
+        finally:
+            parse_telemetry.disable()
+            parse_telemetry.reset()
+        assert result is not None
+
+    def test_telemetry_overhead_bounded(
+        self, translator: BluetoothSIGTranslator, battery_level_data: bytearray
+    ) -> None:
+        """Telemetry must add well under a microsecond-scale parse's own cost."""
+        iterations = 20000
+        translator.parse_characteristic("2A19", battery_level_data)
+        disabled = benchmark_function(
+            lambda: translator.parse_characteristic("2A19", battery_level_data), iterations, "telemetry off"
+        )
+        parse_telemetry.enable()
+        try:
+            enabled = benchmark_function(
+                lambda: translator.parse_characteristic("2A19", battery_level_data), iterations, "telemetry on"
+            )
+        finally:
+            parse_telemetry.disable()
+            parse_telemetry.reset()
+
+        # Two clock reads and a few counter increments: generous 25% bound for CI noise.
+        assert enabled.min_time <= disabled.min_time * 1.25
+
+
+@pytest.mark.benchmark
+class TestResultSerializationPerformance:
+    """Benchmark serializing batches of parse results."""
+
+    BATCH_SIZE = 1000
+
+    def test_per_field_to_primitive_json(
+        self, benchmark: Any, translator: BluetoothSIGTranslator, heart_rate_data: bytearray
+    ) -> None:
+        """Baseline: per-field to_primitive dicts encoded one value at a time."""
+        values = [translator.parse_characteristic("2A37", heart_rate_data)] * self.BATCH_SIZE
+
+        def encode_all() -> list[bytes]:
+            return [msgspec.json.encode({f: to_primitive(getattr(v, f)) for f in v.__struct_fields__}) for v in values]
+
+        result = benchmark(encode_all)
+        assert len(result) == self.BATCH_SIZE
+
+    @pytest.mark.parametrize("fmt", ["json", "msgpack"])
+    def test_result_encoder_batch(
+        self, benchmark: Any, translator: BluetoothSIGTranslator, heart_rate_data: bytearray, fmt: str
+    ) -> None:
+        """Benchmark ResultEncoder.encode_batch with a precomputed plan."""
+        values = [translator.parse_characteristic("2A37", heart_rate_data)] * self.BATCH_SIZE
+        encoder = ResultEncoder(fmt)  # type: ignore[arg-type]
+
+        result = benchmark(encoder.encode_batch, values)
+        assert result
+
+
+@pytest.mark.benchmark
+class TestNonRaisingParsePerformance:
+    """Benchmark raising vs non-raising parse on special-value and error paths."""
+
+    SPECIAL_VALUE = b"\x00\x80"  # Temperature "value is not known"
+    TRUNCATED = b"\x00"  # Temperature needs 2 bytes
+
+    def test_special_value_raising(self, benchmark: Any, translator: BluetoothSIGTranslator) -> None:
+        """Benchmark special value detection via SpecialValueDetectedError."""
+
+        def parse() -> bool:
+            try:
+                translator.parse_characteristic("2A6E", self.SPECIAL_VALUE)
+            except SpecialValueDetectedError:
+                return True
+            return False
+
+        assert benchmark(parse)
+
+    def test_special_value_try_parse(self, benchmark: Any, translator: BluetoothSIGTranslator) -> None:
+        """Benchmark special value detection via try_parse_characteristic."""
+        result = benchmark(translator.try_parse_characteristic, "2A6E", self.SPECIAL_VALUE)
+        assert result.special_value is not None
+
+    def test_truncated_raising(self, benchmark: Any, translator: BluetoothSIGTranslator) -> None:
+        """Benchmark a truncated packet via CharacteristicParseError."""
+
+        def parse() -> bool:
+            try:
+                translator.parse_characteristic("2A6E", self.TRUNCATED)
+            except CharacteristicParseError:
+                return True
+            return False
+
+        assert benchmark(parse)
+
+    def test_truncated_try_parse(self, benchmark: Any, translator: BluetoothSIGTranslator) -> None:
+        """Benchmark a truncated packet via try_parse_characteristic."""
+        result = benchmark(translator.try_parse_characteristic, "2A6E", self.TRUNCATED)
+        assert not result.ok
+
+
+@pytest.mark.benchmark
+class TestFlagLayoutDecodePerformance:
+    """Benchmark precompiled flag layouts against field-by-field decoding."""
+
+    # Every optional Indoor Bike Data field present (flags 0x1FFE, 29 bytes)
+    FULL_PACKET = bytearray([0xFE, 0x1F, *range(1, 28)])
+
+    class _DisabledLayout:
+        """Layout stand-in forcing the lenient field-by-field decoder."""
+
+        def decode(self, data: bytearray) -> None:
+            return None
+
+    def test_indoor_bike_compiled(self, benchmark: Any) -> None:
+        """Benchmark Indoor Bike Data decoding through the compiled layout."""
+        char = indoor_bike_data.IndoorBikeDataCharacteristic()
+        result = benchmark(char._decode_value, self.FULL_PACKET)
+        assert result.remaining_time is not None
+
+    def test_indoor_bike_field_by_field(self, benchmark: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Baseline: Indoor Bike Data decoding field by field."""
+        monkeypatch.setattr(indoor_bike_data, "_LAYOUT", self._DisabledLayout())
+        char = indoor_bike_data.IndoorBikeDataCharacteristic()
+        result = benchmark(char._decode_value, self.FULL_PACKET)
+        assert result.remaining_time is not None
+
+    def test_compiled_layout_speedup(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The compiled layout must clearly beat field-by-field decoding on a full packet."""
+        iterations = 5000
+        char = indoor_bike_data.IndoorBikeDataCharacteristic()
+        compiled = benchmark_function(lambda: char._decode_value(self.FULL_PACKET), iterations, "compiled")
+        monkeypatch.setattr(indoor_bike_data, "_LAYOUT", self._DisabledLayout())
+        lenient = benchmark_function(lambda: char._decode_value(self.FULL_PACKET), iterations, "field by field")
+
+        # Typically 3-5x; 2x leaves headroom for CI noise.
+        assert compiled.min_time * 2 <= lenient.min_time
+
+
+@pytest.mark.benchmark
+class TestContextLookupPerformance:
+    """Benchmark context-aware parsing against context-free parsing."""
+
+    HEART_RATE = bytes([0x06, 0x48])  # Contact detected, 72 bpm
+
+    @pytest.fixture
+    def context(self) -> CharacteristicContext:
+        """Context holding a Body Sensor Location value."""
+        key = str(BodySensorLocationCharacteristic.get_class_uuid())
+        return CharacteristicContext(other_characteristics={key: 2})
+
+    def test_heart_rate_without_context(self, benchmark: Any) -> None:
+        """Baseline: Heart Rate Measurement parse without context."""
+        char = HeartRateMeasurementCharacteristic()
+        result = benchmark(char.parse_value, self.HEART_RATE)
+        assert result.sensor_location is None
+
+    def test_heart_rate_with_context(self, benchmark: Any, context: CharacteristicContext) -> None:
+        """Benchmark Heart Rate Measurement parse resolving Body Sensor Location from context."""
+        char = HeartRateMeasurementCharacteristic()
+        result = benchmark(char.parse_value, self.HEART_RATE, context)
+        assert result.sensor_location is not None
+
+    def test_context_lookup_overhead_bounded(self, context: CharacteristicContext) -> None:
+        """A context lookup must cost a dictionary hit, not a name resolution."""
+        iterations = 20000
+        char = HeartRateMeasurementCharacteristic()
+        char.parse_value(self.HEART_RATE, context)
+        without = benchmark_function(lambda: char.parse_value(self.HEART_RATE), iterations, "no context")
+        with_context = benchmark_function(lambda: char.parse_value(self.HEART_RATE, context), iterations, "context")
+
+        # The lookup itself is a few dict hits; the rest is building the enum value.
+        assert with_context.min_time <= without.min_time * 1.5
+
+
+EXTRACTORS: dict[str, RawExtractor] = {
+    "uint8": UINT8,
+    "sint8": SINT8,
+    "uint16": UINT16,
+    "sint16": SINT16,
+    "uint24": UINT24,
+    "sint24": SINT24,
+    "uint32": UINT32,
+    "sint32": SINT32,
+    "uint48": UINT48,
+    "float32": FLOAT32,
+}
+
+
+@pytest.mark.benchmark
+class TestExtractorPerformance:
+    """Micro-benchmarks for every raw extractor in both directions."""
+
+    PAYLOAD = bytearray(range(1, 9))
+
+    @pytest.mark.parametrize("name", list(EXTRACTORS))
+    def test_extract(self, benchmark: Any, name: str) -> None:
+        """Benchmark extraction at a non-zero offset."""
+        extractor = EXTRACTORS[name]
+        raw = benchmark(extractor.extract, self.PAYLOAD, 1)
+        assert extractor.pack(raw) == self.PAYLOAD[1 : 1 + extractor.byte_size]
+
+    @pytest.mark.parametrize("name", list(EXTRACTORS))
+    def test_extract_memoryview(self, benchmark: Any, name: str) -> None:
+        """Benchmark extraction from a memoryview (read in place)."""
+        extractor = EXTRACTORS[name]
+        view = memoryview(self.PAYLOAD)
+        assert benchmark(extractor.extract, view, 1) == extractor.extract(self.PAYLOAD, 1)
+
+    @pytest.mark.parametrize("name", list(EXTRACTORS))
+    def test_pack(self, benchmark: Any, name: str) -> None:
+        """Benchmark packing a raw value."""
+        extractor = EXTRACTORS[name]
+        raw = extractor.extract(self.PAYLOAD, 1)
+        assert benchmark(extractor.pack, raw) == self.PAYLOAD[1 : 1 + extractor.byte_size]
+
+    def test_struct_extract_not_slower_than_data_parser(self) -> None:
+        """Precompiled struct extraction must not regress against slicing + int.from_bytes."""
+        iterations = 20000
+        payload = self.PAYLOAD
+        compiled = benchmark_function(lambda: SINT16.extract(payload, 1), iterations, "struct")
+        sliced = benchmark_function(lambda: DataParser.parse_int16(payload, 1, signed=True), iterations, "slice")
+
+        # Typically ~1.5-2x faster; equality leaves headroom for CI noise.
+        assert compiled.min_time <= sliced.min_time
+
+
+@pytest.mark.benchmark
+class TestSfloatDecodePerformance:
+    """Benchmark SFLOAT scalar decoding (arithmetic vs table) and vectorized decoding."""
+
+    SAMPLE = bytearray([0x72, 0xF0])
+    # 4096 packed SFLOAT values covering every exponent
+    BULK = bytearray(b"".join(raw.to_bytes(2, "little") for raw in range(0, 0x10000, 16)))
+
+    def test_scalar_arithmetic(self, benchmark: Any) -> None:
+        """Benchmark scalar decoding through precomputed exponent scales."""
+        assert benchmark(IEEE11073Parser.parse_sfloat, self.SAMPLE) == 1.14e9
+
+    def test_scalar_table(self, benchmark: Any) -> None:
+        """Benchmark scalar decoding through the 64K lookup table."""
+        IEEE11073Parser.enable_sfloat_table()
+        try:
+            assert benchmark(IEEE11073Parser.parse_sfloat, self.SAMPLE) == 1.14e9
+        finally:
+            IEEE11073Parser.disable_sfloat_table()
+
+    def test_bulk_scalar_loop(self, benchmark: Any) -> None:
+        """Baseline: decode 4096 values one call at a time."""
+        bulk = self.BULK
+        result = benchmark(lambda: [IEEE11073Parser.parse_sfloat(bulk, offset) for offset in range(0, len(bulk), 2)])
+        assert len(result) == 4096
+
+    def test_bulk_vectorized(self, benchmark: Any) -> None:
+        """Benchmark decoding 4096 values in one NumPy call."""
+        pytest.importorskip("numpy")
+        result = benchmark(IEEE11073Parser.parse_sfloat_array, self.BULK)
+        assert len(result) == 4096
+
+
+@pytest.mark.benchmark
+class TestAdvertisementBuildPerformance:
+    """Benchmark immutable vs buffer-backed advertisement building and synthesis."""
+
+    NAME = "Benchmark Sensor"
+    MANUFACTURER_PAYLOAD = bytes(range(20))
+
+    def _build_immutable(self) -> bytes:
+        builder = AdvertisementBuilder().with_extended_advertising().with_flags(0x06)
+        builder = builder.with_complete_local_name(self.NAME).with_tx_power(-8).with_appearance(0x0340)
+        for service in ("180F", "180D", "181A", "1816"):
+            builder = builder.with_service_data(service, b"\x01\x02\x03\x04")
+        for company in (0x004C, 0x0006, 0x0075):
+            builder = builder.with_manufacturer_data(company, self.MANUFACTURER_PAYLOAD)
+        return builder.build()
+
+    def test_build_immutable(self, benchmark: Any) -> None:
+        """Baseline: copy-on-write builder with eleven structures."""
+        assert len(benchmark(self._build_immutable)) > 31
+
+    def test_build_mutable(self, benchmark: Any) -> None:
+        """Benchmark the buffer-backed builder producing the same payload."""
+        builder = MutableAdvertisementBuilder(EXTENDED_ADVERTISING_MAX_SIZE)
+
+        def build() -> bytes:
+            builder.reset().add_flags(0x06)
+            builder.add_complete_local_name(self.NAME).add_tx_power(-8).add_appearance(0x0340)
+            for service in (0x180F, 0x180D, 0x181A, 0x1816):
+                builder.add_service_data(service, b"\x01\x02\x03\x04")
+            for company in (0x004C, 0x0006, 0x0075):
+                builder.add_manufacturer_data(company, self.MANUFACTURER_PAYLOAD)
+            return builder.build()
+
+        assert benchmark(build) == self._build_immutable()
+
+    def test_synthesize(self, benchmark: Any) -> None:
+        """Benchmark generating one randomized advertisement."""
+        synthesizer = AdvertisementSynthesizer(seed=1)
+        assert benchmark(synthesizer.generate)
+
+
+@pytest.mark.benchmark
+class TestServiceDiscoveryPerformance:
+    """Benchmark processing the same discovered database repeatedly."""
+
+    SERVICES: ClassVar[dict[str, dict[str, Any]]] = {
+        "180F": {"characteristics": {"2A19": {"name": "Battery Level"}}},
+        "180D": {"characteristics": {"2A37": {"name": "Heart Rate Measurement"}, "2A38": {}}},
+        "AA002000-0000-1000-8000-00805F9B34FB": {
+            "characteristics": {"AA002001-0000-1000-8000-00805F9B34FB": {"name": "Vendor Data"}},
+        },
+    }
+
+    def test_resolve_uncached(self, benchmark: Any) -> None:
+        """Baseline: resolve every class through the registries."""
+        discovery = ServiceManager._discovery_data(self.SERVICES)  # pylint: disable=protected-access
+        assert len(benchmark(lambda: ServiceTreePrototype.resolve(discovery).instantiate())) == 2
+
+    def test_process_cached(self, benchmark: Any) -> None:
+        """Benchmark repeat discoveries served from the prototype cache."""
+        manager = ServiceManager(ServiceDiscoveryCache())
+        benchmark(manager.process_services, self.SERVICES)
+        assert len(manager.discovered_services) == 2
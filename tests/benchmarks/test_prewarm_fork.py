@@ -0,0 +1,132 @@
+"""Benchmark registry sharing across forked worker processes.
+
+Each scenario runs in a fresh interpreter that optionally pre-warms the
+registries, forks ``WORKER_COUNT`` children, and has every child report its
+first-parse latency and private (non-shared) resident memory.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import msgspec
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+WORKER_COUNT = 8
+
+_FORK_SCRIPT = """
+import gc, json, os, sys, time
+
+from bluetooth_sig.core.translator import BluetoothSIGTranslator
+from bluetooth_sig.utils.prewarm import prewarm_registries
+
+MODE = {mode!r}
+if MODE == "prewarm":
+    prewarm_registries()
+elif MODE == "freeze":
+    prewarm_registries(freeze=True)
+
+
+def private_kb() -> int:
+    total = 0
+    with open("/proc/self/smaps_rollup", encoding="utf-8") as fh:
+        for line in fh:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                total += int(line.split()[1])
+    return total
+
+
+def rss_kb() -> int:
+    with open("/proc/self/status", encoding="utf-8") as fh:
+        for line in fh:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+pipes = []
+for _ in range({workers}):
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        exit_code = 1
+        try:
+            os.close(read_fd)
+            t0 = time.perf_counter()
+            BluetoothSIGTranslator().parse_characteristic("2A19", b"\\x55")
+            first_parse_ms = (time.perf_counter() - t0) * 1000
+            gc.collect()
+            payload = json.dumps({{"first_parse_ms": first_parse_ms, "rss_kb": rss_kb(), "private_kb": private_kb()}})
+            os.write(write_fd, payload.encode())
+            exit_code = 0
+        finally:
+            os._exit(exit_code)
+    os.close(write_fd)
+    pipes.append((pid, read_fd))
+
+samples = []
+for pid, read_fd in pipes:
+    with os.fdopen(read_fd, "rb") as fh:
+        raw = fh.read()
+    _, status = os.waitpid(pid, 0)
+    if status != 0:
+        sys.exit(f"worker {{pid}} failed")
+    samples.append(json.loads(raw))
+print(json.dumps(samples))
+"""
+
+
+class ForkSample(msgspec.Struct, frozen=True, kw_only=True):
+    """Per-child measurements reported by the fork script."""
+
+    first_parse_ms: float
+    rss_kb: int
+    private_kb: int
+
+
+class ForkSummary(msgspec.Struct, frozen=True, kw_only=True):
+    """Mean measurements across all forked children."""
+
+    first_parse_ms: float
+    rss_kb: float
+    private_kb: float
+
+
+def _run_fork_scenario(mode: str) -> ForkSummary:
+    script = _FORK_SCRIPT.format(mode=mode, workers=WORKER_COUNT)
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env={**os.environ, "PYTHONPATH": str(REPO_ROOT / "src")},
+    )
+    samples = msgspec.json.decode(result.stdout.strip(), type=list[ForkSample])
+    assert len(samples) == WORKER_COUNT
+    return ForkSummary(
+        first_parse_ms=sum(s.first_parse_ms for s in samples) / len(samples),
+        rss_kb=sum(s.rss_kb for s in samples) / len(samples),
+        private_kb=sum(s.private_kb for s in samples) / len(samples),
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not Path("/proc/self/smaps_rollup").exists(), reason="Requires Linux /proc smaps_rollup")
+class TestForkedWorkerRegistrySharing:
+    """Per-child memory and first-parse latency across forked workers."""
+
+    @pytest.mark.parametrize("mode", ["cold", "prewarm", "freeze"])
+    def test_forked_workers(self, benchmark: Any, mode: str) -> None:
+        """Benchmark forking workers from a cold, pre-warmed, or frozen parent."""
+        summary = benchmark.pedantic(_run_fork_scenario, args=(mode,), rounds=3, iterations=1)
+        benchmark.extra_info.update(json.loads(msgspec.json.encode(summary)))
+        if mode != "cold":
+            # Registries were inherited, so the first parse must not re-read YAML.
+            assert summary.first_parse_ms < 50.0
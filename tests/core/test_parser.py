@@ -0,0 +1,94 @@
+"""Tests for batch parsing internals of CharacteristicParser."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from bluetooth_sig.core import parser as parser_module
+from bluetooth_sig.core.parser import CharacteristicParser, LayeredMapping
+from bluetooth_sig.gatt.context import CharacteristicContext
+
+BATTERY_LEVEL = "2A19"
+
+
+class TestLayeredMapping:
+    """Test the read-only overlay/base view."""
+
+    def test_overlay_wins(self) -> None:
+        """Test overlay keys shadow base keys and base keys remain visible."""
+        view = LayeredMapping({"a": 1, "b": 2}, {"b": 20, "c": 30})
+        assert view["a"] == 1
+        assert view["b"] == 2
+        assert view["c"] == 30
+        assert view.get("d") is None
+        with pytest.raises(KeyError):
+            view["d"]
+
+    def test_membership_iteration_and_length(self) -> None:
+        """Test keys are reported once each, overlay first."""
+        view = LayeredMapping({"a": 1, "b": 2}, {"b": 20, "c": 30})
+        assert "c" in view
+        assert "d" not in view
+        assert list(view) == ["a", "b", "c"]
+        assert len(view) == 3
+        assert dict(view) == {"a": 1, "b": 2, "c": 30}
+
+    def test_reflects_overlay_growth(self) -> None:
+        """Test the view is live, so one context serves a whole batch."""
+        overlay: dict[str, Any] = {}
+        view = LayeredMapping(overlay, {"c": 30})
+        overlay["a"] = 1
+        assert view["a"] == 1
+        assert len(view) == 2
+
+
+class TestDependencyOrder:
+    """Test memoised topological ordering."""
+
+    def test_order_memoised_per_graph(self) -> None:
+        """Test repeated batches over the same graph reuse the cached order."""
+        parser_module._topological_order.cache_clear()
+        data = {"b": b"", "a": b""}
+        for _ in range(3):
+            order = CharacteristicParser._resolve_dependency_order(data, {"b": ["a"]}, {})
+            assert order == ["a", "b"]
+        info = parser_module._topological_order.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_out_of_batch_dependencies_ignored(self) -> None:
+        """Test dependencies absent from the batch do not affect ordering."""
+        order = CharacteristicParser._resolve_dependency_order({"a": b"", "b": b""}, {"a": ["z"]}, {"b": ["y"]})
+        assert order == ["a", "b"]
+
+    def test_cycle_falls_back_to_input_order(self) -> None:
+        """Test a cyclic graph yields the input order."""
+        data = {"a": b"", "b": b""}
+        assert CharacteristicParser._resolve_dependency_order(data, {"a": ["b"], "b": ["a"]}, {}) == ["a", "b"]
+
+
+class TestBatchContext:
+    """Test the context shared across a batch."""
+
+    def test_base_context_values_visible(self) -> None:
+        """Test batch contexts layer results over the caller's values without copying."""
+        base = CharacteristicContext(other_characteristics={"x": 1})
+        results: dict[str, Any] = {}
+        ctx = CharacteristicParser._build_parse_context(base, results)
+        results["y"] = 2
+        assert ctx.other_characteristics is not None
+        assert dict(ctx.other_characteristics) == {"y": 2, "x": 1}
+
+    def test_results_used_directly_without_base_values(self) -> None:
+        """Test the live results dict is used when there is nothing to layer."""
+        results: dict[str, Any] = {}
+        ctx = CharacteristicParser._build_parse_context(None, results)
+        assert ctx.other_characteristics is results
+
+    def test_parse_characteristics_with_base_context(self) -> None:
+        """Test batch parsing still returns every result when given a base context."""
+        base = CharacteristicContext(other_characteristics={"unrelated": 5})
+        results = CharacteristicParser().parse_characteristics({BATTERY_LEVEL: bytes([0x55])}, base)
+        assert results == {BATTERY_LEVEL: 85}
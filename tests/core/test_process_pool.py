@@ -0,0 +1,70 @@
+"""Tests for process-pool parsing via BluetoothSIGTranslator."""
+
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from bluetooth_sig import BluetoothSIGTranslator
+from bluetooth_sig.core.process_pool import ProcessPoolParser
+from bluetooth_sig.gatt.exceptions import CharacteristicParseError, SpecialValueDetectedError
+from bluetooth_sig.types import SpecialValueResult, SpecialValueType
+from bluetooth_sig.types.uuid import BluetoothUUID
+
+
+class TestParseCharacteristicsInProcesses:
+    """Tests for parse_characteristics_in_processes."""
+
+    def test_results_preserve_order(self) -> None:
+        translator = BluetoothSIGTranslator()
+        payloads = [("2A19", bytes([level])) for level in range(0, 101, 10)]
+
+        results = translator.parse_characteristics_in_processes(payloads, max_workers=2, chunksize=3)
+
+        assert results == list(range(0, 101, 10))
+
+    def test_empty_payloads(self) -> None:
+        assert BluetoothSIGTranslator().parse_characteristics_in_processes([]) == []
+
+    def test_pool_and_snapshot_reused(self) -> None:
+        parser = ProcessPoolParser()
+        try:
+            assert parser.parse_characteristics_in_processes([("2A19", b"\x10")], max_workers=1) == [16]
+            executor = parser._executor  # pylint: disable=protected-access
+            snapshot_path = parser._snapshot_path  # pylint: disable=protected-access
+            assert parser.parse_characteristics_in_processes([("2A19", b"\x20")], max_workers=1) == [32]
+            assert parser._executor is executor  # pylint: disable=protected-access
+            assert parser._snapshot_path == snapshot_path  # pylint: disable=protected-access
+        finally:
+            parser.close()
+        assert snapshot_path is not None
+        assert not snapshot_path.exists()
+
+    def test_parse_error_propagates(self) -> None:
+        translator = BluetoothSIGTranslator()
+        with pytest.raises(CharacteristicParseError):
+            translator.parse_characteristics_in_processes([("2A19", b"")], max_workers=1)
+
+
+class TestParseErrorPickling:
+    """Parse errors must survive the trip back from worker processes."""
+
+    def test_characteristic_parse_error_round_trip(self) -> None:
+        error = CharacteristicParseError(
+            message="too short", name="Battery Level", uuid=BluetoothUUID("2A19"), raw_data=b"", raw_int=None
+        )
+        restored = pickle.loads(pickle.dumps(error))
+        assert str(restored) == str(error)
+        assert restored.raw_data == b""
+
+    def test_special_value_error_round_trip(self) -> None:
+        special = SpecialValueResult(
+            raw_value=0x8000, meaning="value is not known", value_type=SpecialValueType.UNKNOWN
+        )
+        error = SpecialValueDetectedError(
+            special_value=special, name="Temperature", uuid=BluetoothUUID("2A6E"), raw_data=b"\x00\x80", raw_int=0x8000
+        )
+        restored = pickle.loads(pickle.dumps(error))
+        assert restored.special_value == special
+        assert restored.raw_int == 0x8000
@@ -5,10 +5,11 @@ from __future__ import annotations
 import pytest
 
 from bluetooth_sig import BluetoothSIGTranslator
+from bluetooth_sig.gatt.characteristics.battery_level import BatteryLevelCharacteristic
 from bluetooth_sig.gatt.characteristics.weight_scale_feature import WeightScaleFeatureCharacteristic
 from bluetooth_sig.gatt.context import CharacteristicContext
 from bluetooth_sig.gatt.exceptions import CharacteristicParseError
-from bluetooth_sig.types import ValidationResult
+from bluetooth_sig.types import ParseErrorCode, ParseOutcome, ValidationResult
 from bluetooth_sig.types.gatt_enums import CharacteristicName, ServiceName
 
 
@@ -324,3 +325,32 @@ class TestBluetoothSIGTranslator:
         for uuid_format in formats:
             result = translator.parse_characteristic(uuid_format, simulated_data)
             assert result == 85, f"Should parse with format: {uuid_format}"
+
+
+class TestTryParseCharacteristic:
+    """Test the non-raising try_parse_characteristic API."""
+
+    def test_ok_by_uuid(self) -> None:
+        """Test a valid payload parsed by UUID."""
+        result = BluetoothSIGTranslator().try_parse_characteristic("2A19", b"\x64")
+        assert result.outcome is ParseOutcome.OK
+        assert result.value == 100
+
+    def test_ok_by_class(self) -> None:
+        """Test a valid payload parsed by characteristic class."""
+        result = BluetoothSIGTranslator().try_parse_characteristic(BatteryLevelCharacteristic, b"\x64")
+        assert result.value == 100
+
+    def test_special_value(self) -> None:
+        """Test a sentinel is reported without raising."""
+        result = BluetoothSIGTranslator().try_parse_characteristic("2A6E", b"\x00\x80")
+        assert result.outcome is ParseOutcome.SPECIAL_VALUE
+        assert result.special_value is not None
+
+    def test_unknown_uuid(self) -> None:
+        """Test an unknown UUID yields UNKNOWN_CHARACTERISTIC."""
+        result = BluetoothSIGTranslator().try_parse_characteristic("FFFFFFFF-FFFF-FFFF-FFFF-FFFFFFFFFFFF", b"\x64")
+        assert result.outcome is ParseOutcome.ERROR
+        assert result.error_code is ParseErrorCode.UNKNOWN_CHARACTERISTIC
+        with pytest.raises(CharacteristicParseError, match="No parser available"):
+            result.unwrap()
@@ -0,0 +1,212 @@
+"""Tests for read coalescing and the read TTL cache of CharacteristicIO."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from bluetooth_sig import BluetoothSIGTranslator
+from bluetooth_sig.device import DependencyResolutionMode, Device
+from bluetooth_sig.gatt.characteristics.battery_level import BatteryLevelCharacteristic
+from bluetooth_sig.types.gatt_enums import CharacteristicName
+from bluetooth_sig.types.uuid import BluetoothUUID
+
+from .test_device_async_methods import AsyncMockClientManager
+
+BATTERY_LEVEL_UUID = "00002A19-0000-1000-8000-00805F9B34FB"
+
+
+class SlowReadManager(AsyncMockClientManager):
+    """Mock manager whose reads wait until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = asyncio.Event()
+        self.read_error: Exception | None = None
+
+    async def read_gatt_char(self, char_uuid: BluetoothUUID) -> bytes:
+        self.read_char_calls.append(char_uuid)
+        await self.release.wait()
+        if self.read_error is not None:
+            raise self.read_error
+        return self.read_char_return
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _device(manager: AsyncMockClientManager, clock: FakeClock | None = None) -> Device:
+    device = Device(manager, BluetoothSIGTranslator())
+    if clock is not None:
+        device._char_io._clock = clock  # pylint: disable=protected-access
+    return device
+
+
+class TestReadCoalescing:
+    """Test concurrent reads share one device read."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_device_read(self) -> None:
+        """Test readers using the class, name and UUID all join one read."""
+        manager = SlowReadManager()
+        device = _device(manager)
+        readers: list[asyncio.Future[Any]] = [
+            asyncio.ensure_future(device.read(BatteryLevelCharacteristic)),
+            asyncio.ensure_future(device.read(CharacteristicName.BATTERY_LEVEL)),
+            asyncio.ensure_future(device.read("2A19")),
+        ]
+        await asyncio.sleep(0)
+        manager.release.set()
+        assert await asyncio.gather(*readers) == [100, 100, 100]
+        assert len(manager.read_char_calls) == 1
+        assert device.read_stats.reads == 3
+        assert device.read_stats.coalesced == 2
+        assert device.read_stats.saved_ratio == pytest.approx(2 / 3)
+
+        # Without a TTL the next read goes to the device again
+        await device.read(BatteryLevelCharacteristic)
+        assert len(manager.read_char_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_reader(self) -> None:
+        """Test a failed shared read raises in every caller and is not reused."""
+        manager = SlowReadManager()
+        manager.read_error = RuntimeError("link lost")
+        device = _device(manager)
+        readers = [asyncio.ensure_future(device.read("2A19")) for _ in range(3)]
+        await asyncio.sleep(0)
+        manager.release.set()
+        results = await asyncio.gather(*readers, return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+        manager.read_error = None
+        assert await device.read("2A19") == 100
+        assert len(manager.read_char_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_reader_does_not_cancel_others(self) -> None:
+        """Test the shared read survives the first caller being cancelled."""
+        manager = SlowReadManager()
+        device = _device(manager)
+        first = asyncio.ensure_future(device.read("2A19"))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(device.read("2A19"))
+        await asyncio.sleep(0)
+        first.cancel()
+        manager.release.set()
+        assert await second == 100
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_skip_dependencies_reads_separately(self) -> None:
+        """Test reads that skip dependencies do not join reads that resolve them."""
+        manager = SlowReadManager()
+        device = _device(manager)
+        readers = [
+            asyncio.ensure_future(device.read("2A19")),
+            asyncio.ensure_future(device.read("2A19", DependencyResolutionMode.SKIP_DEPENDENCIES)),
+        ]
+        await asyncio.sleep(0)
+        manager.release.set()
+        await asyncio.gather(*readers)
+        assert len(manager.read_char_calls) == 2
+
+
+class TestReadCache:
+    """Test the per-characteristic TTL cache."""
+
+    @pytest.mark.asyncio
+    async def test_value_served_until_expiry(self) -> None:
+        """Test reads within the TTL are hits and a later read refreshes the value."""
+        clock = FakeClock()
+        manager = AsyncMockClientManager()
+        device = _device(manager, clock)
+        device.set_read_cache_ttl(BatteryLevelCharacteristic, 5.0)
+
+        assert await device.read(BatteryLevelCharacteristic) == 100
+        manager.read_char_return = b"\x32"
+        clock.now = 4.9
+        assert await device.read(CharacteristicName.BATTERY_LEVEL) == 100
+        assert device.read_stats.hits == 1
+
+        clock.now = 5.0
+        assert await device.read(BatteryLevelCharacteristic) == 50
+        assert len(manager.read_char_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_bypasses_cache(self) -> None:
+        """Test FORCE_REFRESH reads the device and refreshes the cached value."""
+        manager = AsyncMockClientManager()
+        device = _device(manager, FakeClock())
+        device.set_read_cache_ttl("2A19", 60.0)
+        await device.read("2A19")
+        manager.read_char_return = b"\x32"
+        assert await device.read("2A19", DependencyResolutionMode.FORCE_REFRESH) == 50
+        assert await device.read("2A19") == 50
+        assert len(manager.read_char_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_write_and_notification_invalidate(self) -> None:
+        """Test writes and notifications drop the cached value."""
+        manager = AsyncMockClientManager()
+        device = _device(manager, FakeClock())
+        device.set_read_cache_ttl("2A19", 60.0)
+
+        await device.read("2A19")
+        await device.write("2A19", b"\x32")
+        manager.read_char_return = b"\x32"
+        assert await device.read("2A19") == 50
+
+        notified: list[int] = []
+        await device.start_notify(BatteryLevelCharacteristic, notified.append)
+        manager.notify_callbacks[BATTERY_LEVEL_UUID](BATTERY_LEVEL_UUID, b"\x19")
+        assert notified == [25]
+        manager.read_char_return = b"\x19"
+        assert await device.read("2A19") == 25
+        assert len(manager.read_char_calls) == 3
+        assert device.read_stats.invalidations == 2
+
+    @pytest.mark.asyncio
+    async def test_write_during_read_is_not_cached(self) -> None:
+        """Test a value read before a concurrent write completes is not cached."""
+        manager = SlowReadManager()
+        device = _device(manager, FakeClock())
+        device.set_read_cache_ttl("2A19", 60.0)
+
+        stale = asyncio.ensure_future(device.read("2A19"))
+        await asyncio.sleep(0)
+        await device.write("2A19", b"\x32")
+        manager.release.set()
+        assert await stale == 100
+
+        manager.read_char_return = b"\x32"
+        assert await device.read("2A19") == 50
+        assert len(manager.read_char_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_disabling_and_disconnect_clear_cache(self) -> None:
+        """Test removing the TTL or disconnecting drops cached values."""
+        manager = AsyncMockClientManager()
+        device = _device(manager, FakeClock())
+        device.set_read_cache_ttl("2A19", 60.0)
+        await device.read("2A19")
+        await device.disconnect()
+        await device.read("2A19")
+        device.set_read_cache_ttl("2A19", None)
+        await device.read("2A19")
+        assert len(manager.read_char_calls) == 3
+
+    def test_invalid_ttl(self) -> None:
+        """Test a non-positive TTL is rejected."""
+        device = _device(AsyncMockClientManager())
+        with pytest.raises(ValueError, match="ttl"):
+            device.set_read_cache_ttl("2A19", 0)
@@ -8,10 +8,13 @@ import msgspec
 import pytest
 
 from bluetooth_sig.advertising.base import AdvertisingData, InterpreterInfo, PayloadInterpreter
+from bluetooth_sig.advertising.change_detection import AdvertisementChanges
 from bluetooth_sig.advertising.exceptions import AdvertisingParseError
 from bluetooth_sig.advertising.registry import PayloadInterpreterRegistry
 from bluetooth_sig.advertising.state import DeviceAdvertisingState
 from bluetooth_sig.device.advertising import DeviceAdvertising
+from bluetooth_sig.types.advertising.ad_structures import AdvertisingDataStructures, CoreAdvertisingData
+from bluetooth_sig.types.advertising.result import AdvertisementData
 from bluetooth_sig.types.company import ManufacturerData
 
 
@@ -252,3 +255,62 @@ class TestDeviceAdvertisingStateManagement:
         adv.process(ad_data2)
 
         assert adv.state.encryption.encryption_counter == 10
+
+
+class TestDeviceAdvertisingChangeSubscriptions:
+    """Tests for change-only advertisement subscriptions."""
+
+    @staticmethod
+    def _advertisement(temperature_raw: int, counter: int = 0) -> AdvertisementData:
+        payload = temperature_raw.to_bytes(2, "little", signed=True) + bytes([counter])
+        core = CoreAdvertisingData(manufacturer_data={0x1234: ManufacturerData.from_id_and_payload(0x1234, payload)})
+        return AdvertisementData(ad_structures=AdvertisingDataStructures(core=core), rssi=-60)
+
+    def test_only_changes_dispatched(self) -> None:
+        """Test repeated advertisements are neither parsed nor dispatched."""
+        adv = DeviceAdvertising("AA:BB:CC:DD:EE:FF", Mock())
+        interpreter = MockInterpreter("AA:BB:CC:DD:EE:FF")
+        interpreter.interpret = Mock(wraps=interpreter.interpret)  # type: ignore[method-assign]
+        adv.register_interpreter("mock", interpreter)
+        received: list[AdvertisementChanges] = []
+        adv.subscribe_changes(lambda _ad, changes: received.append(changes), thresholds={"temperature": 0.5})
+
+        for advertisement in (
+            self._advertisement(2000),
+            self._advertisement(2000),
+            self._advertisement(2010, counter=1),
+            self._advertisement(2060, counter=2),
+        ):
+            adv._backend_callback_handler(advertisement)
+
+        assert [changes.values for changes in received] == [
+            {"temperature": 20.0, "humidity": None},
+            {"temperature": 20.6},
+        ]
+        assert interpreter.interpret.call_count == 3
+
+    def test_monitoring_follows_subscriptions(self) -> None:
+        """Test backend monitoring is enabled for and released with change subscribers."""
+        mock_cm = Mock()
+        adv = DeviceAdvertising("AA:BB:CC:DD:EE:FF", mock_cm)
+
+        def callback(_ad: AdvertisementData, _changes: AdvertisementChanges) -> None:
+            pass
+
+        adv.subscribe_changes(callback)
+        mock_cm.register_advertisement_callback.assert_called_once()
+        adv.unsubscribe_changes(callback)
+        mock_cm.unregister_advertisement_callback.assert_called_once()
+
+    def test_callback_errors_contained(self) -> None:
+        """Test a failing change callback does not stop other subscribers."""
+        adv = DeviceAdvertising("AA:BB:CC:DD:EE:FF", Mock())
+        received: list[AdvertisementChanges] = []
+
+        def failing(_ad: AdvertisementData, _changes: AdvertisementChanges) -> None:
+            raise RuntimeError("boom")
+
+        adv.subscribe_changes(failing)
+        adv.subscribe_changes(lambda _ad, changes: received.append(changes))
+        adv._backend_callback_handler(self._advertisement(100))
+        assert len(received) == 1
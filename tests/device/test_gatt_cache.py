@@ -0,0 +1,259 @@
+"""Tests for the persistent per-device GATT database cache."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from bluetooth_sig import BluetoothSIGTranslator
+from bluetooth_sig.device import Device, GattDatabaseCache
+from bluetooth_sig.device.client import ClientManagerProtocol
+from bluetooth_sig.device.gatt_cache import CachedCharacteristic, CachedService, GattCacheEntry
+from bluetooth_sig.gatt.characteristics.body_sensor_location import (
+    BodySensorLocation,
+    BodySensorLocationCharacteristic,
+)
+from bluetooth_sig.gatt.characteristics.database_hash import DatabaseHashCharacteristic
+from bluetooth_sig.gatt.characteristics.heart_rate_measurement import HeartRateMeasurementCharacteristic
+from bluetooth_sig.gatt.characteristics.manufacturer_name_string import ManufacturerNameStringCharacteristic
+from bluetooth_sig.gatt.characteristics.service_changed import ServiceChangedCharacteristic
+from bluetooth_sig.gatt.services.device_information import DeviceInformationService
+from bluetooth_sig.gatt.services.generic_attribute import GenericAttributeService
+from bluetooth_sig.gatt.services.heart_rate import HeartRateService
+from bluetooth_sig.types.advertising.ad_structures import AdvertisingDataStructures, CoreAdvertisingData
+from bluetooth_sig.types.advertising.result import AdvertisementData
+from bluetooth_sig.types.device_types import DeviceService
+from bluetooth_sig.types.uuid import BluetoothUUID
+
+ADDRESS = "AA:BB:CC:DD:EE:FF"
+DATABASE_HASH = bytes(range(16))
+HEART_RATE_MEASUREMENT = "00002A37-0000-1000-8000-00805F9B34FB"
+BODY_SENSOR_LOCATION = "00002A38-0000-1000-8000-00805F9B34FB"
+MANUFACTURER_NAME = "00002A29-0000-1000-8000-00805F9B34FB"
+DATABASE_HASH_CHAR = "00002B2A-0000-1000-8000-00805F9B34FB"
+SERVICE_CHANGED = "00002A05-0000-1000-8000-00805F9B34FB"
+
+
+class GattServerMock(ClientManagerProtocol):
+    """Connection manager exposing a heart rate sensor's GATT database."""
+
+    def __init__(self, *, database_hash: bytes | None = DATABASE_HASH, **kwargs: object) -> None:
+        super().__init__(ADDRESS, **kwargs)
+        self._connected = False
+        self.database_hash = database_hash
+        self.read_calls: list[str] = []
+        self.discoveries = 0
+        self.notify_callbacks: dict[str, Callable[[str, bytes], None]] = {}
+        self.values = {
+            HEART_RATE_MEASUREMENT: b"\x00\x48",
+            BODY_SENSOR_LOCATION: bytes([BodySensorLocation.WRIST]),
+            MANUFACTURER_NAME: b"Acme",
+        }
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    @property
+    def mtu_size(self) -> int:
+        return 247
+
+    @property
+    def name(self) -> str:
+        return "Heart Rate Sensor"
+
+    async def connect(self, *, timeout: float = 10.0) -> None:
+        self._connected = True
+
+    async def disconnect(self) -> None:
+        self._connected = False
+
+    async def read_gatt_char(self, char_uuid: BluetoothUUID) -> bytes:
+        self.read_calls.append(str(char_uuid))
+        if str(char_uuid) == DATABASE_HASH_CHAR:
+            if self.database_hash is None:
+                raise RuntimeError("Characteristic not found")
+            return self.database_hash
+        return self.values[str(char_uuid)]
+
+    async def write_gatt_char(self, char_uuid: BluetoothUUID, data: bytes, response: bool = True) -> None:
+        pass
+
+    async def read_gatt_descriptor(self, desc_uuid: BluetoothUUID) -> bytes:
+        return b"\x00\x00"
+
+    async def write_gatt_descriptor(self, desc_uuid: BluetoothUUID, data: bytes) -> None:
+        pass
+
+    async def get_services(self) -> list[DeviceService]:
+        self.discoveries += 1
+        generic_attribute = {SERVICE_CHANGED: ServiceChangedCharacteristic()}
+        if self.database_hash is not None:
+            generic_attribute[DATABASE_HASH_CHAR] = DatabaseHashCharacteristic()
+        return [
+            DeviceService(service=GenericAttributeService(), characteristics=generic_attribute),  # type: ignore[arg-type]
+            DeviceService(
+                service=HeartRateService(),
+                characteristics={
+                    HEART_RATE_MEASUREMENT: HeartRateMeasurementCharacteristic(),
+                    BODY_SENSOR_LOCATION: BodySensorLocationCharacteristic(),
+                },
+            ),
+            DeviceService(
+                service=DeviceInformationService(),
+                characteristics={MANUFACTURER_NAME: ManufacturerNameStringCharacteristic()},
+            ),
+        ]
+
+    async def start_notify(self, char_uuid: BluetoothUUID, callback: Callable[[str, bytes], None]) -> None:
+        self.notify_callbacks[str(char_uuid)] = callback
+
+    async def stop_notify(self, char_uuid: BluetoothUUID) -> None:
+        self.notify_callbacks.pop(str(char_uuid), None)
+
+    async def pair(self) -> None:
+        pass
+
+    async def unpair(self) -> None:
+        pass
+
+    async def read_rssi(self) -> int:
+        return -55
+
+    async def get_advertisement_rssi(self, refresh: bool = False) -> int | None:
+        return -65
+
+    def set_disconnected_callback(self, callback: Callable[[], None]) -> None:
+        pass
+
+    @classmethod
+    def convert_advertisement(cls, _advertisement: object) -> AdvertisementData:
+        return AdvertisementData(ad_structures=AdvertisingDataStructures(core=CoreAdvertisingData()))
+
+    async def get_latest_advertisement(self, refresh: bool = False) -> AdvertisementData | None:
+        return None
+
+
+async def _first_session(cache: GattDatabaseCache, manager: GattServerMock | None = None) -> GattServerMock:
+    """Connect, discover and read as a first-time client would, then disconnect."""
+    manager = manager or GattServerMock()
+    device = Device(manager, BluetoothSIGTranslator(), gatt_cache=cache)
+    await device.connect()
+    await device.discover_services()
+    await device.read(HeartRateMeasurementCharacteristic)
+    await device.read("2A29")
+    await device.disconnect()
+    return manager
+
+
+class TestGattDatabaseCache:
+    """Test the SQLite-backed entry store."""
+
+    def test_round_trip_on_disk(self, tmp_path: Path) -> None:
+        """Test entries survive closing and reopening the database file."""
+        path = tmp_path / "gatt.sqlite3"
+        entry = GattCacheEntry(
+            address=ADDRESS.lower(),
+            services=(CachedService(uuid="180D", characteristics=(CachedCharacteristic(uuid="2A37"),)),),
+            database_hash=DATABASE_HASH,
+            values={"2A38": b"\x02"},
+        )
+        with GattDatabaseCache(path) as cache:
+            cache.store(entry)
+        with GattDatabaseCache(path) as cache:
+            assert len(cache) == 1
+            assert cache.load(ADDRESS) == entry
+            assert cache.invalidate(ADDRESS) is True
+            assert cache.load(ADDRESS) is None
+            assert cache.invalidate(ADDRESS) is False
+
+    def test_schema_change_discards_entries(self, tmp_path: Path) -> None:
+        """Test a file written with another schema version starts empty."""
+        path = tmp_path / "gatt.sqlite3"
+        with GattDatabaseCache(path) as cache:
+            cache.store(GattCacheEntry(address=ADDRESS, services=()))
+        with sqlite3.connect(path) as connection:
+            connection.execute("PRAGMA user_version = 0")
+        with GattDatabaseCache(path) as cache:
+            assert len(cache) == 0
+
+    def test_unreadable_entry_removed(self) -> None:
+        """Test an entry that fails to decode is dropped instead of raising."""
+        cache = GattDatabaseCache()
+        cache._connection.execute(  # pylint: disable=protected-access
+            "INSERT INTO gatt_database (address, entry) VALUES (?, ?)", (ADDRESS, b"\xc1")
+        )
+        assert cache.load(ADDRESS) is None
+        assert len(cache) == 0
+
+
+class TestDeviceGattCache:
+    """Test Device reconnects served from the GATT cache."""
+
+    @pytest.mark.asyncio
+    async def test_reconnect_skips_discovery_and_static_reads(self) -> None:
+        """Test a known device is restored with one Database Hash read and no dependency reads."""
+        cache = GattDatabaseCache()
+        first = await _first_session(cache)
+        assert first.read_calls == [DATABASE_HASH_CHAR, BODY_SENSOR_LOCATION, HEART_RATE_MEASUREMENT, MANUFACTURER_NAME]
+
+        manager = GattServerMock()
+        device = Device(manager, BluetoothSIGTranslator(), gatt_cache=cache)
+        await device.connect()
+        assert manager.discoveries == 0
+        assert len(device.services) == 3
+        assert device.get_characteristic_data(BluetoothUUID(MANUFACTURER_NAME)) == "Acme"
+
+        measurement = await device.read(HeartRateMeasurementCharacteristic)
+        assert measurement is not None
+        assert manager.read_calls == [DATABASE_HASH_CHAR, HEART_RATE_MEASUREMENT]
+
+    @pytest.mark.asyncio
+    async def test_database_hash_mismatch_invalidates(self) -> None:
+        """Test a changed Database Hash drops the entry and leaves services to discovery."""
+        cache = GattDatabaseCache()
+        await _first_session(cache)
+
+        manager = GattServerMock(database_hash=bytes(16))
+        device = Device(manager, BluetoothSIGTranslator(), gatt_cache=cache)
+        await device.connect()
+        assert device.services == {}
+        assert cache.load(ADDRESS) is None
+
+    @pytest.mark.asyncio
+    async def test_without_database_hash_trusts_entry(self) -> None:
+        """Test devices without a Database Hash are restored without any read."""
+        cache = GattDatabaseCache()
+        await _first_session(cache, GattServerMock(database_hash=None))
+        assert cache.load(ADDRESS).database_hash is None  # type: ignore[union-attr]
+
+        manager = GattServerMock(database_hash=None)
+        device = Device(manager, BluetoothSIGTranslator(), gatt_cache=cache)
+        await device.connect()
+        assert len(device.services) == 3
+        assert manager.read_calls == []
+
+    @pytest.mark.asyncio
+    async def test_service_changed_indication_invalidates(self) -> None:
+        """Test a Service Changed indication removes the device's entry."""
+        cache = GattDatabaseCache()
+        await _first_session(cache)
+
+        manager = GattServerMock()
+        device = Device(manager, BluetoothSIGTranslator(), gatt_cache=cache)
+        await device.connect()
+        manager.notify_callbacks[SERVICE_CHANGED](SERVICE_CHANGED, b"\x01\x00\xff\xff")
+        assert cache.load(ADDRESS) is None
+
+    @pytest.mark.asyncio
+    async def test_cache_bypassed_on_request(self) -> None:
+        """Test connect(use_gatt_cache=False) leaves services for discovery."""
+        cache = GattDatabaseCache()
+        await _first_session(cache)
+
+        device = Device(GattServerMock(), BluetoothSIGTranslator(), gatt_cache=cache)
+        await device.connect(use_gatt_cache=False)
+        assert device.services == {}
@@ -0,0 +1,307 @@
+"""Simulation tests for scheduling many devices over a limited number of links."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+import pytest
+
+from bluetooth_sig import BluetoothSIGTranslator
+from bluetooth_sig.device import Device, DevicePool
+from bluetooth_sig.device.client import ClientManagerProtocol
+from bluetooth_sig.types.advertising.ad_structures import AdvertisingDataStructures, CoreAdvertisingData
+from bluetooth_sig.types.advertising.result import AdvertisementData
+from bluetooth_sig.types.device_types import DeviceService
+from bluetooth_sig.types.gatt_enums import CharacteristicName
+from bluetooth_sig.types.uuid import BluetoothUUID
+
+BATTERY_LEVEL = CharacteristicName.BATTERY_LEVEL
+
+
+class SimulatedAdapter:
+    """Adapter with a fixed number of links and fixed connection and ATT latencies."""
+
+    def __init__(self, max_links: int, *, connect_latency: float = 0.002, op_latency: float = 0.001) -> None:
+        self.max_links = max_links
+        self.connect_latency = connect_latency
+        self.op_latency = op_latency
+        self.links: set[str] = set()
+        self.peak_links = 0
+        self.connects: dict[str, int] = {}
+        self.operations: list[str] = []
+
+    async def connect(self, address: str) -> None:
+        await asyncio.sleep(self.connect_latency)
+        if len(self.links) >= self.max_links:
+            raise RuntimeError("Adapter has no free link")
+        self.links.add(address)
+        self.peak_links = max(self.peak_links, len(self.links))
+        self.connects[address] = self.connects.get(address, 0) + 1
+
+    async def disconnect(self, address: str) -> None:
+        await asyncio.sleep(self.connect_latency / 2)
+        self.links.discard(address)
+
+    async def operate(self, address: str) -> None:
+        assert address in self.links, f"{address} used without a link"
+        await asyncio.sleep(self.op_latency)
+        self.operations.append(address)
+
+
+class SimulatedLink(ClientManagerProtocol):
+    """Connection manager for one device behind a :class:`SimulatedAdapter`."""
+
+    def __init__(self, address: str, adapter: SimulatedAdapter, *, failing_connects: int = 0) -> None:
+        super().__init__(address)
+        self.adapter = adapter
+        self.failing_connects = failing_connects
+        self.disconnected_callback: Callable[[], None] | None = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self.address in self.adapter.links
+
+    @property
+    def mtu_size(self) -> int:
+        return 247
+
+    @property
+    def name(self) -> str:
+        return f"Sensor {self.address}"
+
+    async def connect(self, *, timeout: float = 10.0) -> None:
+        if self.failing_connects:
+            self.failing_connects -= 1
+            await asyncio.sleep(self.adapter.connect_latency)
+            raise TimeoutError(f"{self.address} did not respond")
+        await self.adapter.connect(self.address)
+
+    async def disconnect(self) -> None:
+        await self.adapter.disconnect(self.address)
+
+    def drop(self) -> None:
+        """Simulate the peripheral dropping the link."""
+        self.adapter.links.discard(self.address)
+        if self.disconnected_callback is not None:
+            self.disconnected_callback()
+
+    async def read_gatt_char(self, char_uuid: BluetoothUUID) -> bytes:
+        await self.adapter.operate(self.address)
+        return b"\x64"
+
+    async def write_gatt_char(self, char_uuid: BluetoothUUID, data: bytes, response: bool = True) -> None:
+        await self.adapter.operate(self.address)
+
+    async def read_gatt_descriptor(self, desc_uuid: BluetoothUUID) -> bytes:
+        return b"\x00\x00"
+
+    async def write_gatt_descriptor(self, desc_uuid: BluetoothUUID, data: bytes) -> None:
+        pass
+
+    async def get_services(self) -> list[DeviceService]:
+        return []
+
+    async def start_notify(self, char_uuid: BluetoothUUID, callback: Callable[[str, bytes], None]) -> None:
+        pass
+
+    async def stop_notify(self, char_uuid: BluetoothUUID) -> None:
+        pass
+
+    async def pair(self) -> None:
+        pass
+
+    async def unpair(self) -> None:
+        pass
+
+    async def read_rssi(self) -> int:
+        return -60
+
+    async def get_advertisement_rssi(self, refresh: bool = False) -> int | None:
+        return -60
+
+    def set_disconnected_callback(self, callback: Callable[[], None]) -> None:
+        self.disconnected_callback = callback
+
+    @classmethod
+    def convert_advertisement(cls, _advertisement: object) -> AdvertisementData:
+        return AdvertisementData(ad_structures=AdvertisingDataStructures(core=CoreAdvertisingData()))
+
+    async def get_latest_advertisement(self, refresh: bool = False) -> AdvertisementData | None:
+        return None
+
+
+def _address(index: int) -> str:
+    return f"AA:BB:CC:00:{index // 256:02X}:{index % 256:02X}"
+
+
+def _populate(pool: DevicePool, adapter: SimulatedAdapter, count: int, **kwargs: int) -> list[SimulatedLink]:
+    links = [SimulatedLink(_address(index), adapter, **kwargs) for index in range(count)]
+    for link in links:
+        pool.add(Device(link, BluetoothSIGTranslator()))
+    return links
+
+
+class TestDevicePool:
+    """Test link limits, fairness, priorities, reconnects and statistics."""
+
+    @pytest.mark.asyncio
+    async def test_many_devices_share_limited_links(self) -> None:
+        """Test every read completes without exceeding the adapter's link limit."""
+        adapter = SimulatedAdapter(max_links=4)
+        async with DevicePool(max_links=4) as pool:
+            links = _populate(pool, adapter, 40)
+            reads = [pool.read(link.address, BATTERY_LEVEL) for link in links for _ in range(3)]
+            assert await asyncio.gather(*reads) == [100] * 120
+
+            assert adapter.peak_links == 4
+            assert pool.stats.completed == pool.stats.started == 120
+            assert pool.stats.connects == sum(adapter.connects.values())
+            assert pool.stats.mean_queue_delay > 0
+            assert pool.stats.max_queue_delay >= pool.stats.mean_queue_delay
+            assert 0.0 < pool.link_utilization <= 1.0
+            assert pool.links_in_use == 4
+            assert pool.queued == 0
+        assert adapter.links == set()
+
+    @pytest.mark.asyncio
+    async def test_round_robin_between_waiting_devices(self) -> None:
+        """Test waiting devices take turns of ``quantum`` operations each."""
+        adapter = SimulatedAdapter(max_links=1)
+        async with DevicePool(max_links=1, quantum=2) as pool:
+            links = _populate(pool, adapter, 3)
+            await asyncio.gather(*(pool.read(link.address, BATTERY_LEVEL) for link in links for _ in range(6)))
+        runs = [adapter.operations[index : index + 2] for index in range(0, 18, 2)]
+        assert all(len(set(run)) == 1 for run in runs)
+        assert [run[0] for run in runs[:3]] == [link.address for link in links]
+
+    @pytest.mark.asyncio
+    async def test_priority_devices_served_first(self) -> None:
+        """Test a higher priority device overtakes queued lower priority work."""
+        adapter = SimulatedAdapter(max_links=1)
+        async with DevicePool(max_links=1) as pool:
+            links = _populate(pool, adapter, 3)
+            urgent = SimulatedLink("AA:BB:CC:FF:00:01", adapter)
+            pool.add(Device(urgent, BluetoothSIGTranslator()), priority=1)
+            background = [pool.read(link.address, BATTERY_LEVEL) for link in links]
+            tasks = [asyncio.ensure_future(read) for read in background]
+            await asyncio.sleep(0)
+            await pool.read(urgent.address, BATTERY_LEVEL)
+            await asyncio.gather(*tasks)
+        assert adapter.operations.index(urgent.address) <= 1
+
+    @pytest.mark.asyncio
+    async def test_keep_connected_device_holds_link(self) -> None:
+        """Test a notification device stays connected and is reconnected after a drop."""
+        adapter = SimulatedAdapter(max_links=2)
+        async with DevicePool(max_links=2) as pool:
+            streaming = SimulatedLink("AA:BB:CC:FF:00:02", adapter)
+            pool.add(Device(streaming, BluetoothSIGTranslator()), keep_connected=True)
+            links = _populate(pool, adapter, 6)
+            await asyncio.gather(*(pool.read(link.address, BATTERY_LEVEL) for link in links))
+            assert streaming.address in adapter.links
+            assert adapter.connects[streaming.address] == 1
+
+            streaming.drop()
+            for _ in range(20):
+                await asyncio.sleep(adapter.connect_latency)
+                if streaming.address in adapter.links:
+                    break
+            assert adapter.connects[streaming.address] == 2
+            assert adapter.peak_links == 2
+
+    @pytest.mark.asyncio
+    async def test_connected_members_served_while_head_waits_for_link(self) -> None:
+        """Test a device waiting for a link does not hold up devices that already have one."""
+        adapter = SimulatedAdapter(max_links=2)
+        async with DevicePool(max_links=2) as pool:
+            streaming = SimulatedLink("AA:BB:CC:FF:00:03", adapter)
+            pool.add(Device(streaming, BluetoothSIGTranslator()), keep_connected=True)
+            busy, waiting = _populate(pool, adapter, 2)
+            release = asyncio.Event()
+
+            async def hold_link(device: Device) -> None:
+                await release.wait()
+
+            holder = asyncio.ensure_future(pool.submit(busy.address, hold_link))
+            while busy.address not in adapter.links or streaming.address not in adapter.links:
+                await asyncio.sleep(adapter.connect_latency)
+            queued = asyncio.ensure_future(pool.read(waiting.address, BATTERY_LEVEL))
+            await asyncio.sleep(0)
+
+            try:
+                assert await asyncio.wait_for(pool.read(streaming.address, BATTERY_LEVEL), 1.0) == 100
+                assert not queued.done()
+            finally:
+                release.set()
+            await holder
+            assert await asyncio.wait_for(queued, 1.0) == 100
+
+    @pytest.mark.asyncio
+    async def test_rejects_work_when_all_links_pinned(self) -> None:
+        """Test devices that can never get a link are rejected instead of waiting forever."""
+        adapter = SimulatedAdapter(max_links=1)
+        async with DevicePool(max_links=1) as pool:
+            streaming = SimulatedLink("AA:BB:CC:FF:00:04", adapter)
+            pool.add(Device(streaming, BluetoothSIGTranslator()), keep_connected=True)
+            (other,) = _populate(pool, adapter, 1)
+            with pytest.raises(RuntimeError, match="keep_connected"):
+                await asyncio.wait_for(pool.read(other.address, BATTERY_LEVEL), 1.0)
+            with pytest.raises(ValueError, match="keep_connected"):
+                pool.add(
+                    Device(SimulatedLink("AA:BB:CC:FF:00:05", adapter), BluetoothSIGTranslator()), keep_connected=True
+                )
+            assert await asyncio.wait_for(pool.read(streaming.address, BATTERY_LEVEL), 1.0) == 100
+
+    @pytest.mark.asyncio
+    async def test_reconnect_backoff(self) -> None:
+        """Test failed connections are retried with growing delays."""
+        adapter = SimulatedAdapter(max_links=2)
+        loop = asyncio.get_running_loop()
+        async with DevicePool(max_links=2, reconnect_delay=0.02) as pool:
+            (link,) = _populate(pool, adapter, 1, failing_connects=2)
+            started = loop.time()
+            assert await pool.read(link.address, BATTERY_LEVEL) == 100
+            assert loop.time() - started >= 0.02 + 0.04
+            assert pool.stats.connect_failures == 2
+            assert pool.stats.connects == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self) -> None:
+        """Test queued operations fail once the connection attempts are exhausted."""
+        adapter = SimulatedAdapter(max_links=1)
+        async with DevicePool(max_links=1, reconnect_delay=0.001, max_connect_attempts=3) as pool:
+            (link,) = _populate(pool, adapter, 1, failing_connects=5)
+            with pytest.raises(TimeoutError):
+                await pool.read(link.address, BATTERY_LEVEL)
+            assert pool.stats.connect_failures == 3
+            assert pool.stats.failed == 1
+            assert pool.links_in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_operation_errors_and_removal(self) -> None:
+        """Test operation errors reach the caller and removing a device cancels its queue."""
+        adapter = SimulatedAdapter(max_links=1)
+        async with DevicePool(max_links=1) as pool:
+            first, second = _populate(pool, adapter, 2)
+
+            async def failing(_device: Device) -> None:
+                raise ValueError("bad value")
+
+            with pytest.raises(ValueError, match="bad value"):
+                await pool.submit(first.address, failing)
+
+            blocker = asyncio.ensure_future(pool.read(first.address, BATTERY_LEVEL))
+            queued = asyncio.ensure_future(pool.read(second.address, BATTERY_LEVEL))
+            await asyncio.sleep(0)
+            await pool.remove(second.address)
+            assert await blocker == 100
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            with pytest.raises(KeyError):
+                await pool.read(second.address, BATTERY_LEVEL)
+
+    def test_invalid_configuration(self) -> None:
+        """Test non-positive limits are rejected."""
+        with pytest.raises(ValueError, match="max_links"):
+            DevicePool(max_links=0)
@@ -0,0 +1,133 @@
+"""Tests for windowed, MTU-sized write pipelining."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from bluetooth_sig import BluetoothSIGTranslator
+from bluetooth_sig.device import Device
+from bluetooth_sig.gatt.characteristics.battery_level import BatteryLevelCharacteristic
+from bluetooth_sig.types.uuid import BluetoothUUID
+
+from .test_device_async_methods import AsyncMockClientManager
+
+WRITE_LATENCY = 0.005
+
+
+class LinkSimulator(AsyncMockClientManager):
+    """Mock manager with a fixed MTU and per-write latency."""
+
+    def __init__(self, mtu: int = 23, *, fail_at: int | None = None) -> None:
+        super().__init__()
+        self._mtu = mtu
+        self.fail_at = fail_at
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def write_gatt_char(self, char_uuid: BluetoothUUID, data: bytes, response: bool = True) -> None:
+        if len(data) > self._mtu - 3:
+            raise ValueError(f"{len(data)} bytes exceed the ATT MTU")
+        index = len(self.write_char_calls)
+        self.write_char_calls.append((char_uuid, bytes(data), response))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(WRITE_LATENCY)
+            if index == self.fail_at:
+                raise RuntimeError("write rejected")
+        finally:
+            self.in_flight -= 1
+
+
+class TestWritePipeline:
+    """Test chunking, windowing, ordering and throughput reporting."""
+
+    @pytest.mark.asyncio
+    async def test_values_chunked_to_mtu_in_order(self) -> None:
+        """Test long values are split into MTU-sized packets sent in order."""
+        manager = LinkSimulator(mtu=23)
+        device = Device(manager, BluetoothSIGTranslator())
+        pipeline = device.write_pipeline(window=4)
+        image = bytes(range(256)) * 2
+        pipeline.add("2A19", b"\x01")
+        pipeline.add("2A19", image)
+        assert pipeline.packet_size == 20
+        assert pipeline.pending == 1 + 26
+
+        stats = await pipeline.flush()
+        assert pipeline.pending == 0
+        assert stats.values == 2
+        assert stats.writes == 27
+        assert stats.bytes_written == 513
+        assert stats.max_in_flight == manager.peak_in_flight == 4
+        assert b"".join(data for _, data, _ in manager.write_char_calls[1:]) == image
+        assert all(response is False for _, _, response in manager.write_char_calls)
+
+    @pytest.mark.asyncio
+    async def test_window_raises_throughput(self) -> None:
+        """Test a wider window achieves proportionally higher throughput."""
+        rates = {}
+        for window in (1, 8):
+            manager = LinkSimulator(mtu=247)
+            pipeline = Device(manager, BluetoothSIGTranslator()).write_pipeline(window=window)
+            pipeline.add_many("2A19", [bytes(244)] * 32)
+            stats = await pipeline.flush()
+            assert manager.peak_in_flight == window
+            rates[window] = stats.throughput
+        assert rates[8] > 3 * rates[1]
+
+    @pytest.mark.asyncio
+    async def test_typed_values_encoded_up_front(self) -> None:
+        """Test characteristic classes encode values when queued."""
+        manager = LinkSimulator()
+        pipeline = Device(manager, BluetoothSIGTranslator()).write_pipeline(response=True)
+        pipeline.add_many(BatteryLevelCharacteristic, [100, 50])
+        with pytest.raises(TypeError):
+            pipeline.add("2A19", 7)  # type: ignore[call-overload]
+        assert pipeline.pending == 2
+
+        await pipeline.flush()
+        assert [(data, response) for _, data, response in manager.write_char_calls] == [
+            (b"\x64", True),
+            (b"\x32", True),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unsplit_value_must_fit(self) -> None:
+        """Test split=False rejects values longer than one packet."""
+        pipeline = Device(LinkSimulator(mtu=23), BluetoothSIGTranslator()).write_pipeline()
+        with pytest.raises(ValueError, match="exceeds packet size"):
+            pipeline.add("2A19", bytes(21), split=False)
+        assert pipeline.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_stops_pipeline(self) -> None:
+        """Test a failed write cancels outstanding writes and issues no more."""
+        manager = LinkSimulator(fail_at=2)
+        pipeline = Device(manager, BluetoothSIGTranslator()).write_pipeline(window=3)
+        pipeline.add_many("2A19", [bytes([index]) for index in range(10)])
+        with pytest.raises(RuntimeError, match="write rejected"):
+            await pipeline.flush()
+        assert len(manager.write_char_calls) < 10
+        assert manager.in_flight == 0
+        assert pipeline.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_invalidates_read_cache(self) -> None:
+        """Test characteristics written by a flush are re-read afterwards."""
+        manager = LinkSimulator()
+        device = Device(manager, BluetoothSIGTranslator())
+        device.set_read_cache_ttl("2A19", 60.0)
+        await device.read("2A19")
+        pipeline = device.write_pipeline()
+        pipeline.add("2A19", b"\x32")
+        await pipeline.flush()
+        manager.read_char_return = b"\x32"
+        assert await device.read("2A19") == 50
+
+    def test_invalid_window(self) -> None:
+        """Test a non-positive window is rejected."""
+        with pytest.raises(ValueError, match="window"):
+            Device(LinkSimulator(), BluetoothSIGTranslator()).write_pipeline(window=0)
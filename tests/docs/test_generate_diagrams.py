@@ -116,7 +116,7 @@ def test_generate_all_diagrams_strict_mode(tmp_path: Path, monkeypatch: MonkeyPa
     assert rc2 == 0, "Should return exit code 0 in non-strict mode"
 
 
-def test_generate_all_diagrams_strict_mode_partial_failure(monkeypatch: MonkeyPatch) -> None:
+def test_generate_all_diagrams_strict_mode_partial_failure(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
     """In strict mode any missing artifact for a package should make the.
 
     diagrams generator fail (non-zero exit code).
@@ -127,12 +127,14 @@ def test_generate_all_diagrams_strict_mode_partial_failure(monkeypatch: MonkeyPa
     monkeypatch.setattr(gen, "generate_class_puml", _fake_generate_class_puml)
     monkeypatch.setattr(gen, "generate_pydeps_svg", _fake_generate_pydeps_svg)
 
-    rc, results = gen.generate_all_diagrams(packages=["fakepkg"])
+    rc, results = gen.generate_all_diagrams(
+        packages=["fakepkg"], docs_diagrams=tmp_path / "diagrams", cache_file=tmp_path / "diagrams_cache.json"
+    )
     assert rc == 1, "Strict mode should return non-zero when any artifact fails"
     assert "fakepkg" in results
 
 
-def test_generate_all_diagrams_non_strict_partial_failure(monkeypatch: MonkeyPatch) -> None:
+def test_generate_all_diagrams_non_strict_partial_failure(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
     """When strict mode is off partial failures should not fail the.
 
     overall diagrams generation (non-zero only when nothing created).
@@ -141,5 +143,7 @@ def test_generate_all_diagrams_non_strict_partial_failure(monkeypatch: MonkeyPat
     monkeypatch.setattr(gen, "generate_class_puml", _fake_generate_class_puml)
     monkeypatch.setattr(gen, "generate_pydeps_svg", _fake_generate_pydeps_svg)
 
-    rc, _ = gen.generate_all_diagrams(packages=["fakepkg"])
+    rc, _ = gen.generate_all_diagrams(
+        packages=["fakepkg"], docs_diagrams=tmp_path / "diagrams", cache_file=tmp_path / "diagrams_cache.json"
+    )
     assert rc == 0, "Non-strict mode should not fail on partial artifact failures"
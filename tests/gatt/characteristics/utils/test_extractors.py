@@ -0,0 +1,127 @@
+"""Tests for struct-backed raw byte extractors."""
+
+from __future__ import annotations
+
+import pickle
+import random
+from types import MemberDescriptorType
+from typing import Literal
+
+import pytest
+
+from bluetooth_sig.gatt.characteristics.utils.extractors import (
+    FLOAT32,
+    Float32Extractor,
+    RawExtractor,
+    Sint8Extractor,
+    Sint16Extractor,
+    Sint24Extractor,
+    Sint32Extractor,
+    Uint8Extractor,
+    Uint16Extractor,
+    Uint24Extractor,
+    Uint32Extractor,
+    Uint48Extractor,
+    get_extractor,
+)
+from bluetooth_sig.gatt.exceptions import InsufficientDataError, ValueRangeError
+
+Endian = Literal["little", "big"]
+
+ENDIAN_AWARE: list[tuple[type[RawExtractor], int, bool]] = [
+    (Uint16Extractor, 2, False),
+    (Sint16Extractor, 2, True),
+    (Uint24Extractor, 3, False),
+    (Sint24Extractor, 3, True),
+    (Uint32Extractor, 4, False),
+    (Sint32Extractor, 4, True),
+    (Uint48Extractor, 6, False),
+]
+
+
+def _cases() -> list[tuple[RawExtractor, int, bool, Endian]]:
+    cases: list[tuple[RawExtractor, int, bool, Endian]] = [
+        (Uint8Extractor(), 1, False, "little"),
+        (Sint8Extractor(), 1, True, "little"),
+    ]
+    for cls, size, signed in ENDIAN_AWARE:
+        for endian in ("little", "big"):
+            cases.append((cls(endian), size, signed, endian))  # type: ignore[call-arg]
+    return cases
+
+
+CASES = _cases()
+CASE_IDS = [f"{type(e).__name__}-{endian}" for e, _, _, endian in CASES]
+
+
+class TestExtractors:
+    """Test every extractor against int.from_bytes/to_bytes."""
+
+    @pytest.mark.parametrize(("extractor", "size", "signed", "endian"), CASES, ids=CASE_IDS)
+    def test_round_trip_matches_int_bytes(
+        self, extractor: RawExtractor, size: int, signed: bool, endian: Endian
+    ) -> None:
+        """Test random buffers decode like int.from_bytes and re-encode identically."""
+        assert extractor.byte_size == size
+        assert extractor.signed is signed
+        rng = random.Random(size)
+        for _ in range(200):
+            data = bytearray(rng.getrandbits(8) for _ in range(size + 3))
+            expected = int.from_bytes(data[2 : 2 + size], endian, signed=signed)
+            assert extractor.extract(data, 2) == expected
+            assert extractor.extract(bytes(data), 2) == expected
+            assert extractor.extract(memoryview(data), 2) == expected
+            assert extractor.pack(expected) == data[2 : 2 + size]
+
+    @pytest.mark.parametrize(("extractor", "size", "signed", "endian"), CASES, ids=CASE_IDS)
+    def test_insufficient_data(self, extractor: RawExtractor, size: int, signed: bool, endian: Endian) -> None:
+        """Test short buffers raise InsufficientDataError with the required size."""
+        with pytest.raises(InsufficientDataError) as exc_info:
+            extractor.extract(bytearray(size + 1), 2)
+        assert exc_info.value.required == size
+        assert exc_info.value.actual == size - 1
+
+    @pytest.mark.parametrize(("extractor", "size", "signed", "endian"), CASES, ids=CASE_IDS)
+    def test_out_of_range_pack(self, extractor: RawExtractor, size: int, signed: bool, endian: Endian) -> None:
+        """Test values one past either bound raise ValueRangeError."""
+        bits = size * 8
+        low, high = (-(1 << (bits - 1)), (1 << (bits - 1)) - 1) if signed else (0, (1 << bits) - 1)
+        extractor.pack(low)
+        extractor.pack(high)
+        for value in (low - 1, high + 1):
+            with pytest.raises(ValueRangeError) as exc_info:
+                extractor.pack(value)
+            assert (exc_info.value.min_val, exc_info.value.max_val) == (low, high)
+
+    @pytest.mark.parametrize(("extractor", "size", "signed", "endian"), CASES, ids=CASE_IDS)
+    def test_pickle_round_trip(self, extractor: RawExtractor, size: int, signed: bool, endian: Endian) -> None:
+        """Test extractors survive pickling with their configuration."""
+        restored = pickle.loads(pickle.dumps(extractor))
+        data = bytearray(range(1, 1 + size))
+        assert type(restored) is type(extractor)
+        assert restored.extract(data) == extractor.extract(data)
+
+    def test_metadata_are_slots(self) -> None:
+        """Test byte_size/signed are plain slot attributes, not properties."""
+        extractor = Uint16Extractor()
+        assert not hasattr(extractor, "__dict__")
+        assert isinstance(RawExtractor.__dict__["byte_size"], MemberDescriptorType)
+        assert isinstance(RawExtractor.__dict__["signed"], MemberDescriptorType)
+
+
+class TestFloat32Extractor:
+    """Test raw-bits and float helpers of the float32 extractor."""
+
+    def test_raw_bits_and_float(self) -> None:
+        """Test raw bits are unsigned and the float helpers round trip."""
+        data = FLOAT32.pack_float(-1.5)
+        assert FLOAT32.extract(data) == 0xBFC00000
+        assert FLOAT32.pack(0xBFC00000) == data
+        assert FLOAT32.extract_float(memoryview(data)) == -1.5
+        assert get_extractor("FLOAT32") is FLOAT32
+        assert isinstance(pickle.loads(pickle.dumps(FLOAT32)), Float32Extractor)
+
+    def test_float_insufficient_data(self) -> None:
+        """Test short buffers raise InsufficientDataError."""
+        with pytest.raises(InsufficientDataError):
+            FLOAT32.extract_float(bytearray(3))
@@ -0,0 +1,149 @@
+"""Tests for precompiled flag-gated field layouts."""
+
+from __future__ import annotations
+
+import random
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from bluetooth_sig.gatt.characteristics import (
+    cross_trainer_data,
+    cycling_power_measurement,
+    heart_rate_measurement,
+    indoor_bike_data,
+    rower_data,
+    treadmill_data,
+)
+from bluetooth_sig.gatt.characteristics.utils.flag_layout import (
+    MAX_COMPILED_LAYOUTS,
+    FlagGroup,
+    FlagLayout,
+    LayoutField,
+)
+
+LAYOUT = FlagLayout(
+    "uint16",
+    (
+        FlagGroup((LayoutField("speed", "uint16", divisor=100.0),), mask=0x0001, inverted=True),
+        FlagGroup((LayoutField("distance", "uint24"),), mask=0x0002),
+        FlagGroup((LayoutField("level", "uint8", multiplier=10.0), LayoutField("power", "sint16")), mask=0x0004),
+        FlagGroup((LayoutField("offset", "sint24"),), mask=0x0008),
+    ),
+    tail=FlagGroup((LayoutField("samples", "uint16", divisor=2.0),), mask=0x0010),
+)
+
+
+class _DisabledLayout:
+    """Layout stand-in forcing the lenient field-by-field decoder."""
+
+    def decode(self, data: bytes | bytearray) -> None:
+        return None
+
+
+class TestFlagLayout:
+    """Test FlagLayout decoding and caching."""
+
+    def test_decode_field_values(self) -> None:
+        """Test each field kind against hand-computed values."""
+        # speed 100.00, distance 70000, level 50.0, power -200, offset -2
+        data = bytearray([0x0E, 0x00, 0x10, 0x27, 0x70, 0x11, 0x01, 0x05, 0x38, 0xFF, 0xFE, 0xFF, 0xFF])
+        assert LAYOUT.decode(data) == {
+            "flags": 0x0E,
+            "speed": 100.0,
+            "distance": 70000,
+            "level": 50.0,
+            "power": -200,
+            "offset": -2,
+            "samples": None,
+        }
+
+    def test_inverted_flag_skips_field(self) -> None:
+        """Test inverted groups are absent when their bit is set."""
+        values = LAYOUT.decode(bytearray([0x03, 0x00, 0x70, 0x11, 0x01]))
+        assert values is not None
+        assert values["speed"] is None
+        assert values["distance"] == 70000
+
+    def test_tail_repeats_to_end(self) -> None:
+        """Test the tail field is decoded until the end of the packet, ignoring a trailing odd byte."""
+        values = LAYOUT.decode(bytearray([0x11, 0x00, 0x04, 0x00, 0x06, 0x00, 0xFF]))
+        assert values is not None
+        assert values["samples"] == (2.0, 3.0)
+
+    def test_truncated_packet_returns_none(self) -> None:
+        """Test packets shorter than the compiled size defer to the caller."""
+        assert LAYOUT.decode(bytearray([0x02, 0x00, 0x10, 0x27])) is None
+        assert LAYOUT.decode(bytearray([0x00])) is None
+
+    def test_compiled_layout_cached_by_relevant_flags(self) -> None:
+        """Test flag bits outside every group share one compiled layout."""
+        layout = FlagLayout("uint16", (FlagGroup((LayoutField("a", "uint8"),), mask=0x0001),))
+        assert layout.compile(0x0001) is layout.compile(0x8001)
+        assert layout.cache_size() == 1
+        layout.clear_cache()
+        assert layout.cache_size() == 0
+
+    def test_cache_bounded(self) -> None:
+        """Test the compiled cache stops growing at its bound."""
+        groups = tuple(FlagGroup((LayoutField(f"f{bit}", "uint8"),), mask=1 << bit) for bit in range(11))
+        layout = FlagLayout("uint16", groups)
+        for flags in range(MAX_COMPILED_LAYOUTS + 10):
+            layout.compile(flags)
+        assert layout.cache_size() == MAX_COMPILED_LAYOUTS
+
+    def test_invalid_configuration(self) -> None:
+        """Test unsupported flag widths and multi-field tails are rejected."""
+        with pytest.raises(ValueError):
+            FlagLayout("sint16", ())
+        with pytest.raises(ValueError):
+            FlagLayout(
+                "uint8",
+                (),
+                tail=FlagGroup((LayoutField("a", "uint8"), LayoutField("b", "uint8"))),
+            )
+
+
+CHARACTERISTIC_MODULES: list[tuple[ModuleType, str]] = [
+    (indoor_bike_data, "IndoorBikeDataCharacteristic"),
+    (treadmill_data, "TreadmillDataCharacteristic"),
+    (rower_data, "RowerDataCharacteristic"),
+    (cross_trainer_data, "CrossTrainerDataCharacteristic"),
+    (cycling_power_measurement, "CyclingPowerMeasurementCharacteristic"),
+    (heart_rate_measurement, "HeartRateMeasurementCharacteristic"),
+]
+
+
+def _decode_or_error(char: Any, data: bytearray) -> Any:  # Any characteristic value
+    try:
+        return char._decode_value(data)
+    except ValueError as error:
+        return type(error), str(error)
+
+
+class TestCompiledCharacteristicLayouts:
+    """Test compiled layouts match the lenient decoders they short-circuit."""
+
+    @pytest.mark.parametrize(("module", "class_name"), CHARACTERISTIC_MODULES)
+    def test_matches_lenient_decoder(
+        self, module: ModuleType, class_name: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test random complete packets decode identically on both paths."""
+        char = getattr(module, class_name)()
+        layout: FlagLayout = module._LAYOUT
+        rng = random.Random(0x2A)
+        flags_bits = layout.flags_size * 8
+        packets: list[bytearray] = []
+        for _ in range(300):
+            flags = rng.getrandbits(flags_bits)
+            size = layout.compile(flags).size + rng.choice((0, 0, 1, 4))
+            payload = bytearray(rng.getrandbits(8) for _ in range(size - layout.flags_size))
+            packets.append(bytearray(flags.to_bytes(layout.flags_size, "little")) + payload)
+
+        compiled = [_decode_or_error(char, packet) for packet in packets]
+        monkeypatch.setattr(module, "_LAYOUT", _DisabledLayout())
+        lenient = [_decode_or_error(char, packet) for packet in packets]
+
+        assert any(not isinstance(value, tuple) for value in compiled)
+        assert [repr(value) for value in compiled] == [repr(value) for value in lenient]
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import math
+import random
 import struct
+from collections.abc import Iterator
 from datetime import datetime
 
 import pytest
 
+from bluetooth_sig.gatt.characteristics.templates import IEEE11073FloatTemplate
 from bluetooth_sig.gatt.characteristics.utils.ieee11073_parser import IEEE11073Parser
 from bluetooth_sig.gatt.exceptions import InsufficientDataError, ValueRangeError
 
@@ -281,3 +284,99 @@ class TestIEEE11073TimestampParser:
         result = IEEE11073Parser.encode_timestamp(timestamp)
         decoded = IEEE11073Parser.parse_timestamp(result, 0)
         assert decoded == timestamp
+
+
+def _reference_sfloat(raw_value: int) -> float:
+    """SFLOAT decoding as originally implemented (bit-field arithmetic per call)."""
+    if raw_value in (IEEE11073Parser.SFLOAT_NAN, IEEE11073Parser.SFLOAT_NRES):
+        return float("nan")
+    if raw_value == IEEE11073Parser.SFLOAT_POSITIVE_INFINITY:
+        return float("inf")
+    if raw_value == IEEE11073Parser.SFLOAT_NEGATIVE_INFINITY:
+        return float("-inf")
+    mantissa = raw_value & IEEE11073Parser.SFLOAT_MANTISSA_MASK
+    if mantissa >= IEEE11073Parser.SFLOAT_MANTISSA_SIGN_BIT:
+        mantissa -= IEEE11073Parser.SFLOAT_MANTISSA_CONVERSION
+    exponent = ((raw_value >> 12) & 0x0F) - IEEE11073Parser.SFLOAT_EXPONENT_BIAS
+    return float(mantissa * (10.0**exponent))
+
+
+ALL_SFLOAT_BYTES = b"".join(raw.to_bytes(2, "little") for raw in range(0x10000))
+REFERENCE_SFLOATS = [repr(_reference_sfloat(raw)) for raw in range(0x10000)]
+
+
+@pytest.fixture
+def sfloat_table() -> Iterator[None]:
+    """Enable the SFLOAT lookup table for one test."""
+    IEEE11073Parser.enable_sfloat_table()
+    try:
+        yield
+    finally:
+        IEEE11073Parser.disable_sfloat_table()
+
+
+class TestSFLOATExactness:
+    """Test every SFLOAT decoding path against the reference across all 65,536 inputs."""
+
+    def test_arithmetic_path(self) -> None:
+        """Test the default arithmetic decoder."""
+        assert not IEEE11073Parser.sfloat_table_enabled()
+        decoded = [repr(IEEE11073Parser.parse_sfloat(ALL_SFLOAT_BYTES, 2 * raw)) for raw in range(0x10000)]
+        assert decoded == REFERENCE_SFLOATS
+
+    @pytest.mark.usefixtures("sfloat_table")
+    def test_table_path(self) -> None:
+        """Test the precomputed table, through both byte and raw-bit entry points."""
+        assert IEEE11073Parser.sfloat_table_enabled()
+        decoded = [repr(IEEE11073Parser.parse_sfloat(ALL_SFLOAT_BYTES, 2 * raw)) for raw in range(0x10000)]
+        assert decoded == REFERENCE_SFLOATS
+        assert [repr(IEEE11073Parser.decode_sfloat(raw)) for raw in range(0x10000)] == REFERENCE_SFLOATS
+
+    def test_vectorized_path(self) -> None:
+        """Test the NumPy decoder over the whole SFLOAT space in one call."""
+        pytest.importorskip("numpy")
+        decoded = IEEE11073Parser.parse_sfloat_array(ALL_SFLOAT_BYTES)
+        assert [repr(value) for value in decoded.tolist()] == REFERENCE_SFLOATS
+
+
+class TestVectorizedDecoding:
+    """Test NumPy array decoding of SFLOAT/FLOAT32 buffers."""
+
+    def test_sfloat_offset_and_count(self) -> None:
+        """Test offset/count select values, and short buffers are rejected."""
+        pytest.importorskip("numpy")
+        data = bytearray([0xFF, 0x0A, 0xF0, 0xFF, 0x07])
+        assert IEEE11073Parser.parse_sfloat_array(data, 1).tolist()[0] == IEEE11073Parser.parse_sfloat(data, 1)
+        assert math.isnan(IEEE11073Parser.parse_sfloat_array(data, 3, 1)[0])
+        with pytest.raises(InsufficientDataError):
+            IEEE11073Parser.parse_sfloat_array(data, 3, 2)
+
+    def test_float32_matches_scalar(self) -> None:
+        """Test random FLOAT32 patterns, every exponent and reserved values match the scalar decoder."""
+        pytest.importorskip("numpy")
+        rng = random.Random(11073)
+        raws = [rng.getrandbits(32) for _ in range(20000)]
+        raws += [(field << 24) | rng.getrandbits(24) for field in range(256)]
+        raws += [
+            IEEE11073Parser.FLOAT32_NAN,
+            IEEE11073Parser.FLOAT32_NRES,
+            IEEE11073Parser.FLOAT32_RFU,
+            IEEE11073Parser.FLOAT32_POSITIVE_INFINITY,
+            IEEE11073Parser.FLOAT32_NEGATIVE_INFINITY,
+            0xFF800000,
+            0xFF7FFFFF,
+        ]
+        data = b"".join(raw.to_bytes(4, "little") for raw in raws)
+        decoded = IEEE11073Parser.parse_float32_array(data)
+        expected = [repr(IEEE11073Parser.parse_float32(data, 4 * index)) for index in range(len(raws))]
+        assert [repr(value) for value in decoded.tolist()] == expected
+
+    def test_template_decode_array(self) -> None:
+        """Test the SFLOAT template's bulk decoder agrees with decode_value."""
+        pytest.importorskip("numpy")
+        template = IEEE11073FloatTemplate()
+        data = bytearray(ALL_SFLOAT_BYTES[0x1000:0x1100])
+        values = template.decode_array(data).tolist()
+        assert [repr(value) for value in values] == [
+            repr(template.decode_value(data, 2 * index)) for index in range(len(values))
+        ]
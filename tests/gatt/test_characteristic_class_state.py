@@ -0,0 +1,143 @@
+"""Tests for per-class shared characteristic state and slotted instances."""
+
+from __future__ import annotations
+
+from bluetooth_sig.gatt.characteristics.base import ValidationConfig
+from bluetooth_sig.gatt.characteristics.battery_level import BatteryLevelCharacteristic
+from bluetooth_sig.gatt.characteristics.custom import CustomBaseCharacteristic
+from bluetooth_sig.gatt.characteristics.temperature import TemperatureCharacteristic
+from bluetooth_sig.gatt.context import CharacteristicContext
+from bluetooth_sig.gatt.descriptors.cccd import CCCDDescriptor
+from bluetooth_sig.types import CharacteristicInfo
+from bluetooth_sig.types.uuid import BluetoothUUID
+
+
+class _LimitedCharacteristic(CustomBaseCharacteristic):
+    """Custom characteristic declaring class-level limits."""
+
+    expected_length: int | None = 1
+    max_value: int | float | None = 50
+
+    _info = CharacteristicInfo(uuid=BluetoothUUID("ABCD0001-0000-1000-8000-00805F9B34FB"), name="Limited")
+
+    def _decode_value(self, data: bytearray, ctx: CharacteristicContext | None = None, *, validate: bool = True) -> int:
+        return data[0]
+
+    def _encode_value(self, data: int) -> bytearray:
+        return bytearray([data])
+
+
+class TestSharedClassState:
+    """Test immutable per-class data is built once and shared."""
+
+    def test_sig_instances_have_no_dict(self) -> None:
+        """Test SIG characteristic instances are fully slotted."""
+        assert not hasattr(BatteryLevelCharacteristic(), "__dict__")
+        assert not hasattr(TemperatureCharacteristic(), "__dict__")
+
+    def test_state_shared_between_instances(self) -> None:
+        """Test spec, info and special value resolver are shared objects."""
+        first, second = TemperatureCharacteristic(), TemperatureCharacteristic()
+        assert first._state is second._state
+        assert first.info is second.info
+        assert first.spec is second.spec
+        assert first._special_resolver is second._special_resolver
+        assert first.gss_special_values is second.gss_special_values
+        assert first._parse_pipeline is BatteryLevelCharacteristic()._parse_pipeline
+
+    def test_state_per_class(self) -> None:
+        """Test each class gets its own state rather than inheriting its parent's."""
+        assert TemperatureCharacteristic()._state is not BatteryLevelCharacteristic()._state
+        assert TemperatureCharacteristic().name != BatteryLevelCharacteristic().name
+
+    def test_special_values_resolved(self) -> None:
+        """Test GSS special values still resolve through the shared resolver."""
+        char = TemperatureCharacteristic()
+        assert char.is_special_value(-32768)
+        assert char.try_parse_value(bytes([0x00, 0x80])).special_value is not None
+
+    def test_dependencies_resolved_once(self) -> None:
+        """Test dependency UUIDs are cached on the class state."""
+        char = BatteryLevelCharacteristic()
+        assert char.required_dependencies == []
+        assert char._state.required_dependencies == []
+
+
+class TestValidationLimits:
+    """Test validation limits live in a shared config with per-instance overrides."""
+
+    def test_class_limits_read_through(self) -> None:
+        """Test class-level declarations are visible on the class and instances."""
+        char = _LimitedCharacteristic(auto_register=False)
+        assert _LimitedCharacteristic.max_value == 50
+        assert char.max_value == 50
+        assert char.expected_length == 1
+        assert char._validation is _LimitedCharacteristic._class_validation
+
+    def test_constructor_config_overrides_instance(self) -> None:
+        """Test a ValidationConfig replaces the limits for that instance only."""
+        char = _LimitedCharacteristic(auto_register=False, validation=ValidationConfig(max_value=10))
+        assert char.max_value == 10
+        assert char.expected_length is None
+        assert _LimitedCharacteristic(auto_register=False).max_value == 50
+        assert not char.try_parse_value(bytes([20])).ok
+
+    def test_assignment_does_not_leak(self) -> None:
+        """Test assigning a limit copies the shared config first."""
+        char = _LimitedCharacteristic(auto_register=False)
+        char.max_value = 5
+        assert char.max_value == 5
+        assert _LimitedCharacteristic.max_value == 50
+        assert _LimitedCharacteristic(auto_register=False).max_value == 50
+
+    def test_limits_inherited(self) -> None:
+        """Test subclasses inherit and extend their parent's limits."""
+
+        class _Narrower(_LimitedCharacteristic):
+            min_value: int | float | None = 5
+
+        assert _Narrower.max_value == 50
+        assert _Narrower.min_value == 5
+        assert _LimitedCharacteristic.min_value is None
+
+    def test_class_assignment_applies_to_validation(self) -> None:
+        """Test assigning a limit on a class is enforced and inherited."""
+
+        class _Parent(_LimitedCharacteristic):
+            pass
+
+        class _Inheriting(_Parent):
+            pass
+
+        class _Declaring(_Parent):
+            max_value: int | float | None = 40
+
+        _Parent.max_value = 10
+        assert _Parent._class_validation.max_value == 10
+        assert not _Parent(auto_register=False).try_parse_value(bytes([20])).ok
+        assert not _Inheriting(auto_register=False).try_parse_value(bytes([20])).ok
+        assert _Declaring(auto_register=False).try_parse_value(bytes([20])).ok
+        assert _LimitedCharacteristic(auto_register=False).try_parse_value(bytes([20])).ok
+
+        _Parent.expected_length = 2
+        assert not _Parent(auto_register=False).try_parse_value(bytes([5])).ok
+
+
+class TestInstanceState:
+    """Test the remaining per-instance state."""
+
+    def test_descriptors_created_lazily(self) -> None:
+        """Test the descriptor dict only exists once a descriptor is added."""
+        char = BatteryLevelCharacteristic()
+        assert char._descriptors is None
+        assert char.get_descriptors() == {}
+        assert char.get_cccd() is None
+        char.add_descriptor(CCCDDescriptor())
+        assert char.get_cccd() is not None
+        assert BatteryLevelCharacteristic().get_descriptors() == {}
+
+    def test_user_subclass_keeps_dict(self) -> None:
+        """Test subclasses defined outside the package may still add attributes."""
+        char = _LimitedCharacteristic(auto_register=False)
+        char.extra = 1  # type: ignore[attr-defined]
+        assert char.extra == 1  # type: ignore[attr-defined]
@@ -0,0 +1,78 @@
+"""Tests for context-based characteristic lookup."""
+
+from __future__ import annotations
+
+import pytest
+
+from bluetooth_sig.gatt.characteristics import context_lookup
+from bluetooth_sig.gatt.characteristics.body_sensor_location import BodySensorLocationCharacteristic
+from bluetooth_sig.gatt.characteristics.characteristic_meta import context_lookup_name
+from bluetooth_sig.gatt.characteristics.heart_rate_measurement import HeartRateMeasurementCharacteristic
+from bluetooth_sig.gatt.context import CharacteristicContext
+from bluetooth_sig.types.gatt_enums import CharacteristicName
+
+BODY_SENSOR_LOCATION_KEY = "00002A38-0000-1000-8000-00805F9B34FB"
+
+
+@pytest.fixture
+def ctx() -> CharacteristicContext:
+    key = str(BodySensorLocationCharacteristic.get_class_uuid())
+    assert key.upper() == BODY_SENSOR_LOCATION_KEY
+    return CharacteristicContext(other_characteristics={key: 2})
+
+
+class TestContextLookupName:
+    """Test class-name derivation done at class creation."""
+
+    def test_name_precomputed_on_class(self) -> None:
+        """Test the metaclass stores the lookup name on each class."""
+        assert BodySensorLocationCharacteristic._context_lookup_name == "Body Sensor Location"
+
+    def test_context_lookup_name(self) -> None:
+        """Test the suffix is dropped and words are split."""
+        assert context_lookup_name("HeartRateMeasurementCharacteristic") == "Heart Rate Measurement"
+
+
+class TestGetContextCharacteristic:
+    """Test lookups by class, enum and string name."""
+
+    def test_lookup_by_class(self, ctx: CharacteristicContext) -> None:
+        """Test lookup by class resolves and caches the class key."""
+        char = HeartRateMeasurementCharacteristic()
+        assert char.get_context_characteristic(ctx, BodySensorLocationCharacteristic) == 2
+        assert BodySensorLocationCharacteristic._context_key is not None
+        assert BodySensorLocationCharacteristic._context_key.upper() == BODY_SENSOR_LOCATION_KEY
+
+    def test_lookup_by_enum_and_string(self, ctx: CharacteristicContext) -> None:
+        """Test lookups by enum member and by name string agree."""
+        char = HeartRateMeasurementCharacteristic()
+        assert char.get_context_characteristic(ctx, CharacteristicName.BODY_SENSOR_LOCATION) == 2
+        assert char.get_context_characteristic(ctx, "Body Sensor Location") == 2
+
+    def test_name_key_cached(self, ctx: CharacteristicContext, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the registry is consulted once per name."""
+        monkeypatch.setattr(context_lookup, "_name_keys", {})
+        calls: list[str] = []
+        original = context_lookup.ContextLookupMixin._get_characteristic_uuid_by_name
+
+        def counting(name: CharacteristicName | str) -> object:
+            calls.append(str(name))
+            return original(name)
+
+        monkeypatch.setattr(context_lookup.ContextLookupMixin, "_get_characteristic_uuid_by_name", counting)
+        char = HeartRateMeasurementCharacteristic()
+        for _ in range(3):
+            assert char.get_context_characteristic(ctx, "Body Sensor Location") == 2
+        assert calls == ["Body Sensor Location"]
+
+    def test_unknown_name_returns_none(self, ctx: CharacteristicContext) -> None:
+        """Test names missing from the registry never match."""
+        char = HeartRateMeasurementCharacteristic()
+        assert char.get_context_characteristic(ctx, "Not A Characteristic") is None
+        assert context_lookup._name_keys["Not A Characteristic"] == ""
+
+    def test_missing_context_returns_none(self) -> None:
+        """Test empty or missing contexts short-circuit."""
+        char = HeartRateMeasurementCharacteristic()
+        assert char.get_context_characteristic(None, BodySensorLocationCharacteristic) is None
+        assert char.get_context_characteristic(CharacteristicContext(), BodySensorLocationCharacteristic) is None
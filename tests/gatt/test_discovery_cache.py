@@ -0,0 +1,189 @@
+"""Tests for resolved service tree caching across repeated discoveries."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from bluetooth_sig.core.service_manager import ServiceManager
+from bluetooth_sig.device.connected import DeviceConnected
+from bluetooth_sig.gatt.characteristics.battery_level import BatteryLevelCharacteristic
+from bluetooth_sig.gatt.characteristics.unknown import UnknownCharacteristic
+from bluetooth_sig.gatt.discovery_cache import ServiceDiscoveryCache, ServiceTreePrototype, layout_hash
+from bluetooth_sig.gatt.services.battery_service import BatteryService
+from bluetooth_sig.gatt.services.custom import CustomBaseGattService
+from bluetooth_sig.gatt.services.registry import GattServiceRegistry
+from bluetooth_sig.types import CharacteristicInfo, ServiceInfo
+from bluetooth_sig.types.device_types import DeviceService
+from bluetooth_sig.types.uuid import BluetoothUUID
+
+BATTERY_SERVICE = BluetoothUUID("180F")
+BATTERY_LEVEL = BluetoothUUID("2A19")
+VENDOR_SERVICE = BluetoothUUID("AA002000-0000-1000-8000-00805F9B34FB")
+VENDOR_CHARACTERISTIC = BluetoothUUID("AA002001-0000-1000-8000-00805F9B34FB")
+
+SERVICES: dict[str, dict[str, Any]] = {
+    str(BATTERY_SERVICE): {"characteristics": {str(BATTERY_LEVEL): {"name": "Battery Level"}}},
+    str(VENDOR_SERVICE): {
+        "characteristics": {str(VENDOR_CHARACTERISTIC): {"name": "Vendor Data", "value_type": "int"}},
+    },
+}
+
+
+class _StaticServicesManager:  # pylint: disable=too-few-public-methods
+    """Connection manager stand-in that only reports a fixed service list."""
+
+    def __init__(self, services: list[DeviceService]) -> None:
+        self.services = services
+
+    async def get_services(self) -> list[DeviceService]:
+        return self.services
+
+
+class TestLayoutHash:
+    """Test layout keys for databases without a Database Hash value."""
+
+    def test_stable_across_uuid_forms(self) -> None:
+        """Test short and full UUID strings of the same layout hash equally."""
+        assert layout_hash([(BATTERY_SERVICE, [BATTERY_LEVEL])]) == layout_hash(
+            [(BluetoothUUID("0000180f-0000-1000-8000-00805f9b34fb"), [BluetoothUUID("2a19")])]
+        )
+
+    def test_order_and_nesting_matter(self) -> None:
+        """Test reordering or moving a characteristic changes the key."""
+        base = layout_hash([(BATTERY_SERVICE, [BATTERY_LEVEL]), (VENDOR_SERVICE, [VENDOR_CHARACTERISTIC])])
+        reordered = layout_hash([(VENDOR_SERVICE, [VENDOR_CHARACTERISTIC]), (BATTERY_SERVICE, [BATTERY_LEVEL])])
+        moved = layout_hash([(BATTERY_SERVICE, []), (VENDOR_SERVICE, [BATTERY_LEVEL, VENDOR_CHARACTERISTIC])])
+        assert len({base, reordered, moved}) == 3
+
+
+class TestServiceTreePrototype:
+    """Test prototype resolution and instantiation."""
+
+    def test_instantiate_creates_fresh_instances(self) -> None:
+        """Test every instantiation yields new service and characteristic objects."""
+        prototype = ServiceTreePrototype.from_layout([(BATTERY_SERVICE, [BATTERY_LEVEL])])
+        first = prototype.instantiate()
+        second = prototype.instantiate()
+        key = str(BATTERY_SERVICE)
+        assert isinstance(first[key], BatteryService)
+        assert first[key] is not second[key]
+        assert isinstance(first[key].characteristics[BATTERY_LEVEL], BatteryLevelCharacteristic)
+        assert first[key].characteristics[BATTERY_LEVEL] is not second[key].characteristics[BATTERY_LEVEL]
+
+    def test_unknown_service_and_characteristic(self) -> None:
+        """Test unknown services are skipped and unknown characteristics kept as UnknownCharacteristic."""
+        prototype = ServiceTreePrototype.from_layout(
+            [(BATTERY_SERVICE, [BATTERY_LEVEL, VENDOR_CHARACTERISTIC]), (VENDOR_SERVICE, [VENDOR_CHARACTERISTIC])]
+        )
+        assert prototype.service_classes() == {BATTERY_SERVICE: BatteryService, VENDOR_SERVICE: None}
+        services = prototype.instantiate()
+        assert list(services) == [str(BATTERY_SERVICE)]
+        assert isinstance(services[str(BATTERY_SERVICE)].characteristics[VENDOR_CHARACTERISTIC], UnknownCharacteristic)
+
+
+class TestServiceDiscoveryCache:
+    """Test the bounded prototype cache."""
+
+    def test_hits_misses_and_eviction(self) -> None:
+        """Test lookups are counted and the least recently used entry is evicted."""
+        cache = ServiceDiscoveryCache(max_entries=2)
+        prototype = ServiceTreePrototype.from_layout([(BATTERY_SERVICE, [BATTERY_LEVEL])])
+        assert cache.get(b"a") is None
+        cache.put(b"a", prototype)
+        cache.put(b"b", prototype)
+        assert cache.get(b"a") is prototype
+        cache.put(b"c", prototype)
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") is prototype
+        assert (len(cache), cache.hits, cache.misses) == (2, 2, 2)
+
+    def test_registration_invalidates_prototypes(self) -> None:
+        """Test registering a service class makes earlier prototypes stale."""
+
+        class VendorService(CustomBaseGattService):
+            _info = ServiceInfo(uuid=VENDOR_SERVICE, name="Vendor")
+
+        cache = ServiceDiscoveryCache()
+        layout = [(VENDOR_SERVICE, [VENDOR_CHARACTERISTIC])]
+        cache.put(b"vendor", ServiceTreePrototype.from_layout(layout))
+        GattServiceRegistry.register_service_class(VENDOR_SERVICE, VendorService)
+        try:
+            assert cache.get(b"vendor") is None
+            assert len(cache) == 0
+            assert ServiceTreePrototype.from_layout(layout).service_classes() == {VENDOR_SERVICE: VendorService}
+        finally:
+            GattServiceRegistry.unregister_service_class(VENDOR_SERVICE)
+
+    def test_invalid_size(self) -> None:
+        """Test a non-positive capacity is rejected."""
+        with pytest.raises(ValueError, match="max_entries"):
+            ServiceDiscoveryCache(max_entries=0)
+
+
+class TestCachedDiscovery:
+    """Test service managers and devices reuse prototypes for identical databases."""
+
+    def test_service_manager_reuses_prototype(self) -> None:
+        """Test a second identical discovery is a cache hit with equivalent services."""
+        cache = ServiceDiscoveryCache()
+        first = ServiceManager(cache)
+        second = ServiceManager(cache)
+
+        first.process_services(SERVICES)
+        second.process_services(SERVICES)
+
+        assert (cache.hits, cache.misses) == (1, 1)
+        service = second.get_service_by_uuid(str(BATTERY_SERVICE))
+        assert isinstance(service, BatteryService)
+        assert service is not first.get_service_by_uuid(str(BATTERY_SERVICE))
+        assert isinstance(service.characteristics[BATTERY_LEVEL], BatteryLevelCharacteristic)
+        assert second.get_service_by_uuid(str(VENDOR_SERVICE)) is None
+
+    def test_database_hash_keys_the_cache(self) -> None:
+        """Test a Database Hash value is used as the key instead of the layout."""
+        cache = ServiceDiscoveryCache()
+        ServiceManager(cache).process_services(SERVICES, database_hash=bytes(16))
+        assert cache.get(b"services:" + bytes(16)) is not None
+
+    @pytest.mark.asyncio
+    async def test_layout_prototype_not_reused_for_named_services(self) -> None:
+        """Test a device discovery does not supply nameless characteristics to a translator."""
+        cache = ServiceDiscoveryCache()
+        database_hash = bytes(range(16))
+        vendor = UnknownCharacteristic(info=CharacteristicInfo(uuid=VENDOR_CHARACTERISTIC, name="Adapter Name"))
+        raw = DeviceService(service=BatteryService(), characteristics={str(VENDOR_CHARACTERISTIC): vendor})
+        connected = DeviceConnected("AA:BB:CC:DD:EE:01", _StaticServicesManager([raw]), discovery_cache=cache)  # type: ignore[arg-type]
+        await connected.discover_services(database_hash=database_hash)
+
+        manager = ServiceManager(cache)
+        manager.process_services(
+            {
+                str(BATTERY_SERVICE): {
+                    "characteristics": {str(VENDOR_CHARACTERISTIC): {"name": "Vendor Data", "unit": "V"}}
+                }
+            },
+            database_hash=database_hash,
+        )
+        service = manager.get_service_by_uuid(str(BATTERY_SERVICE))
+        assert service is not None
+        characteristic = service.characteristics[VENDOR_CHARACTERISTIC]
+        assert characteristic.name == "Unknown: Vendor Data"
+        assert characteristic.unit == "V"
+
+    @pytest.mark.asyncio
+    async def test_device_discovery_reuses_prototype(self) -> None:
+        """Test devices with the same layout share the resolved service classes."""
+        cache = ServiceDiscoveryCache()
+        devices = []
+        for address in ("AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:02"):
+            characteristic = BatteryLevelCharacteristic()
+            raw = DeviceService(service=BatteryService(), characteristics={str(BATTERY_LEVEL): characteristic})
+            connected = DeviceConnected(address, _StaticServicesManager([raw]), discovery_cache=cache)  # type: ignore[arg-type]
+            services = await connected.discover_services()
+            assert services[0].service_class is BatteryService
+            # The adapter's own characteristic instances are kept
+            assert services[0].characteristics[str(BATTERY_LEVEL)] is characteristic
+            devices.append(connected)
+        assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,152 @@
+"""Tests for the non-raising BaseCharacteristic.try_parse_value API."""
+
+from __future__ import annotations
+
+import pytest
+
+from bluetooth_sig.gatt.characteristics.battery_level import BatteryLevelCharacteristic
+from bluetooth_sig.gatt.characteristics.custom import CustomBaseCharacteristic
+from bluetooth_sig.gatt.characteristics.temperature import TemperatureCharacteristic
+from bluetooth_sig.gatt.context import CharacteristicContext
+from bluetooth_sig.gatt.exceptions import CharacteristicParseError, ParseFieldError, SpecialValueDetectedError
+from bluetooth_sig.types import CharacteristicInfo, ParseErrorCode, ParseOutcome
+from bluetooth_sig.types.uuid import BluetoothUUID
+
+
+class RangeCheckedCharacteristic(CustomBaseCharacteristic):
+    """Characteristic with length, range and type constraints."""
+
+    expected_length: int | None = 2
+    min_value: int | float | None = 0
+    max_value: int | float | None = 100
+    expected_type: type | None = int
+
+    _info = CharacteristicInfo(
+        uuid=BluetoothUUID("12345678-1234-1234-1234-123456789020"),
+        name="Range Checked",
+        unit="",
+        python_type=int,
+    )
+
+    def _decode_value(self, data: bytearray, ctx: CharacteristicContext | None = None, *, validate: bool = True) -> int:
+        return int.from_bytes(data[:2], byteorder="little", signed=False)
+
+    def _encode_value(self, data: int) -> bytearray:
+        return bytearray(data.to_bytes(2, byteorder="little", signed=False))
+
+
+class FieldCheckedCharacteristic(CustomBaseCharacteristic):
+    """Characteristic whose decoder reports a field-level failure."""
+
+    _info = CharacteristicInfo(
+        uuid=BluetoothUUID("12345678-1234-1234-1234-123456789021"),
+        name="Field Checked",
+        unit="",
+        python_type=int,
+    )
+
+    def _decode_value(self, data: bytearray, ctx: CharacteristicContext | None = None, *, validate: bool = True) -> int:
+        if data[0] > 0x7F:
+            raise ParseFieldError("Field Checked", "level", data, "reserved value", offset=0)
+        return data[0]
+
+    def _encode_value(self, data: int) -> bytearray:
+        return bytearray([data])
+
+
+class TestTryParseValue:
+    """Test try_parse_value outcomes mirror parse_value behaviour."""
+
+    def test_ok(self) -> None:
+        """Test a valid payload yields an OK result."""
+        char = BatteryLevelCharacteristic()
+        result = char.try_parse_value(b"\x55")
+
+        assert result.ok
+        assert result.outcome is ParseOutcome.OK
+        assert result.value == 85
+        assert result.value_or(-1) == 85
+        assert result.unwrap() == 85
+        assert result.to_exception() is None
+        assert char.last_parsed == 85
+
+    def test_special_value(self) -> None:
+        """Test a sentinel yields SPECIAL_VALUE instead of raising."""
+        result = TemperatureCharacteristic().try_parse_value(b"\x00\x80")
+
+        assert result.outcome is ParseOutcome.SPECIAL_VALUE
+        assert result.special_value is not None
+        assert result.special_value.meaning == "value is not known"
+        assert result.value is None
+        assert result.value_or(None) is None
+        assert "Special value detected" in result.message
+        with pytest.raises(SpecialValueDetectedError):
+            result.unwrap()
+
+    def test_invalid_length(self) -> None:
+        """Test a length violation yields INVALID_LENGTH."""
+        result = RangeCheckedCharacteristic().try_parse_value(b"\x32")
+
+        assert result.outcome is ParseOutcome.ERROR
+        assert result.error_code is ParseErrorCode.INVALID_LENGTH
+        assert "expected exactly 2 bytes, got 1" in result.message
+
+    def test_out_of_range(self) -> None:
+        """Test a range violation yields OUT_OF_RANGE."""
+        result = RangeCheckedCharacteristic().try_parse_value(b"\xc8\x00")
+
+        assert result.error_code is ParseErrorCode.OUT_OF_RANGE
+        assert "Value 200 is above maximum 100" in result.message
+
+    def test_out_of_range_skipped_without_validation(self) -> None:
+        """Test validate=False skips range checks like parse_value."""
+        result = RangeCheckedCharacteristic().try_parse_value(b"\xc8\x00", validate=False)
+        assert result.value == 200
+
+    def test_decode_failed(self) -> None:
+        """Test a decoder exception yields DECODE_FAILED."""
+        result = TemperatureCharacteristic().try_parse_value(b"\x00")
+
+        assert result.outcome is ParseOutcome.ERROR
+        assert result.error_code is ParseErrorCode.DECODE_FAILED
+        assert result.value_or("fallback") == "fallback"
+
+    @pytest.mark.parametrize(
+        ("char_class", "payload"),
+        [
+            (TemperatureCharacteristic, b"\x00"),
+            (RangeCheckedCharacteristic, b"\x32"),
+            (RangeCheckedCharacteristic, b"\xc8\x00"),
+            (FieldCheckedCharacteristic, b"\xff"),
+        ],
+    )
+    def test_to_exception_matches_parse_value(self, char_class: type, payload: bytes) -> None:
+        """Test the materialized exception matches what parse_value raises."""
+        char = char_class()
+        with pytest.raises(CharacteristicParseError) as exc_info:
+            char.parse_value(payload)
+        expected = exc_info.value
+
+        result = char.try_parse_value(payload)
+        error = result.to_exception()
+        assert isinstance(error, CharacteristicParseError)
+        assert result.to_exception() is error
+        assert error.name == expected.name
+        assert error.uuid == expected.uuid
+        assert error.raw_data == expected.raw_data == payload
+        assert error.raw_int == expected.raw_int
+        assert str(error) == str(expected)
+        assert error.field_errors == expected.field_errors
+        assert error.validation is not None and expected.validation is not None
+        assert error.validation.errors == expected.validation.errors
+        assert error.validation.warnings == expected.validation.warnings
+        assert type(error.__cause__) is type(expected.__cause__)
+        assert str(error.__cause__) == str(expected.__cause__)
+
+    def test_to_exception_keeps_field_errors(self) -> None:
+        """Test a decoder's field-level failure survives into the exception."""
+        error = FieldCheckedCharacteristic().try_parse_value(b"\xff").to_exception()
+        assert isinstance(error, CharacteristicParseError)
+        assert [(field.field, field.reason, field.offset) for field in error.field_errors] == [
+            ("level", "reserved value", 0)
+        ]
@@ -0,0 +1,99 @@
+"""Tests for the compact company name table and its precompiled form."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from bluetooth_sig.registry.company_identifiers import (
+    CompanyIdentifiersRegistry,
+    CompanyNameTable,
+    compile_company_table,
+)
+from bluetooth_sig.registry.utils import find_bluetooth_sig_path
+
+YAML_DOCUMENT = """\
+company_identifiers:
+  - value: 0x0059
+    name: 'Nordic Semiconductor ASA'
+  - value: 0x004C
+    name: 'Apple, Inc.'
+  - value: 0x0006
+    name: 'Microsoft'
+"""
+
+
+class TestCompanyNameTable:
+    """Test table lookups and the precompiled round trip."""
+
+    def test_lookup(self) -> None:
+        """Test known IDs resolve and anything else returns None."""
+        table = CompanyNameTable([(0x0059, "Nordic"), (0x004C, "Apple"), (0x0006, "Microsoft")])
+        assert len(table) == 3
+        assert table.get(0x004C) == "Apple"
+        assert table.get(0x0006) == "Microsoft"
+        assert table.get(0x0007) is None
+        assert table.get(-1) is None
+        assert table.get(0x10000) is None
+
+    def test_out_of_range_ids_dropped(self) -> None:
+        """Test entries outside uint16 never reach the table."""
+        table = CompanyNameTable([(-1, "negative"), (0x10000, "too big"), (1, "one")])
+        assert len(table) == 1
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test compiling YAML and decoding the result preserves every entry."""
+        yaml_path = tmp_path / "company_identifiers.yaml"
+        yaml_path.write_text(YAML_DOCUMENT)
+        output = tmp_path / "table.msgpack"
+        compiled = compile_company_table(yaml_path, output)
+        decoded = CompanyNameTable.decode(output.read_bytes())
+        assert decoded.source_digest == compiled.source_digest != ""
+        assert [decoded.get(cid) for cid in (0x0006, 0x004C, 0x0059)] == [
+            "Microsoft",
+            "Apple, Inc.",
+            "Nordic Semiconductor ASA",
+        ]
+
+    def test_decode_rejects_other_data(self) -> None:
+        """Test foreign or truncated buffers raise ValueError."""
+        with pytest.raises(ValueError, match="not a precompiled"):
+            CompanyNameTable.decode(b"company_identifiers: []")
+        with pytest.raises(ValueError, match="Corrupt"):
+            CompanyNameTable.decode(CompanyNameTable([(1, "one")]).encode()[:-2])
+
+
+class TestPrecompiledRegistry:
+    """Test the registry prefers a precompiled table that matches its YAML."""
+
+    @pytest.fixture
+    def yaml_path(self) -> Path:
+        """Return the SIG company identifiers YAML."""
+        uuids_path = find_bluetooth_sig_path()
+        assert uuids_path is not None
+        return uuids_path.parent / "company_identifiers" / "company_identifiers.yaml"
+
+    def test_matching_table_used(self, tmp_path: Path, yaml_path: Path) -> None:
+        """Test a table compiled from the current YAML is loaded as-is."""
+        table_path = tmp_path / "table.msgpack"
+        compile_company_table(yaml_path, table_path)
+        registry = CompanyIdentifiersRegistry(table_path=table_path)
+        assert registry.get_company_name(0x004C) == "Apple, Inc."
+        assert registry._table.source_digest != ""  # Only precompiled tables carry a digest
+
+    def test_stale_table_ignored(self, tmp_path: Path) -> None:
+        """Test a table built from different YAML falls back to the source."""
+        stale_yaml = tmp_path / "company_identifiers.yaml"
+        stale_yaml.write_text("company_identifiers:\n  - value: 0x004C\n    name: 'Stale'\n")
+        table_path = tmp_path / "table.msgpack"
+        compile_company_table(stale_yaml, table_path)
+        registry = CompanyIdentifiersRegistry(table_path=table_path)
+        assert registry.get_company_name(0x004C) == "Apple, Inc."
+
+    def test_unreadable_table_ignored(self, tmp_path: Path) -> None:
+        """Test a missing or corrupt table falls back to the YAML source."""
+        corrupt = tmp_path / "table.msgpack"
+        corrupt.write_bytes(b"garbage")
+        assert CompanyIdentifiersRegistry(table_path=corrupt).get_company_name(0x0006) == "Microsoft"
+        assert CompanyIdentifiersRegistry(table_path=tmp_path / "missing").get_company_name(0x0006) == "Microsoft"
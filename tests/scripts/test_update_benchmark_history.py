@@ -0,0 +1,79 @@
+"""Tests for scripts/update_benchmark_history.py."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+from pathlib import Path
+from types import ModuleType
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_SCRIPT = _PROJECT_ROOT / "scripts" / "update_benchmark_history.py"
+
+
+def _load_script() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("update_benchmark_history", _SCRIPT)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+BENCHMARK_JSON = {
+    "datetime": "2026-01-01T00:00:00+00:00",
+    "commit_info": {"id": "0123456789abcdef"},
+    "benchmarks": [
+        {"name": "test_uuid_lookup", "stats": {"mean": 2e-6, "max": 5e-6, "stddev": 1e-7}},
+        {
+            "name": "test_parse_advertising_data",
+            "stats": {"mean": 0.025, "max": 0.03, "stddev": 0.001},
+            "extra_info": {"packets": 500},
+        },
+        {
+            "name": "test_registry_footprint[gss_registry]",
+            "stats": {"mean": 1.0, "max": 1.0, "stddev": 0.0},
+            "extra_info": {"bytes": 600_000, "threshold_bytes": 720_000},
+        },
+        {
+            "name": "test_tracked_device",
+            "stats": {"mean": 0.3, "max": 0.3, "stddev": 0.0},
+            "extra_info": {"bytes": 3200, "threshold_bytes": 3000},
+        },
+    ],
+}
+
+
+class TestExtractSummary:
+    """Summary extraction keeps timings and derives packet throughput."""
+
+    def test_timings_in_microseconds(self) -> None:
+        """Plain benchmarks keep mean/max/stddev only."""
+        summary = _load_script().extract_summary(BENCHMARK_JSON)
+        assert summary["commit"] == "01234567"
+        assert summary["results"]["test_uuid_lookup"] == {"mean": 2.0, "max": 5.0, "stddev": 0.1}
+
+    def test_packets_per_second(self) -> None:
+        """Corpus benchmarks also record packets/sec from their packet count."""
+        result = _load_script().extract_summary(BENCHMARK_JSON)["results"]["test_parse_advertising_data"]
+        assert result["mean"] == 25000.0
+        assert result["packets_per_sec"] == 20000.0
+
+    def test_memory_thresholds(self) -> None:
+        """Memory benchmarks keep bytes and threshold, and overruns are listed as regressions."""
+        summary = _load_script().extract_summary(BENCHMARK_JSON)
+        assert summary["results"]["test_registry_footprint[gss_registry]"]["bytes"] == 600_000
+        assert summary["results"]["test_tracked_device"]["threshold_bytes"] == 3000
+        assert summary["memory_regressions"] == ["test_tracked_device"]
+
+    def test_update_history_appends(self, tmp_path: Path) -> None:
+        """History files grow by one summary per run."""
+        current = tmp_path / "benchmark.json"
+        history = tmp_path / "history" / "history.json"
+        current.write_text(json.dumps(BENCHMARK_JSON), encoding="utf-8")
+        script = _load_script()
+        script.update_history(current, history)
+        script.update_history(current, history)
+        entries = json.loads(history.read_text(encoding="utf-8"))
+        assert len(entries) == 2
+        assert "packets_per_sec" in entries[-1]["results"]["test_parse_advertising_data"]
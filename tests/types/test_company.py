@@ -1,5 +1,9 @@
 """Test ManufacturerData and CompanyIdentifier types."""
 
+import msgspec
+import pytest
+
+from bluetooth_sig.types import company as company_module
 from bluetooth_sig.types.company import CompanyIdentifier, ManufacturerData
 
 
@@ -55,3 +59,39 @@ def test_manufacturer_data_too_short() -> None:
         raise AssertionError("Should raise ValueError")
     except ValueError as e:
         assert "too short" in str(e).lower()
+
+
+def test_company_identifier_interned() -> None:
+    """Test from_id returns one shared instance per company ID."""
+    assert CompanyIdentifier.from_id(0x004C) is CompanyIdentifier.from_id(0x004C)
+    assert CompanyIdentifier.from_id(0x0006) is not CompanyIdentifier.from_id(0x004C)
+    assert CompanyIdentifier.from_id(0x10000) is not CompanyIdentifier.from_id(0x10000)
+
+
+def test_manufacturer_data_shares_interned_company(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test parsing looks each company up once and shares the identifier."""
+    monkeypatch.setattr(company_module, "_interned", {})
+    lookups: list[int] = []
+    registry = company_module.get_company_identifiers_registry()
+    original = registry.get_company_name
+
+    def record(company_id: int) -> str | None:
+        lookups.append(company_id)
+        return original(company_id)
+
+    monkeypatch.setattr(registry, "get_company_name", record)
+    first = ManufacturerData.from_bytes(b"\x4c\x00\x02\x15")
+    second = ManufacturerData.from_id_and_payload(0x004C, b"")
+    assert first.company is second.company
+    assert first.company_id == 0x004C
+    assert first.to_bytes() == b"\x4c\x00\x02\x15"
+    assert lookups == [0x004C]
+
+
+def test_manufacturer_data_encoding() -> None:
+    """Test ManufacturerData is built and encoded with its company field."""
+    mfr_data = ManufacturerData(company=CompanyIdentifier.from_id(0x004C), payload=b"\x01")
+    decoded = msgspec.json.decode(msgspec.json.encode(mfr_data))
+    assert decoded["company"] == {"id": 0x004C, "name": "Apple, Inc."}
+    assert "company_id" not in decoded
+    assert msgspec.json.decode(msgspec.json.encode(mfr_data), type=ManufacturerData) == mfr_data
@@ -0,0 +1,178 @@
+"""Tests for streaming columnar export."""
+
+from __future__ import annotations
+
+import csv
+import math
+from array import array
+from pathlib import Path
+
+import pytest
+
+from bluetooth_sig.gatt.characteristics.battery_level import BatteryLevelCharacteristic
+from bluetooth_sig.gatt.characteristics.heart_rate_measurement import (
+    HeartRateData,
+    HeartRateMeasurementCharacteristic,
+)
+from bluetooth_sig.gatt.characteristics.indoor_bike_data import IndoorBikeDataCharacteristic
+from bluetooth_sig.utils.columnar import (
+    ColumnarSink,
+    ColumnChunk,
+    ColumnSpec,
+    CsvChunkWriter,
+    NpzChunkWriter,
+    derive_column_schema,
+)
+
+# Flags 0x18 (energy + RR present), HR 72, energy 300 kJ, RR 1024/1024 s
+HR_WITH_RR = bytes([0x18, 0x48, 0x2C, 0x01, 0x00, 0x04])
+# Flags 0x06 (contact detected), HR 60
+HR_CONTACT = bytes([0x06, 0x3C])
+# Flags 0x0040 (speed + power present), speed 15.00 km/h, power 200 W
+BIKE_SPEED_POWER = bytes([0x40, 0x00, 0xDC, 0x05, 0xC8, 0x00])
+
+
+class TestDeriveColumnSchema:
+    """Test schema derivation from struct fields."""
+
+    def test_heart_rate_schema(self) -> None:
+        """Test each field maps to the expected column storage."""
+        assert derive_column_schema(HeartRateData) == (
+            ColumnSpec(name="heart_rate", typecode="q"),
+            ColumnSpec(name="sensor_contact", typecode="q"),
+            ColumnSpec(name="energy_expended", typecode="d", nullable=True),
+            ColumnSpec(name="rr_intervals", typecode=None),
+            ColumnSpec(name="flags", typecode="q"),
+            ColumnSpec(name="sensor_location", typecode="d", nullable=True),
+        )
+
+    def test_non_struct_rejected(self) -> None:
+        """Test non-struct types are rejected."""
+        with pytest.raises(TypeError):
+            derive_column_schema(int)  # type: ignore[arg-type]
+
+
+class TestColumnarSink:
+    """Test ColumnarSink buffering and flushing."""
+
+    def test_non_struct_characteristic_rejected(self) -> None:
+        """Test characteristics with primitive values are rejected."""
+        with pytest.raises(TypeError):
+            ColumnarSink(BatteryLevelCharacteristic)
+
+    def test_invalid_chunk_size(self) -> None:
+        """Test chunk_size must be positive."""
+        with pytest.raises(ValueError):
+            ColumnarSink(HeartRateMeasurementCharacteristic, chunk_size=0)
+
+    def test_append_struct_values(self) -> None:
+        """Test parsed structs are appended into typed columns."""
+        char = HeartRateMeasurementCharacteristic()
+        sink = ColumnarSink(char)
+        sink.append(char.parse_value(HR_WITH_RR))
+        sink.append(char.parse_value(HR_CONTACT))
+        assert len(sink) == 2
+
+        chunk = sink.flush()
+        assert chunk is not None
+        assert len(sink) == 0
+        assert isinstance(chunk["heart_rate"], array)
+        assert list(chunk["heart_rate"]) == [72, 60]
+        assert list(chunk["sensor_contact"]) == [0, 2]
+        assert chunk["energy_expended"][0] == 300.0
+        assert math.isnan(chunk["energy_expended"][1])
+        assert chunk["rr_intervals"] == [(1.0,), ()]
+        assert list(chunk["flags"]) == [0x18, 0x06]
+
+    def test_flush_empty_returns_none(self) -> None:
+        """Test flushing with no buffered rows is a no-op."""
+        assert ColumnarSink(HeartRateMeasurementCharacteristic).flush() is None
+
+    def test_on_flush_called_per_chunk(self) -> None:
+        """Test full chunks are handed to on_flush automatically."""
+        chunks: list[ColumnChunk] = []
+        with ColumnarSink(HeartRateMeasurementCharacteristic, chunk_size=2, on_flush=chunks.append) as sink:
+            for _ in range(5):
+                sink.append_raw(HR_CONTACT)
+            assert len(chunks) == 2
+
+        assert [len(chunk["heart_rate"]) for chunk in chunks] == [2, 2, 1]
+
+    @pytest.mark.parametrize(
+        ("char_class", "payloads"),
+        [
+            (HeartRateMeasurementCharacteristic, [HR_WITH_RR, HR_CONTACT]),
+            (IndoorBikeDataCharacteristic, [BIKE_SPEED_POWER, bytes([0x01, 0x00])]),
+        ],
+    )
+    def test_direct_decode_matches_parsed_values(self, char_class: type, payloads: list[bytes]) -> None:
+        """Test the decode_row path produces the same columns as parsed structs."""
+        char = char_class()
+        direct = ColumnarSink(char)
+        via_struct = ColumnarSink(char)
+        assert direct.supports_direct_decode
+
+        for payload in payloads:
+            direct.append_raw(payload)
+            via_struct.append(char.parse_value(payload))
+
+        direct_chunk = direct.flush()
+        struct_chunk = via_struct.flush()
+        assert direct_chunk is not None
+        assert struct_chunk is not None
+        for name, column in struct_chunk.items():
+            assert [repr(v) for v in direct_chunk[name]] == [repr(v) for v in column]
+
+
+class TestChunkWriters:
+    """Test the CSV and NPZ on_flush targets."""
+
+    def test_csv_writer(self, tmp_path: Path) -> None:
+        """Test chunks append to one CSV with a single header row."""
+        path = tmp_path / "hr.csv"
+        with ColumnarSink(HeartRateMeasurementCharacteristic, chunk_size=1, on_flush=CsvChunkWriter(path)) as sink:
+            sink.append_raw(HR_WITH_RR)
+            sink.append_raw(HR_CONTACT)
+
+        with path.open(encoding="utf-8") as file_handle:
+            rows = list(csv.reader(file_handle))
+        assert rows[0] == [spec.name for spec in sink.schema]
+        assert len(rows) == 3
+        assert rows[1][0] == "72"
+        assert rows[2][0] == "60"
+
+    def test_npz_writer(self, tmp_path: Path) -> None:
+        """Test each chunk is written to its own NPZ file."""
+        np = pytest.importorskip("numpy")
+        writer = NpzChunkWriter(tmp_path, prefix="bike")
+        with ColumnarSink(IndoorBikeDataCharacteristic, chunk_size=2, on_flush=writer) as sink:
+            for _ in range(3):
+                sink.append_raw(BIKE_SPEED_POWER)
+
+        assert [path.name for path in writer.paths] == ["bike-00000.npz", "bike-00001.npz"]
+        with np.load(writer.paths[0]) as data:
+            assert data["instantaneous_speed"].tolist() == [15.0, 15.0]
+            assert data["instantaneous_power"].tolist() == [200.0, 200.0]
+
+    def test_npz_writer_loads_without_pickle(self, tmp_path: Path) -> None:
+        """Test list-backed columns round-trip through the default np.load."""
+        np = pytest.importorskip("numpy")
+        writer = NpzChunkWriter(tmp_path, prefix="hr")
+        with ColumnarSink(HeartRateMeasurementCharacteristic, on_flush=writer) as sink:
+            sink.append_raw(HR_WITH_RR)
+            sink.append_raw(HR_CONTACT)
+        writer({"label": ["a", None], "count": [1, None], "seen": [True, False], "level": [1, 2.5]})
+
+        with np.load(writer.paths[0]) as data:
+            assert data["heart_rate"].tolist() == [72, 60]
+            assert data["rr_intervals"].dtype.kind == "U"
+            assert data["rr_intervals"].tolist() == ["(1.0,)", "()"]
+            assert "rr_intervals.mask" not in data
+        with np.load(writer.paths[1]) as data:
+            assert data["label"].tolist() == ["a", ""]
+            assert data["label.mask"].tolist() == [False, True]
+            assert data["count"].dtype == np.int64
+            assert data["count"].tolist() == [1, 0]
+            assert data["count.mask"].tolist() == [False, True]
+            assert data["seen"].dtype == np.bool_
+            assert data["level"].tolist() == [1.0, 2.5]
@@ -67,3 +67,46 @@ class TestPrewarmRegistries:
             assert instance._loaded, registry_cls.__name__
 
         assert get_uuid_registry()._loaded
+
+
+class TestPrewarmFreeze:
+    """Tests for prewarm_registries(freeze=True)."""
+
+    def test_freeze_moves_objects_to_permanent_generation(self) -> None:
+        """Freezing must leave registry objects in the permanent GC generation."""
+        import gc
+
+        try:
+            prewarm_registries(freeze=True)
+            assert gc.get_freeze_count() > 0
+        finally:
+            gc.unfreeze()
+
+    def test_freeze_preserves_lookups(self) -> None:
+        """Compaction must not change lookup results."""
+        import gc
+
+        before = get_uuid_registry().get_characteristic_info("2A19")
+        try:
+            prewarm_registries(freeze=True)
+        finally:
+            gc.unfreeze()
+        after = get_uuid_registry().get_characteristic_info("2A19")
+        assert before == after
+
+    def test_compact_interns_string_keys(self) -> None:
+        """compact_mapping interns string keys and preserves order and values."""
+        import sys
+
+        from bluetooth_sig.registry.utils import compact_mapping
+
+        key = "".join(["batt", "ery"])
+        compacted = compact_mapping({key: 1, "b": 2, 3: "c"})
+        assert list(compacted.items()) == [("battery", 1), ("b", 2), (3, "c")]
+        assert next(iter(compacted)) is sys.intern("battery")
+
+    def test_compact_mapping_empty(self) -> None:
+        """Compacting an empty mapping yields an empty dict."""
+        from bluetooth_sig.registry.utils import compact_mapping
+
+        assert compact_mapping({}) == {}
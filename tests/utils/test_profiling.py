@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import gc
+import threading
 import time
+import tracemalloc
+from collections.abc import Generator
 
+import pytest
+
+from bluetooth_sig.core.translator import BluetoothSIGTranslator
+from bluetooth_sig.gatt.exceptions import CharacteristicParseError
 from bluetooth_sig.utils.profiling import (
+    TELEMETRY_BUCKET_COUNT,
+    MemoryResult,
+    ParseOutcome,
+    ParseTelemetry,
     ProfilingSession,
     TimingResult,
     benchmark_function,
     compare_implementations,
     format_comparison,
+    measure_memory,
+    parse_telemetry,
     timer,
 )
 
@@ -251,3 +265,206 @@ class TestProfilingSession:
         session_str = str(session)
         assert "test_session" in session_str
         assert "test_op" in session_str
+
+
+class TestMeasureMemory:
+    """Test tracemalloc-based memory measurement."""
+
+    def test_retained_objects_counted(self) -> None:
+        """Test objects returned by the function count towards retained bytes."""
+        result = measure_memory(lambda: [bytearray(1000) for _ in range(100)], count=100, operation="buffers")
+
+        assert isinstance(result, MemoryResult)
+        assert result.count == 100
+        assert 100_000 <= result.retained_bytes < 150_000
+        assert result.peak_bytes >= result.retained_bytes
+        assert result.per_item_bytes == result.retained_bytes / 100
+        assert "buffers" in str(result)
+
+    def test_temporaries_only_in_peak(self) -> None:
+        """Test garbage created during the call shows in peak but not retained bytes."""
+
+        def churn() -> None:
+            for _ in range(10):
+                bytearray(100_000)
+
+        result = measure_memory(churn)
+        assert result.retained_bytes < 10_000
+        assert result.peak_bytes >= 100_000
+
+    def test_tracing_state_restored(self) -> None:
+        """Test tracing is only stopped if measure_memory started it."""
+        measure_memory(list)
+        assert not tracemalloc.is_tracing()
+
+        tracemalloc.start()
+        try:
+            measure_memory(list)
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+
+class TestParseTelemetry:
+    """Test the ParseTelemetry collector."""
+
+    def test_disabled_by_default(self) -> None:
+        """Test a new collector starts disabled and empty."""
+        telemetry = ParseTelemetry()
+        assert telemetry.enabled is False
+        assert telemetry.snapshot().characteristics == {}
+
+    def test_record_counts_outcomes(self) -> None:
+        """Test calls, errors and special values are counted per UUID."""
+        telemetry = ParseTelemetry()
+        telemetry.record("2A19", "Battery Level", 1000, ParseOutcome.OK)
+        telemetry.record("2A19", "Battery Level", 3000, ParseOutcome.ERROR)
+        telemetry.record("2A19", "Battery Level", 2000, ParseOutcome.SPECIAL_VALUE)
+
+        stats = telemetry.snapshot().characteristics["2A19"]
+        assert stats.name == "Battery Level"
+        assert stats.calls == 3
+        assert stats.errors == 1
+        assert stats.special_values == 1
+        assert stats.total_ns == 6000
+        assert stats.mean_ns == 2000.0
+
+    def test_latency_buckets_are_log2(self) -> None:
+        """Test bucket ``i`` takes latencies above ``2**(i-1)`` and up to ``2**i`` ns."""
+        telemetry = ParseTelemetry()
+        telemetry.record("2A19", "Battery Level", 0, ParseOutcome.OK)
+        telemetry.record("2A19", "Battery Level", 1000, ParseOutcome.OK)
+        telemetry.record("2A19", "Battery Level", 1024, ParseOutcome.OK)
+        telemetry.record("2A19", "Battery Level", 1025, ParseOutcome.OK)
+        telemetry.record("2A19", "Battery Level", 1 << 40, ParseOutcome.OK)
+
+        buckets = telemetry.snapshot().characteristics["2A19"].latency_buckets
+        assert len(buckets) == TELEMETRY_BUCKET_COUNT
+        assert buckets[0] == 1
+        assert buckets[10] == 2
+        assert buckets[11] == 1
+        assert buckets[-1] == 1  # Overflow clamps to the last bucket
+
+    def test_snapshot_merges_thread_shards(self) -> None:
+        """Test records from several threads are merged in the snapshot."""
+        telemetry = ParseTelemetry()
+
+        def worker() -> None:
+            for _ in range(100):
+                telemetry.record("2A19", "Battery Level", 500, ParseOutcome.OK)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = telemetry.snapshot().characteristics["2A19"]
+        assert stats.calls == 400
+        assert sum(stats.latency_buckets) == 400
+
+    def test_exited_thread_shards_folded(self) -> None:
+        """Test shards of exited threads are merged into one total and dropped."""
+        telemetry = ParseTelemetry()
+        telemetry.record("2A19", "Battery Level", 500, ParseOutcome.OK)
+
+        def worker() -> None:
+            telemetry.record("2A19", "Battery Level", 500, ParseOutcome.ERROR)
+            telemetry.record("2A6E", "Temperature", 500, ParseOutcome.OK)
+
+        for _ in range(20):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+        gc.collect()
+
+        assert len(telemetry._shards) == 1  # Only this thread's shard remains
+        characteristics = telemetry.snapshot().characteristics
+        assert (characteristics["2A19"].calls, characteristics["2A19"].errors) == (21, 20)
+        assert characteristics["2A6E"].calls == 20
+        telemetry.reset()
+        assert telemetry.snapshot().characteristics == {}
+
+    def test_reset_discards_data(self) -> None:
+        """Test reset clears all recorded data."""
+        telemetry = ParseTelemetry()
+        telemetry.record("2A19", "Battery Level", 1000, ParseOutcome.OK)
+        telemetry.reset()
+        assert telemetry.snapshot().characteristics == {}
+
+    def test_to_dict(self) -> None:
+        """Test snapshot export as plain builtins."""
+        telemetry = ParseTelemetry()
+        telemetry.record("2A19", "Battery Level", 1000, ParseOutcome.OK)
+
+        exported = telemetry.snapshot().to_dict()
+        assert exported["characteristics"]["2A19"]["calls"] == 1
+        assert exported["characteristics"]["2A19"]["name"] == "Battery Level"
+
+    def test_to_prometheus(self) -> None:
+        """Test Prometheus exposition output."""
+        telemetry = ParseTelemetry()
+        telemetry.record("2A19", "Battery Level", 1000, ParseOutcome.OK)
+        telemetry.record("2A19", "Battery Level", 1000, ParseOutcome.ERROR)
+
+        text = telemetry.snapshot().to_prometheus()
+        labels = 'uuid="2A19",name="Battery Level"'
+        assert "# TYPE bluetooth_sig_parse_duration_seconds histogram" in text
+        assert f"bluetooth_sig_parse_calls_total{{{labels}}} 2" in text
+        assert f"bluetooth_sig_parse_errors_total{{{labels}}} 1" in text
+        assert f'bluetooth_sig_parse_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f"bluetooth_sig_parse_duration_seconds_count{{{labels}}} 2" in text
+
+    def test_to_prometheus_bucket_bounds_inclusive(self) -> None:
+        """Test a latency equal to a bucket bound is counted in that ``le`` bucket."""
+        telemetry = ParseTelemetry()
+        telemetry.record("2A19", "Battery Level", 1024, ParseOutcome.OK)
+        telemetry.record("2A19", "Battery Level", 1 << 40, ParseOutcome.OK)
+
+        text = telemetry.snapshot().to_prometheus()
+        labels = 'uuid="2A19",name="Battery Level"'
+        assert f'bluetooth_sig_parse_duration_seconds_bucket{{{labels},le="5.12e-07"}} 0' in text
+        assert f'bluetooth_sig_parse_duration_seconds_bucket{{{labels},le="1.024e-06"}} 1' in text
+        # The slowest parse only appears in +Inf
+        assert f'bluetooth_sig_parse_duration_seconds_bucket{{{labels},le="1.07374182"}} 1' in text
+        assert f'le="{(1 << (TELEMETRY_BUCKET_COUNT - 1)) / 1e9:.9g}"' not in text
+        assert f'bluetooth_sig_parse_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+
+
+class TestParsePipelineTelemetry:
+    """Test telemetry recorded by the characteristic parse pipeline."""
+
+    @pytest.fixture(autouse=True)
+    def _enabled_telemetry(self) -> Generator[None, None, None]:
+        parse_telemetry.reset()
+        parse_telemetry.enable()
+        yield
+        parse_telemetry.disable()
+        parse_telemetry.reset()
+
+    def test_successful_parse_recorded(self) -> None:
+        """Test a successful parse is counted under its UUID."""
+        translator = BluetoothSIGTranslator()
+        translator.parse_characteristic("2A19", b"\x55")
+
+        stats = next(iter(parse_telemetry.snapshot().characteristics.values()))
+        assert stats.name == "Battery Level"
+        assert stats.calls == 1
+        assert stats.errors == 0
+        assert stats.total_ns > 0
+
+    def test_failed_parse_recorded(self) -> None:
+        """Test a failed parse is counted as an error."""
+        translator = BluetoothSIGTranslator()
+        with pytest.raises(CharacteristicParseError):
+            translator.parse_characteristic("2A19", b"")
+
+        stats = next(iter(parse_telemetry.snapshot().characteristics.values()))
+        assert stats.calls == 1
+        assert stats.errors == 1
+
+    def test_disabled_records_nothing(self) -> None:
+        """Test no data is recorded while telemetry is disabled."""
+        parse_telemetry.disable()
+        BluetoothSIGTranslator().parse_characteristic("2A19", b"\x55")
+        assert parse_telemetry.snapshot().characteristics == {}
@@ -0,0 +1,88 @@
+"""Tests for bluetooth_sig.utils.registry_snapshot."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from bluetooth_sig.registry import utils as registry_utils
+from bluetooth_sig.registry.utils import get_loaded_documents, load_yaml_document, set_document_source
+from bluetooth_sig.utils.registry_snapshot import (
+    SNAPSHOT_MAGIC,
+    attach_registry_snapshot,
+    encode_registry_snapshot,
+    load_registry_snapshot,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_document_source(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    # Keep temporary YAML files out of the process-wide list later snapshots are built from.
+    monkeypatch.setattr(registry_utils, "_loaded_documents", dict(registry_utils._loaded_documents))
+    yield
+    set_document_source(None)
+
+
+@pytest.fixture
+def yaml_file(tmp_path: Path) -> Path:
+    path = tmp_path / "company_identifiers.yaml"
+    path.write_text("company_identifiers:\n  - value: 76\n    name: Apple, Inc.\n", encoding="utf-8")
+    return path
+
+
+def _snapshot_of(path: Path) -> bytes:
+    """Load *path* and encode a snapshot holding only that document."""
+    load_yaml_document(path)
+    return encode_registry_snapshot({str(path): get_loaded_documents()[str(path)]})
+
+
+class TestRegistrySnapshot:
+    """Snapshot encode/load round trips."""
+
+    def test_snapshot_serves_documents_without_file(self, yaml_file: Path) -> None:
+        """Installed snapshot documents are returned even after the file is gone."""
+        expected = load_yaml_document(yaml_file)
+        snapshot = _snapshot_of(yaml_file)
+        yaml_file.unlink()
+
+        assert load_registry_snapshot(snapshot) == 1
+        assert load_yaml_document(yaml_file) == expected
+
+    def test_attach_memory_mapped_file(self, yaml_file: Path, tmp_path: Path) -> None:
+        """A snapshot file can be memory-mapped and attached."""
+        snapshot_path = tmp_path / "registry.snapshot"
+        snapshot_path.write_bytes(_snapshot_of(yaml_file))
+
+        assert attach_registry_snapshot(snapshot_path) == 1
+        document = load_yaml_document(yaml_file)
+        assert document["company_identifiers"][0] == {"value": 76, "name": "Apple, Inc."}
+
+    def test_unknown_paths_fall_back_to_disk(self, yaml_file: Path, tmp_path: Path) -> None:
+        """Paths missing from the snapshot are read from disk."""
+        load_registry_snapshot(encode_registry_snapshot({}))
+        assert load_yaml_document(yaml_file)["company_identifiers"][0]["value"] == 76
+
+    def test_rejects_buffer_without_header(self) -> None:
+        """Arbitrary bytes are rejected."""
+        with pytest.raises(ValueError, match="not a bluetooth-sig registry snapshot"):
+            load_registry_snapshot(b"not a snapshot")
+
+    def test_rejects_empty_buffer(self) -> None:
+        """An empty buffer is rejected."""
+        with pytest.raises(ValueError, match="not a bluetooth-sig registry snapshot"):
+            load_registry_snapshot(b"")
+
+    def test_header_prefix(self) -> None:
+        """Encoded snapshots start with the snapshot header."""
+        assert encode_registry_snapshot({}).startswith(SNAPSHOT_MAGIC)
+
+    def test_loaded_documents_kept_without_files(self, yaml_file: Path) -> None:
+        """Snapshots are built from documents kept at load time, not by re-reading files."""
+        expected = load_yaml_document(yaml_file)
+        yaml_file.unlink()
+        snapshot = encode_registry_snapshot(get_loaded_documents())
+
+        assert load_registry_snapshot(snapshot) >= 1
+        assert load_yaml_document(yaml_file) == expected
@@ -0,0 +1,140 @@
+"""Tests for bulk msgspec serialization of parse results."""
+
+from __future__ import annotations
+
+import datetime
+import enum
+
+import msgspec
+import pytest
+
+from bluetooth_sig.gatt.characteristics.heart_rate_measurement import (
+    HeartRateData,
+    HeartRateMeasurementCharacteristic,
+)
+from bluetooth_sig.utils.serialization import ResultDecoder, ResultEncoder, SerializationFormat
+
+FORMATS: list[SerializationFormat] = ["msgpack", "json"]
+
+
+class Mode(enum.Enum):
+    """Non-integer enum used in test structs."""
+
+    IDLE = "idle"
+    ACTIVE = "active"
+
+
+class Status(enum.IntFlag):
+    """Flag enum used in test structs."""
+
+    A = 0x01
+    B = 0x02
+
+
+class Inner(msgspec.Struct, frozen=True, kw_only=True):
+    """Nested struct with a converted field."""
+
+    mode: Mode
+
+
+class Plain(msgspec.Struct, frozen=True, kw_only=True):
+    """Struct msgspec can encode without conversion."""
+
+    count: int
+    label: str
+
+
+class Sample(msgspec.Struct, frozen=True, kw_only=True):
+    """Struct exercising every converted field kind."""
+
+    status: Status
+    timestamp: datetime.datetime
+    duration: datetime.timedelta
+    inner: Inner
+    history: tuple[Inner, ...] = ()
+    optional_mode: Mode | None = None
+    value: float = 0.0
+
+
+SAMPLE = Sample(
+    status=Status.A | Status.B,
+    timestamp=datetime.datetime(2024, 1, 2, 3, 4, 5),
+    duration=datetime.timedelta(seconds=90),
+    inner=Inner(mode=Mode.ACTIVE),
+    history=(Inner(mode=Mode.IDLE),),
+    optional_mode=Mode.IDLE,
+    value=1.5,
+)
+
+
+class TestResultEncoder:
+    """Test ResultEncoder conversions."""
+
+    def test_unsupported_format(self) -> None:
+        """Test unknown formats are rejected."""
+        with pytest.raises(ValueError):
+            ResultEncoder("xml")  # type: ignore[arg-type]
+
+    def test_to_builtins_conversions(self) -> None:
+        """Test enums, flags, datetimes and timedeltas are converted."""
+        converted = ResultEncoder().to_builtins(SAMPLE)
+        assert converted == {
+            "status": 3,
+            "timestamp": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc).timestamp(),
+            "duration": 90.0,
+            "inner": {"mode": "ACTIVE"},
+            "history": [{"mode": "IDLE"}],
+            "optional_mode": "IDLE",
+            "value": 1.5,
+        }
+
+    def test_struct_without_conversions_passes_through(self) -> None:
+        """Test structs with only primitive fields are encoded as-is."""
+        plain = Plain(count=1, label="x")
+        assert ResultEncoder().to_builtins(plain) is plain
+
+    def test_top_level_primitives(self) -> None:
+        """Test non-struct parse results are converted."""
+        encoder = ResultEncoder()
+        assert encoder.to_builtins(Mode.IDLE) == "IDLE"
+        assert encoder.to_builtins(Status.B) == 2
+        assert encoder.to_builtins(42) == 42
+
+    @pytest.mark.parametrize("fmt", FORMATS)
+    def test_encode_batch_mixed_types(self, fmt: SerializationFormat) -> None:
+        """Test a batch of mixed result types encodes as one array."""
+        encoder = ResultEncoder(fmt)
+        payload = encoder.encode_batch([SAMPLE, 85, Mode.ACTIVE])
+        decoded = msgspec.msgpack.decode(payload) if fmt == "msgpack" else msgspec.json.decode(payload)
+        assert decoded[1:] == [85, "ACTIVE"]
+        assert decoded[0]["inner"] == {"mode": "ACTIVE"}
+
+
+class TestResultDecoder:
+    """Test ResultDecoder round trips."""
+
+    @pytest.mark.parametrize("fmt", FORMATS)
+    def test_round_trip(self, fmt: SerializationFormat) -> None:
+        """Test a value survives encode/decode unchanged."""
+        payload = ResultEncoder(fmt).encode(SAMPLE)
+        assert ResultDecoder(Sample, fmt).decode(payload) == SAMPLE
+
+    @pytest.mark.parametrize("fmt", FORMATS)
+    def test_round_trip_batch(self, fmt: SerializationFormat) -> None:
+        """Test a batch survives encode/decode unchanged."""
+        values = [SAMPLE, Sample(**{**msgspec.structs.asdict(SAMPLE), "optional_mode": None})]
+        payload = ResultEncoder(fmt).encode_batch(values)
+        assert ResultDecoder(Sample, fmt).decode_batch(payload) == values
+
+    @pytest.mark.parametrize("fmt", FORMATS)
+    def test_parsed_heart_rate_round_trip(self, fmt: SerializationFormat) -> None:
+        """Test a real parse result survives a round trip."""
+        value = HeartRateMeasurementCharacteristic().parse_value(bytes([0x18, 0x48, 0x2C, 0x01, 0x00, 0x04]))
+        payload = ResultEncoder(fmt).encode_batch([value, value])
+        assert ResultDecoder(HeartRateData, fmt).decode_batch(payload) == [value, value]
+
+    def test_invalid_data_raises(self) -> None:
+        """Test data not matching the result type raises a validation error."""
+        payload = ResultEncoder("json").encode({"mode": "UNKNOWN"})
+        with pytest.raises(msgspec.ValidationError):
+            ResultDecoder(Inner, "json").decode(payload)